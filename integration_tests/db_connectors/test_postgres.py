@@ -48,6 +48,32 @@ def test_psql_output_stream(tmp_path, postgres):
     assert rows == expected_rows
 
 
+def test_psql_output_stream_parallel_writers(tmp_path, postgres):
+    class InputSchema(pw.Schema):
+        name: str
+        count: int
+        price: float
+        available: bool
+
+    input_path = tmp_path / "input.txt"
+    output_table = postgres.create_table(InputSchema, used_for_output=True)
+
+    test_items = [
+        {"name": f"Item {i}", "count": i, "price": i / 2, "available": i % 2 == 0}
+        for i in range(1000)
+    ]
+    with open(input_path, "w") as f:
+        for test_item in test_items:
+            f.write(json.dumps(test_item) + "\n")
+    table = pw.io.jsonlines.read(input_path, schema=InputSchema, mode="static")
+    pw.io.postgres.write(table, POSTGRES_SETTINGS, output_table, parallel_writers=4)
+    pw.run()
+
+    rows = postgres.get_table_contents(output_table, InputSchema.column_names())
+    rows.sort(key=lambda item: item["count"])
+    assert rows == test_items
+
+
 def test_psql_output_snapshot(tmp_path, postgres):
     class InputSchema(pw.Schema):
         name: str = pw.column_definition(primary_key=True)
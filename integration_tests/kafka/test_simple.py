@@ -77,6 +77,37 @@ def test_kafka_message_metadata(tmp_path, kafka_context):
     assert len(offsets) == 2
 
 
+@pytest.mark.flaky(reruns=3)
+def test_kafka_static_partition_assignment(tmp_path, kafka_context):
+    kafka_context.set_input_topic_partitions(3)
+    kafka_context.fill([str(i) for i in range(3000)])
+
+    table = pw.io.kafka.read(
+        rdkafka_settings=kafka_context.default_rdkafka_settings(),
+        topic=kafka_context.input_topic,
+        format="plaintext",
+        autocommit_duration_ms=100,
+        with_metadata=True,
+        static_partition_assignment=True,
+    )
+    output_path = tmp_path / "output.jsonl"
+
+    pw.io.jsonlines.write(table, output_path)
+    wait_result_with_checker(FileLinesNumberChecker(output_path, 3000), 30)
+
+    values = set()
+    positions = set()
+    with open(output_path, "r") as f:
+        for row in f:
+            data = json.loads(row)
+            values.add(data["data"])
+            metadata = data["_metadata"]
+            positions.add((metadata["partition"], metadata["offset"]))
+
+    assert values == {str(i) for i in range(3000)}
+    assert len(positions) == 3000
+
+
 @pytest.mark.parametrize("with_metadata", [False, True])
 @pytest.mark.flaky(reruns=3)
 def test_kafka_json(tmp_path, kafka_context, with_metadata):
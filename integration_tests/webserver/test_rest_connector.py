@@ -4,6 +4,7 @@ import pathlib
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import requests
@@ -532,3 +533,52 @@ def test_requests_caching(tmp_path: pathlib.Path, port: int) -> None:
     t.start()
     wait_result_with_checker(CsvLinesNumberChecker(output_path, 6), 30)
     t.join()
+
+
+def test_requests_coalescing(tmp_path: pathlib.Path, port: int) -> None:
+    output_path = tmp_path / "output.csv"
+
+    class InputSchema(pw.Schema):
+        name: str
+
+    def assign_id(name: str) -> str:
+        time.sleep(1)
+        return str(uuid.uuid4())
+
+    def target() -> None:
+        time.sleep(5)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: requests.post(
+                        f"http://127.0.0.1:{port}/assign-user-id",
+                        json={"name": "Alice"},
+                    ),
+                    range(4),
+                )
+            )
+        for r in responses:
+            r.raise_for_status()
+        assert len({r.text for r in responses}) == 1
+
+    webserver = pw.io.http.PathwayWebserver(host="127.0.0.1", port=port)
+
+    queries, response_writer = pw.io.http.rest_connector(
+        webserver=webserver,
+        schema=InputSchema,
+        route="/assign-user-id",
+        autocommit_duration_ms=100_000,
+        delete_completed_queries=True,
+        coalesce_requests=True,
+        minibatch_duration_ms=10,
+    )
+    queries = queries.select(
+        query_id=queries.id, result=pw.apply(assign_id, queries.name)
+    )
+    response_writer(queries)
+    pw.io.csv.write(queries, output_path)
+
+    t = ExceptionAwareThread(target=target, daemon=True)
+    t.start()
+    wait_result_with_checker(CsvLinesNumberChecker(output_path, 2), 30)
+    t.join()
@@ -23,14 +23,15 @@ import itertools
 import re
 from collections.abc import Iterable
 from os import PathLike
-from typing import Any
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 
 from pathway import persistence
 from pathway.internals import Json, api, parse_graph
 from pathway.internals.config import get_pathway_config
+from pathway.internals.datasink import CallbackDataSink
 from pathway.internals.datasource import DataSourceOptions, PandasDataSource
 from pathway.internals.fingerprints import fingerprint
 from pathway.internals.graph_runner import GraphRunner
@@ -38,7 +39,7 @@ from pathway.internals.monitoring import MonitoringLevel
 from pathway.internals.runtime_type_check import check_arg_types
 from pathway.internals.schema import Schema, schema_from_pandas
 from pathway.internals.table import Table
-from pathway.internals.table_io import table_from_datasource
+from pathway.internals.table_io import table_from_datasource, table_to_datasink
 from pathway.internals.trace import trace_user_frame
 from pathway.io._utils import read_schema
 from pathway.io.python import ConnectorSubject, read
@@ -265,19 +266,77 @@ def _dtype_to_pandas(dtype):
         return None
 
 
+def _compute_table_columns(
+    table: Table, _stacklevel: int = 1
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Computes the final state of the table as NumPy arrays: the keys and one array
+    per column. The changes are received from the engine in columnar batches, so
+    no Python object is created per row for columns with a native dtype."""
+    batches: list[tuple[np.ndarray, list[np.ndarray], int, np.ndarray]] = []
+
+    def on_batch(
+        keys: np.ndarray, columns: list[np.ndarray], time: int, diffs: np.ndarray
+    ) -> None:
+        batches.append((keys, columns, time, diffs))
+
+    operator = table_to_datasink(
+        table,
+        CallbackDataSink(
+            on_change=None,
+            on_time_end=lambda time: None,
+            on_end=lambda: None,
+            skip_persisted_batch=False,
+            skip_errors=False,
+            on_batch=on_batch,
+        ),
+        special=True,
+    )
+    GraphRunner(
+        parse_graph.G,
+        debug=True,
+        monitoring_level=MonitoringLevel.NONE,
+        _stacklevel=_stacklevel + 1,
+    ).run_nodes([operator])
+
+    n_columns = len(table._columns)
+    if not batches:
+        return np.array([], dtype=object), [
+            np.array([], dtype=object) for _ in range(n_columns)
+        ]
+    keys = np.concatenate([batch[0] for batch in batches])
+    columns = [
+        np.concatenate([batch[1][index] for batch in batches])
+        for index in range(n_columns)
+    ]
+    times = np.concatenate(
+        [np.full(len(batch[0]), batch[2], dtype=np.int64) for batch in batches]
+    )
+    diffs = np.concatenate([batch[3] for batch in batches])
+    # as in api.squash_updates, deletions go before insertions at the same time,
+    # so the last update of a key that is present at the end is its insertion
+    order = np.lexsort((diffs, times))
+    updates = pd.DataFrame({"key": keys[order], "diff": diffs[order]})
+    last_updates = updates.drop_duplicates("key", keep="last")
+    present = order[last_updates.index[(last_updates["diff"] == 1).to_numpy()]]
+    return keys[present], [column[present] for column in columns]
+
+
 @check_arg_types
 @trace_user_frame
 def table_to_pandas(table: Table, *, include_id: bool = True):
-    keys, columns = table_to_dicts(table)
+    keys, columns = _compute_table_columns(table)
     series_dict = {}
-    for name in columns:
-        dtype = _dtype_to_pandas(table.schema.typehints()[name])
+    typehints = table.schema.typehints()
+    for name, values in zip(table._columns.keys(), columns):
+        dtype = _dtype_to_pandas(typehints[name])
         if include_id:
-            vals: Any = columns[name]
+            series = pd.Series(values, index=keys, dtype=dtype)
         else:
             # we need to remove keys, otherwise pandas will use them to create index
-            vals = columns[name].values()
-        series = pd.Series(vals, dtype=dtype)
+            series = pd.Series(values, dtype=dtype)
+        if dtype is None:
+            # columns of the types without a native dtype come as arrays of objects
+            series = series.infer_objects()
         series_dict[name] = series
     res = pd.DataFrame(series_dict, index=keys)
     return res
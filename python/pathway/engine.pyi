@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import os
 from collections.abc import Callable, Iterable
 from enum import Enum
 from typing import Any, Generic, TypeVar, Union, final
@@ -36,6 +37,7 @@ class PathwayType:
     INT: PathwayType
     BOOL: PathwayType
     FLOAT: PathwayType
+    FLOAT32: PathwayType
     POINTER: PathwayType
     DATE_TIME_NAIVE: PathwayType
     DATE_TIME_UTC: PathwayType
@@ -97,6 +99,7 @@ class ConnectorProperties:
     commit_duration_ms: int | None = None
     unsafe_trusted_ids: bool | None = False
     column_properties: list[ColumnProperties] = []
+    commit_target_latency_ms: int | None = None
 
 class Column:
     """A Column holds data and conceptually is a Dict[Universe elems, dt]
@@ -231,6 +234,14 @@ class Expression:
         propagate_none: bool = False,
     ) -> Expression: ...
     @staticmethod
+    def vectorized_apply(
+        fun: Callable,
+        /,
+        *args: Expression,
+        dtype: PathwayType,
+        propagate_none: bool = False,
+    ) -> Expression: ...
+    @staticmethod
     def is_none(expr: Expression) -> Expression: ...
     @staticmethod
     def unary_expression(
@@ -589,6 +600,8 @@ class Scope:
         reducers: list[ReducerData],
         by_id: bool,
         table_properties: TableProperties,
+        *,
+        skewed_keys: list[tuple[Value, ...]] = [],
     ) -> Table: ...
     def deduplicate(
         self,
@@ -620,6 +633,9 @@ class Scope:
         assign_id: bool = False,
         left_ear: bool = False,
         right_ear: bool = False,
+        broadcast_left: bool = False,
+        broadcast_right: bool = False,
+        skewed_keys: list[tuple[Value, ...]] = [],
     ) -> Table: ...
     def use_external_index_as_of_now(
         self,
@@ -668,9 +684,11 @@ class Scope:
         column_paths: Iterable[ColumnPath],
         skip_persisted_batch: bool,
         skip_errors: bool,
-        on_change: Callable,
+        on_change: Callable | None,
         on_time_end: Callable,
         on_end: Callable,
+        on_batch: Callable | None = None,
+        on_batch_column_types: list[PathwayType] = [],
     ): ...
     def output_table(
         self,
@@ -685,7 +703,9 @@ class Scope:
     def import_table(self, table: ExportedTable) -> Table: ...
     def error_log(self, properties: ConnectorProperties) -> tuple[Table, ErrorLog]: ...
     def set_error_log(self, error_log: ErrorLog | None) -> None: ...
-    def set_operator_properties(self, id: int, depends_on_error_log: bool) -> None: ...
+    def set_operator_properties(
+        self, id: int, depends_on_error_log: bool, trace: Trace | None = None
+    ) -> None: ...
     def remove_errors_from_table(
         self,
         table: Table,
@@ -731,6 +751,9 @@ def run_with_new_graph(
     trace_parent: str | None = None,
     run_id: str | None = None,
     terminate_on_error: bool = True,
+    profile: str | os.PathLike | None = None,
+    memory_budget: int | None = None,
+    spill_dir: str | os.PathLike | None = None,
 ) -> list[CapturedStream]: ...
 def unsafe_make_pointer(arg) -> Pointer: ...
 
@@ -757,11 +780,20 @@ class DataStorage:
     object_pattern: str
     mock_events: dict[tuple[str, int], list[SnapshotEvent]] | None
     table_name: str | None
+    parquet_settings: ParquetSettings | None
+    partition_columns: list[str]
+    target_file_size: int | None
+    compaction_interval_ms: int | None
+    parallel_writers: int | None
+    static_partition_assignment: bool
     def __init__(self, *args, **kwargs): ...
 
 class CsvParserSettings:
     def __init__(self, *args, **kwargs): ...
 
+class ParquetSettings:
+    def __init__(self, *args, **kwargs): ...
+
 class AwsS3Settings:
     def __init__(self, *args, **kwargs): ...
 
@@ -838,6 +870,14 @@ class TelemetryConfig:
         monitoring_server: str | None = None,
     ) -> TelemetryConfig: ...
 
+class UdfMetrics:
+    def __init__(self, name: str, capacity: int | None = None): ...
+    def on_call_started(self) -> None: ...
+    def on_call_finished(self, latency: float, failed: bool) -> None: ...
+    def on_retry(self) -> None: ...
+    def on_timeout(self) -> None: ...
+    def on_cache_lookup(self, hit: bool) -> None: ...
+
 class ExternalIndexFactory:
     @staticmethod
     def usearch_knn_factory(
@@ -33,6 +33,9 @@ def groupby_handler(
     instance=None,
     _skip_errors=True,
     _is_window=False,
+    skew_hint=None,
+    ttl=None,
+    ttl_time=None,
     **kwargs,
 ):
     if kwargs:
@@ -47,6 +50,9 @@ def groupby_handler(
         "instance": instance,
         "_skip_errors": _skip_errors,
         "_is_window": _is_window,
+        "skew_hint": skew_hint,
+        "ttl": ttl,
+        "ttl_time": ttl_time,
     }
 
 
@@ -154,6 +160,12 @@ def join_kwargs_handler(*, allow_how: bool, allow_id: bool):
         if "defaults" in kwargs:
             processed_kwargs["defaults"] = kwargs.pop("defaults")
 
+        if "skew" in kwargs:
+            processed_kwargs["skew"] = kwargs.pop("skew")
+
+        if "broadcast" in kwargs:
+            processed_kwargs["broadcast"] = kwargs.pop("broadcast")
+
         if "left_instance" in kwargs and "right_instance" in kwargs:
             processed_kwargs["left_instance"] = kwargs.pop("left_instance")
             processed_kwargs["right_instance"] = kwargs.pop("right_instance")
@@ -163,6 +175,18 @@ def join_kwargs_handler(*, allow_how: bool, allow_id: bool):
                 + "should always be provided simultaneously"
             )
 
+        for name in ["ttl", "left_ttl_time", "right_ttl_time"]:
+            if name in kwargs:
+                processed_kwargs[name] = kwargs.pop(name)
+        if processed_kwargs.get("ttl") is not None and (
+            processed_kwargs.get("left_ttl_time") is None
+            or processed_kwargs.get("right_ttl_time") is None
+        ):
+            raise ValueError(
+                "`ttl` argument to join requires both `left_ttl_time` "
+                + "and `right_ttl_time` arguments"
+            )
+
         if "direction" in kwargs:
             direction = processed_kwargs["direction"] = kwargs.pop("direction")
             from pathway.stdlib.temporal import Direction
@@ -507,6 +507,8 @@ class GroupedContext(Context):
     """Original context of grouped table."""
     skip_errors: bool
     sort_by: InternalColRef | None = None
+    skewed_keys: tuple[tuple[Any, ...], ...] = ()
+    """Values of the grouping columns of the groups split across workers."""
 
     def _get_type_interpreter(self):
         from pathway.internals.type_interpreter import ReducerInterprerer
@@ -943,6 +945,10 @@ class JoinContext(Context, column_properties_evaluator=cp.JoinPropsEvaluator):
     left_ear: bool
     right_ear: bool
     exact_match: bool
+    skewed_keys: tuple[tuple[Any, ...], ...] = ()
+    """Values of the join columns of the keys split across workers."""
+    broadcast_left: bool = False
+    broadcast_right: bool = False
 
     def column_dependencies_external(self) -> Iterable[Column]:
         return (self.left_table._id_column, self.right_table._id_column)
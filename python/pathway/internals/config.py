@@ -70,6 +70,7 @@ class PathwayConfig:
         "PATHWAY_TERMINATE_ON_ERROR", default="true"
     )
     process_id: str = _env_field("PATHWAY_PROCESS_ID", default="0")
+    profile: str | None = _env_field("PATHWAY_PROFILE")
 
     @property
     def replay_config(
@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from pathway.internals import api
 
@@ -28,11 +29,12 @@ class GenericDataSink(DataSink):
 
 @dataclass(frozen=True, kw_only=True)
 class CallbackDataSink(DataSink):
-    on_change: Callable[[api.Pointer, list[api.Value], int, int], None]
+    on_change: Callable[[api.Pointer, list[api.Value], int, int], None] | None
     on_time_end: Callable[[int], None]
     on_end: Callable[[], None]
     skip_persisted_batch: bool
     skip_errors: bool
+    on_batch: Callable[[Any, list[Any], int, Any], None] | None = None
 
 
 @dataclass(frozen=True)
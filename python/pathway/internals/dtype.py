@@ -71,6 +71,7 @@ class _SimpleDType(DType):
             BOOL: "BOOL",
             STR: "STR",
             FLOAT: "FLOAT",
+            FLOAT32: "FLOAT32",
             BYTES: "BYTES",
         }[self]
 
@@ -81,7 +82,7 @@ class _SimpleDType(DType):
         return super().__new__(cls, wrapped)
 
     def is_value_compatible(self, arg):
-        if self.wrapped == float:
+        if self.wrapped in (float, np.float32):
             return np.issubdtype(type(arg), np.floating) or np.issubdtype(
                 type(arg), np.integer
             )
@@ -100,6 +101,7 @@ class _SimpleDType(DType):
             BOOL: api.PathwayType.BOOL,
             STR: api.PathwayType.STRING,
             FLOAT: api.PathwayType.FLOAT,
+            FLOAT32: api.PathwayType.FLOAT32,
             BYTES: api.PathwayType.BYTES,
         }[self]
 
@@ -119,6 +121,8 @@ BOOL: DType = _SimpleDType(bool)
 STR: DType = _SimpleDType(str)
 BYTES: DType = _SimpleDType(bytes)
 FLOAT: DType = _SimpleDType(float)
+# single precision is only kept for array elements, scalars are widened to FLOAT
+FLOAT32: DType = _SimpleDType(np.float32)
 
 
 class _NoneDType(DType):
@@ -272,6 +276,9 @@ class Array(DType):
             return Array(n_dim=None, wrapped=self.wrapped)
         elif self.n_dim > 1:
             return Array(n_dim=self.n_dim - 1, wrapped=self.wrapped)
+        elif self.wrapped == FLOAT32:
+            # single elements of float32 arrays are returned as regular floats
+            return FLOAT
         else:
             return self.wrapped
 
@@ -642,6 +649,11 @@ def wrap(input_type) -> DType:
         return ANY_ARRAY
     elif typing.get_origin(input_type) == np.ndarray:
         dims, wrapped = get_args(input_type)
+        if typing.get_origin(wrapped) == np.dtype:
+            (wrapped,) = typing.get_args(wrapped)
+        if wrapped == np.float32:
+            # keep single precision inside arrays, e.g. for embeddings
+            wrapped = FLOAT32
         if dims == typing.Any:
             return Array(n_dim=None, wrapped=wrapped)
         return Array(n_dim=len(typing.get_args(dims)), wrapped=wrapped)
@@ -688,6 +700,9 @@ INT_ARRAY_2D: DType = Array(n_dim=2, wrapped=INT)
 FLOAT_ARRAY: DType = Array(n_dim=None, wrapped=FLOAT)
 FLOAT_ARRAY_1D: DType = Array(n_dim=1, wrapped=FLOAT)
 FLOAT_ARRAY_2D: DType = Array(n_dim=2, wrapped=FLOAT)
+FLOAT32_ARRAY: DType = Array(n_dim=None, wrapped=FLOAT32)
+FLOAT32_ARRAY_1D: DType = Array(n_dim=1, wrapped=FLOAT32)
+FLOAT32_ARRAY_2D: DType = Array(n_dim=2, wrapped=FLOAT32)
 
 
 def dtype_equivalence(
@@ -792,6 +792,10 @@ class AsyncApplyExpression(ApplyExpression):
     pass
 
 
+class VectorizedApplyExpression(ApplyExpression):
+    pass
+
+
 class CastExpression(ColumnExpression):
     _return_type: dt.DType
     _expr: ColumnExpression
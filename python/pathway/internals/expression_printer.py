@@ -69,6 +69,9 @@ class ExpressionFormatter(ExpressionVisitor):
         args = self._eval_args_kwargs(expression._args, expression._kwargs)
         return f"pathway.apply_async({expression._fun.__name__}, {args})"
 
+    def eval_vectorized_apply(self, expression: expr.ApplyExpression):
+        return self.eval_apply(expression)
+
     def eval_pointer(self, expression: expr.PointerExpression):
         kwargs: dict[str, expr.ColumnExpression] = {}
         if expression._instance is not None:
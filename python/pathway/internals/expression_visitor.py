@@ -30,6 +30,7 @@ class ExpressionVisitor(ABC):
             expr.RequireExpression: self.eval_require,
             expr.IfElseExpression: self.eval_ifelse,
             expr.AsyncApplyExpression: self.eval_async_apply,
+            expr.VectorizedApplyExpression: self.eval_vectorized_apply,
             expr.MakeTupleExpression: self.eval_make_tuple,
             expr.GetExpression: self.eval_get,
             expr.MethodCallExpression: self.eval_method_call,
@@ -63,6 +64,9 @@ class ExpressionVisitor(ABC):
     @abstractmethod
     def eval_async_apply(self, expression: expr.AsyncApplyExpression): ...
 
+    @abstractmethod
+    def eval_vectorized_apply(self, expression: expr.VectorizedApplyExpression): ...
+
     @abstractmethod
     def eval_pointer(self, expression: expr.PointerExpression): ...
 
@@ -192,6 +196,23 @@ class IdentityTransform(ExpressionVisitor):
             kwargs=expr_kwargs,
         )
 
+    def eval_vectorized_apply(
+        self, expression: expr.VectorizedApplyExpression, **kwargs
+    ) -> expr.VectorizedApplyExpression:
+        expr_args = [self.eval_expression(arg, **kwargs) for arg in expression._args]
+        expr_kwargs = {
+            name: self.eval_expression(arg, **kwargs)
+            for name, arg in expression._kwargs.items()
+        }
+        return expr.VectorizedApplyExpression(
+            expression._fun,
+            expression._return_type,
+            propagate_none=expression._propagate_none,
+            deterministic=expression._deterministic,
+            args=tuple(expr_args),
+            kwargs=expr_kwargs,
+        )
+
     def eval_pointer(
         self, expression: expr.PointerExpression, **kwargs
     ) -> expr.PointerExpression:
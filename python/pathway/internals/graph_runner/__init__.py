@@ -27,6 +27,7 @@ from pathway.internals.operator import (
     InputOperator,
     Operator,
 )
+from pathway.internals.udfs.metrics import set_udf_metrics_enabled
 from pathway.persistence import (
     Config as PersistenceConfig,
     get_persistence_engine_config,
@@ -55,6 +56,9 @@ class GraphRunner:
         runtime_typechecking: bool | None = None,
         license_key: str | None = None,
         terminate_on_error: bool | None = None,
+        profile: str | os.PathLike | None = None,
+        memory_budget: int | None = None,
+        spill_dir: str | os.PathLike | None = None,
         _stacklevel: int = 1,
     ) -> None:
         pathway_config = get_pathway_config()
@@ -77,6 +81,11 @@ class GraphRunner:
         if terminate_on_error is None:
             terminate_on_error = pathway_config.terminate_on_error
         self.terminate_on_error = terminate_on_error
+        if profile is None:
+            profile = pathway_config.profile
+        self.profile = profile
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
         if not self.terminate_on_error:
             warnings.warn(
                 "terminate_on_error=False mode is experimental",
@@ -107,7 +116,9 @@ class GraphRunner:
         after_build: Callable[[ScopeState, OperatorStorageGraph], None] | None = None,
     ) -> None:
         self._run(
-            self._graph.global_scope.normal_nodes, after_build=after_build, run_all=True
+            self._graph.global_scope.nodes_to_run_all,
+            after_build=after_build,
+            run_all=True,
         )
 
     def run_outputs(
@@ -185,6 +196,10 @@ class GraphRunner:
                 if isinstance(operator, ContextualizedIntermediateOperator)
             ]
             monitoring_level = self.monitoring_level.to_internal()
+            # UDF metrics are exported only by the http server and the monitoring server
+            set_udf_metrics_enabled(
+                self.with_http_server or pathway_config.monitoring_server is not None
+            )
 
             with (
                 new_event_loop() as event_loop,
@@ -213,6 +228,9 @@ class GraphRunner:
                         trace_parent=trace_parent,
                         run_id=run_id,
                         terminate_on_error=self.terminate_on_error,
+                        profile=self.profile,
+                        memory_budget=self.memory_budget,
+                        spill_dir=self.spill_dir,
                     )
                 except api.EngineErrorWithTrace as e:
                     error, frame = e.args
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
+import numpy as np
+
 from pathway.engine import ExternalIndexData, ExternalIndexQuery
 from pathway.internals import (
     api,
@@ -29,6 +32,7 @@ from pathway.internals.operator_mapping import (
     get_convert_operators_mapping,
     get_unary_expression,
 )
+from pathway.internals.shadows import operator
 from pathway.internals.udfs import udf
 
 if TYPE_CHECKING:
@@ -126,12 +130,14 @@ class ExpressionEvaluator(ABC):
 class RowwiseEvalState:
     _dependencies: dict[clmn.Column, int]
     _storages: dict[Storage, api.Table]
+    _reused: dict[Hashable, clmn.Column]
     _deterministic: bool
     _locally_deterministic: bool
 
     def __init__(self) -> None:
         self._dependencies = {}
         self._storages = {}
+        self._reused = {}
         self._deterministic = True
         self._locally_deterministic = True
 
@@ -152,6 +158,23 @@ class RowwiseEvalState:
     def storages(self) -> list[Storage]:
         return list(self._storages.keys())
 
+    def get_reused_column(
+        self, expression: expr.ColumnExpression
+    ) -> clmn.Column | None:
+        if not self._reused:
+            return None
+        key = _expression_key(expression)
+        if key is None:
+            return None
+        return self._reused.get(key)
+
+    def set_reused_column(
+        self, expression: expr.ColumnExpression, column: clmn.Column
+    ) -> None:
+        key = _expression_key(expression)
+        if key is not None:
+            self._reused[key] = column
+
     def set_non_deterministic(self) -> None:
         self._locally_deterministic = False
         self._deterministic = False
@@ -221,10 +244,69 @@ class RowwiseEvaluator(
         engine_input_table = self.state.get_table(input_storage._universe)
         if output_storage.has_only_references:
             return engine_input_table
+        return self._run(
+            output_storage,
+            input_storage,
+            engine_input_table,
+            old_path,
+            disable_runtime_typechecking,
+        )
+
+    def _run(
+        self,
+        output_storage: Storage,
+        input_storage: Storage,
+        engine_input_table: api.Table,
+        old_path: ColumnPath | None,
+        disable_runtime_typechecking: bool,
+    ) -> api.Table:
+        runtime_typechecking = (
+            self.scope_context.runtime_typechecking and not disable_runtime_typechecking
+        )
+        new_columns: dict[clmn.ColumnWithExpression, expr.ColumnExpression] = {}
+        for column in output_storage.get_columns():
+            if input_storage.has_column(column):
+                continue
+            reused_column = self.scope_context.reused_columns.get(column)
+            if reused_column is not None and input_storage.has_column(reused_column):
+                # the values are taken from the input, like the old columns
+                continue
+            assert isinstance(column, clmn.ColumnWithExpression)
+            new_columns[column] = self.context.expression_with_type(column.expression)
 
         expressions = []
         eval_state = RowwiseEvalState()
 
+        if not runtime_typechecking and (
+            repeated := _repeated_applies(new_columns.values())
+        ):
+            # deterministic applies repeated in the columns are computed once,
+            # in a separate step, and then referred to by the columns
+            hoisted_columns = [
+                clmn.ColumnWithExpression(
+                    self.context, self.context.universe, expression
+                )
+                for expression in repeated.values()
+            ]
+            stage_storage = input_storage.with_prefix((0,)).with_updated_paths(
+                {
+                    column: ColumnPath((i + 1,))
+                    for i, column in enumerate(hoisted_columns)
+                }
+            )
+            engine_input_table = self._run(
+                stage_storage,
+                input_storage,
+                engine_input_table,
+                old_path=ColumnPath.EMPTY,
+                disable_runtime_typechecking=True,
+            )
+            input_storage = stage_storage
+            if old_path is not None:
+                old_path = (0,) + old_path
+            for expression, column in zip(repeated.values(), hoisted_columns):
+                eval_state.set_reused_column(expression, column)
+
         if (
             old_path is not None and not output_storage.has_only_new_columns
         ):  # keep old columns if they are needed
@@ -244,22 +326,13 @@ class RowwiseEvaluator(
                 {placeholder_column: old_path}
             )
 
-        for column in output_storage.get_columns():
-            if input_storage.has_column(column):
-                continue
-            assert isinstance(column, clmn.ColumnWithExpression)
-            expression = column.expression
-            expression = self.context.expression_with_type(expression)
-            if (
-                self.scope_context.runtime_typechecking
-                and not disable_runtime_typechecking
-            ):
-                expression = TypeVerifier().eval_expression(expression)
+        for column, expression in new_columns.items():
             properties = api.TableProperties.column(self.column_properties(column))
-
+            append_only = column.properties.append_only
+            if runtime_typechecking:
+                expression = TypeVerifier().eval_expression(expression)
             eval_state.reset_locally_deterministic()
             engine_expression = self.eval_expression(expression, eval_state=eval_state)
-            append_only = column.properties.append_only
             deterministic = eval_state.locally_deterministic
             assert ColumnPath((len(expressions),)) == output_storage.get_path(column)
             expressions.append(
@@ -429,11 +502,13 @@ class RowwiseEvaluator(
         expression: expr.ApplyExpression,
         eval_state: RowwiseEvalState | None = None,
     ):
+        assert eval_state is not None
+        if (reused_column := eval_state.get_reused_column(expression)) is not None:
+            return self.eval_dependency(reused_column, eval_state=eval_state)
         fun, args = self._prepare_positional_apply(
             fun=expression._fun, args=expression._args, kwargs=expression._kwargs
         )
         if not expression._deterministic:
-            assert eval_state is not None
             eval_state.set_non_deterministic()
         return api.Expression.apply(
             fun,
@@ -442,11 +517,34 @@ class RowwiseEvaluator(
             dtype=expression._dtype.to_engine(),
         )
 
+    def eval_vectorized_apply(
+        self,
+        expression: expr.VectorizedApplyExpression,
+        eval_state: RowwiseEvalState | None = None,
+    ):
+        assert eval_state is not None
+        if (reused_column := eval_state.get_reused_column(expression)) is not None:
+            return self.eval_dependency(reused_column, eval_state=eval_state)
+        fun, args = self._prepare_positional_apply(
+            fun=expression._fun, args=expression._args, kwargs=expression._kwargs
+        )
+        if not expression._deterministic:
+            eval_state.set_non_deterministic()
+        return api.Expression.vectorized_apply(
+            _vectorized_function(fun),
+            *(self.eval_expression(arg, eval_state=eval_state) for arg in args),
+            propagate_none=expression._propagate_none,
+            dtype=expression._dtype.to_engine(),
+        )
+
     def eval_async_apply(
         self,
         expression: expr.AsyncApplyExpression,
         eval_state: RowwiseEvalState | None = None,
     ):
+        assert eval_state is not None
+        if (reused_column := eval_state.get_reused_column(expression)) is not None:
+            return self.eval_dependency(reused_column, eval_state=eval_state)
         fun, args = self._prepare_positional_apply(
             fun=expression._fun,
             args=expression._args,
@@ -469,8 +567,8 @@ class RowwiseEvaluator(
             expression._dtype.to_engine(),
         )
 
-        assert eval_state is not None
         eval_state.set_temporary_table(output_storage, engine_table)
+        eval_state.set_reused_column(expression, tmp_column)
         return self.eval_dependency(tmp_column, eval_state=eval_state)
 
     def eval_cast(
@@ -751,6 +849,149 @@ class RowwiseEvaluator(
             return fun, args
 
 
+def _vectorized_function(fun: Callable) -> Callable:
+    """Adapts a function operating on NumPy arrays to the engine, which passes each
+    argument column as a pair of an array and a mask of None values (or None if there
+    are no such values) and expects the result in the same form."""
+
+    def wrapped(*columns: tuple[np.ndarray, np.ndarray | None]):
+        args = [
+            data if mask is None else np.ma.masked_array(data, mask)
+            for data, mask in columns
+        ]
+        result = fun(*args)
+        mask = np.ma.getmask(result)
+        return (
+            np.asarray(np.ma.getdata(result)),
+            None if mask is np.ma.nomask else np.asarray(mask, dtype=bool),
+        )
+
+    return wrapped
+
+
+def _expression_key(expression: expr.ColumnExpression) -> Hashable | None:
+    """Returns a structural fingerprint of a deterministic expression, equal for
+    expressions computing the same values, or None if there is no such fingerprint."""
+
+    if any(
+        isinstance(subexpression, expr.ApplyExpression)
+        and not subexpression._deterministic
+        for subexpression in _subexpressions(expression)
+    ):
+        return None
+
+    def normalize(value):
+        if isinstance(value, expr.InternalColRef):
+            column = value.args[0]
+            # a reference on the same universe has the values of the referred column
+            while (
+                isinstance(column, clmn.ColumnWithReference)
+                and column.dereference().universe == column.universe
+            ):
+                column = column.dereference()
+            return column
+        if isinstance(value, expr.InternalColExpr):
+            return (
+                value.kind,
+                tuple(normalize(arg) for arg in value.args),
+                tuple((name, normalize(kwarg)) for name, kwarg in value.kwargs),
+            )
+        return (type(value), value)  # so that 1, 1.0 and True differ
+
+    key = normalize(expression._to_internal())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def computed_column_key(
+    column: clmn.Column, expression: expr.ColumnExpression
+) -> Hashable | None:
+    """Returns a fingerprint of a column computed with applies, under which
+    it can be reused by other operators on the same universe."""
+    if not any(
+        isinstance(subexpression, expr.ApplyExpression)
+        for subexpression in _subexpressions(expression)
+    ):
+        return None
+    key = _expression_key(expression)
+    if key is None:
+        return None
+    return (key, column.properties.dtype, column.properties.append_only)
+
+
+def _subexpressions(
+    expression: expr.ColumnExpression,
+) -> Iterator[expr.ColumnExpression]:
+    yield expression
+    for dep in expression._deps:
+        yield from _subexpressions(dep)
+
+
+def _is_hoistable(expression: expr.ColumnExpression) -> bool:
+    return isinstance(expression, expr.ApplyExpression) and not isinstance(
+        expression, expr.AsyncApplyExpression
+    )
+
+
+def _unconditional_deps(
+    expression: expr.ColumnExpression,
+) -> tuple[expr.ColumnExpression, ...]:
+    """Returns the dependencies of the expression that are evaluated for every row,
+    skipping the branches that the engine evaluates lazily."""
+    if isinstance(expression, expr.IfElseExpression):
+        return (expression._if,)
+    if isinstance(expression, expr.CoalesceExpression):
+        return expression._args[:1]
+    if isinstance(expression, expr.RequireExpression):
+        return expression._args[:1] if expression._args else (expression._val,)
+    if isinstance(expression, expr.FillErrorExpression):
+        return (expression._expr,)
+    if isinstance(
+        expression, expr.ColumnBinaryOpExpression
+    ) and expression._operator in (operator.and_, operator.or_):
+        return (expression._left,)
+    return expression._deps
+
+
+def _repeated_applies(
+    expressions: Iterable[expr.ColumnExpression],
+) -> dict[Hashable, expr.ColumnExpression]:
+    """Finds the outermost synchronous applies occurring more than once in
+    the expressions. Only the occurrences evaluated for every row are taken into
+    account, so that hoisting an apply never calls it on rows it wasn't called on."""
+    expressions = list(expressions)
+    counts: Counter[Hashable] = Counter()
+
+    def count(expression: expr.ColumnExpression) -> None:
+        if _is_hoistable(expression):
+            key = _expression_key(expression)
+            if key is not None:
+                counts[key] += 1
+        for dep in _unconditional_deps(expression):
+            count(dep)
+
+    for expression in expressions:
+        count(expression)
+
+    repeated: dict[Hashable, expr.ColumnExpression] = {}
+
+    def visit(expression: expr.ColumnExpression) -> None:
+        if _is_hoistable(expression):
+            key = _expression_key(expression)
+            if key is not None and counts[key] > 1:
+                repeated.setdefault(key, expression)
+                return
+        for dep in _unconditional_deps(expression):
+            visit(dep)
+
+    for expression in expressions:
+        visit(expression)
+    return repeated
+
+
 class TableRestrictedRowwiseEvaluator(
     RowwiseEvaluator, context_type=clmn.TableRestrictedRowwiseContext
 ):
@@ -1099,6 +1340,9 @@ class JoinEvaluator(ExpressionEvaluator, context_type=clmn.JoinContext):
             assign_id=self.context.assign_id,
             left_ear=self.context.left_ear,
             right_ear=self.context.right_ear,
+            broadcast_left=self.context.broadcast_left,
+            broadcast_right=self.context.broadcast_right,
+            skewed_keys=list(self.context.skewed_keys),
         )
         self.state.set_table(join_storage, output_engine_table)
 
@@ -1172,6 +1416,7 @@ class GroupedEvaluator(ExpressionEvaluator, context_type=clmn.GroupedContext):
             reducers,
             self.context.set_id,
             properties,
+            skewed_keys=list(self.context.skewed_keys),
         )
 
         return reduced_engine_table
@@ -81,7 +81,9 @@ class OperatorHandler(ABC, Generic[T]):
     ):
         with trace.custom_trace(operator.trace):
             self.scope.set_operator_properties(
-                self.operator_id, operator.depends_on_error_log
+                self.operator_id,
+                operator.depends_on_error_log,
+                operator.trace.to_engine(),
             )
             if operator.error_log and not self.scope_context.inside_iterate:
                 self.scope.set_error_log(self.state.get_error_log(operator.error_log))
@@ -197,6 +199,10 @@ class OutputOperatorHandler(
                 on_end=datasink.on_end,
                 skip_persisted_batch=datasink.skip_persisted_batch,
                 skip_errors=datasink.skip_errors,
+                on_batch=datasink.on_batch,
+                on_batch_column_types=[
+                    column.dtype.to_engine() for column in table._columns.values()
+                ],
             )
         elif isinstance(datasink, ExportDataSink):
             exported_table = self.scope.export_table(
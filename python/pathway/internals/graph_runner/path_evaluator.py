@@ -5,7 +5,7 @@ from __future__ import annotations
 import itertools
 import math
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import ClassVar
 
 import pathway.internals.column as clmn
@@ -22,6 +22,7 @@ def compute_paths(
     input_storages: dict[Universe, Storage],
     operator: op.Operator,
     context: clmn.Context,
+    reused_columns: Mapping[clmn.Column, clmn.Column] | None = None,
 ):
     evaluator: PathEvaluator
     match operator:
@@ -30,7 +31,7 @@ def compute_paths(
         case op.RowTransformerOperator():
             evaluator = FlatStoragePathEvaluator(context)
         case op.ContextualizedIntermediateOperator():
-            evaluator = PathEvaluator.for_context(context)(context)
+            evaluator = PathEvaluator.for_context(context)(context, reused_columns)
         case _:
             raise ValueError(
                 f"Operator {operator} in update_storage() but it shouldn't produce tables."
@@ -67,10 +68,25 @@ def maybe_flatten_input_storage(
 
 class PathEvaluator(ABC):
     context: clmn.Context
+    reused_columns: Mapping[clmn.Column, clmn.Column]
 
-    def __init__(self, context: clmn.Context) -> None:
+    def __init__(
+        self,
+        context: clmn.Context,
+        reused_columns: Mapping[clmn.Column, clmn.Column] | None = None,
+    ) -> None:
         super().__init__()
         self.context = context
+        self.reused_columns = reused_columns if reused_columns is not None else {}
+
+    def reused_column(
+        self, column: clmn.Column, input_storage: Storage
+    ) -> clmn.Column | None:
+        """Returns the column of the input computing the same values as the column."""
+        reused_column = self.reused_columns.get(column)
+        if reused_column is not None and input_storage.has_column(reused_column):
+            return reused_column
+        return None
 
     @abstractmethod
     def compute(
@@ -142,6 +158,10 @@ class AddNewColumnsPathEvaluator(
                 and input_storage.get_path(column.expression._column) != ColumnPath.KEY
             ):
                 paths[column] = input_storage.get_path(column.expression._column)
+            elif (
+                reused_column := self.reused_column(column, input_storage)
+            ) is not None:
+                paths[column] = input_storage.get_path(reused_column)
             else:
                 return None
         return input_storage.with_updated_paths(paths).with_only_references()
@@ -152,7 +172,10 @@ class AddNewColumnsPathEvaluator(
         input_storage: Storage,
     ) -> Storage | None:
         for column in output_columns:
-            if input_storage.has_column(column):
+            if (
+                input_storage.has_column(column)
+                or self.reused_column(column, input_storage) is not None
+            ):
                 return None
         return Storage.flat(
             self.context.universe, output_columns
@@ -178,7 +201,12 @@ class AddNewColumnsPathEvaluator(
         paths: dict[clmn.Column, ColumnPath] = {}
         counter = itertools.count(start=1)
         for column in output_columns:
-            if not input_storage.has_column(column):
+            if input_storage.has_column(column):
+                continue
+            reused_column = self.reused_column(column, input_storage)
+            if reused_column is not None:
+                paths[column] = (0,) + input_storage.get_path(reused_column)
+            else:
                 paths[column] = ColumnPath((next(counter),))
         return input_storage.with_prefix((0,)).with_updated_paths(
             paths, universe=self.context.universe
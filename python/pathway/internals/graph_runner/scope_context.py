@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
-from pathway.internals import operator
+from pathway.internals import column, operator
 from pathway.internals.helpers import StableSet
 
 if TYPE_CHECKING:
@@ -19,6 +19,9 @@ class ScopeContext:
     subscopes: dict[operator.Operator, ScopeContext] = field(default_factory=dict)
     runtime_typechecking: bool = False
     inside_iterate: bool = False
+    # columns computing the same values as a column of an earlier operator on the
+    # same universe, mapped to that column
+    reused_columns: dict[column.Column, column.Column] = field(default_factory=dict)
 
     def iterate_subscope(
         self, operator: operator.IterateOperator, graph_builder: GraphRunner
@@ -28,6 +31,8 @@ class ScopeContext:
                 operator.scope,
                 operator.result_iterated + operator.result_iterated_with_universe,
             )
-            self.subscopes[operator] = replace(self, nodes=nodes, inside_iterate=True)
+            self.subscopes[operator] = replace(
+                self, nodes=nodes, inside_iterate=True, reused_columns={}
+            )
 
         return self.subscopes[operator]
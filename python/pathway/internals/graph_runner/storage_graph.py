@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from itertools import chain
 from typing import TYPE_CHECKING
 
 from pathway.internals import api
-from pathway.internals.column import Column, IdColumn, MaterializedColumn
+from pathway.internals.column import (
+    Column,
+    ColumnWithExpression,
+    ColumnWithReference,
+    IdColumn,
+    MaterializedColumn,
+    RowwiseContext,
+)
 from pathway.internals.column_path import ColumnPath
 from pathway.internals.graph_runner import path_evaluator
+from pathway.internals.graph_runner.expression_evaluator import computed_column_key
 from pathway.internals.graph_runner.path_storage import Storage
 from pathway.internals.graph_runner.scope_context import ScopeContext
 from pathway.internals.graph_runner.state import ScopeState
@@ -94,6 +102,7 @@ class OperatorStorageGraph:
         column_dependencies: dict[Universe, StableSet[Column]],
         input_universes: StableSet[Universe] | None = None,
     ) -> None:
+        self._compute_reused_columns()
         operators_reversed = reversed(list(self.scope_context.nodes))
 
         for operator in operators_reversed:
@@ -114,6 +123,33 @@ class OperatorStorageGraph:
                         + f"universe: {universe} in operator: {operator}"
                     )
 
+    def _compute_reused_columns(self) -> None:
+        """Finds the columns of rowwise operators computing the same values as a column
+        of an earlier operator on the same universe, e.g. the same deterministic UDF
+        applied to the same columns by sibling selects. Such columns are taken from the
+        earlier one instead of being computed again."""
+        computed: dict[tuple[Universe, Hashable], Column] = {}
+        for operator in self.scope_context.nodes:
+            operator_columns: dict[tuple[Universe, Hashable], Column] = {}
+            for table in operator.intermediate_and_output_tables:
+                if not isinstance(table._id_column.context, RowwiseContext):
+                    continue
+                for column in table._columns.values():
+                    if not isinstance(column, ColumnWithExpression) or isinstance(
+                        column, ColumnWithReference
+                    ):
+                        continue
+                    key = computed_column_key(column, column.expression)
+                    if key is None:
+                        continue
+                    if (table._universe, key) in computed:
+                        self.scope_context.reused_columns[column] = computed[
+                            (table._universe, key)
+                        ]
+                    else:
+                        operator_columns.setdefault((table._universe, key), column)
+            computed.update(operator_columns)
+
     def _can_skip_universe_with_cols(
         self,
         universe: Universe,
@@ -161,7 +197,13 @@ class OperatorStorageGraph:
             for column in chain(table._columns.values(), [table._id_column]):
                 # if the first condition is not met, the column is not needed (tree shaking)
                 if column in output_deps or isinstance(column, IdColumn):
-                    for dependency in column.column_dependencies():
+                    reused_column = self.scope_context.reused_columns.get(column)
+                    dependencies = (
+                        StableSet([reused_column])
+                        if reused_column is not None
+                        else column.column_dependencies()
+                    )
+                    for dependency in dependencies:
                         if not isinstance(dependency, IdColumn):
                             column_dependencies[dependency.universe].add(dependency)
 
@@ -237,6 +279,7 @@ class OperatorStorageGraph:
                 storages,
                 operator,
                 table._id_column.context,
+                self.scope_context.reused_columns,
             )
             if path_storage.max_depth > 3:
                 # TODO: 3 is arbitrarily specified number. Check what's best.
@@ -6,7 +6,7 @@ import itertools
 from abc import abstractmethod
 from collections.abc import Iterable, Iterator
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pathway.internals.expression_visitor import IdentityTransform
 from pathway.internals.trace import trace_user_frame
@@ -23,11 +23,12 @@ from pathway.internals.desugaring import (
     DesugaringContext,
     SubstitutionDesugaring,
     TableReduceDesugaring,
+    TableSubstitutionDesugaring,
     ThisDesugaring,
     combine_args_kwargs,
     desugar,
 )
-from pathway.internals.helpers import StableSet
+from pathway.internals.helpers import StableSet, skewed_keys_from_hint
 from pathway.internals.operator_input import OperatorInput
 from pathway.internals.parse_graph import G
 from pathway.internals.universe import Universe
@@ -94,6 +95,8 @@ class GroupedTable(GroupedJoinable, OperatorInput):
     _filter_out_results_of_forgetting: bool
     _skip_errors: bool
     _is_window: bool
+    _skewed_keys: tuple[tuple[Any, ...], ...]
+    _table_substitution: dict[table.TableLike, table.Table]
 
     def __init__(
         self,
@@ -105,6 +108,8 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         _filter_out_results_of_forgetting: bool = False,
         _skip_errors: bool = True,
         _is_window: bool = False,
+        _skewed_keys: tuple[tuple[Any, ...], ...] = (),
+        _table_substitution: dict[table.TableLike, table.Table] | None = None,
     ):
         super().__init__(Universe(), {thisclass.this: self}, _table)
         self._grouping_columns = StableSet(_grouping_columns)
@@ -114,6 +119,8 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         self._filter_out_results_of_forgetting = _filter_out_results_of_forgetting
         self._skip_errors = _skip_errors
         self._is_window = _is_window
+        self._skewed_keys = _skewed_keys
+        self._table_substitution = _table_substitution or {}
 
     @classmethod
     def create(
@@ -126,12 +133,15 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         _filter_out_results_of_forgetting: bool = False,
         _skip_errors: bool = True,
         _is_window: bool = False,
+        skew_hint: Iterable[Any] | None = None,
+        table_substitution: dict[table.TableLike, table.Table] | None = None,
     ) -> GroupedTable:
         cols = tuple(arg._to_original()._to_internal() for arg in grouping_columns)
         col_sort_by = (
             sort_by._to_original()._to_internal() if sort_by is not None else None
         )
-        key = (cls.__name__, table, cols, set_id, col_sort_by)
+        skewed_keys = skewed_keys_from_hint(skew_hint, len(cols), "skew_hint")
+        key = (cls.__name__, table, cols, set_id, col_sort_by, skewed_keys)
         if key not in G.cache:
             result = GroupedTable(
                 _table=table,
@@ -142,6 +152,8 @@ class GroupedTable(GroupedJoinable, OperatorInput):
                 _filter_out_results_of_forgetting=_filter_out_results_of_forgetting,
                 _skip_errors=_skip_errors,
                 _is_window=_is_window,
+                _skewed_keys=skewed_keys,
+                _table_substitution=table_substitution,
             )
             G.cache[key] = result
         return G.cache[key]
@@ -186,6 +198,13 @@ class GroupedTable(GroupedJoinable, OperatorInput):
         """
 
         kwargs = combine_args_kwargs(args, kwargs)
+        if self._table_substitution:
+            # references to the table that was grouped before its state expiry
+            substitution = TableSubstitutionDesugaring(self._table_substitution)
+            kwargs = {
+                name: substitution.eval_expression(expression)
+                for name, expression in kwargs.items()
+            }
 
         output_expressions = {}
         state = _ReducerExpressionState()
@@ -223,6 +242,7 @@ class GroupedTable(GroupedJoinable, OperatorInput):
             inner_context=self._joinable_to_group._rowwise_context,
             sort_by=self._sort_by,
             skip_errors=self._skip_errors,
+            skewed_keys=self._skewed_keys,
         )
 
         for column_name, value in kwargs.items():
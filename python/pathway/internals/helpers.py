@@ -6,7 +6,7 @@ from __future__ import annotations
 from collections import namedtuple
 from collections.abc import Iterable, Iterator, MutableSet
 from functools import partial, wraps
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from pathway.internals import arg_tuple
 from pathway.internals.shadows import inspect
@@ -124,3 +124,22 @@ class StableSet(MutableSet[T]):
         res: StableSet[T] = StableSet()
         res.update(*sets)
         return res
+
+
+def skewed_keys_from_hint(
+    hint: Iterable[Any] | None, n_columns: int, name: str
+) -> tuple[tuple[Any, ...], ...]:
+    """Turns the hot keys given by the user into tuples of values of the key columns."""
+    if hint is None:
+        return ()
+    if n_columns == 1:
+        return tuple((value,) for value in hint)
+    skewed_keys = []
+    for values in hint:
+        if not isinstance(values, tuple) or len(values) != n_columns:
+            raise ValueError(
+                f"{name} has to contain tuples of {n_columns} values when the key"
+                + f" consists of {n_columns} columns, found {values!r}."
+            )
+        skewed_keys.append(values)
+    return tuple(skewed_keys)
@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+import datetime
 import itertools
-from collections.abc import Iterator
-from functools import lru_cache
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache, reduce
 from typing import TYPE_CHECKING, Any, cast
 
 from pathway.internals.trace import trace_user_frame
@@ -31,12 +33,15 @@ from pathway.internals.desugaring import (
     DesugaringContext,
     SubstitutionDesugaring,
     TableSelectDesugaring,
+    TableSubstitutionDesugaring,
+    ThisDesugaring,
     combine_args_kwargs,
     desugar,
 )
-from pathway.internals.helpers import StableSet
+from pathway.internals.helpers import StableSet, skewed_keys_from_hint
 from pathway.internals.join_mode import JoinMode
 from pathway.internals.operator_input import OperatorInput
+from pathway.internals.parse_graph import G
 from pathway.internals.shadows import operator as op
 from pathway.internals.table_like import TableLike
 from pathway.internals.type_interpreter import eval_type
@@ -140,6 +145,11 @@ class Joinable(TableLike, DesugaringContext):
         how: JoinMode = JoinMode.INNER,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew: Iterable[Any] | None = None,
+        broadcast: bool = False,
+        ttl: int | float | datetime.timedelta | None = None,
+        left_ttl_time: expr.ColumnExpression | None = None,
+        right_ttl_time: expr.ColumnExpression | None = None,
     ) -> JoinResult:
         """Join self with other using the given join expression.
 
@@ -152,6 +162,24 @@ class Joinable(TableLike, DesugaringContext):
               correspond to inner, left, right and outer join respectively.
             left_instance/right_instance: optional arguments describing partitioning of the data into
               separate instances
+            skew: optional values of the join columns (tuples of them when joining
+                on multiple columns) that hold a large part of the rows of ``self``.
+                These rows are spread over all workers and the matching rows of
+                ``other`` are replicated to every worker. With ``id=other.id`` the
+                roles are swapped.
+            broadcast: if True, ``other`` is replicated to every worker and joined
+                there with the rows of ``self``, which are not exchanged between
+                workers. Meant for a small ``other``, like a dimension table joined
+                with a large stream.
+            ttl: optional time to live of the rows of both sides, measured in the
+                event time given by ``left_ttl_time`` and ``right_ttl_time``. A row is
+                dropped from the state of the join once the latest event time seen
+                exceeds its own time by ``ttl``. Results of the join involving it are
+                kept in the output, and rows arriving later than ``ttl`` are ignored.
+                Only supported in inner joins of two tables, as the unmatched rows of
+                the other modes would be matched again once their match expires.
+            left_ttl_time/right_ttl_time: event time of the rows of ``self`` and
+                ``other``, required with ``ttl``.
 
         Returns:
             JoinResult: an object on which `.select()` may be called to extract relevant
@@ -187,6 +215,11 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew=skew,
+            broadcast=broadcast,
+            ttl=ttl,
+            left_ttl_time=left_ttl_time,
+            right_ttl_time=right_ttl_time,
         )
 
     @trace_user_frame
@@ -199,6 +232,11 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew: Iterable[Any] | None = None,
+        broadcast: bool = False,
+        ttl: int | float | datetime.timedelta | None = None,
+        left_ttl_time: expr.ColumnExpression | None = None,
+        right_ttl_time: expr.ColumnExpression | None = None,
     ) -> JoinResult:
         """Inner-joins two tables or join results.
 
@@ -209,6 +247,24 @@ class Joinable(TableLike, DesugaringContext):
             id: optional argument for id of result, can be only self.id or other.id
             left_instance/right_instance: optional arguments describing partitioning of the data
                 into separate instances
+            skew: optional values of the join columns (tuples of them when joining
+                on multiple columns) that hold a large part of the rows of ``self``.
+                These rows are spread over all workers and the matching rows of
+                ``other`` are replicated to every worker. With ``id=other.id`` the
+                roles are swapped.
+            broadcast: if True, ``other`` is replicated to every worker and joined
+                there with the rows of ``self``, which are not exchanged between
+                workers. Meant for a small ``other``, like a dimension table joined
+                with a large stream.
+            ttl: optional time to live of the rows of both sides, measured in the
+                event time given by ``left_ttl_time`` and ``right_ttl_time``. A row is
+                dropped from the state of the join once the latest event time seen
+                exceeds its own time by ``ttl``. Results of the join involving it are
+                kept in the output, and rows arriving later than ``ttl`` are ignored.
+                Only supported in inner joins of two tables, as the unmatched rows of
+                the other modes would be matched again once their match expires.
+            left_ttl_time/right_ttl_time: event time of the rows of ``self`` and
+                ``other``, required with ``ttl``.
 
         Returns:
             JoinResult: an object on which `.select()` may be called to extract relevant
@@ -244,6 +300,11 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew=skew,
+            broadcast=broadcast,
+            ttl=ttl,
+            left_ttl_time=left_ttl_time,
+            right_ttl_time=right_ttl_time,
         )
 
     @trace_user_frame
@@ -256,6 +317,8 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew: Iterable[Any] | None = None,
+        broadcast: bool = False,
     ) -> JoinResult:
         """
         Left-joins two tables or join results.
@@ -266,6 +329,15 @@ class Joinable(TableLike, DesugaringContext):
             id: optional id column of the result
             left_instance/right_instance: optional arguments describing partitioning of the data into
               separate instances
+            skew: optional values of the join columns (tuples of them when joining
+                on multiple columns) that hold a large part of the rows of ``self``.
+                These rows are spread over all workers and the matching rows of
+                ``other`` are replicated to every worker. With ``id=other.id`` the
+                roles are swapped.
+            broadcast: if True, ``other`` is replicated to every worker and joined
+                there with the rows of ``self``, which are not exchanged between
+                workers. Meant for a small ``other``, like a dimension table joined
+                with a large stream.
 
         Remarks:
         args cannot contain id column from either of tables, \
@@ -321,6 +393,8 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew=skew,
+            broadcast=broadcast,
         )
 
     @trace_user_frame
@@ -333,6 +407,8 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew: Iterable[Any] | None = None,
+        broadcast: bool = False,
     ) -> JoinResult:
         """
         Outer-joins two tables or join results.
@@ -343,6 +419,15 @@ class Joinable(TableLike, DesugaringContext):
             id: optional id column of the result
             left_instance/right_instance: optional arguments describing partitioning of the data into separate
               instances
+            skew: optional values of the join columns (tuples of them when joining
+                on multiple columns) that hold a large part of the rows of ``self``.
+                These rows are spread over all workers and the matching rows of
+                ``other`` are replicated to every worker. With ``id=other.id`` the
+                roles are swapped.
+            broadcast: if True, ``other`` is replicated to every worker and joined
+                there with the rows of ``self``, which are not exchanged between
+                workers. Meant for a small ``other``, like a dimension table joined
+                with a large stream.
 
         Remarks: args cannot contain id column from either of tables, \
         as the result table has id column with auto-generated ids; \
@@ -401,6 +486,8 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew=skew,
+            broadcast=broadcast,
         )
 
     @trace_user_frame
@@ -413,6 +500,8 @@ class Joinable(TableLike, DesugaringContext):
         id: expr.ColumnReference | None = None,
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
+        skew: Iterable[Any] | None = None,
+        broadcast: bool = False,
     ) -> JoinResult:
         """Outer-joins two tables or join results.
 
@@ -421,6 +510,15 @@ class Joinable(TableLike, DesugaringContext):
             *on: Columns to join, syntax `self.col1 == other.col2`
             id: optional id column of the result
             instance: optional argument describing partitioning of the data into separate instances
+            skew: optional values of the join columns (tuples of them when joining
+                on multiple columns) that hold a large part of the rows of ``self``.
+                These rows are spread over all workers and the matching rows of
+                ``other`` are replicated to every worker. With ``id=other.id`` the
+                roles are swapped.
+            broadcast: if True, ``other`` is replicated to every worker and joined
+                there with the rows of ``self``, which are not exchanged between
+                workers. Meant for a small ``other``, like a dimension table joined
+                with a large stream.
 
         Remarks: args cannot contain id column from either of tables, \
             as the result table has id column with auto-generated ids; \
@@ -478,6 +576,8 @@ class Joinable(TableLike, DesugaringContext):
             id=id,
             left_instance=left_instance,
             right_instance=right_instance,
+            skew=skew,
+            broadcast=broadcast,
         )
 
     @property
@@ -490,6 +590,33 @@ class Joinable(TableLike, DesugaringContext):
     ) -> tuple[Table, dict[expr.InternalColRef, expr.ColumnExpression]]: ...
 
 
+@dataclass(frozen=True)
+class _JoinArguments:
+    """Arguments of a join, kept to rebuild it with filters pushed down to its inputs.
+    The expressions refer to the original inputs of the join, while `left` and
+    `right` are the inputs with the filters pushed down so far."""
+
+    left: Joinable
+    right: Joinable
+    on: tuple[expr.ColumnExpression, ...]
+    kwargs: dict[str, Any]
+
+    def refer_only_to(self, tables: StableSet[Table]) -> bool:
+        expressions = [
+            *self.on,
+            *(
+                value
+                for value in self.kwargs.values()
+                if isinstance(value, expr.ColumnExpression)
+            ),
+        ]
+        return all(
+            ref._table in tables
+            for expression in expressions
+            for ref in expression._dependencies()
+        )
+
+
 class JoinResult(Joinable, OperatorInput):
     """Result of a join between tables.
 
@@ -527,6 +654,7 @@ class JoinResult(Joinable, OperatorInput):
     _joined_on_names: StableSet[str]
     _all_colnames: StableSet[str]
     _join_mode: JoinMode
+    _join_arguments: _JoinArguments | None
 
     def __init__(
         self,
@@ -540,6 +668,7 @@ class JoinResult(Joinable, OperatorInput):
         _substitution: dict[thisclass.ThisMetaclass, Joinable],
         _joined_on_names: StableSet[str],
         _join_mode: JoinMode,
+        _join_arguments: _JoinArguments | None = None,
     ):
         super().__init__(_context)
         self._inner_table = _inner_table
@@ -549,6 +678,7 @@ class JoinResult(Joinable, OperatorInput):
         self._substitution = {**_substitution, thisclass.this: self}
         self._joined_on_names = _joined_on_names
         self._join_mode = _join_mode
+        self._join_arguments = _join_arguments
         self._original_left = _original_left
         self._original_right = _original_right
         assert _original_left._subtables().isdisjoint(_original_right._subtables())
@@ -693,6 +823,12 @@ class JoinResult(Joinable, OperatorInput):
     def filter(self, filter_expression: expr.ColumnExpression) -> JoinResult:
         """Filters rows, keeping the ones satisfying the predicate.
 
+        Conditions of the predicate (joined with ``&``) that refer to only one of the
+        joined tables, and that can't be affected by the join, are applied to that
+        table before joining it, so that the join keeps fewer rows in its state. The
+        join on the unfiltered tables is then not computed, unless it is used
+        elsewhere.
+
         Example:
 
         >>> import pathway as pw
@@ -715,13 +851,155 @@ class JoinResult(Joinable, OperatorInput):
         9   | L
         10  | M
         """
+        if self._join_arguments is not None:
+            pushed_down = self._push_down_filter(filter_expression)
+            if pushed_down is not None:
+                return pushed_down
         desugared_filter_expression = self._chained_join_desugaring.eval_expression(
             filter_expression
         )
         inner_table = self._inner_table.filter(desugared_filter_expression)
+        return self._with_inner_table(inner_table, self._columns_mapping)
+
+    def _push_down_filter(
+        self, filter_expression: expr.ColumnExpression
+    ) -> JoinResult | None:
+        """Applies the conditions of the filter referring to a single input of the join
+        to that input and rebuilds the join. Returns None if there are no such
+        conditions."""
+        assert self._join_arguments is not None
+        if not self._join_arguments.refer_only_to(self._subtables()):
+            return None
+        left_conditions: list[expr.ColumnExpression] = []
+        right_conditions: list[expr.ColumnExpression] = []
+        remaining_conditions: list[expr.ColumnExpression] = []
+        for condition in _conjuncts(filter_expression):
+            tables = {ref._table for ref in condition._dependencies()}
+            if self._join_mode in [JoinMode.INNER, JoinMode.LEFT] and tables.issubset(
+                self._original_left._subtables()
+            ):
+                left_conditions.append(condition)
+            elif self._join_mode in [
+                JoinMode.INNER,
+                JoinMode.RIGHT,
+            ] and tables.issubset(self._original_right._subtables()):
+                right_conditions.append(condition)
+            else:
+                remaining_conditions.append(condition)
+        if not left_conditions and not right_conditions:
+            return None
+
+        left = self._filter_input(
+            self._original_left, self._join_arguments.left, left_conditions
+        )
+        right = self._filter_input(
+            self._original_right, self._join_arguments.right, right_conditions
+        )
+        result = self._rejoin(left, right)
+        if remaining_conditions:
+            substitution = TableSubstitutionDesugaring(
+                {self._inner_table: result._inner_table}
+            )
+            result = result.filter(
+                substitution.eval_expression(reduce(op.and_, remaining_conditions))
+            )
+        return result
+
+    @staticmethod
+    def _filter_input(
+        original: Joinable,
+        current: Joinable,
+        conditions: list[expr.ColumnExpression],
+    ) -> Joinable:
+        from pathway.internals.table import Table
+
+        if not conditions:
+            return current
+        condition = reduce(op.and_, conditions)
+        if isinstance(original, Table) and original is not current:
+            # join results keep resolving the columns of the original tables,
+            # their filtered versions don't
+            substitution = TableSubstitutionDesugaring({original: current})
+            condition = substitution.eval_expression(condition)
+        return current.filter(condition)
+
+    def _rejoin(self, left: Joinable, right: Joinable) -> JoinResult:
+        from pathway.internals.table import Table
+
+        assert self._join_arguments is not None
+        substitution = TableSubstitutionDesugaring(
+            {
+                original: new
+                for original, new in [
+                    (self._original_left, left),
+                    (self._original_right, right),
+                ]
+                if isinstance(original, Table)
+            }
+        )
+        result = JoinResult._table_join(
+            left,
+            right,
+            *(substitution.eval_expression(cond) for cond in self._join_arguments.on),
+            **{
+                name: (
+                    substitution.eval_expression(value)
+                    if isinstance(value, expr.ColumnExpression)
+                    else value
+                )
+                for name, value in self._join_arguments.kwargs.items()
+            },
+        )
+        # the rows of the rebuilt join are the rows of this join that pass the filter,
+        # with the same ids
+        G.universe_solver.register_as_subset(
+            result._inner_table._universe, self._inner_table._universe
+        )
+        # the unfiltered join is computed only if something else still uses it
+        G.replace_operator(self._inner_table._source.operator)
+        # columns of the original inputs are resolved to the columns of the new ones
+        columns_mapping = result._columns_mapping.copy()
+        for original, new in [
+            (self._original_left, left),
+            (self._original_right, right),
+        ]:
+            if isinstance(original, Table):
+                assert isinstance(new, Table)
+                refs = [(ref, new[ref.name]) for ref in [original.id, *original]]
+            else:
+                assert isinstance(original, JoinResult) and isinstance(new, JoinResult)
+                refs = [(original._inner_table.id, new._inner_table.id)] + [
+                    (original._inner_table[name], new._inner_table[name])
+                    for name in original._joined_on_names
+                    if name != "id"
+                ]
+            for ref, new_ref in refs:
+                if new_ref._to_internal() in columns_mapping:
+                    columns_mapping[ref._to_internal()] = columns_mapping[
+                        new_ref._to_internal()
+                    ]
+        return self._with_inner_table(
+            result._inner_table,
+            columns_mapping,
+            left_table=result._left_table,
+            right_table=result._right_table,
+            join_arguments=_JoinArguments(
+                left, right, self._join_arguments.on, self._join_arguments.kwargs
+            ),
+        )
+
+    def _with_inner_table(
+        self,
+        inner_table: Table,
+        columns_mapping: dict[expr.InternalColRef, expr.ColumnReference],
+        *,
+        left_table: Table | None = None,
+        right_table: Table | None = None,
+        join_arguments: _JoinArguments | None = None,
+    ) -> JoinResult:
         new_columns_mapping = {
             int_ref: inner_table[expression.name]
-            for int_ref, expression in self._columns_mapping.items()
+            for int_ref, expression in columns_mapping.items()
         }
         new_columns_mapping[inner_table.id._to_internal()] = inner_table.id
 
@@ -734,13 +1012,16 @@ class JoinResult(Joinable, OperatorInput):
             _context=context,
             _inner_table=inner_table,
             _columns_mapping=new_columns_mapping,
-            _left_table=self._left_table,
-            _right_table=self._right_table,
+            _left_table=left_table if left_table is not None else self._left_table,
+            _right_table=(
+                right_table if right_table is not None else self._right_table
+            ),
             _original_left=self._original_left,
             _original_right=self._original_right,
             _substitution=self._substitution,
             _joined_on_names=self._joined_on_names,
             _join_mode=self._join_mode,
+            _join_arguments=join_arguments,
         )
 
     @trace_user_frame
@@ -942,11 +1223,58 @@ class JoinResult(Joinable, OperatorInput):
         left_instance: expr.ColumnReference | None = None,
         right_instance: expr.ColumnReference | None = None,
         exact_match: bool = False,  # if True do not optionalize output columns even if other than inner join is used
+        skew: Iterable[Any] | None = None,
+        broadcast: bool = False,
+        ttl: int | float | datetime.timedelta | None = None,
+        left_ttl_time: expr.ColumnExpression | None = None,
+        right_ttl_time: expr.ColumnExpression | None = None,
     ) -> JoinResult:
         if left == right:
             raise ValueError(
                 "Cannot join table with itself. Use <table>.copy() as one of the arguments of the join."
             )
+        # the arguments are kept to rebuild the join with filters pushed down, so they
+        # have to refer to the inputs of the join rather than to pw.left and pw.right
+        this_desugaring = ThisDesugaring({thisclass.left: left, thisclass.right: right})
+        on = tuple(this_desugaring.eval_expression(cond) for cond in on)
+        if id is not None:
+            id = this_desugaring.eval_expression(id)
+        if left_instance is not None and right_instance is not None:
+            left_instance = this_desugaring.eval_expression(left_instance)
+            right_instance = this_desugaring.eval_expression(right_instance)
+        if ttl is not None:
+            return JoinResult._table_join_with_ttl(
+                left,
+                right,
+                *on,
+                mode=mode,
+                id=id,
+                left_instance=left_instance,
+                right_instance=right_instance,
+                exact_match=exact_match,
+                skew=skew,
+                broadcast=broadcast,
+                ttl=ttl,
+                left_ttl_time=left_ttl_time,
+                right_ttl_time=right_ttl_time,
+            )
+
+        if skew is not None:
+            skew = list(skew)
+        join_arguments = _JoinArguments(
+            left,
+            right,
+            on,
+            dict(
+                mode=mode,
+                id=id,
+                left_instance=left_instance,
+                right_instance=right_instance,
+                exact_match=exact_match,
+                skew=skew,
+                broadcast=broadcast,
+            ),
+        )
 
         left_table, left_substitutions = left._substitutions()
         right_table, right_substitutions = right._substitutions()
@@ -970,6 +1298,9 @@ class JoinResult(Joinable, OperatorInput):
             last_column_is_instance = False
 
         on_ = tuple(validate_shape(cond) for cond in on)
+        skewed_keys = skewed_keys_from_hint(skew, len(on_), "skew")
+        if broadcast and skewed_keys:
+            raise ValueError("`skew` and `broadcast` arguments cannot be used together")
 
         for cond in on_:
             cond_left = cast(expr.ColumnReference, cond._left)
@@ -1021,6 +1352,8 @@ class JoinResult(Joinable, OperatorInput):
                 mode in [JoinMode.RIGHT, JoinMode.OUTER],
                 mode in [JoinMode.LEFT, JoinMode.OUTER],
                 exact_match,
+                skewed_keys,
+                broadcast_left=broadcast,
             )
         else:
             context = clmn.JoinContext(
@@ -1034,6 +1367,8 @@ class JoinResult(Joinable, OperatorInput):
                 mode in [JoinMode.LEFT, JoinMode.OUTER],
                 mode in [JoinMode.RIGHT, JoinMode.OUTER],
                 exact_match,
+                skewed_keys,
+                broadcast_right=broadcast,
             )
         inner_table, columns_mapping = JoinResult._prepare_inner_table_with_mapping(
             context,
@@ -1052,9 +1387,79 @@ class JoinResult(Joinable, OperatorInput):
             substitution,
             common_column_names,
             mode,
+            join_arguments,
+        )
+
+    @staticmethod
+    def _table_join_with_ttl(
+        left: Joinable,
+        right: Joinable,
+        *on: expr.ColumnExpression,
+        mode: JoinMode,
+        ttl: int | float | datetime.timedelta,
+        left_ttl_time: expr.ColumnExpression | None,
+        right_ttl_time: expr.ColumnExpression | None,
+        id: expr.ColumnReference | None = None,
+        left_instance: expr.ColumnReference | None = None,
+        right_instance: expr.ColumnReference | None = None,
+        **kwargs,
+    ) -> JoinResult:
+        from pathway.internals.table import Table
+
+        if not isinstance(left, Table) or not isinstance(right, Table):
+            raise ValueError(
+                "`ttl` argument is supported only when joining two tables."
+            )
+        # an expired row of an outer join would make its match unmatched again, and
+        # the padded row produced for it would contradict the result kept in the output
+        if mode != JoinMode.INNER:
+            raise ValueError("`ttl` argument is supported only in inner joins.")
+        assert left_ttl_time is not None and right_ttl_time is not None
+        expired_left = left._expire_after(left_ttl_time, ttl)
+        expired_right = right._expire_after(right_ttl_time, ttl)
+        substitution = TableSubstitutionDesugaring(
+            {left: expired_left, right: expired_right}
+        )
+        result = JoinResult._table_join(
+            expired_left,
+            expired_right,
+            *(substitution.eval_expression(cond) for cond in on),
+            id=substitution.eval_expression(id) if id is not None else None,
+            left_instance=(
+                substitution.eval_expression(left_instance)
+                if left_instance is not None
+                else None
+            ),
+            right_instance=(
+                substitution.eval_expression(right_instance)
+                if right_instance is not None
+                else None
+            ),
+            mode=mode,
+            **kwargs,
+        )
+        # columns of the input tables are resolved to the columns of the expired ones
+        columns_mapping = result._columns_mapping.copy()
+        for table, expired in [(left, expired_left), (right, expired_right)]:
+            for ref in [table.id, *table]:
+                columns_mapping[ref._to_internal()] = columns_mapping[
+                    expired[ref.name]._to_internal()
+                ]
+        # retractions of the expired rows are not propagated
+        return result._with_inner_table(
+            result._inner_table._filter_out_results_of_forgetting(), columns_mapping
         )
 
 
+def _conjuncts(expression: expr.ColumnExpression) -> list[expr.ColumnExpression]:
+    if (
+        isinstance(expression, expr.ColumnBinaryOpExpression)
+        and expression._operator == op.and_
+    ):
+        return [*_conjuncts(expression._left), *_conjuncts(expression._right)]
+    return [expression]
+
+
 def validate_shape(cond: expr.ColumnExpression) -> expr.ColumnBinaryOpExpression:
     if (
         not isinstance(cond, expr.ColumnBinaryOpExpression)
@@ -1110,6 +1515,11 @@ def join(
     how: JoinMode = JoinMode.INNER,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew: Iterable[Any] | None = None,
+    broadcast: bool = False,
+    ttl: int | float | datetime.timedelta | None = None,
+    left_ttl_time: expr.ColumnExpression | None = None,
+    right_ttl_time: expr.ColumnExpression | None = None,
 ) -> JoinResult:
     """Join self with other using the given join expression.
 
@@ -1123,6 +1533,21 @@ def join(
             correspond to inner, left, right and outer join respectively.
         left_instance/right_instance: optional arguments describing partitioning of the data into
             separate instances
+        skew: optional values of the join columns (tuples of them when joining on
+            multiple columns) that hold a large part of the rows of ``left``. These rows
+            are spread over all workers and the matching rows of ``right`` are
+            replicated to every worker. With ``id=right.id`` the roles are swapped.
+        broadcast: if True, ``right`` is replicated to every worker and joined there
+            with the rows of ``left``, which are not exchanged between workers. Meant
+            for a small ``right``, like a dimension table joined with a large stream.
+        ttl: optional time to live of the rows of both sides, measured in the event
+            time given by ``left_ttl_time`` and ``right_ttl_time``. A row is dropped
+            from the state of the join once the latest event time seen exceeds its own
+            time by ``ttl``. Results of the join involving it are kept in the output,
+            and rows arriving later than ``ttl`` are ignored. Only supported in inner
+            joins of two tables.
+        left_ttl_time/right_ttl_time: event time of the rows of ``left`` and
+            ``right``, required with ``ttl``.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1157,6 +1582,11 @@ def join(
         how=how,
         left_instance=left_instance,
         right_instance=right_instance,
+        skew=skew,
+        broadcast=broadcast,
+        ttl=ttl,
+        left_ttl_time=left_ttl_time,
+        right_ttl_time=right_ttl_time,
     )
 
 
@@ -1167,6 +1597,11 @@ def join_inner(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew: Iterable[Any] | None = None,
+    broadcast: bool = False,
+    ttl: int | float | datetime.timedelta | None = None,
+    left_ttl_time: expr.ColumnExpression | None = None,
+    right_ttl_time: expr.ColumnExpression | None = None,
 ) -> JoinResult:
     """Inner-joins two tables or join results.
 
@@ -1177,6 +1612,21 @@ def join_inner(
             and be of the form LHS: ColumnReference == RHS: ColumnReference.
         id: optional argument for id of result, can be only self.id or other.id
         left_instance/right_instance: optional arguments describing partitioning of the data into separate instances
+        skew: optional values of the join columns (tuples of them when joining on
+            multiple columns) that hold a large part of the rows of ``left``. These rows
+            are spread over all workers and the matching rows of ``right`` are
+            replicated to every worker. With ``id=right.id`` the roles are swapped.
+        broadcast: if True, ``right`` is replicated to every worker and joined there
+            with the rows of ``left``, which are not exchanged between workers. Meant
+            for a small ``right``, like a dimension table joined with a large stream.
+        ttl: optional time to live of the rows of both sides, measured in the event
+            time given by ``left_ttl_time`` and ``right_ttl_time``. A row is dropped
+            from the state of the join once the latest event time seen exceeds its own
+            time by ``ttl``. Results of the join involving it are kept in the output,
+            and rows arriving later than ``ttl`` are ignored. Only supported in inner
+            joins of two tables.
+        left_ttl_time/right_ttl_time: event time of the rows of ``left`` and
+            ``right``, required with ``ttl``.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1205,7 +1655,16 @@ def join_inner(
     9   | Bob        | L
     """
     return left.join_inner(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew=skew,
+        broadcast=broadcast,
+        ttl=ttl,
+        left_ttl_time=left_ttl_time,
+        right_ttl_time=right_ttl_time,
     )
 
 
@@ -1216,6 +1675,8 @@ def join_left(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew: Iterable[Any] | None = None,
+    broadcast: bool = False,
 ) -> JoinResult:
     """
     Left-joins two tables or join results.
@@ -1239,6 +1700,13 @@ def join_left(
     missing values on the right are replaced with `None`
     - rows from the right side that were not matched with the left side are skipped
     - for rows that were matched the behavior is the same as that of an inner join.
+        skew: optional values of the join columns (tuples of them when joining on
+            multiple columns) that hold a large part of the rows of ``left``. These rows
+            are spread over all workers and the matching rows of ``right`` are
+            replicated to every worker. With ``id=right.id`` the roles are swapped.
+        broadcast: if True, ``right`` is replicated to every worker and joined there
+            with the rows of ``left``, which are not exchanged between workers. Meant
+            for a small ``right``, like a dimension table joined with a large stream.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1275,7 +1743,13 @@ def join_left(
     13 |      |
     """
     return left.join_left(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew=skew,
+        broadcast=broadcast,
     )
 
 
@@ -1286,6 +1760,8 @@ def join_right(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew: Iterable[Any] | None = None,
+    broadcast: bool = False,
 ) -> JoinResult:
     """
     Outer-joins two tables or join results.
@@ -1308,6 +1784,13 @@ def join_right(
     - for rows from the right side that were not matched with the left side,
     missing values on the left are replaced with `None`
     - for rows that were matched the behavior is the same as that of an inner join.
+        skew: optional values of the join columns (tuples of them when joining on
+            multiple columns) that hold a large part of the rows of ``left``. These rows
+            are spread over all workers and the matching rows of ``right`` are
+            replicated to every worker. With ``id=right.id`` the roles are swapped.
+        broadcast: if True, ``right`` is replicated to every worker and joined there
+            with the rows of ``left``, which are not exchanged between workers. Meant
+            for a small ``right``, like a dimension table joined with a large stream.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1348,7 +1831,13 @@ def join_right(
 
     """
     return left.join_right(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew=skew,
+        broadcast=broadcast,
     )
 
 
@@ -1359,6 +1848,8 @@ def join_outer(
     id: expr.ColumnReference | None = None,
     left_instance: expr.ColumnReference | None = None,
     right_instance: expr.ColumnReference | None = None,
+    skew: Iterable[Any] | None = None,
+    broadcast: bool = False,
 ) -> JoinResult:
     """Outer-joins two tables or join results.
 
@@ -1380,6 +1871,13 @@ def join_outer(
     - for rows from the right side that were not matched with the left side,
     missing values on the left are replaced with `None`
     - for rows that were matched the behavior is the same as that of an inner join.
+        skew: optional values of the join columns (tuples of them when joining on
+            multiple columns) that hold a large part of the rows of ``left``. These rows
+            are spread over all workers and the matching rows of ``right`` are
+            replicated to every worker. With ``id=right.id`` the roles are swapped.
+        broadcast: if True, ``right`` is replicated to every worker and joined there
+            with the rows of ``left``, which are not exchanged between workers. Meant
+            for a small ``right``, like a dimension table joined with a large stream.
 
     Returns:
         JoinResult: an object on which `.select()` may be called to extract relevant
@@ -1418,5 +1916,11 @@ def join_outer(
     13 |      |
     """
     return left.join_outer(
-        right, *on, id=id, left_instance=left_instance, right_instance=right_instance
+        right,
+        *on,
+        id=id,
+        left_instance=left_instance,
+        right_instance=right_instance,
+        skew=skew,
+        broadcast=broadcast,
     )
@@ -182,6 +182,11 @@ _binary_operators_mapping: BinaryOperatorMapping = {
     (operator.matmul, dt.ANY_ARRAY, dt.ANY_ARRAY): dt.ANY_ARRAY,
     (operator.matmul, dt.INT_ARRAY, dt.INT_ARRAY): dt.INT_ARRAY,
     (operator.matmul, dt.FLOAT_ARRAY, dt.FLOAT_ARRAY): dt.FLOAT_ARRAY,
+    (operator.matmul, dt.FLOAT32_ARRAY_2D, dt.FLOAT32_ARRAY_2D): dt.FLOAT32_ARRAY_2D,
+    (operator.matmul, dt.FLOAT32_ARRAY_2D, dt.FLOAT32_ARRAY_1D): dt.FLOAT32_ARRAY_1D,
+    (operator.matmul, dt.FLOAT32_ARRAY_1D, dt.FLOAT32_ARRAY_2D): dt.FLOAT32_ARRAY_1D,
+    (operator.matmul, dt.FLOAT32_ARRAY_1D, dt.FLOAT32_ARRAY_1D): dt.FLOAT,
+    (operator.matmul, dt.FLOAT32_ARRAY, dt.FLOAT32_ARRAY): dt.FLOAT32_ARRAY,
 }
 
 tuple_handling_operators = {
@@ -30,11 +30,13 @@ class Scope:
     _graph: ParseGraph
     _nodes: StableSet[operator.Operator]
     _normal_nodes: StableSet[operator.Operator]
+    _replaced_nodes: StableSet[operator.Operator]
 
     def __init__(self, graph: ParseGraph) -> None:
         self._graph = graph
         self._nodes = StableSet()
         self._normal_nodes = StableSet()
+        self._replaced_nodes = StableSet()
 
     def is_empty(self) -> bool:
         return not self._nodes
@@ -44,6 +46,10 @@ class Scope:
         if not special:
             self._normal_nodes.add(node)
 
+    def replace_node(self, node: operator.Operator) -> None:
+        if node in self._nodes:
+            self._replaced_nodes.add(node)
+
     @property
     def nodes(self) -> Iterator[operator.Operator]:
         return iter(self._nodes)
@@ -52,6 +58,13 @@ class Scope:
     def normal_nodes(self) -> Iterator[operator.Operator]:
         return iter(self._normal_nodes)
 
+    @property
+    def nodes_to_run_all(self) -> list[operator.Operator]:
+        """Normal nodes without the replaced ones that no other node depends on."""
+        kept = [node for node in self.normal_nodes if node not in self._replaced_nodes]
+        relevant = set(self.relevant_nodes(kept))
+        return [node for node in self.normal_nodes if node in relevant]
+
     @property
     def output_nodes(self) -> Iterator[operator.OutputOperator]:
         return (
@@ -212,6 +225,12 @@ class ParseGraph:
         self.error_log_stack = []
         self.mark_all_operators_as_used()
 
+    def replace_operator(self, node: operator.Operator) -> None:
+        """Marks an operator as superseded by a rewritten part of the graph, so that
+        ``pw.run_all`` skips it unless other operators depend on it."""
+        for scope in self.scopes:
+            scope.replace_node(node)
+
     def mark_all_operators_as_used(self) -> None:
         self.unused_operators = False
 
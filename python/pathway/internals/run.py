@@ -1,5 +1,6 @@
 # Copyright © 2024 Pathway
 
+import os
 
 from pathway.internals import parse_graph
 from pathway.internals.graph_runner import GraphRunner
@@ -19,6 +20,9 @@ def run(
     runtime_typechecking: bool | None = None,
     license_key: str | None = None,
     terminate_on_error: bool | None = None,
+    profile: str | os.PathLike | None = None,
+    memory_budget: int | None = None,
+    spill_dir: str | os.PathLike | None = None,
 ) -> None:
     """Runs the computation graph.
 
@@ -37,6 +41,24 @@ def run(
             persistence is required.
         runtime_typechecking: enables additional strict type checking at runtime
         terminate_on_error: whether to terminate the computation if the data/user-logic error occurs
+        profile: path of a file to which an operator-level profile of the run is
+            written as a Chrome trace, which can be opened in Perfetto. The trace is
+            appended to every second while the computation runs. The activations
+            are also aggregated into collapsed stacks for flamegraph tools, written next
+            to it with the ``.folded`` extension at the end of the run. Can also be set
+            with the ``PATHWAY_PROFILE`` environment variable.
+        memory_budget: the number of bytes of allocated memory above which each process
+            returns the memory freed by the compaction of its state to the operating
+            system right away. It is not a limit, the state is not compacted harder
+            above it, but with a budget arrangements keep compacting their state while
+            idle. Can also be set with the ``PATHWAY_MEMORY_BUDGET`` environment
+            variable.
+        spill_dir: a directory to which joins and groupby reductions write the large
+            batches of their state, keeping only the recently read parts in memory.
+            Batches merged into at least ``PATHWAY_SPILL_THRESHOLD`` updates are
+            written as they are merged, and each worker keeps up to
+            ``PATHWAY_SPILL_CACHE_SIZE`` updates of them in memory. Can also be set with
+            the ``PATHWAY_SPILL_DIR`` environment variable.
     """
     GraphRunner(
         parse_graph.G,
@@ -48,6 +70,9 @@ def run(
         license_key=license_key,
         runtime_typechecking=runtime_typechecking,
         terminate_on_error=terminate_on_error,
+        profile=profile,
+        memory_budget=memory_budget,
+        spill_dir=spill_dir,
         _stacklevel=4,
     ).run_outputs()
 
@@ -63,6 +88,9 @@ def run_all(
     runtime_typechecking: bool | None = None,
     license_key: str | None = None,
     terminate_on_error: bool | None = None,
+    profile: str | os.PathLike | None = None,
+    memory_budget: int | None = None,
+    spill_dir: str | os.PathLike | None = None,
 ) -> None:
     """Runs the computation graph with disabled tree-shaking optimization.
 
@@ -81,6 +109,24 @@ def run_all(
             persistence is required.
         runtime_typechecking: enables additional strict type checking at runtime
         terminate_on_error: whether to terminate the computation if the data/user-logic error occurs
+        profile: path of a file to which an operator-level profile of the run is
+            written as a Chrome trace, which can be opened in Perfetto. The trace is
+            appended to every second while the computation runs. The activations
+            are also aggregated into collapsed stacks for flamegraph tools, written next
+            to it with the ``.folded`` extension at the end of the run. Can also be set
+            with the ``PATHWAY_PROFILE`` environment variable.
+        memory_budget: the number of bytes of allocated memory above which each process
+            returns the memory freed by the compaction of its state to the operating
+            system right away. It is not a limit, the state is not compacted harder
+            above it, but with a budget arrangements keep compacting their state while
+            idle. Can also be set with the ``PATHWAY_MEMORY_BUDGET`` environment
+            variable.
+        spill_dir: a directory to which joins and groupby reductions write the large
+            batches of their state, keeping only the recently read parts in memory.
+            Batches merged into at least ``PATHWAY_SPILL_THRESHOLD`` updates are
+            written as they are merged, and each worker keeps up to
+            ``PATHWAY_SPILL_CACHE_SIZE`` updates of them in memory. Can also be set with
+            the ``PATHWAY_SPILL_DIR`` environment variable.
     """
     GraphRunner(
         parse_graph.G,
@@ -92,5 +138,8 @@ def run_all(
         runtime_typechecking=runtime_typechecking,
         license_key=license_key,
         terminate_on_error=terminate_on_error,
+        profile=profile,
+        memory_budget=memory_budget,
+        spill_dir=spill_dir,
         _stacklevel=4,
     ).run_all()
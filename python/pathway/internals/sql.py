@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import itertools
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
@@ -441,8 +442,9 @@ def _join(node: sql_expr.Join, _context: ContextType) -> Callable:
         else:
             assert side in ["INNER", ""]
             ret = left_tab.join(right_tab, *on)
-            for fil in postfilter:
-                ret = ret.filter(fil)
+            if postfilter:
+                # a single filter, as each one pushed down rebuilds the join
+                ret = ret.filter(functools.reduce(operator.and_, postfilter))
             return ret, context
 
     return _wrap
@@ -487,6 +489,23 @@ class _HavingHelper(IdentityTransform):
         return super().eval_column_val(expression, **kwargs)
 
 
+def _where_conditions(
+    node: sql_expr.Expression, context: ContextType
+) -> list[expr.ColumnExpression]:
+    """Translates the conjunction in WHERE to a list of its conditions, skipping the
+    ones that are constantly true."""
+    if isinstance(node, sql_expr.Paren):
+        return _where_conditions(node.this, context)
+    if isinstance(node, sql_expr.And):
+        return _where_conditions(node.this, context) + _where_conditions(
+            node.expression, context
+        )
+    condition = _run(node, context)
+    if condition is True:
+        return []
+    return [expr.ColumnExpression._wrap(condition)]
+
+
 def _all_nonnested_subqueries(node):
     def prune_fn(_self, _parent, _key):
         return isinstance(_self, sql_expr.Subquery)
@@ -547,7 +566,17 @@ def _select(
             expr_args.append(ret)
 
     # WHERE block
-    if (where_field := node.args.pop("where", None)) is not None:
+    where_field = node.args.pop("where", None)
+    if (
+        where_field is not None
+        and isinstance(tab, table.JoinResult)
+        and not _all_nonnested_subqueries(where_field)
+    ):
+        # conditions referring to a single joined table are applied before the join
+        conditions = _where_conditions(where_field.this, context)
+        if conditions:
+            tab = tab.filter(functools.reduce(operator.and_, conditions))
+    elif where_field is not None:
         # mutates `where_field`
         tab_joined_where, context_subqueries_where = _process_field_for_subqueries(
             where_field, tab, context, orig_context, ""
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import datetime
 import functools
 import warnings
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
 
 import pathway.internals.column as clmn
@@ -21,6 +22,7 @@ from pathway.internals.arg_handlers import (
 from pathway.internals.decorators import contextualized_operator
 from pathway.internals.desugaring import (
     RestrictUniverseDesugaring,
+    TableSubstitutionDesugaring,
     combine_args_kwargs,
     desugar,
 )
@@ -734,6 +736,22 @@ id_type=<class 'pathway.engine.Pointer'>>
         )
         return self._table_with_context(context)
 
+    def _expire_after(
+        self,
+        time_column: expr.ColumnExpression,
+        ttl: int | float | datetime.timedelta,
+    ) -> Table:
+        """Drops the rows from the state of the operators below once the latest time
+        seen exceeds their time by ``ttl``. Late rows are ignored."""
+        threshold = time_column + ttl
+        frozen = self._freeze(threshold, time_column)
+        substitution = TableSubstitutionDesugaring({self: frozen})
+        return frozen._forget(
+            substitution.eval_expression(threshold),
+            substitution.eval_expression(time_column),
+            True,
+        )
+
     @contextualized_operator
     @check_arg_types
     def difference(self, other: Table) -> Table[TSchema]:
@@ -948,6 +966,9 @@ id_type=<class 'pathway.engine.Pointer'>>
         instance: expr.ColumnReference | None = None,
         _skip_errors: bool = True,
         _is_window: bool = False,
+        skew_hint: Iterable[Any] | None = None,
+        ttl: int | float | datetime.timedelta | None = None,
+        ttl_time: expr.ColumnExpression | None = None,
     ) -> groupbys.GroupedTable:
         """Groups table by columns from args.
 
@@ -959,6 +980,19 @@ id_type=<class 'pathway.engine.Pointer'>>
             id: if provided, is the column used to set id's of the rows of the result
             sort_by: if provided, column values are used as sorting keys for particular reducers
             instance: optional argument describing partitioning of the data into separate instances
+            skew_hint: optional values of the grouping columns of the groups that hold
+                a large part of the rows, given as tuples when grouping by multiple
+                columns (with ``instance`` being the last one). The rows of these groups
+                are spread over all workers and aggregated in two phases. Reducers that
+                depend on the processing time (``stateful_*``, ``earliest``, ``latest``)
+                still aggregate them on one worker.
+            ttl: optional time to live of the groups, measured in the event time given
+                by ``ttl_time``. A group is dropped from the state of the groupby once
+                the latest event time seen exceeds its time by ``ttl``. Its result is
+                kept in the output, and rows of the group arriving later are ignored.
+            ttl_time: event time of the groups, required with ``ttl``. It has to be one
+                of the grouping columns, like the start of a time window, so that all
+                rows of a group expire together.
 
         Returns:
             GroupedTable: Groupby object.
@@ -1008,8 +1042,33 @@ id_type=<class 'pathway.engine.Pointer'>>
                         "All Table.groupby() arguments have to be a ColumnReference."
                     )
 
+        table = self
+        table_substitution: dict[TableLike, Table] = {}
+        if ttl is not None or ttl_time is not None:
+            if ttl is None or ttl_time is None:
+                raise ValueError(
+                    "Table.groupby() requires both ttl and ttl_time arguments"
+                    + " to expire its state."
+                )
+            # a group that expired only in part would have its result updated from
+            # the remaining rows, which is not the result kept in the output
+            if not isinstance(ttl_time, expr.ColumnReference) or all(
+                arg._column != ttl_time._column for arg in args
+            ):
+                raise ValueError(
+                    "Table.groupby() requires ttl_time to be one of the grouping"
+                    + " columns, so that all rows of a group expire together."
+                )
+            table = self._expire_after(ttl_time, ttl)
+            table_substitution = {self: table}
+            substitution = TableSubstitutionDesugaring(table_substitution)
+            args = tuple(substitution.eval_expression(arg) for arg in args)
+            if sort_by is not None:
+                sort_by = substitution.eval_expression(sort_by)
+            _filter_out_results_of_forgetting = True
+
         return groupbys.GroupedTable.create(
-            table=self,
+            table=table,
             grouping_columns=args,
             last_column_is_instance=instance is not None,
             set_id=id is not None,
@@ -1017,6 +1076,8 @@ id_type=<class 'pathway.engine.Pointer'>>
             _filter_out_results_of_forgetting=_filter_out_results_of_forgetting,
             _skip_errors=_skip_errors,
             _is_window=_is_window,
+            skew_hint=skew_hint,
+            table_substitution=table_substitution,
         )
 
     @trace_user_frame
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from typing import Any, Literal, Protocol
+
+import numpy as np
+import pyarrow as pa
 
 from pathway.internals import datasink
 from pathway.internals.api import Pointer
@@ -57,6 +60,32 @@ transaction;
         ...
 
 
+class OnBatchCallback(Protocol):
+    """
+    The callback to be called once per time with all the changes of the table at this
+    time in a columnar form. It is required to accept two parameters: the batch and
+    the time.
+    """
+
+    def __call__(
+        self, batch: dict[str, np.ndarray] | pa.RecordBatch, time: int
+    ) -> None:
+        """
+        The callable part of the callback.
+
+        Args:
+            batch: the changes, either as a dict mapping from the column name to the \
+NumPy array of its values, or as an Arrow ``RecordBatch``. Besides the columns of the \
+table, it contains the column ``id`` with the keys of the changed rows and the column \
+``diff`` with ``1`` for the inserted rows and ``-1`` for the deleted ones;
+            time: the time of the changes.
+
+        Returns:
+            None
+        """
+        ...
+
+
 class OnTimeEndCallback(Protocol):
     """
     The callback to be called on every time finished. It is required
@@ -79,10 +108,12 @@ def subscribe(
     table,
     *,
     skip_persisted_batch: bool,
-    on_change: OnChangeCallback,
+    on_change: OnChangeCallback | None = None,
     on_time_end: OnTimeEndCallback = lambda time: None,
     on_end: OnFinishCallback = lambda: None,
     skip_errors: bool = True,
+    on_batch: OnBatchCallback | None = None,
+    batch_format: Literal["numpy", "arrow"] = "numpy",
 ) -> None:
     """
     Calls a callback function on_change on every change happening in table. This method
@@ -103,9 +134,18 @@ def subscribe(
         on_time_end: the callback function to be called on each closed time of computation.
         on_end: the callback function to be called when the stream of changes ends.
         skip_errors: whether to skip rows containing errors
+        on_batch: the callback function to be called once per time with all the
+          changes at this time, in a columnar form.
+        batch_format: the form of the batch passed to ``on_batch``: ``"numpy"`` for
+          a dict of NumPy arrays, ``"arrow"`` for an Arrow ``RecordBatch``.
     Returns:
         None
     """
+    if on_change is None and on_batch is None:
+        raise ValueError("at least one of on_change and on_batch must be provided")
+    if batch_format not in ("numpy", "arrow"):
+        raise ValueError(f"unsupported batch format: {batch_format!r}")
+    column_names = list(table._columns.keys())
 
     def on_change_wrapper(
         key: Pointer, values: list[Any], time: int, diff: int
@@ -128,19 +168,40 @@ def subscribe(
         """
 
         row = {}
-        for field_name, field_value in zip(table._columns.keys(), values):
+        for field_name, field_value in zip(column_names, values):
             row[field_name] = field_value
 
         assert diff in [-1, 1]
+        assert on_change is not None
         return on_change(key=key, row=row, time=time, is_addition=(diff >= 1))
 
+    def on_batch_wrapper(
+        keys: np.ndarray, columns: list[np.ndarray], time: int, diffs: np.ndarray
+    ) -> None:
+        """
+        Wraps the columns of a batch built by the engine in a dict or a RecordBatch.
+        Batches with no rows are not passed to the user.
+        """
+        if len(keys) == 0:
+            return
+        batch: dict[str, Any] = {"id": keys}
+        batch.update(zip(column_names, columns))
+        batch["diff"] = diffs
+        assert on_batch is not None
+        if batch_format == "arrow":
+            batch["id"] = np.array([str(key) for key in keys])
+            on_batch(batch=pa.RecordBatch.from_pydict(batch), time=time)
+        else:
+            on_batch(batch=batch, time=time)
+
     table_to_datasink(
         table,
         datasink.CallbackDataSink(
-            on_change=on_change_wrapper,
+            on_change=on_change_wrapper if on_change is not None else None,
             on_time_end=on_time_end,
             on_end=on_end,
             skip_persisted_batch=skip_persisted_batch,
             skip_errors=skip_errors,
+            on_batch=on_batch_wrapper if on_batch is not None else None,
         ),
     )
@@ -249,6 +249,15 @@ class TypeInterpreter(IdentityTransform):
         expression = super().eval_async_apply(expression, state=state, **kwargs)
         return _wrap(expression, expression._return_type)
 
+    def eval_vectorized_apply(
+        self,
+        expression: expr.VectorizedApplyExpression,
+        state: TypeInterpreterState | None = None,
+        **kwargs,
+    ) -> expr.VectorizedApplyExpression:
+        expression = super().eval_vectorized_apply(expression, state=state, **kwargs)
+        return _wrap(expression, expression._return_type)
+
     def eval_call(
         self,
         expression: expr.ColumnCallExpression,
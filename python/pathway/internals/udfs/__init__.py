@@ -8,7 +8,7 @@ from collections.abc import Callable
 from typing import Any, overload
 from warnings import warn
 
-from pathway.internals import dtype as dt, expression as expr, udfs
+from pathway.internals import api, dtype as dt, expression as expr, udfs
 from pathway.internals.helpers import with_optional_kwargs
 from pathway.internals.runtime_type_check import check_arg_types
 from pathway.internals.shadows import inspect
@@ -16,6 +16,7 @@ from pathway.internals.udfs.caches import (
     CacheStrategy,
     DefaultCache,
     DiskCache,
+    EmbeddingCache,
     InMemoryCache,
     with_cache_strategy,
 )
@@ -30,6 +31,7 @@ from pathway.internals.udfs.executors import (
     with_capacity,
     with_timeout,
 )
+from pathway.internals.udfs.metrics import mark_computed, with_cache_metrics
 from pathway.internals.udfs.retries import (
     AsyncRetryStrategy,
     ExponentialBackoffRetryStrategy,
@@ -51,6 +53,7 @@ __all__ = [
     "CacheStrategy",
     "DefaultCache",
     "DiskCache",
+    "EmbeddingCache",
     "InMemoryCache",
     "AsyncRetryStrategy",
     "ExponentialBackoffRetryStrategy",
@@ -110,6 +113,7 @@ class UDF(abc.ABC):
     propagate_none: bool
     executor: Executor
     cache_strategy: CacheStrategy | None
+    vectorized: bool
 
     def __init__(
         self,
@@ -119,6 +123,7 @@ class UDF(abc.ABC):
         propagate_none: bool = False,
         executor: Executor = AutoExecutor(),
         cache_strategy: CacheStrategy | None = None,
+        vectorized: bool = False,
     ) -> None:
         """
         Args:
@@ -142,12 +147,28 @@ class UDF(abc.ABC):
                 then it is executed asynchronously. Otherwise it is executed synchronously.
             cache_strategy: Defines the caching mechanism.
                 Defaults to None.
+            vectorized: If True, the function is called once per minibatch of rows
+                instead of once per row. Each argument is then passed as a NumPy array
+                holding the values of all rows, as a masked array if some of them are
+                None. The function has to return an array (possibly masked) with one
+                value per row. ``return_type`` describes the elements of that array.
+                The only cache strategy supported by vectorized UDFs is
+                ``EmbeddingCache``. Defaults to False.
         """
         self.return_type = return_type
         self.deterministic = deterministic
         self.propagate_none = propagate_none
+        self.vectorized = vectorized
         self.executor = self._prepare_executor(executor)
+        if vectorized and not (
+            cache_strategy is None or isinstance(cache_strategy, EmbeddingCache)
+        ):
+            raise ValueError(
+                "Vectorized UDFs can't be used with a cache_strategy"
+                + " other than EmbeddingCache."
+            )
         self.cache_strategy = cache_strategy
+        self._metrics = self._make_metrics()
         self.func = self._wrap_function()
 
     def _get_config(self) -> dict[str, Any]:
@@ -157,6 +178,7 @@ class UDF(abc.ABC):
             "propagate_none": self.propagate_none,
             "executor": self.executor,
             "cache_strategy": self.cache_strategy,
+            "vectorized": self.vectorized,
         }
 
     def _get_return_type(self) -> Any:
@@ -187,21 +209,43 @@ class UDF(abc.ABC):
         return return_type
 
     def _wrap_function(self) -> Callable:
-        func = self.executor._wrap(self.__wrapped__)
-        if self.cache_strategy is not None:
+        func = self.executor._wrap(self.__wrapped__, self._metrics)
+        track_cache = self.cache_strategy is not None and not self.vectorized
+        if track_cache:
+            func = mark_computed(func)
+        if isinstance(self.cache_strategy, EmbeddingCache) and self.vectorized:
+            func = self.cache_strategy.wrap_vectorized(func)
+        elif self.cache_strategy is not None:
             func = with_cache_strategy(func, self.cache_strategy)
+        if track_cache:
+            func = with_cache_metrics(func, self._metrics)
         return func
 
+    def _make_metrics(self) -> api.UdfMetrics:
+        name = getattr(self, "__qualname__", type(self).__qualname__)
+        capacity = getattr(self.executor, "capacity", None)
+        return api.UdfMetrics(name, capacity)
+
     def _prepare_executor(self, executor: Executor) -> Executor:
         is_coroutine = inspect.iscoroutinefunction(self.__wrapped__)
         if is_coroutine and isinstance(executor, SyncExecutor):
             raise ValueError("The function is a coroutine. You can't use SyncExecutor.")
+        if self.vectorized:
+            if is_coroutine or not isinstance(executor, (AutoExecutor, SyncExecutor)):
+                raise ValueError("Vectorized UDFs have to be executed synchronously.")
+            return udfs.sync_executor()
         if isinstance(executor, AutoExecutor):
             return async_executor() if is_coroutine else udfs.sync_executor()
         return executor
 
     def __call__(self, *args, **kwargs) -> expr.ColumnExpression:
-        return self.executor._apply_expression_type(
+        if self.vectorized:
+            apply_expression_type: type[expr.ApplyExpression] = (
+                expr.VectorizedApplyExpression
+            )
+        else:
+            apply_expression_type = self.executor._apply_expression_type
+        return apply_expression_type(
             self.func,
             return_type=self._get_return_type(),
             propagate_none=self.propagate_none,
@@ -294,6 +338,7 @@ def udf(
     propagate_none: bool = False,
     executor: Executor = AutoExecutor(),
     cache_strategy: CacheStrategy | None = None,
+    vectorized: bool = False,
 ) -> Callable[[Callable], UDF]: ...
 
 
@@ -307,6 +352,7 @@ def udf(
     propagate_none: bool = False,
     executor: Executor = AutoExecutor(),
     cache_strategy: CacheStrategy | None = None,
+    vectorized: bool = False,
 ) -> UDF: ...
 
 
@@ -321,6 +367,7 @@ def udf(
     propagate_none: bool = False,
     executor: Executor = AutoExecutor(),
     cache_strategy: CacheStrategy | None = None,
+    vectorized: bool = False,
 ):
     """Create a Python UDF (user-defined function) out of a callable.
 
@@ -345,6 +392,13 @@ def udf(
             then it is executed asynchronously. Otherwise it is executed synchronously.
         cache_strategy: Defines the caching mechanism.
             Defaults to None.
+        vectorized: If True, the function is called once per minibatch of rows with
+            NumPy arrays holding the values of all rows as arguments (masked arrays if
+            some of the values are None) and has to return an array with one value per
+            row. The return type describes the elements of that array.
+            The function is called row by row for tables that are not append-only,
+            unless it is also ``deterministic``.
+            Defaults to False.
     Example:
 
     >>> import pathway as pw
@@ -390,6 +444,26 @@ def udf(
     Alice-dog
     Bob-dog
     Bob-dog
+    >>>
+    >>> import numpy as np
+    >>> prices = pw.debug.table_from_markdown(
+    ...     '''
+    ... price
+    ...     0
+    ...     1
+    ...     3
+    ... '''
+    ... )
+    >>> @pw.udf(vectorized=True, deterministic=True)
+    ... def log_price(price: np.ndarray) -> float:
+    ...     return np.log2(price + 1)
+    ...
+    >>> res3 = prices.select(log_price=log_price(prices.price))
+    >>> pw.debug.compute_and_print(res3, include_id=False)
+    log_price
+    0.0
+    1.0
+    2.0
     """
 
     return UDFFunction(
@@ -399,6 +473,7 @@ def udf(
         propagate_none=propagate_none,
         executor=executor,
         cache_strategy=cache_strategy,
+        vectorized=vectorized,
     )
 
 
@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import fcntl
 import functools
+import hashlib
 import inspect
 import os
-from collections.abc import Awaitable, Callable
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections.abc import Awaitable, Callable, Sequence
 from pathlib import Path
 from typing import Any, ClassVar, ParamSpec, TypeVar, overload
 
 import async_lru
 import diskcache
+import numpy as np
 
 from pathway.internals import api, trace
 from pathway.internals.runtime_type_check import check_arg_types
@@ -32,6 +40,15 @@ class CacheStrategy(abc.ABC):
     def wrap_sync(self, func: Callable[P, T]) -> Callable[P, T]: ...
 
 
+_MISSING = object()
+
+
+def _store_in_cache(cache: diskcache.Cache, key: str, value: T) -> T:
+    cache[key] = value
+    # read back so that the value returned on a miss matches the one on later hits
+    return cache[key]
+
+
 class DiskCache(CacheStrategy):
     """On disk cache."""
 
@@ -61,16 +78,46 @@ class DiskCache(CacheStrategy):
         return str(api.ref_scalar(args, tuple(kwargs.items())))
 
     def wrap_async(self, func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        # calls with the same key running concurrently share a single computation
+        in_flight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             cache = self._get_cache(func)
-            key = self.make_key(args, kwargs)
             if cache is None:
                 return await func(*args, **kwargs)
-            if key not in cache:
-                result = await func(*args, **kwargs)
-                cache[key] = result
-            return cache[key]
+            key = self.make_key(args, kwargs)
+            loop = asyncio.get_running_loop()
+            pending = in_flight.get((loop, key))
+            if pending is not None:
+                try:
+                    return await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # the call computing the value was cancelled, not this one
+                    return await wrapper(*args, **kwargs)
+
+            future = loop.create_future()
+            in_flight[(loop, key)] = future
+            try:
+                # the cache does blocking I/O, so it is kept off the event loop
+                result = await asyncio.to_thread(cache.get, key, _MISSING)
+                if result is _MISSING:
+                    value = await func(*args, **kwargs)
+                    result = await asyncio.to_thread(_store_in_cache, cache, key, value)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except BaseException as e:
+                future.set_exception(e)
+                future.exception()  # the error is raised here, don't log it again
+                raise
+            else:
+                future.set_result(result)
+            finally:
+                del in_flight[(loop, key)]
+            return result
 
         return wrapper
 
@@ -81,10 +128,10 @@ class DiskCache(CacheStrategy):
             key = self.make_key(args, kwargs)
             if cache is None:
                 return func(*args, **kwargs)
-            if key not in cache:
-                result = func(*args, **kwargs)
-                cache[key] = result
-            return cache[key]
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = _store_in_cache(cache, key, func(*args, **kwargs))
+            return result
 
         return wrapper
 
@@ -137,6 +184,252 @@ class InMemoryCache(CacheStrategy):
         return functools.lru_cache(self.max_size)(func)  # type: ignore[return-value]
 
 
+def _as_embedding(vector: Any) -> np.ndarray:
+    # the stored vectors are float32, so the computed ones are returned as float32 too
+    return np.asarray(vector, dtype=np.float32)
+
+
+class _VectorStore:
+    """Float32 vectors appended to a memory-mapped file, indexed in SQLite.
+
+    Appends are serialized between processes with a file lock, so several pipelines
+    can share one store.
+    """
+
+    # SQLite limits the number of variables in a single statement
+    _LOOKUP_CHUNK_SIZE: ClassVar[int] = 500
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = directory / "vectors.f32"
+        self._vectors_path.touch(exist_ok=True)
+        self._lock_path = directory / "vectors.lock"
+        self._lock = threading.Lock()
+        self._vectors: np.memmap | None = None
+        self._index = sqlite3.connect(
+            directory / "index.sqlite",
+            timeout=60,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute(
+            "CREATE TABLE IF NOT EXISTS vectors"
+            " (key TEXT PRIMARY KEY, offset INTEGER NOT NULL, dim INTEGER NOT NULL)"
+        )
+
+    def _find(self, keys: Sequence[str]) -> dict[str, tuple[int, int]]:
+        found = {}
+        for start in range(0, len(keys), self._LOOKUP_CHUNK_SIZE):
+            chunk = keys[start : start + self._LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._index.execute(
+                f"SELECT key, offset, dim FROM vectors WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, offset, dim in rows:
+                found[key] = (offset, dim)
+        return found
+
+    def get_many(self, keys: Sequence[str]) -> list[np.ndarray | None]:
+        with self._lock:
+            found = self._find(keys)
+            if not found:
+                return [None] * len(keys)
+            end = max(offset + dim for offset, dim in found.values())
+            if self._vectors is None or len(self._vectors) < end:
+                # the file grew since it was mapped
+                self._vectors = np.memmap(self._vectors_path, np.float32, mode="r")
+            vectors = self._vectors
+        result: list[np.ndarray | None] = []
+        for key in keys:
+            if key in found:
+                offset, dim = found[key]
+                # copied, so that the result doesn't keep the file mapped
+                result.append(np.array(vectors[offset : offset + dim]))
+            else:
+                result.append(None)
+        return result
+
+    def put_many(self, items: Sequence[tuple[str, np.ndarray]]) -> None:
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # another pipeline might have stored some of the vectors in the meantime
+                present = self._find([key for key, _vector in items])
+                rows = []
+                with open(self._vectors_path, "ab") as vectors_file:
+                    offset = vectors_file.seek(0, os.SEEK_END) // 4
+                    for key, vector in items:
+                        if key in present:
+                            continue
+                        data = np.ascontiguousarray(vector, dtype=np.float32)
+                        if data.ndim != 1:
+                            raise ValueError(
+                                "embeddings have to be one-dimensional,"
+                                + f" got shape {data.shape}"
+                            )
+                        vectors_file.write(data.tobytes())
+                        rows.append((key, offset, len(data)))
+                        present[key] = (offset, len(data))
+                        offset += len(data)
+                self._index.executemany(
+                    "INSERT OR IGNORE INTO vectors VALUES (?, ?, ?)", rows
+                )
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class EmbeddingCache(CacheStrategy):
+    """Content-addressed cache for embedding functions, shared between pipelines.
+
+    The vectors are keyed by a hash of the normalized text and the model name, so
+    a text is embedded once, no matter which function or pipeline asks for it.
+    They are stored as float32 blocks in a memory-mapped file with a SQLite index,
+    which can be used by several processes at the same time.
+
+    It can be used with vectorized UDFs taking a single column of texts, in which case
+    the whole minibatch is looked up at once and only the missing texts are passed
+    to the function.
+
+    Example:
+
+    >>> import pathway as pw
+    >>> from pathway.xpacks.llm import embedders
+    >>> embedder = embedders.OpenAIEmbedder(  # doctest: +SKIP
+    ...     model="text-embedding-3-small",
+    ...     cache_strategy=pw.udfs.EmbeddingCache(model="text-embedding-3-small"),
+    ... )
+    """
+
+    _store: _VectorStore | None
+
+    @trace.trace_user_frame
+    def __init__(
+        self,
+        model: str,
+        *,
+        name: str = "default",
+        path: str | os.PathLike | None = None,
+        normalize_text: bool = True,
+    ) -> None:
+        """
+        Args:
+            model: name of the embedding model, a part of the key of each entry.
+            name: name of the cache. Caches with the same name share a storage.
+            path: directory of the storage. Defaults to ``embeddings/<name>``
+                in the persistent storage.
+            normalize_text: whether to apply the Unicode NFC normalization, strip the
+                texts and collapse the whitespace before computing the keys.
+        """
+        super().__init__()
+        self.model = model
+        self._name = name
+        self._path = Path(path) if path is not None else None
+        self._normalize_text = normalize_text
+        self._store = None
+
+    def make_key(
+        self,
+        text: Any,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> str:
+        kwargs = kwargs or {}
+        text = "" if text is None else str(text)
+        if self._normalize_text:
+            text = re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+        model = kwargs.get("model") or self.model
+        params = repr((args, sorted(kwargs.items())))
+        digest = hashlib.sha256()
+        for part in (model, params, text):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def lookup(self, texts: Sequence[Any], **kwargs) -> list[np.ndarray | None]:
+        """Returns the cached embeddings of ``texts``, None for the missing ones."""
+        keys = [self.make_key(text, kwargs=kwargs) for text in texts]
+        return self._get_store().get_many(keys)
+
+    def store(
+        self, texts: Sequence[Any], embeddings: Sequence[np.ndarray], **kwargs
+    ) -> None:
+        """Stores the embeddings of ``texts``."""
+        keys = [self.make_key(text, kwargs=kwargs) for text in texts]
+        self._get_store().put_many(list(zip(keys, embeddings)))
+
+    def wrap_async(self, func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(text, *args, **kwargs):
+            key = self.make_key(text, args, kwargs)
+            # the store does blocking I/O, so it is kept off the event loop
+            store = await asyncio.to_thread(self._get_store)
+            [cached] = await asyncio.to_thread(store.get_many, [key])
+            if cached is not None:
+                return cached
+            result = _as_embedding(await func(text, *args, **kwargs))
+            await asyncio.to_thread(store.put_many, [(key, result)])
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    def wrap_sync(self, func: Callable[P, T]) -> Callable[P, T]:
+        @functools.wraps(func)
+        def wrapper(text, *args, **kwargs):
+            store = self._get_store()
+            key = self.make_key(text, args, kwargs)
+            [cached] = store.get_many([key])
+            if cached is not None:
+                return cached
+            result = _as_embedding(func(text, *args, **kwargs))
+            store.put_many([(key, result)])
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    def wrap_vectorized(self, func: Callable[..., np.ndarray]) -> Callable:
+        @functools.wraps(func)
+        def wrapper(texts: np.ndarray, *args, **kwargs) -> np.ndarray:
+            if args or kwargs:
+                # other arguments are columns as well and can't be a part of the key
+                return func(texts, *args, **kwargs)
+            store = self._get_store()
+            keys = [self.make_key(text) for text in np.ma.getdata(texts)]
+            results = store.get_many(keys)
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                computed = func(texts[missing])
+                if len(computed) != len(missing):
+                    raise ValueError(
+                        f"vectorized function returned {len(computed)} values"
+                        + f" for {len(missing)} rows"
+                    )
+                vectors = [_as_embedding(vector) for vector in computed]
+                store.put_many([(keys[i], vectors[j]) for j, i in enumerate(missing)])
+                for j, i in enumerate(missing):
+                    results[i] = vectors[j]
+            output = np.empty(len(results), dtype=object)
+            for i, result in enumerate(results):
+                output[i] = result
+            return output
+
+        return wrapper
+
+    def _get_store(self) -> _VectorStore:
+        if self._store is None:
+            path = self._path
+            if path is None:
+                storage_root = os.environ.get("PATHWAY_PERSISTENT_STORAGE")
+                if storage_root is None:
+                    raise RuntimeError(
+                        "no persistent storage configured for the embedding cache"
+                    )
+                path = Path(storage_root) / "embeddings" / self._name
+            self._store = _VectorStore(path)
+        return self._store
+
+
 @overload
 def with_cache_strategy(
     func: Callable[P, T], cache_strategy: CacheStrategy
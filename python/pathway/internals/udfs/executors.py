@@ -11,8 +11,10 @@ from dataclasses import dataclass
 from typing import ParamSpec, TypeVar
 
 import pathway.internals.expression as expr
+from pathway.internals import api
 from pathway.internals.runtime_type_check import check_arg_types
 from pathway.internals.udfs.caches import CacheStrategy, with_cache_strategy
+from pathway.internals.udfs.metrics import current_udf_metrics, with_udf_metrics
 from pathway.internals.udfs.retries import AsyncRetryStrategy, with_retry_strategy
 from pathway.internals.udfs.utils import coerce_async
 
@@ -25,7 +27,9 @@ class Executor(abc.ABC):
     ...
 
     @abc.abstractmethod
-    def _wrap(self, fun: Callable) -> Callable: ...
+    def _wrap(
+        self, fun: Callable, metrics: api.UdfMetrics | None = None
+    ) -> Callable: ...
 
     @property
     @abc.abstractmethod
@@ -34,7 +38,9 @@ class Executor(abc.ABC):
 
 @dataclass
 class AutoExecutor(Executor):
-    def _wrap(self, fun: Callable) -> Callable:
+    def _wrap(
+        self, fun: Callable, metrics: api.UdfMetrics | None = None
+    ) -> Callable:
         raise ValueError("You can't wrap a function using AutoExecutor.")
 
     @property
@@ -90,7 +96,11 @@ def auto_executor() -> Executor:
 
 @dataclass
 class SyncExecutor(Executor):
-    def _wrap(self, fun: Callable) -> Callable:
+    def _wrap(
+        self, fun: Callable, metrics: api.UdfMetrics | None = None
+    ) -> Callable:
+        if metrics is not None:
+            fun = with_udf_metrics(fun, metrics)
         return fun
 
     @property
@@ -134,12 +144,18 @@ class AsyncExecutor(Executor):
     timeout: float | None = None
     retry_strategy: AsyncRetryStrategy | None = None
 
-    def _wrap(self, fun: Callable) -> Callable:
-        return async_options(
-            capacity=self.capacity,
-            timeout=self.timeout,
-            retry_strategy=self.retry_strategy,
-        )(fun)
+    def _wrap(
+        self, fun: Callable, metrics: api.UdfMetrics | None = None
+    ) -> Callable:
+        func = async_options(timeout=self.timeout, retry_strategy=self.retry_strategy)(
+            fun
+        )
+        # measured under the capacity, the calls waiting for a slot are not running yet
+        if metrics is not None:
+            func = with_udf_metrics(func, metrics)
+        if self.capacity is not None:
+            func = with_capacity(func, self.capacity)
+        return func
 
     @property
     def _apply_expression_type(self) -> type[expr.ApplyExpression]:
@@ -269,17 +285,25 @@ def with_timeout(
 
     if sys.version_info < (3, 11):
 
-        @functools.wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        async def call_with_timeout(*args: P.args, **kwargs: P.kwargs) -> T:
             return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
 
     else:
 
-        @functools.wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        async def call_with_timeout(*args: P.args, **kwargs: P.kwargs) -> T:
             async with asyncio.timeout(timeout):
                 return await func(*args, **kwargs)
 
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return await call_with_timeout(*args, **kwargs)
+        except asyncio.TimeoutError:
+            metrics = current_udf_metrics()
+            if metrics is not None:
+                metrics.on_timeout()
+            raise
+
     return wrapper
 
 
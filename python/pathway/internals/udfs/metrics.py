@@ -0,0 +1,160 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import time
+from collections.abc import Callable
+
+from pathway.internals import api
+
+
+class _UdfCall:
+    metrics: api.UdfMetrics
+    computed: bool
+
+    def __init__(self, metrics: api.UdfMetrics) -> None:
+        self.metrics = metrics
+        self.computed = False
+
+
+_current_call: contextvars.ContextVar[_UdfCall | None] = contextvars.ContextVar(
+    "pathway_udf_call", default=None
+)
+
+# the metrics are recorded only when they can be read, see set_udf_metrics_enabled
+_enabled = False
+
+
+def set_udf_metrics_enabled(enabled: bool) -> None:
+    """
+    Sets whether the calls of UDFs record their metrics. It is enabled for the runs
+    exporting the metrics, through the monitoring HTTP server or the monitoring server.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def current_udf_metrics() -> api.UdfMetrics | None:
+    """Returns the metrics of the UDF whose call is in progress in this context."""
+    call = _current_call.get()
+    return None if call is None else call.metrics
+
+
+def mark_computed(func: Callable) -> Callable:
+    """
+    Wraps the function placed under the cache of a UDF. A call that reaches it
+    is a cache miss, every other call is answered from the cache.
+    """
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            call = _current_call.get()
+            if call is not None:
+                call.computed = True
+            return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            call = _current_call.get()
+            if call is not None:
+                call.computed = True
+            return func(*args, **kwargs)
+
+        return wrapper
+
+
+def with_udf_metrics(func: Callable, metrics: api.UdfMetrics) -> Callable:
+    """
+    Records the latency and the outcome of every call of a UDF. The executors apply it
+    after waiting for the capacity, so that only the calls actually running are counted
+    as in flight.
+    """
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not _enabled:
+                return await func(*args, **kwargs)
+            # read by the timeouts and the retries
+            token = _current_call.set(_UdfCall(metrics))
+            metrics.on_call_started()
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = await func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                metrics.on_call_finished(time.perf_counter() - start, failed)
+                _current_call.reset(token)
+
+        return async_wrapper
+
+    else:
+        # nothing below a synchronous UDF reads the context, so it is not set
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            metrics.on_call_started()
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                metrics.on_call_finished(time.perf_counter() - start, failed)
+
+        return wrapper
+
+
+def with_cache_metrics(func: Callable, metrics: api.UdfMetrics) -> Callable:
+    """
+    Counts the calls of a UDF as cache hits or misses. It is applied above the cache,
+    and the function under the cache has to be wrapped with ``mark_computed``.
+    """
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not _enabled:
+                return await func(*args, **kwargs)
+            call = _UdfCall(metrics)
+            token = _current_call.set(call)
+            try:
+                result = await func(*args, **kwargs)
+            finally:
+                _current_call.reset(token)
+            metrics.on_cache_lookup(not call.computed)
+            return result
+
+        return async_wrapper
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            call = _UdfCall(metrics)
+            token = _current_call.set(call)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _current_call.reset(token)
+            metrics.on_cache_lookup(not call.computed)
+            return result
+
+        return wrapper
@@ -10,6 +10,7 @@ from collections.abc import Awaitable, Callable
 from typing import ParamSpec, TypeVar
 
 from pathway.internals.runtime_type_check import check_arg_types
+from pathway.internals.udfs.metrics import current_udf_metrics
 from pathway.internals.udfs.utils import coerce_async
 
 T = TypeVar("T")
@@ -94,6 +95,9 @@ class ExponentialBackoffRetryStrategy(AsyncRetryStrategy):
             except Exception:
                 if n_attempt == self._max_retries:
                     raise
+                metrics = current_udf_metrics()
+                if metrics is not None:
+                    metrics.on_retry()
             await asyncio.sleep(delay)
             delay = self._next_delay(delay)
         raise ValueError(f"incorrect max_retries: {self._max_retries}")
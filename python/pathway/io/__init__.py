@@ -17,6 +17,7 @@ from pathway.io import (
     mongodb,
     nats,
     null,
+    parquet,
     plaintext,
     postgres,
     pubsub,
@@ -62,4 +63,5 @@ __all__ = [
     "deltalake",
     "mongodb",
     "nats",
+    "parquet",
 ]
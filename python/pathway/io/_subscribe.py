@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pathway.internals.table_subscription import (
+    OnBatchCallback,
     OnChangeCallback,
     OnFinishCallback,
     OnTimeEndCallback,
@@ -12,9 +15,12 @@ from pathway.internals.table_subscription import (
 
 def subscribe(
     table,
-    on_change: OnChangeCallback,
+    on_change: OnChangeCallback | None = None,
     on_end: OnFinishCallback = lambda: None,
     on_time_end: OnTimeEndCallback = lambda time: None,
+    *,
+    on_batch: OnBatchCallback | None = None,
+    batch_format: Literal["numpy", "arrow"] = "numpy",
 ):
     """
     Calls a callback function on_change on every change happening in table.
@@ -28,6 +34,21 @@ def subscribe(
           names key, row, time and is_addition respectively.
         on_end: the callback to be called when the stream of changes ends.
         on_time_end: the callback function to be called on each closed time of computation.
+        on_batch: the callback to be called once per time with all the changes of
+          this time in a columnar form. It is required to accept two parameters: the
+          batch and the time. The batch is built in the engine and the callback is
+          called once per time instead of once per row, so it is much faster than
+          ``on_change`` for large volumes of data. Besides the columns of the table,
+          the batch contains the column ``id`` with the keys and the column ``diff``
+          with ``1`` for insertions and ``-1`` for deletions. At least one of
+          ``on_change`` and ``on_batch`` must be provided.
+        batch_format: the form of the batch passed to ``on_batch``. If ``"numpy"``,
+          it is a dict mapping from the column name to the NumPy array of its values.
+          Columns of type ``int``, ``float`` or ``bool`` get a native dtype, other
+          columns (including optional ones) are arrays of Python objects, so the
+          dtype of a column is the same in every batch. If ``"arrow"``, it is a
+          ``pyarrow.RecordBatch`` built in Python from these arrays, and the keys in
+          the ``id`` column are strings.
     Returns:
         None
 
@@ -58,6 +79,18 @@ def subscribe(
     {'pet': 'dog', 'owner': 'Bob', 'age': 7}, 4, True
     {'pet': 'cat', 'owner': 'Alice', 'age': 8}, 6, False
     End of stream.
+
+    The same changes can be received in batches, one per time:
+
+    >>> def on_batch(batch: dict, time: int):
+    ...     print(f"{batch['age'].tolist()}, {batch['diff'].tolist()}, {time}")
+    ...
+    >>> pw.io.subscribe(table, on_batch=on_batch)  # doctest: +SKIP
+    >>> pw.run(monitoring_level=pw.MonitoringLevel.NONE)  # doctest: +SKIP
+    [10], [1], 0
+    [8], [1], 2
+    [7], [1], 4
+    [8], [-1], 6
     """
 
     internal_subscribe(
@@ -66,4 +99,6 @@ def subscribe(
         on_change=on_change,
         on_time_end=on_time_end,
         on_end=on_end,
+        on_batch=on_batch,
+        batch_format=batch_format,
     )
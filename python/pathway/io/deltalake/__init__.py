@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from os import PathLike, fspath
 from typing import Any
 
-from pathway.internals import api, datasink, datasource
+from pathway.internals import api, datasink, datasource, dtype as dt
 from pathway.internals._io_helpers import (
     AwsS3Settings,
     _format_output_value_fields,
     is_s3_path,
 )
 from pathway.internals.config import _check_entitlements
+from pathway.internals.expression import ColumnReference
 from pathway.internals.runtime_type_check import check_arg_types
 from pathway.internals.schema import Schema
 from pathway.internals.table import Table
@@ -175,6 +177,9 @@ def write(
         AwsS3Settings | MinIOSettings | WasabiS3Settings | DigitalOceanS3Settings | None
     ) = None,
     min_commit_frequency: int | None = 60_000,
+    partition_by: Iterable[ColumnReference] | None = None,
+    target_file_size: int | None = None,
+    compaction_interval_ms: int | None = None,
 ) -> None:
     """
     Writes the stream of changes from ``table`` into `Delta Lake <https://delta.io/>_` data
@@ -208,6 +213,20 @@ def write(
             or \
 `optimize <https://docs.delta.io/2.0.2/optimizations-oss.html#optimize-performance-with-file-management>`_
             operations afterwards.
+        partition_by: Columns of ``table`` by which the output is partitioned. Each
+            distinct combination of their values is stored in a separate directory of
+            the Delta table. The columns must be of type ``str``, ``int`` or ``bool``.
+            Partition columns can only be set when the table is created; they are
+            ignored if the Delta table already exists.
+        target_file_size: The desired size of a single data file in bytes. If the
+            buffered data reaches this size, it is committed even if
+            ``min_commit_frequency`` hasn't elapsed yet. It is also the size of the
+            files produced by the background compaction.
+        compaction_interval_ms: If set, enables background compaction. Once a
+            partition receives no new rows for this many milliseconds, it is
+            considered closed and its small files are rewritten into larger ones.
+            The rewrite is committed as a transaction that removes the old files and
+            adds the new ones, without changing the data.
 
     Returns:
         None
@@ -243,9 +262,27 @@ def write(
     can be simplified as follows:
 
     >>> pw.io.deltalake.write(access_log, "s3://logs/access-log/")  # doctest: +SKIP
+
+    If the log is queried by day, it is better to partition it by the date of the
+    access, assuming that the table has a string column ``date``. The files of the
+    past days can also be compacted in the background once they stop receiving new
+    entries, for instance, after an hour:
+
+    >>> pw.io.deltalake.write(  # doctest: +SKIP
+    ...     access_log,
+    ...     "./logs/access-log",
+    ...     partition_by=[access_log.date],
+    ...     target_file_size=128 * 1024 * 1024,
+    ...     compaction_interval_ms=3_600_000,
+    ... )
     """
     _check_entitlements("deltalake")
     prepared_connection_settings = _prepare_connection_settings(s3_connection_settings)
+    partition_columns = _prepare_partition_columns(table, partition_by)
+    if target_file_size is not None and target_file_size <= 0:
+        raise ValueError("target_file_size must be positive")
+    if compaction_interval_ms is not None and compaction_interval_ms <= 0:
+        raise ValueError("compaction_interval_ms must be positive")
 
     uri = fspath(uri)
     data_storage = api.DataStorage(
@@ -255,6 +292,9 @@ def write(
             uri, prepared_connection_settings
         ),
         min_commit_frequency=min_commit_frequency,
+        partition_columns=partition_columns,
+        target_file_size=target_file_size,
+        compaction_interval_ms=compaction_interval_ms,
     )
     data_format = api.DataFormat(
         format_type="identity",
@@ -271,6 +311,27 @@ def write(
     )
 
 
+def _prepare_partition_columns(
+    table: Table, partition_by: Iterable[ColumnReference] | None
+) -> list[str]:
+    if partition_by is None:
+        return []
+    allowed_types = (dt.STR, dt.INT, dt.BOOL)
+    partition_columns = []
+    for column in partition_by:
+        if column.table is not table:
+            raise ValueError(
+                f"The partition column {column.name!r} doesn't belong to the table"
+            )
+        if dt.unoptionalize(column._column.dtype) not in allowed_types:
+            raise ValueError(
+                f"The partition column {column.name!r} must be of type str, int "
+                f"or bool, got {column._column.dtype}"
+            )
+        partition_columns.append(column.name)
+    return partition_columns
+
+
 def _prepare_connection_settings(
     s3_connection_settings: (
         AwsS3Settings | MinIOSettings | WasabiS3Settings | DigitalOceanS3Settings | None
@@ -49,7 +49,14 @@ class ElasticSearchAuth:
 
 @check_arg_types
 @trace_user_frame
-def write(table: Table, host: str, auth: ElasticSearchAuth, index_name: str) -> None:
+def write(
+    table: Table,
+    host: str,
+    auth: ElasticSearchAuth,
+    index_name: str,
+    *,
+    parallel_writers: int | None = None,
+) -> None:
     """Write a table to a given index in ElasticSearch.
 
     Args:
@@ -57,6 +64,9 @@ def write(table: Table, host: str, auth: ElasticSearchAuth, index_name: str) ->
         host: the host and port, on which Elasticsearch server works.
         auth: credentials for Elasticsearch authorization.
         index_name: name of the index, which gets the docs.
+        parallel_writers: the number of connections each Pathway worker uses to send
+            the ``_bulk`` requests. The docs are distributed among the connections by
+            the row key. If not specified, each worker uses a single connection.
 
     Returns:
         None
@@ -91,6 +101,16 @@ def write(table: Table, host: str, auth: ElasticSearchAuth, index_name: str) ->
     ... )
 
     All the updates of table "pets" will be indexed to "animals" as well.
+
+    If indexing is the bottleneck, the docs can be sent over several connections:
+
+    >>> pw.io.elasticsearch.write(
+    ...     table=pets,
+    ...     host="http://localhost:9200",
+    ...     auth=pw.io.elasticsearch.ElasticSearchAuth.basic("admin", "admin"),
+    ...     index_name="animals",
+    ...     parallel_writers=4,
+    ... )
     """
 
     data_storage = api.DataStorage(
@@ -100,6 +120,7 @@ def write(table: Table, host: str, auth: ElasticSearchAuth, index_name: str) ->
             index_name=index_name,
             auth=auth.engine_es_auth,
         ),
+        parallel_writers=parallel_writers,
     )
 
     data_format = api.DataFormat(
@@ -13,7 +13,14 @@ from pathway.internals.trace import trace_user_frame
 from pathway.io import python
 
 from .._subscribe import subscribe
-from ._common import RetryPolicy, Sender, prepare_request_payload, unescape
+from ._common import (
+    AsyncSender,
+    BatchingWriter,
+    RetryPolicy,
+    Sender,
+    prepare_request_payload,
+    unescape,
+)
 from ._server import (
     EndpointDocumentation,
     EndpointExamples,
@@ -64,7 +71,10 @@ def read(
           table with single "data" column will be produced. For "json" format, bytes
           encoded json is expected.
         delimiter: delimiter used to split stream into messages.
-        n_retries: how many times to retry the failed request.
+        n_retries: how many times to retry the request failed because of a connection
+          error or a status from ``retry_codes``. If the last retry fails as well,
+          the error is raised and the computation stops, instead of the body of the
+          error response being read as the data of the stream.
         retry_policy: policy of delays or backoffs for the retries.
         connect_timeout_ms: connection timeout, specified in milliseconds. In case
           it's None, no restrictions on connection duration will be applied.
@@ -170,6 +180,9 @@ def write(
     headers: dict[str, str] | None = None,
     allow_redirects: bool = True,
     retry_codes: tuple | None = (429, 500, 502, 503, 504),
+    max_concurrent_requests: int = 1,
+    max_batch_size: int | None = None,
+    batch_format: str = "json_array",
 ) -> None:
     """Sends the stream of updates from the table to the specified HTTP API.
 
@@ -183,7 +196,9 @@ def write(
           field request_payload_template will be used.
         request_payload_template: the template to format and send in case "custom" was
           specified in the format field. Can include wildcards.
-        n_retries: how many times to retry the failed request.
+        n_retries: how many times to retry the request failed because of a connection
+          error or a status from ``retry_codes``. If the last retry fails as well,
+          the error is raised and the computation stops.
         retry_policy: policy of delays or backoffs for the retries.
         connect_timeout_ms: connection timeout, specified in milliseconds. In case
           it's None, no restrictions on connection duration will be applied.
@@ -195,6 +210,16 @@ def write(
           JSON, it will be defaulted to "application/json".
         headers: request headers in the form of dict. Wildcards are allowed both, in
           keys and in values.
+        max_concurrent_requests: the maximum number of requests sent at the same time.
+          If it's greater than one, the requests are sent asynchronously over a pool of
+          keep-alive connections and may be delivered out of order.
+        max_batch_size: if set, the payloads of up to this number of rows with the same
+          URL and headers are sent in a single request. The batches that are not full
+          are sent at the end of each Pathway time. The retries are done for the whole
+          batch.
+        batch_format: the format of the body of a batched request, one of
+          {"json_array", "ndjson"}. "json_array" can only be used with the "json"
+          payload format. For "ndjson", the payloads are sent one per line.
 
     Wildcards:
 
@@ -253,17 +278,58 @@ def write(
     ...     format="custom",
     ...     request_payload_template=message_template
     ... )
+
+    If the endpoint can't keep up with the stream of updates sent one by one, the rows
+    can be sent in batches, with several requests in flight at once. The following
+    code sends up to 100 rows per request as newline-delimited JSON, keeping up to 8
+    requests in flight:
+
+    >>> pw.io.http.write(
+    ...     pets,
+    ...     "http://www.example.com/api/events",
+    ...     max_concurrent_requests=8,
+    ...     max_batch_size=100,
+    ...     batch_format="ndjson",
+    ... )
     """
 
-    sender = Sender(
-        request_method=method,
-        n_retries=n_retries,
-        retry_policy=retry_policy,
-        connect_timeout_ms=connect_timeout_ms,
-        request_timeout_ms=request_timeout_ms,
-        allow_redirects=allow_redirects,
-        retry_codes=retry_codes,
-    )
+    if max_concurrent_requests < 1:
+        raise ValueError("max_concurrent_requests must be a positive integer")
+    if max_batch_size is not None and max_batch_size < 1:
+        raise ValueError("max_batch_size must be a positive integer")
+    if batch_format not in ("json_array", "ndjson"):
+        raise ValueError(f"Unknown batch format: {batch_format}")
+    if max_batch_size is not None and batch_format == "json_array" and format != "json":
+        raise ValueError(
+            "'json_array' batch format can only be used with 'json' payload format"
+        )
+
+    sender: Sender | AsyncSender | BatchingWriter
+    if max_concurrent_requests == 1 and max_batch_size is None:
+        sender = Sender(
+            request_method=method,
+            n_retries=n_retries,
+            retry_policy=retry_policy,
+            connect_timeout_ms=connect_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+            allow_redirects=allow_redirects,
+            retry_codes=retry_codes,
+        )
+    else:
+        sender = AsyncSender(
+            request_method=method,
+            n_retries=n_retries,
+            retry_policy=retry_policy,
+            connect_timeout_ms=connect_timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+            allow_redirects=allow_redirects,
+            retry_codes=retry_codes,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        if max_batch_size is not None:
+            sender = BatchingWriter(sender, max_batch_size, batch_format)
+
+    is_ndjson_batch = max_batch_size is not None and batch_format == "ndjson"
 
     def callback(key: Pointer, row: dict[str, Any], time: int, is_addition: bool):
         payload = prepare_request_payload(
@@ -279,6 +345,8 @@ def write(
 
         if content_type:
             patched_headers["Content-Type"] = content_type
+        elif format == "json" and is_ndjson_batch:
+            patched_headers["Content-Type"] = "application/x-ndjson"
         elif format == "json":
             patched_headers["Content-Type"] = "application/json"
 
@@ -288,7 +356,15 @@ def write(
             data=payload,
         )
 
-    subscribe(table, callback)
+    def on_time_end(time: int):
+        if isinstance(sender, BatchingWriter):
+            sender.flush()
+
+    def on_end():
+        if not isinstance(sender, Sender):
+            sender.close()
+
+    subscribe(table, callback, on_end=on_end, on_time_end=on_time_end)
 
 
 __all__ = [
@@ -1,10 +1,15 @@
 # Copyright © 2024 Pathway
 
+import asyncio
+import copy
 import json
 import random
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import Any
 
+import aiohttp
 import requests
 
 import pathway as pw
@@ -65,8 +70,9 @@ class Sender:
         headers = headers or {}
         if "User-Agent" not in headers:
             headers["User-Agent"] = f"pathway/{pw.__version__}"
-        retry_policy = self._retry_policy
+        retry_policy = copy.copy(self._retry_policy)
         for n_attempt in range(0, self._n_retries + 1):
+            is_last_attempt = n_attempt == self._n_retries
             try:
                 response = requests.request(
                     self._request_method,
@@ -77,11 +83,17 @@ class Sender:
                     allow_redirects=self._allow_redirects,
                     stream=stream,
                 )
+            except requests.exceptions.ConnectionError:
+                # includes the connection timeouts
+                if is_last_attempt:
+                    raise
+            else:
                 if response.ok or response.status_code not in self._retry_codes:
                     break
-            except requests.exceptions.ConnectTimeout:
-                if n_attempt == self._n_retries:
-                    raise
+                if is_last_attempt:
+                    # the retries are exhausted, don't let the request fail silently
+                    response.raise_for_status()
+                    break
 
             sleep_duration = retry_policy.wait_duration_before_retry()
             time.sleep(sleep_duration)
@@ -97,6 +109,196 @@ class Sender:
         return (connect_timeout, request_timeout)
 
 
+class AsyncSender:
+    """Sends the requests concurrently from a dedicated event loop, reusing the
+    connections of a shared keep-alive pool.
+
+    At most ``max_concurrent_requests`` requests are in flight at once. When the limit
+    is reached, ``send`` blocks until one of them finishes and raises the exception of
+    a failed request, if there was one.
+    """
+
+    def __init__(
+        self,
+        request_method: str,
+        n_retries: int,
+        retry_policy: RetryPolicy,
+        connect_timeout_ms: int | None,
+        request_timeout_ms: int | None,
+        allow_redirects: bool,
+        retry_codes: tuple | None,
+        max_concurrent_requests: int,
+    ) -> None:
+        self._request_method = request_method
+        self._n_retries = n_retries
+        self._retry_policy = retry_policy
+        self._connect_timeout_ms = connect_timeout_ms
+        self._request_timeout_ms = request_timeout_ms
+        self._allow_redirects = allow_redirects
+        self._retry_codes = retry_codes or ()
+        self._max_concurrent_requests = max_concurrent_requests
+        self._in_flight: set[Future] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    def send(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        data: Any | None = None,
+    ) -> None:
+        if self._loop is None:
+            self._start()
+        assert self._loop is not None
+        while len(self._in_flight) >= self._max_concurrent_requests:
+            self._wait(FIRST_COMPLETED)
+        self._in_flight.add(
+            asyncio.run_coroutine_threadsafe(
+                self._send(url, headers or {}, data), self._loop
+            )
+        )
+
+    def wait_all(self) -> None:
+        """Waits until all the requests sent so far are finished."""
+        while self._in_flight:
+            self._wait(FIRST_COMPLETED)
+
+    def close(self) -> None:
+        try:
+            self.wait_all()
+        finally:
+            if self._loop is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._close_session(), self._loop
+                ).result()
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                assert self._thread is not None
+                self._thread.join()
+                self._loop = None
+
+    def _start(self) -> None:
+        self._loop = asyncio.new_event_loop()
+
+        def target(event_loop: asyncio.AbstractEventLoop):
+            try:
+                event_loop.run_forever()
+            finally:
+                event_loop.close()
+
+        self._thread = threading.Thread(
+            target=target, args=(self._loop,), name="pathway:http-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _wait(self, return_when: str) -> None:
+        done, self._in_flight = wait(self._in_flight, return_when=return_when)
+        for future in done:
+            future.result()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connect_timeout, request_timeout = Sender.format_timeouts_tuple(
+                self._connect_timeout_ms, self._request_timeout_ms
+            )
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_concurrent_requests),
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=connect_timeout, sock_read=request_timeout
+                ),
+            )
+        return self._session
+
+    async def _close_session(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _send(self, url: str, headers: dict[str, str], data: Any) -> None:
+        if "User-Agent" not in headers:
+            headers["User-Agent"] = f"pathway/{pw.__version__}"
+        session = await self._get_session()
+        retry_policy = copy.copy(self._retry_policy)
+        for n_attempt in range(0, self._n_retries + 1):
+            is_last_attempt = n_attempt == self._n_retries
+            try:
+                async with session.request(
+                    self._request_method,
+                    url,
+                    headers=headers,
+                    data=data,
+                    allow_redirects=self._allow_redirects,
+                ) as response:
+                    await response.read()
+            except aiohttp.ClientConnectionError:
+                # includes the timeouts of connecting and reading
+                if is_last_attempt:
+                    raise
+            else:
+                if response.ok or response.status not in self._retry_codes:
+                    break
+                if is_last_attempt:
+                    # the retries are exhausted, don't let the request fail silently
+                    response.raise_for_status()
+                    break
+
+            await asyncio.sleep(retry_policy.wait_duration_before_retry())
+
+
+class BatchingWriter:
+    """Groups the payloads of the rows sharing the same URL and headers into the
+    request bodies of at most ``max_batch_size`` rows and sends them with the given
+    ``AsyncSender``. The unfinished batches are sent at the end of each time."""
+
+    def __init__(
+        self,
+        sender: AsyncSender,
+        max_batch_size: int,
+        batch_format: str,
+    ) -> None:
+        self._sender = sender
+        self._max_batch_size = max_batch_size
+        self._batch_format = batch_format
+        self._batches: dict[tuple[str, tuple[tuple[str, str], ...]], list[str]] = {}
+
+    def send(self, url: str, headers: dict[str, str], data: str) -> None:
+        batch_key = (url, tuple(headers.items()))
+        batch = self._batches.setdefault(batch_key, [])
+        batch.append(data)
+        if len(batch) >= self._max_batch_size:
+            del self._batches[batch_key]
+            self._send(batch_key, batch)
+
+    def flush(self) -> None:
+        batches = self._batches
+        self._batches = {}
+        for batch_key, batch in batches.items():
+            self._send(batch_key, batch)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._sender.close()
+
+    def _send(
+        self, batch_key: tuple[str, tuple[tuple[str, str], ...]], batch: list[str]
+    ) -> None:
+        url, headers = batch_key
+        self._sender.send(
+            url=url, headers=dict(headers), data=format_batch(batch, self._batch_format)
+        )
+
+
+def format_batch(payloads: list[str], batch_format: str) -> str:
+    if batch_format == "json_array":
+        return "[" + ",".join(payloads) + "]"
+    elif batch_format == "ndjson":
+        return "".join(payload + "\n" for payload in payloads)
+    else:
+        raise ValueError(f"Unknown batch format: {batch_format}")
+
+
 def unescape(message: str, row: dict[str, Any], time: int, is_addition: bool):
     message = message.replace("{table.time}", str(time))
     message = message.replace("{table.diff}", "1" if is_addition else "-1")
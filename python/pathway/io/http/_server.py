@@ -504,6 +504,8 @@ class RestServerSubject(io.python.ConnectorSubject):
         request_validator: Callable | None = None,
         documentation: EndpointDocumentation = EndpointDocumentation(),
         cache_strategy: CacheStrategy | None = None,
+        coalesce_requests: bool = False,
+        minibatch_duration_ms: int | None = None,
     ) -> None:
         super().__init__()
         self._webserver = webserver
@@ -513,6 +515,10 @@ class RestServerSubject(io.python.ConnectorSubject):
         self._format = format
         self._request_validator = request_validator
         self._cache_strategy = cache_strategy
+        self._coalesce_requests = coalesce_requests
+        self._requests_in_flight: dict[str, asyncio.Future] = {}
+        self._minibatch_duration_ms = minibatch_duration_ms
+        self._commit_scheduled = False
         self._request_processor = self._create_request_processor()
 
         webserver._register_endpoint(
@@ -558,13 +564,41 @@ class RestServerSubject(io.python.ConnectorSubject):
                 logging.error(json.dumps(record))
                 raise web.HTTPBadRequest(reason=str(e))
 
-        result = await self._request_processor(
-            json.dumps(payload, sort_keys=True, ensure_ascii=False)
-        )
-        return copy.deepcopy(result)
+        payload_encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        if self._coalesce_requests:
+            status, result = await self._process_coalesced(payload_encoded)
+        else:
+            status, result = await self._request_processor(payload_encoded)
+        if status != 200:
+            return web.json_response(status=status)
+        return web.json_response(status=status, data=result, dumps=pw.Json.dumps)
+
+    async def _process_coalesced(self, payload_encoded: str) -> tuple[int, Any]:
+        # Concurrent requests with the same payload share a single row in the table
+        # and its result. The shared processing isn't cancelled when one of the
+        # clients disconnects.
+        future = self._requests_in_flight.get(payload_encoded)
+        if future is None:
+            future = asyncio.ensure_future(self._request_processor(payload_encoded))
+            self._requests_in_flight[payload_encoded] = future
+            future.add_done_callback(
+                lambda _: self._requests_in_flight.pop(payload_encoded, None)
+            )
+        return await asyncio.shield(future)
+
+    def _schedule_commit(self) -> None:
+        if self._minibatch_duration_ms is None or self._commit_scheduled:
+            return
+
+        def commit():
+            self._commit_scheduled = False
+            self.commit()
+
+        self._commit_scheduled = True
+        self._webserver._loop.call_later(self._minibatch_duration_ms * 1e-3, commit)
 
     def _create_request_processor(self):
-        async def inner(payload_encoded: str) -> web.Response:
+        async def inner(payload_encoded: str) -> tuple[int, Any]:
             id = unsafe_make_pointer(uuid4().int)
             payload = json.loads(payload_encoded)
             self._cast_types_to_schema(payload)
@@ -576,12 +610,14 @@ class RestServerSubject(io.python.ConnectorSubject):
             }
 
             self._add_inner(id, payload)
+            self._schedule_commit()
             response = await self._fetch_response(id, event)
             if self._delete_completed_queries:
                 self._remove_inner(id, payload)
+                self._schedule_commit()
             if response is api.ERROR:
-                return web.json_response(status=500)
-            return web.json_response(status=200, data=response, dumps=pw.Json.dumps)
+                return (500, None)
+            return (200, response)
 
         if not self._cache_strategy:
             return inner
@@ -630,11 +666,14 @@ def rest_connector(
     schema: type[pw.Schema] | None = None,
     methods: Sequence[str] = ("POST",),
     autocommit_duration_ms=1500,
+    autocommit_target_latency_ms: int | None = None,
     documentation: EndpointDocumentation = EndpointDocumentation(),
     keep_queries: bool | None = None,
     delete_completed_queries: bool | None = None,
     request_validator: Callable | None = None,
     cache_strategy: CacheStrategy | None = None,
+    coalesce_requests: bool = False,
+    minibatch_duration_ms: int | None = None,
 ) -> tuple[pw.Table, Callable]:
     """
     Runs a lightweight HTTP server and inputs a collection from the HTTP endpoint,
@@ -653,6 +692,11 @@ need to create only one instance of this class per single host-port pair;
         autocommit_duration_ms: the maximum time between two commits. Every
           autocommit_duration_ms milliseconds, the updates received by the connector are
           committed and pushed into Pathway's computation graph;
+        autocommit_target_latency_ms: if set, the commits are adaptive: the requests are
+          committed as soon as the computation has processed the previous ones and,
+          while it's busy, they are accumulated into larger minibatches as long as the
+          estimated p99 end-to-end latency stays within this target. In this mode,
+          ``autocommit_duration_ms`` limits the duration of a single minibatch;
         keep_queries: whether to keep queries after processing; defaults to False. [deprecated]
         delete_completed_queries: whether to send a deletion entry after the query is processed.
           Allows to remove it from the system if it is stored by operators such as ``join`` or ``groupby``;
@@ -661,6 +705,12 @@ need to create only one instance of this class per single host-port pair;
           caught and treated as validation failure.
         cache_strategy: one of available request caching strategies or None if no caching is required.
           If enabled, caches responses for the requests with the same ``schema``-defined payload.
+        coalesce_requests: whether the requests with the same ``schema``-defined payload
+          that arrive while an identical request is being processed should share its
+          row in the table and its response, instead of being processed separately;
+        minibatch_duration_ms: if set, the requests are committed into the computation
+          graph in minibatches: a commit happens this many milliseconds after the first
+          request of a minibatch arrives, regardless of ``autocommit_duration_ms``.
 
     Returns:
         table: the table read;
@@ -730,6 +780,9 @@ with:
             )
             delete_completed_queries = not keep_queries
 
+    if minibatch_duration_ms is not None and minibatch_duration_ms <= 0:
+        raise ValueError("minibatch_duration_ms must be a positive integer")
+
     if schema is None:
         format = "raw"
         schema = pw.schema_builder({"query": pw.column_definition()})
@@ -768,10 +821,13 @@ with:
             request_validator=request_validator,
             documentation=documentation,
             cache_strategy=cache_strategy,
+            coalesce_requests=coalesce_requests,
+            minibatch_duration_ms=minibatch_duration_ms,
         ),
         schema=schema,
         format="json",
         autocommit_duration_ms=autocommit_duration_ms,
+        autocommit_target_latency_ms=autocommit_target_latency_ms,
         name="rest-connector",
     )
 
@@ -32,11 +32,13 @@ def read(
     format: str = "raw",
     debug_data=None,
     autocommit_duration_ms: int | None = 1500,
+    autocommit_target_latency_ms: int | None = None,
     json_field_paths: dict[str, str] | None = None,
     autogenerate_key: bool = False,
     with_metadata: bool = False,
     start_from_timestamp_ms: int | None = None,
     parallel_readers: int | None = None,
+    static_partition_assignment: bool = False,
     persistent_id: str | None = None,
     value_columns: list[str] | None = None,
     primary_key: list[str] | None = None,
@@ -68,6 +70,11 @@ def read(
         autocommit_duration_ms:the maximum time between two commits. Every
             autocommit_duration_ms milliseconds, the updates received by the connector are
             committed and pushed into Pathway's computation graph.
+        autocommit_target_latency_ms: if set, the commits are adaptive: the updates are
+            committed as soon as the computation has processed the previous ones and,
+            while it's busy, they are accumulated into larger minibatches as long as the
+            estimated p99 end-to-end latency stays within this target. In this mode,
+            ``autocommit_duration_ms`` limits the duration of a single minibatch.
         json_field_paths: If the format is JSON, this field allows to map field names
             into path in the field. For the field which require such mapping, it should be
             given in the format ``<field_name>: <path to be mapped>``, where the path to
@@ -89,6 +96,10 @@ def read(
             will be taken. This number also can't be greater than the number of Pathway
             engine threads, and will be reduced to the number of engine threads, if it
             exceeds.
+        static_partition_assignment: If set to ``True``, the partitions of the topic are
+            assigned to the parallel readers in a round-robin manner instead of being
+            balanced by the consumer group. It avoids the rebalancing pauses, but the
+            partitions added to the topic after the start are not read.
         persistent_id: (unstable) An identifier, under which the state of the table will
             be persisted or ``None``, if there is no need to persist the state of this table.
             When a program restarts, it restores the state for all input tables according to what
@@ -262,6 +273,7 @@ def read(
         rdkafka_settings=rdkafka_settings,
         topic=topic,
         parallel_readers=parallel_readers,
+        static_partition_assignment=static_partition_assignment,
         persistent_id=persistent_id,
         start_from_timestamp_ms=start_from_timestamp_ms,
         mode=api.ConnectorMode.STREAMING,
@@ -280,7 +292,8 @@ def read(
         _stacklevel=5,
     )
     data_source_options = datasource.DataSourceOptions(
-        commit_duration_ms=autocommit_duration_ms
+        commit_duration_ms=autocommit_duration_ms,
+        commit_target_latency_ms=autocommit_target_latency_ms,
     )
     return table_from_datasource(
         datasource.GenericDataSource(
@@ -0,0 +1,240 @@
+# Copyright © 2024 Pathway
+
+from __future__ import annotations
+
+from os import PathLike, fspath
+from typing import Any
+
+from pathway.internals import api, datasink, datasource
+from pathway.internals._io_helpers import AwsS3Settings, _format_output_value_fields
+from pathway.internals.runtime_type_check import check_arg_types
+from pathway.internals.schema import Schema
+from pathway.internals.table import Table
+from pathway.internals.table_io import table_from_datasource
+from pathway.internals.trace import trace_user_frame
+from pathway.io._utils import internal_connector_mode, read_schema
+from pathway.io.deltalake import (
+    _engine_s3_connection_settings,
+    _prepare_connection_settings,
+)
+from pathway.io.minio import MinIOSettings
+from pathway.io.s3 import DigitalOceanS3Settings, WasabiS3Settings
+
+SUPPORTED_FILTER_OPERATORS: set[str] = {"=", "==", "!=", "<", "<=", ">", ">="}
+SUPPORTED_COMPRESSIONS: set[str] = {"none", "snappy", "gzip", "lz4", "zstd", "brotli"}
+
+
+def _check_filters(
+    filters: list[tuple[str, str, Any]], schema: type[Schema]
+) -> list[tuple[str, str, Any]]:
+    column_names = set(schema.column_names())
+    for column, operator, _ in filters:
+        if column not in column_names:
+            raise ValueError(
+                f"Filter refers to the column {column!r}, which is not in the schema"
+            )
+        if operator not in SUPPORTED_FILTER_OPERATORS:
+            raise ValueError(
+                "Unknown filter operator: {}. Only {} are supported".format(
+                    operator, ", ".join(sorted(SUPPORTED_FILTER_OPERATORS))
+                )
+            )
+    return [(column, operator, value) for column, operator, value in filters]
+
+
+@check_arg_types
+@trace_user_frame
+def read(
+    path: str | PathLike,
+    schema: type[Schema],
+    *,
+    mode: str = "streaming",
+    filters: list[tuple[str, str, Any]] | None = None,
+    parallel_row_groups: int | None = None,
+    s3_connection_settings: (
+        AwsS3Settings | MinIOSettings | WasabiS3Settings | DigitalOceanS3Settings | None
+    ) = None,
+    autocommit_duration_ms: int | None = 1500,
+    persistent_id: str | None = None,
+    debug_data: Any = None,
+) -> Table:
+    """
+    Reads a table from one or several Parquet files. The files are discovered the same
+    way as in ``pw.io.fs.read``: the path can point to a single file, a directory, which
+    is scanned for the files with the ``.parquet`` extension, or be a glob pattern.
+    Paths starting with ``s3://`` or ``s3a://`` are read from S3.
+
+    Only the columns present in the ``schema`` are decoded, the remaining columns of the
+    files are skipped. The row groups of each file are decoded in parallel.
+
+    Args:
+        path: Path to the file, the directory or the glob pattern for the files to be read.
+        schema: Schema of the resulting table.
+        mode: Denotes how the engine polls the new data from the source. Currently
+            ``"streaming"`` and ``"static"`` are supported. If set to ``"streaming"``
+            the engine will wait for the new files to appear in the specified location.
+            On the other hand, the ``"static"`` mode will only consider the available
+            data and ingest all of it in one commit. The default value is ``"streaming"``.
+        filters: A list of conditions in the form ``(column, operator, value)``, where
+            the operator is one of ``"=="``, ``"!="``, ``"<"``, ``"<="``, ``">"``, ``">="``.
+            Only the rows satisfying all conditions are read. The conditions are also
+            checked against the min-max statistics of the row groups, so that the row
+            groups that can't contain matching rows are not decoded at all.
+        parallel_row_groups: The maximum number of row groups of a file decoded in parallel.
+            If not specified, it defaults to the number of available CPU cores.
+        s3_connection_settings: Configuration for S3 credentials when using S3 storage.
+            If the path starts with ``s3://`` or ``s3a://`` and no settings are given,
+            the credentials of the currently authenticated user are used.
+        autocommit_duration_ms: The maximum time between two commits. Every
+            ``autocommit_duration_ms`` milliseconds, the updates received by the connector are
+            committed and pushed into Pathway's computation graph.
+        persistent_id: (unstable) An identifier, under which the state of the table
+            will be persisted or ``None``, if there is no need to persist the state of this table.
+            When a program restarts, it restores the state for all input tables according to what
+            was saved for their ``persistent_id``. This way it's possible to configure the start of
+            computations from the moment they were terminated last time.
+        debug_data: Static data replacing original one when debug mode is active.
+
+    Returns:
+        Table: The table read.
+
+    Example:
+
+    Consider a table of prices, written into a local directory with ``pw.io.parquet.write``:
+
+    >>> import pathway as pw
+    >>> class PricesSchema(pw.Schema):
+    ...     product: str
+    ...     price: float
+    >>> prices = pw.debug.table_from_markdown(
+    ...     "product | price \\n apple | 1.5 \\n melon | 4.0 \\n lemon | 0.5"
+    ... )
+    >>> output_path = getfixture("tmp_path") / "prices"  # NODOCS
+    >>> pw.io.parquet.write(prices, output_path)
+    >>> pw.run(monitoring_level=pw.MonitoringLevel.NONE)
+
+    The files can then be read back. The filter below is applied before the rows enter
+    the engine, so only the expensive products are read:
+
+    >>> expensive = pw.io.parquet.read(
+    ...     output_path, PricesSchema, mode="static", filters=[("price", ">", 1.0)]
+    ... )
+    >>> pw.debug.compute_and_print(expensive, include_id=False)
+    product | price
+    apple   | 1.5
+    melon   | 4.0
+    """
+    path = fspath(path)
+    schema, api_schema = read_schema(schema=schema)
+    prepared_connection_settings = _prepare_connection_settings(s3_connection_settings)
+
+    data_storage = api.DataStorage(
+        storage_type="parquet",
+        path=path,
+        mode=internal_connector_mode(mode),
+        aws_s3_settings=_engine_s3_connection_settings(
+            path, prepared_connection_settings
+        ),
+        persistent_id=persistent_id,
+        parquet_settings=api.ParquetSettings(
+            filters=_check_filters(filters or [], schema),
+            parallel_row_groups=parallel_row_groups,
+        ),
+    )
+    data_format = api.DataFormat(
+        format_type="transparent",
+        **api_schema,
+    )
+
+    data_source_options = datasource.DataSourceOptions(
+        commit_duration_ms=autocommit_duration_ms
+    )
+    return table_from_datasource(
+        datasource.GenericDataSource(
+            datastorage=data_storage,
+            dataformat=data_format,
+            schema=schema,
+            data_source_options=data_source_options,
+            datasource_name="parquet",
+        ),
+        debug_datasource=datasource.debug_datasource(debug_data),
+    )
+
+
+@check_arg_types
+@trace_user_frame
+def write(
+    table: Table,
+    path: str | PathLike,
+    *,
+    compression: str = "snappy",
+    max_file_size: int | None = 128 * 1024 * 1024,
+    max_file_duration_ms: int | None = 60_000,
+) -> None:
+    """
+    Writes the stream of changes from ``table`` into a local directory as a sequence of
+    Parquet files. Along with the columns of the ``table``, the files contain two integer
+    columns: ``time``, representing the computation minibatch, and ``diff``, indicating
+    the type of change (``1`` for row addition and ``-1`` for row deletion).
+
+    The output is split into files, which are finalized when they reach the size of
+    ``max_file_size`` bytes or when they have been open for ``max_file_duration_ms``
+    milliseconds, whichever happens first. While being written, a file has the
+    ``.parquet.inprogress`` extension; once finalized, it is renamed to ``.parquet``,
+    so the readers never see incomplete files. Each worker writes its own files.
+
+    Args:
+        table: Table to be written.
+        path: Path to the directory, where the files are placed. It is created if
+            it doesn't exist.
+        compression: Compression codec for the files. Supported values are ``"none"``,
+            ``"snappy"``, ``"gzip"``, ``"lz4"``, ``"zstd"`` and ``"brotli"``.
+        max_file_size: The size in bytes, after which the current file is finalized.
+            If set to ``None``, the files are not rolled over by size.
+        max_file_duration_ms: The time in milliseconds, after which the current file
+            is finalized. If set to ``None``, the files are not rolled over by time.
+
+    Returns:
+        None
+
+    Example:
+
+    Consider a table ``access_log`` that needs to be output to the folder
+    ``./logs/access-log`` with zstd-compressed files of at most 64 MB:
+
+    >>> pw.io.parquet.write(  # doctest: +SKIP
+    ...     access_log,
+    ...     "./logs/access-log",
+    ...     compression="zstd",
+    ...     max_file_size=64 * 1024 * 1024,
+    ... )
+    """
+    if compression not in SUPPORTED_COMPRESSIONS:
+        raise ValueError(
+            "Unknown compression: {}. Only {} are supported".format(
+                compression, ", ".join(sorted(SUPPORTED_COMPRESSIONS))
+            )
+        )
+
+    data_storage = api.DataStorage(
+        storage_type="parquet",
+        path=fspath(path),
+        parquet_settings=api.ParquetSettings(
+            compression=compression,
+            max_file_size=max_file_size,
+            max_file_duration_ms=max_file_duration_ms,
+        ),
+    )
+    data_format = api.DataFormat(
+        format_type="identity",
+        key_field_names=None,
+        value_fields=_format_output_value_fields(table),
+    )
+
+    table.to(
+        datasink.GenericDataSink(
+            data_storage,
+            data_format,
+            datasink_name="parquet",
+        )
+    )
@@ -20,6 +20,8 @@ def write(
     postgres_settings: dict,
     table_name: str,
     max_batch_size: int | None = None,
+    *,
+    parallel_writers: int | None = None,
 ) -> None:
     """Writes ``table``'s stream of updates to a postgres table.
 
@@ -31,6 +33,10 @@ def write(
         table_name: Name of the target table.
         max_batch_size: Maximum number of entries allowed to be committed within a \
 single transaction.
+        parallel_writers: Number of connections each Pathway worker uses to write the \
+updates. The updates are distributed among the connections by the row key, so the \
+updates of a single row are still written in order. If not specified, each worker \
+uses a single connection.
 
     Returns:
         None
@@ -94,6 +100,7 @@ single transaction.
         storage_type="postgres",
         connection_string=_connection_string_from_settings(postgres_settings),
         max_batch_size=max_batch_size,
+        parallel_writers=parallel_writers,
     )
     data_format = api.DataFormat(
         format_type="sql",
@@ -352,6 +352,7 @@ def read(
     schema: type[Schema] | None = None,
     format: str | None = None,
     autocommit_duration_ms: int | None = 1500,
+    autocommit_target_latency_ms: int | None = None,
     debug_data=None,
     value_columns: list[str] | None = None,
     primary_key: list[str] | None = None,
@@ -372,6 +373,11 @@ def read(
         autocommit_duration_ms: the maximum time between two commits. Every
             autocommit_duration_ms milliseconds, the updates received by the connector are
             committed and pushed into Pathway's computation graph
+        autocommit_target_latency_ms: if set, the commits are adaptive: the updates are
+            committed as soon as the computation has processed the previous ones and,
+            while it's busy, they are accumulated into larger minibatches as long as the
+            estimated p99 end-to-end latency stays within this target. In this mode,
+            ``autocommit_duration_ms`` limits the duration of a single minibatch.
         value_columns: Columns to extract for a table. [will be deprecated soon]
         primary_key: In case the table should have a primary key generated according to
             a subset of its columns, the set of columns should be specified in this field.
@@ -455,7 +461,8 @@ computations from the moment they were terminated last time.
         mode=mode,
     )
     data_source_options = datasource.DataSourceOptions(
-        commit_duration_ms=autocommit_duration_ms
+        commit_duration_ms=autocommit_duration_ms,
+        commit_target_latency_ms=autocommit_target_latency_ms,
     )
     return table_from_datasource(
         datasource.GenericDataSource(
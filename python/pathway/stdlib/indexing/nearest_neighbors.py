@@ -1,6 +1,7 @@
 # Copyright © 2024 Pathway
 
 import dataclasses
+import weakref
 from dataclasses import dataclass, field
 from typing import Callable, Tuple
 
@@ -48,6 +49,13 @@ def check_default_knn_column_types(
     check_column_reference_type(typecheck_list)
 
 
+# embeddings of the columns of each table, shared by the indexes built over the same
+# column with the same embedder (e.g. by a DocumentStore and a HybridIndex)
+_embeddings: weakref.WeakKeyDictionary[
+    pw.Table, list[tuple[str, pw.UDF, pw.ColumnReference]]
+] = weakref.WeakKeyDictionary()
+
+
 def _calculate_embeddings(
     column: pw.ColumnReference, embedder: pw.UDF | None
 ) -> pw.ColumnReference:
@@ -55,10 +63,16 @@ def _calculate_embeddings(
         return column
 
     table = column.table
-    table = table.with_columns(_pw_embedded_column=embedder(column))
-    column = table._pw_embedded_column
-
-    return column
+    computed = _embeddings.setdefault(table, [])
+    for name, computed_embedder, embeddings in computed:
+        if name == column.name and computed_embedder is embedder:
+            return embeddings
+
+    embeddings = table.with_columns(
+        _pw_embedded_column=embedder(column)
+    )._pw_embedded_column
+    computed.append((column.name, embedder, embeddings))
+    return embeddings
 
 
 @dataclass(frozen=True, kw_only=True)
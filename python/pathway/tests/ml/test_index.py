@@ -1058,6 +1058,57 @@ def test_hybrid_index_ignores_duplicates():
     assert_table_equality_wo_index(res.update_types(doc=list[str]), expected)
 
 
+def test_indexes_share_embeddings():
+    embedded: list[str] = []
+
+    @pw.udf
+    def embedder(x: str) -> list[float]:
+        embedded.append(x)
+        if x == "query" or x == "doc1":
+            return [1.0, 2.0, 3.0]
+        elif x == "doc3":
+            return [1.0, 2.0, 4.0]
+        else:
+            return [4.0, 5.0, 6.0]
+
+    @pw.udf
+    def sort_docs(x: list[str]) -> list[str]:
+        return sorted(x)
+
+    query = pw.debug.table_from_rows(pw.schema_from_types(query=str), [("query",)])
+    docs = pw.debug.table_from_rows(
+        pw.schema_from_types(doc=str), [("doc1",), ("doc2",), ("doc3",)]
+    )
+
+    index1 = BruteForceKnn(
+        docs.doc,
+        None,
+        dimensions=3,
+        reserved_space=3,
+        metric=BruteForceKnnMetricKind.COS,
+        embedder=embedder,
+    )
+    index2 = USearchKnn(
+        docs.doc,
+        None,
+        dimensions=3,
+        reserved_space=3,
+        metric=USearchMetricKind.COS,
+        embedder=embedder,
+    )
+    assert index1._data_column is index2._data_column
+    hybrid_index = HybridIndex([index1, index2])
+    index = DataIndex(docs, hybrid_index)
+    res = query + index.query_as_of_now(
+        query.query, collapse_rows=True, number_of_matches=2
+    ).select(doc=sort_docs(pw.right.doc))
+    expected = pw.debug.table_from_pandas(
+        pd.DataFrame({"query": ["query"], "doc": [("doc1", "doc3")]})
+    )
+    assert_table_equality_wo_index(res.update_types(doc=list[str]), expected)
+    assert sorted(embedded) == ["doc1", "doc2", "doc3", "query"]
+
+
 @pytest.mark.parametrize(
     "factory",
     [
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import functools
 import inspect
+import json
+import logging
 import multiprocessing
 import os
 import pathlib
 import re
+import time
 import warnings
 from typing import Any, Optional
 from unittest import mock
@@ -20,7 +23,7 @@ import pathway as pw
 import pathway.internals.shadows.operator as operator
 from pathway.debug import table_from_pandas, table_to_pandas
 from pathway.internals import dtype as dt
-from pathway.internals.parse_graph import warn_if_some_operators_unused
+from pathway.internals.parse_graph import G, warn_if_some_operators_unused
 from pathway.internals.table_io import empty_from_schema
 from pathway.tests.utils import (
     T,
@@ -2143,6 +2146,235 @@ def test_join():
     )
 
 
+def test_join_skew(monkeypatch: pytest.MonkeyPatch):
+    # the hot keys are split across workers only if there are several of them
+    monkeypatch.setenv("PATHWAY_THREADS", "4")
+    t1 = T(
+        """
+            | pet | owner | age
+        1   |   1 | Alice |  10
+        2   |   1 |   Bob |   9
+        3   |   2 | Alice |   8
+        4   |   1 |   Bob |   7
+        """
+    )
+    t2 = T(
+        """
+            | pet | owner | size
+        11  |   3 | Alice |    M
+        12  |   1 |   Bob |    L
+        13  |   1 |   Tom |   XL
+        """
+    )
+    res = t1.join_left(
+        t2, t1.pet == t2.pet, t1.owner == t2.owner, skew=[(1, "Bob"), (2, "Alice")]
+    ).select(owner_name=t1.owner, age=t1.age, size=t2.size)
+    assert_table_equality_wo_index(
+        res,
+        T(
+            """
+            owner_name | age | size
+            Alice      |  10 |
+            Bob        |   9 |    L
+            Alice      |   8 |
+            Bob        |   7 |    L
+            """,
+        ),
+    )
+
+
+def test_join_broadcast(monkeypatch: pytest.MonkeyPatch):
+    # the right table is copied to every worker only if there are several of them
+    monkeypatch.setenv("PATHWAY_THREADS", "4")
+    t1 = T(
+        """
+            | pet | owner | age
+        1   |   1 | Alice |  10
+        2   |   1 |   Bob |   9
+        3   |   2 | Alice |   8
+        4   |   1 |   Bob |   7
+        """
+    )
+    t2 = T(
+        """
+            | pet | owner | size
+        11  |   3 | Alice |    M
+        12  |   1 |   Bob |    L
+        13  |   1 |   Tom |   XL
+        """
+    )
+    res = t1.join_outer(
+        t2, t1.pet == t2.pet, t1.owner == t2.owner, broadcast=True
+    ).select(age=t1.age, size=t2.size)
+    assert_table_equality_wo_index(
+        res,
+        T(
+            """
+            age | size
+             10 |
+              9 |    L
+              8 |
+              7 |    L
+                |    M
+                |   XL
+            """,
+        ),
+    )
+
+
+def test_join_broadcast_with_right_id(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PATHWAY_THREADS", "4")
+    t1 = T(
+        """
+            | pet | owner
+        1   |   1 | Alice
+        2   |   1 |   Bob
+        """
+    )
+    t2 = T(
+        """
+            | pet | owner | size
+        11  |   1 | Alice |    M
+        12  |   1 |   Bob |    L
+        13  |   1 |   Tom |   XL
+        """
+    )
+    res = t1.join(
+        t2, t1.pet == t2.pet, t1.owner == t2.owner, id=t2.id, broadcast=True
+    ).select(t2.size)
+    assert_table_equality(
+        res,
+        T(
+            """
+                | size
+            11  |    M
+            12  |    L
+            """,
+        ),
+    )
+
+
+def test_join_broadcast_with_skew(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("PATHWAY_THREADS", "4")
+    t1 = T(
+        """
+            | pet
+        1   |   1
+        """
+    )
+    t2 = t1.copy()
+    with pytest.raises(ValueError, match="cannot be used together"):
+        t1.join(t2, t1.pet == t2.pet, skew=[1], broadcast=True)
+
+
+def test_join_ttl():
+    t1 = T(
+        """
+        k |  t | a | __time__
+        1 |  1 | 1 |        2
+        2 | 10 | 2 |        4
+        """
+    )
+    t2 = T(
+        """
+        k |  t |  b | __time__
+        1 |  2 | 10 |        2
+        1 | 12 | 30 |        6
+        2 | 11 | 20 |        6
+        """
+    )
+    res = t1.join(
+        t2, t1.k == t2.k, ttl=5, left_ttl_time=t1.t, right_ttl_time=pw.right.t
+    ).select(pw.left.k, t1.a, t2.b)
+    assert_table_equality_wo_index(
+        res,
+        T(
+            """
+            k | a |  b
+            1 | 1 | 10
+            2 | 2 | 20
+            """
+        ),
+    )
+
+
+def test_join_ttl_outer_rematching_expired_row():
+    t1 = T(
+        """
+        k | t
+        1 | 1
+        """
+    )
+    t2 = t1.copy()
+    # a left row whose match expired would be padded with None while its result with
+    # the match is kept in the output
+    with pytest.raises(ValueError, match="supported only in inner joins"):
+        t1.join(
+            t2,
+            t1.k == t2.k,
+            how=pw.JoinMode.LEFT,
+            ttl=5,
+            left_ttl_time=t1.t,
+            right_ttl_time=t2.t,
+        )
+    with pytest.raises(TypeError):
+        t1.join_outer(  # type: ignore[call-arg]
+            t2, t1.k == t2.k, ttl=5, left_ttl_time=t1.t, right_ttl_time=t2.t
+        )
+
+
+def test_join_functions_outer_modes():
+    t1 = T(
+        """
+        k | a
+        1 | 1
+        2 | 2
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        2 | 20
+        3 | 30
+        """
+    )
+    assert_table_equality_wo_index(
+        (
+            pw.join_left(t1, t2, t1.k == t2.k).select(t1.a, t2.b),
+            pw.join_outer(t1, t2, t1.k == t2.k).select(t1.a, t2.b),
+        ),
+        (
+            T(
+                """
+                a | b
+                1 |
+                2 | 20
+                """
+            ),
+            T(
+                """
+                a | b
+                1 |
+                2 | 20
+                  | 30
+                """
+            ),
+        ),
+    )
+
+
+def test_join_ttl_requires_time():
+    t1 = T(
+        """
+        k | t
+        1 | 1
+        """
+    )
+    t2 = t1.copy()
+    with pytest.raises(ValueError, match="requires both `left_ttl_time`"):
+        t1.join(t2, t1.k == t2.k, ttl=5, left_ttl_time=t1.t)
+
+
 def test_join_instance():
     t1 = T(
         """
@@ -2930,6 +3162,124 @@ def test_groupby_mutlicol():
     )
 
 
+def test_groupby_skew_hint(monkeypatch: pytest.MonkeyPatch):
+    # the hot keys are split across workers only if there are several of them
+    monkeypatch.setenv("PATHWAY_THREADS", "4")
+    left = T(
+        """
+    pet  |  owner  | age
+    dog  | Alice   | 10
+    dog  | Alice   | 3
+    dog  | Bob     | 9
+    cat  | Alice   | 8
+    dog  | Bob     | 7
+    dog  | Bob     | 2
+    """
+    )
+
+    left_res = left.groupby(
+        left.pet, left.owner, skew_hint=[("dog", "Bob"), ("cat", "Tom")]
+    ).reduce(
+        left.pet,
+        left.owner,
+        ageagg=pw.reducers.sum(left.age),
+        cnt=pw.reducers.count(),
+        youngest=pw.reducers.min(left.age),
+        oldest=pw.reducers.max(left.age),
+    )
+
+    assert_table_equality_wo_index(
+        left_res,
+        T(
+            """
+    pet  |  owner  | ageagg | cnt | youngest | oldest
+    dog  | Alice   | 13     | 2   | 3        | 10
+    dog  | Bob     | 18     | 3   | 2        | 9
+    cat  | Alice   | 8      | 1   | 8        | 8
+    """
+        ),
+    )
+
+
+def test_groupby_skew_hint_wrong_shape():
+    left = T(
+        """
+    pet  |  owner
+    dog  | Alice
+    """
+    )
+    with pytest.raises(ValueError, match="skew_hint has to contain tuples of 2 values"):
+        left.groupby(left.pet, left.owner, skew_hint=["dog"])
+
+
+def test_groupby_ttl():
+    t = T(
+        """
+        k | day |  v | __time__
+        1 |   1 |  1 |        2
+        2 |   1 |  2 |        2
+        3 |   5 | 10 |        4
+        1 |   1 |  7 |        6
+        1 |  12 |  3 |        8
+        1 |   1 |  4 |       10
+        2 |  12 |  5 |       10
+        """
+    )
+    # the groups of days 1 and 5 expire at once when day 12 arrives, they keep their
+    # results and the later row of day 1 is ignored
+    res = t.groupby(t.k, t.day, ttl=5, ttl_time=t.day).reduce(
+        t.k, t.day, s=pw.reducers.sum(t.v)
+    )
+    assert_table_equality_wo_index(
+        res,
+        T(
+            """
+            k | day |  s
+            1 |   1 |  8
+            2 |   1 |  2
+            3 |   5 | 10
+            1 |  12 |  3
+            2 |  12 |  5
+            """
+        ),
+    )
+
+
+def test_groupby_ttl_partly_expired_group():
+    t = T(
+        """
+        k | t | v
+        1 | 1 | 1
+        """
+    )
+    # rows of one group expiring at different times would leave the group in part
+    with pytest.raises(ValueError, match="ttl_time to be one of the grouping columns"):
+        t.groupby(t.k, ttl=5, ttl_time=t.t)
+
+
+def test_groupby_ttl_fully_expired_group():
+    t = T(
+        """
+        k | t | v
+        1 | 1 | 1
+        """
+    )
+    # a group whose rows all expired would be started anew by a row with a new time
+    with pytest.raises(ValueError, match="ttl_time to be one of the grouping columns"):
+        t.groupby(t.k, ttl=5, ttl_time=t.t + 1)
+
+
+def test_groupby_ttl_requires_time():
+    t = T(
+        """
+        k | t
+        1 | 1
+        """
+    )
+    with pytest.raises(ValueError, match="requires both ttl and ttl_time"):
+        t.groupby(t.k, ttl=5)
+
+
 def test_groupby_mix_key_val():
     left = T(
         """
@@ -3182,6 +3532,179 @@ def test_npsum_reducer_floats():
     assert_table_equality_wo_index(t.reduce(sum=pw.reducers.sum(pw.this.data)), result)
 
 
+def test_float32_arrays():
+    t = T(
+        """
+        a
+        1
+        2
+        3
+        """
+    )
+
+    @pw.udf
+    def embed(a: int) -> np.ndarray[Any, np.dtype[np.float32]]:
+        return np.full(3, a / 2, dtype=np.float32)
+
+    @pw.udf
+    def describe(x: np.ndarray) -> str:
+        return f"{x.dtype.name}:{x.sum()}"
+
+    embedded = t.select(e=embed(pw.this.a))
+    assert embedded.schema["e"].dtype == dt.FLOAT32_ARRAY
+    result = embedded.reduce(s=pw.reducers.sum(pw.this.e)).select(
+        s=describe(pw.this.s)
+    )
+    expected = T(
+        """
+        s
+        float32:9.0
+        """
+    )
+    assert_table_equality_wo_index(result, expected)
+
+
+def test_run_with_profile(tmp_path: pathlib.Path):
+    table = T(
+        """
+        a | b
+        1 | 2
+        1 | 3
+        2 | 4
+        """
+    )
+    result = table.groupby(pw.this.a).reduce(pw.this.a, s=pw.reducers.sum(pw.this.b))
+    pw.io.csv.write(result, tmp_path / "output.csv")
+    profile_path = tmp_path / "profile.json"
+
+    pw.run(profile=profile_path, monitoring_level=pw.MonitoringLevel.NONE)
+
+    events = json.loads(profile_path.read_text())
+    spans = [event for event in events if event["ph"] == "X"]
+    assert spans
+    assert any(span["args"]["operator"] is not None for span in spans)
+    folded = (tmp_path / "profile.folded").read_text().splitlines()
+    assert folded
+    for line in folded:
+        stack, micros = line.rsplit(" ", 1)
+        assert len(stack.split(";")) == 3
+        assert micros.isdigit()
+
+
+def test_run_with_profile_written_while_running(tmp_path: pathlib.Path):
+    profile_path = tmp_path / "profile.json"
+    sizes_while_running = []
+
+    class InputSubject(pw.io.python.ConnectorSubject):
+        def run(self):
+            self.next(a=1)
+            # the activations are handed over to the profile every second
+            time.sleep(2)
+            sizes_while_running.append(profile_path.stat().st_size)
+            self.next(a=2)
+
+    class InputSchema(pw.Schema):
+        a: int
+
+    table = pw.io.python.read(InputSubject(), schema=InputSchema)
+    pw.io.csv.write(table.select(b=pw.this.a + 1), tmp_path / "output.csv")
+
+    pw.run(profile=profile_path, monitoring_level=pw.MonitoringLevel.NONE)
+
+    # more than the opening bracket was written before the run has finished
+    assert sizes_while_running[0] > 1
+    events = json.loads(profile_path.read_text())
+    assert any(event["ph"] == "X" for event in events)
+
+
+def test_run_with_memory_budget(caplog: pytest.LogCaptureFixture):
+    class InputSubject(pw.io.python.ConnectorSubject):
+        def run(self):
+            self.next(a=1, b=2)
+            self.next(a=1, b=3)
+            # the allocated memory is compared with the budget every 100 milliseconds
+            time.sleep(0.5)
+            self.next(a=2, b=4)
+
+    class InputSchema(pw.Schema):
+        a: int
+        b: int
+
+    table = pw.io.python.read(InputSubject(), schema=InputSchema)
+    result = table.groupby(pw.this.a).reduce(pw.this.a, s=pw.reducers.sum(pw.this.b))
+    rows: dict[int, int] = {}
+
+    def on_change(key, row, time, is_addition):
+        if is_addition:
+            rows[row["a"]] = row["s"]
+        elif rows.get(row["a"]) == row["s"]:
+            del rows[row["a"]]
+
+    pw.io.subscribe(result, on_change=on_change)
+
+    # a budget that is always exceeded
+    pw.run(memory_budget=1, monitoring_level=pw.MonitoringLevel.NONE)
+
+    assert rows == {1: 5, 2: 4}
+    assert any(
+        record.levelname == "WARNING"
+        and "exceeds the memory budget (1 bytes)" in record.getMessage()
+        for record in caplog.records
+    )
+
+
+def test_run_with_spill_dir(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    caplog.set_level(logging.INFO)
+    # every merged batch is written to disk and none of its blocks is cached
+    monkeypatch.setenv("PATHWAY_SPILL_THRESHOLD", "1")
+    monkeypatch.setenv("PATHWAY_SPILL_CACHE_SIZE", "0")
+    left = T(
+        """
+        a | b | __time__
+        1 | 2 |     2
+        2 | 3 |     4
+        1 | 4 |     6
+        3 | 5 |     8
+        2 | 6 |    10
+        """
+    )
+    right = T(
+        """
+        a | c | __time__
+        1 | 1 |     2
+        2 | 2 |     6
+        3 | 3 |    10
+        """
+    )
+    joined = left.join(right, left.a == right.a).select(left.a, d=left.b * right.c)
+    result = joined.groupby(pw.this.a).reduce(pw.this.a, s=pw.reducers.sum(pw.this.d))
+    rows: dict[int, int] = {}
+
+    def on_change(key, row, time, is_addition):
+        if is_addition:
+            rows[row["a"]] = row["s"]
+        elif rows.get(row["a"]) == row["s"]:
+            del rows[row["a"]]
+
+    pw.io.subscribe(result, on_change=on_change)
+
+    pw.run(spill_dir=tmp_path, monitoring_level=pw.MonitoringLevel.NONE)
+
+    assert rows == {1: 6, 2: 18, 3: 15}
+    # each worker reports how many updates it has written and read back
+    summaries = [
+        re.search(r"Spilled (\d+) updates to .* and read back (\d+) updates", message)
+        for message in caplog.messages
+    ]
+    spilled = [(int(m.group(1)), int(m.group(2))) for m in summaries if m is not None]
+    assert sum(written for written, _ in spilled) > 0
+    assert sum(read for _, read in spilled) > 0
+
+
 def test_ndarray_reducer():
     t = pw.debug.table_from_markdown(
         """
@@ -4938,6 +5461,245 @@ def test_join_filter_2():
     assert_table_equality_wo_index(result, expected)
 
 
+def test_join_filter_pushed_down():
+    t1 = T(
+        """
+            | k | a
+        1   | 1 | 1
+        2   | 2 | 2
+        3   | 3 | 3
+        """
+    )
+    t2 = T(
+        """
+            | k | b
+        4   | 1 | 10
+        5   | 2 | 20
+        6   | 3 | 30
+        """
+    )
+    joined = t1.join(t2, t1.k == t2.k, id=t1.id)
+    filtered = joined.filter((t1.a > 1) & (pw.right.b < 30) & (t1.a * 10 == t2.b))
+    assert filtered._join_arguments is not None
+    assert filtered._join_arguments.left is not t1
+    assert filtered._join_arguments.right is not t2
+    assert_table_equality(
+        filtered.select(t1.a, pw.right.b, pw.this.k),
+        T(
+            """
+                | a | b  | k
+            2   | 2 | 20 | 2
+            """
+        ),
+    )
+
+
+def test_join_filter_pushed_down_this_sides():
+    t1 = T(
+        """
+        k | a
+        1 | 1
+        2 | 2
+        3 | 3
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        1 | 10
+        2 | 20
+        3 | 30
+        """
+    )
+    filtered = t1.join(t2, pw.left.k == pw.right.k).filter(
+        (pw.left.a > 1) & (pw.right.b < 30)
+    )
+    assert filtered._join_arguments is not None
+    assert filtered._join_arguments.left is not t1
+    assert filtered._join_arguments.right is not t2
+    assert_table_equality_wo_index(
+        filtered.select(pw.left.a, pw.right.b),
+        T(
+            """
+            a | b
+            2 | 20
+            """
+        ),
+    )
+
+
+def test_join_filter_pushed_down_skips_unfiltered_join():
+    t1 = T(
+        """
+        k | a
+        1 | 1
+        2 | 2
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        1 | 10
+        2 | 20
+        """
+    )
+    joined = t1.join(t2, t1.k == t2.k)
+    filtered = joined.filter(t1.a > 1)
+    unfiltered_join = joined._inner_table._source.operator
+    filtered_join = filtered._inner_table._source.operator
+    assert unfiltered_join not in G.global_scope.nodes_to_run_all
+    assert filtered_join in G.global_scope.nodes_to_run_all
+
+    used = joined.select(t1.a, t2.b)
+    assert unfiltered_join in G.global_scope.nodes_to_run_all
+    assert_table_equality_wo_index(
+        (filtered.select(t1.a, t2.b), used),
+        (
+            T(
+                """
+                a | b
+                2 | 20
+                """
+            ),
+            T(
+                """
+                a | b
+                1 | 10
+                2 | 20
+                """
+            ),
+        ),
+    )
+
+
+def test_join_filter_pushed_down_subset_of_join():
+    t1 = T(
+        """
+        k | a
+        1 | 1
+        2 | 2
+        3 | 3
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        1 | 10
+        2 | 20
+        3 | 30
+        """
+    )
+    joined = t1.join(t2, t1.k == t2.k)
+    unfiltered = joined.select(t1.a, t2.b)
+    filtered = joined.filter(t1.a > 1).select(b=t2.b * 10)
+    assert_table_equality_wo_index(
+        (
+            unfiltered.update_cells(filtered),
+            unfiltered.restrict(filtered),
+            filtered.with_universe_of(unfiltered.restrict(filtered)),
+        ),
+        (
+            T(
+                """
+                a | b
+                1 | 10
+                2 | 200
+                3 | 300
+                """
+            ),
+            T(
+                """
+                a | b
+                2 | 20
+                3 | 30
+                """
+            ),
+            T(
+                """
+                b
+                200
+                300
+                """
+            ),
+        ),
+    )
+
+
+def test_join_filter_not_pushed_to_optional_side():
+    t1 = T(
+        """
+        k | a
+        1 | 1
+        2 | 2
+        3 | 3
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        1 | 10
+        2 | 20
+        """
+    )
+    result = (
+        t1.join_left(t2, t1.k == t2.k)
+        .filter(t1.a > 1)
+        .filter(t2.b.is_none())
+        .select(t1.a)
+    )
+    assert_table_equality_wo_index(
+        result,
+        T(
+            """
+            a
+            3
+            """
+        ),
+    )
+
+
+def test_join_filter_pushed_down_chained():
+    t1 = T(
+        """
+        k | a
+        1 | 1
+        2 | 2
+        3 | 3
+        """
+    )
+    t2 = T(
+        """
+        k | b
+        1 | 10
+        2 | 20
+        3 | 30
+        """
+    )
+    t3 = T(
+        """
+        a | c
+        1 | 100
+        2 | 200
+        3 | 300
+        """
+    )
+    result = (
+        t1.join(t2, t1.k == t2.k)
+        .join(t3, t1.a == t3.a)
+        .filter((t1.a >= 2) & (t3.c < 300))
+        .select(t1.k, t2.b, t3.c)
+    )
+    assert_table_equality_wo_index(
+        result,
+        T(
+            """
+            k | b  | c
+            2 | 20 | 200
+            """
+        ),
+    )
+
+
 def test_outerjoin_filter_1():
     left = T(
         """
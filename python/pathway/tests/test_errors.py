@@ -59,6 +59,58 @@ def test_division_by_zero():
     )
 
 
+def test_large_batch_with_errors():
+    # large minibatches are evaluated column by column, results have to match the row path
+    class InputSchema(pw.Schema):
+        a: int
+        b: int
+        c: float
+
+    rows = [(i, i % 7 - 3, i / 4) for i in range(500)]
+    t1 = pw.debug.table_from_rows(InputSchema, rows)
+
+    t2 = t1.select(
+        pw.this.a,
+        x=pw.fill_error(pw.this.a // pw.this.b, -1),
+        y=pw.fill_error(pw.this.c / pw.this.b + pw.this.a * 2.0, -1.0),
+        z=(pw.this.b > 0) & (pw.this.a % pw.this.b == 0),
+        w=(pw.this.b == 0) | (pw.this.a // pw.this.b > 10),
+    )
+
+    class OutputSchema(pw.Schema):
+        a: int
+        x: int
+        y: float
+        z: bool
+        w: bool
+
+    expected_rows = [
+        (
+            a,
+            a // b if b != 0 else -1,
+            c / b + a * 2.0 if b != 0 else -1.0,
+            b > 0 and a % b == 0,
+            b == 0 or a // b > 10,
+        )
+        for a, b, c in rows
+    ]
+    expected = pw.debug.table_from_rows(OutputSchema, expected_rows)
+
+    class ErrorSchema(pw.Schema):
+        message: str
+
+    n_zeros = sum(1 for _, b, _ in rows if b == 0)
+    # short-circuiting z and w must not report any errors
+    expected_errors = pw.debug.table_from_rows(
+        ErrorSchema, [("division by zero",)] * (2 * n_zeros)
+    )
+    assert_table_equality_wo_index(
+        (t2, pw.global_error_log().select(pw.this.message)),
+        (expected, expected_errors),
+        terminate_on_error=False,
+    )
+
+
 def test_removal_of_error():
     t1 = T(
         """
@@ -64,3 +64,81 @@ def test_http_server_doesnt_run_when_disabled():
         G, with_http_server=False, monitoring_level=pw.MonitoringLevel.NONE
     ).run_tables(response_code)[0]
     assert updates_stream[0].values[0] == -1
+
+
+def http_server_metrics() -> str:
+    port = os.environ.get("PATHWAY_MONITORING_HTTP_PORT", "20000")
+    with urllib.request.urlopen(f"http://localhost:{port}/metrics") as response:
+        return response.read().decode()
+
+
+@pytest.mark.xdist_group(name="http_server_tests")
+def test_http_server_exports_udf_metrics():
+    @pw.udf(cache_strategy=pw.udfs.InMemoryCache())
+    def double(x: int) -> int:
+        return 2 * x
+
+    table = T(
+        """
+            | foo
+        1   | 1
+        2   | 1
+        3   | 2
+        """
+    )
+    result = table.select(bar=double(pw.this.foo))
+
+    scraped: list[str] = []
+    pw.io.subscribe(
+        result,
+        on_change=lambda **kwargs: None,
+        on_end=lambda: scraped.append(http_server_metrics()),
+    )
+    pw.run(with_http_server=True, monitoring_level=pw.MonitoringLevel.NONE)
+
+    [metrics] = scraped
+    labels = f'{{udf="{double.__qualname__}"}}'
+    assert f"udf_calls_total{labels} 3" in metrics
+    assert f"udf_cache_hits_total{labels} 1" in metrics
+    assert f"udf_cache_misses_total{labels} 2" in metrics
+    assert f"udf_in_flight{labels} 0" in metrics
+
+
+def metric_values(metrics: str, name: str) -> list[float]:
+    return [
+        float(line.rsplit(" ", 1)[1])
+        for line in metrics.splitlines()
+        if line.startswith(f"{name}{{")
+    ]
+
+
+@pytest.mark.xdist_group(name="http_server_tests")
+def test_http_server_exports_operator_and_connector_metrics():
+    class InputSchema(pw.Schema):
+        key: int
+
+    class InputSubject(pw.io.python.ConnectorSubject):
+        def run(self):
+            # each commit updates the count, retracting the previous one
+            for _ in range(3):
+                self.next(key=1)
+                self.commit()
+
+    table = pw.io.python.read(InputSubject(), schema=InputSchema)
+    result = table.groupby(pw.this.key).reduce(pw.this.key, count=pw.reducers.count())
+
+    scraped: list[str] = []
+    pw.io.subscribe(
+        result,
+        on_change=lambda **kwargs: None,
+        on_end=lambda: scraped.append(http_server_metrics()),
+    )
+    pw.run(with_http_server=True, monitoring_level=pw.MonitoringLevel.NONE)
+
+    [metrics] = scraped
+    assert "# TYPE operator_rows_in counter" in metrics
+    assert "# TYPE operator_retractions counter" in metrics
+    assert "# TYPE connector_messages counter" in metrics
+    assert max(metric_values(metrics, "operator_rows_in_total")) >= 3
+    assert max(metric_values(metrics, "operator_retractions_total")) >= 1
+    assert metric_values(metrics, "connector_messages_total") == [3]
@@ -1,5 +1,7 @@
 # Copyright © 2024 Pathway
 
+import http.server
+import itertools
 import json
 import os
 import pathlib
@@ -12,7 +14,9 @@ import time
 from typing import Any, Optional
 from unittest import mock
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 import yaml
 from deltalake import DeltaTable, write_deltalake
@@ -251,6 +255,37 @@ def test_python_connector_commits(tmp_path: pathlib.Path):
     assert result.equals(expected)
 
 
+def test_python_connector_adaptive_commits():
+    class TestSubject(pw.io.python.ConnectorSubject):
+        def run(self):
+            for k in range(3):
+                self.next(k=k)
+                time.sleep(0.5)
+
+    class InputSchema(pw.Schema):
+        k: int
+
+    table = pw.io.python.read(
+        TestSubject(),
+        schema=InputSchema,
+        autocommit_duration_ms=100_000,
+        autocommit_target_latency_ms=50,
+    )
+
+    times = {}
+    pw.io.subscribe(
+        table,
+        on_change=lambda key, row, time, is_addition: times.update({row["k"]: time}),
+    )
+
+    run_all()
+
+    # the dataflow is idle when each of the rows arrives, so they're committed
+    # separately without waiting for autocommit_duration_ms
+    assert sorted(times) == [0, 1, 2]
+    assert len(set(times.values())) == 3
+
+
 def test_python_connector_remove():
     class TestSubject(pw.io.python.ConnectorSubject):
         def run(self):
@@ -672,6 +707,96 @@ def test_subscribe():
     )
 
 
+def test_subscribe_on_batch():
+    table = T(
+        """
+          | a | b   | c    | __time__ | __diff__
+        1 | 1 | 1.5 | foo  |     2    |     1
+        2 | 2 | 2.5 | bar  |     2    |     1
+        1 | 1 | 1.5 | foo  |     4    |    -1
+        """
+    )
+
+    batches = []
+
+    def on_batch(batch, time):
+        batches.append((time, batch))
+
+    pw.io.subscribe(table, on_batch=on_batch)
+    run_all()
+
+    assert [time for time, _ in batches] == [2, 4]
+    _, first = batches[0]
+    assert set(first.keys()) == {"id", "a", "b", "c", "diff"}
+    assert first["a"].dtype == np.int64
+    assert first["b"].dtype == np.float64
+    assert sorted(first["a"].tolist()) == [1, 2]
+    assert sorted(first["c"].tolist()) == ["bar", "foo"]
+    assert first["diff"].tolist() == [1, 1]
+    _, second = batches[1]
+    assert second["a"].tolist() == [1]
+    assert second["diff"].tolist() == [-1]
+    assert second["id"][0] in set(first["id"])
+
+
+def test_subscribe_on_batch_dtypes_follow_schema():
+    table = T(
+        """
+          | a | b    | __time__
+        1 | 1 | 1    |     2
+        2 | 2 |      |     2
+        3 | 3 | 3    |     4
+        """
+    )
+
+    batches = []
+    pw.io.subscribe(table, on_batch=lambda batch, time: batches.append(batch))
+    run_all()
+
+    assert len(batches) == 2
+    for batch in batches:
+        assert batch["a"].dtype == np.int64
+        # optional column has the same dtype also in a batch without None
+        assert batch["b"].dtype == object
+    assert batches[1]["b"].tolist() == [3]
+
+
+def test_subscribe_on_batch_arrow():
+    table = T(
+        """
+        a | b
+        1 | foo
+        2 | bar
+        """
+    )
+
+    batches = []
+    pw.io.subscribe(
+        table,
+        on_batch=lambda batch, time: batches.append(batch),
+        batch_format="arrow",
+    )
+    run_all()
+
+    assert len(batches) == 1
+    (batch,) = batches
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.schema.names == ["id", "a", "b", "diff"]
+    assert sorted(batch.column("a").to_pylist()) == [1, 2]
+    assert batch.column("diff").to_pylist() == [1, 1]
+
+
+def test_subscribe_requires_callback():
+    table = T(
+        """
+        a
+        1
+        """
+    )
+    with pytest.raises(ValueError, match="at least one of on_change and on_batch"):
+        pw.io.subscribe(table)
+
+
 def test_fs_raw(tmp_path: pathlib.Path):
     input_path = tmp_path / "input.txt"
     write_lines(input_path, "foo\nbar\nbaz")
@@ -2054,6 +2179,53 @@ def test_stream_generator_from_list():
     assert on_change.call_count == 5
 
 
+@pytest.mark.parametrize("queue_size", [None, "0", "2"])
+@pytest.mark.parametrize("max_in_flight_batches", [None, "3"])
+def test_output_queue_settings(
+    queue_size, max_in_flight_batches, tmp_path: pathlib.Path, monkeypatch
+):
+    if queue_size is not None:
+        monkeypatch.setenv("PATHWAY_OUTPUT_QUEUE_SIZE", queue_size)
+    if max_in_flight_batches is not None:
+        monkeypatch.setenv(
+            "PATHWAY_OUTPUT_MAX_IN_FLIGHT_BATCHES", max_in_flight_batches
+        )
+    output_path = tmp_path / "output.jsonl"
+
+    table = T(
+        """
+        k | v | __time__
+        1 | a |     2
+        2 | b |     4
+        3 | c |     6
+        4 | d |     8
+        5 | e |    10
+        """
+    )
+    pw.io.jsonlines.write(table, output_path)
+    run_all()
+
+    with open(output_path) as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["k"] for row in rows] == [1, 2, 3, 4, 5]
+    assert [row["time"] for row in rows] == [2, 4, 6, 8, 10]
+
+
+def test_output_queue_settings_validation(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setenv("PATHWAY_OUTPUT_MAX_IN_FLIGHT_BATCHES", "0")
+    table = T(
+        """
+        k
+        1
+        """
+    )
+    pw.io.jsonlines.write(table, tmp_path / "output.jsonl")
+    with pytest.raises(
+        api.EngineError, match="number of in-flight output batches must be positive"
+    ):
+        run_all()
+
+
 def test_stream_generator_from_list_multiple_workers(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("PATHWAY_THREADS", "2")
     stream_generator = pw.debug.StreamGenerator()
@@ -2654,6 +2826,158 @@ def test_server_fail_on_duplicate_route():
         )
 
 
+@pytest.mark.parametrize("batch_format", ["json_array", "ndjson"])
+def test_http_write_batched(batch_format):
+    received = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((self.headers["Content-Type"], body.decode()))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    table = pw.debug.table_from_markdown(
+        """
+        value
+        1
+        2
+        3
+        4
+        5
+        """
+    )
+    pw.io.http.write(
+        table,
+        f"http://127.0.0.1:{server.server_address[1]}/",
+        max_concurrent_requests=2,
+        max_batch_size=2,
+        batch_format=batch_format,
+    )
+    try:
+        run_all()
+    finally:
+        server.shutdown()
+
+    rows = []
+    for content_type, body in received:
+        if batch_format == "json_array":
+            assert content_type == "application/json"
+            batch = json.loads(body)
+        else:
+            assert content_type == "application/x-ndjson"
+            batch = [json.loads(line) for line in body.splitlines()]
+        assert 1 <= len(batch) <= 2
+        rows.extend(batch)
+    assert sorted(row["value"] for row in rows) == [1, 2, 3, 4, 5]
+    assert all(row["diff"] == 1 for row in rows)
+
+
+def _start_failing_http_server(n_failures: int | None):
+    """Starts a server answering 503 to the first ``n_failures`` requests (to all of
+    them if ``None``) and 200 to the next ones."""
+    received = []
+    n_requests = itertools.count()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if n_failures is None or next(n_requests) < n_failures:
+                self.send_response(503)
+            else:
+                received.append(json.loads(body))
+                self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, received
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 2])
+def test_http_write_retries_unavailable(max_concurrent_requests):
+    server, received = _start_failing_http_server(n_failures=2)
+    table = pw.debug.table_from_markdown(
+        """
+        value
+        1
+        """
+    )
+    pw.io.http.write(
+        table,
+        f"http://127.0.0.1:{server.server_address[1]}/",
+        n_retries=3,
+        retry_policy=pw.io.http.RetryPolicy(
+            first_delay_ms=10, backoff_factor=1, jitter_ms=0
+        ),
+        max_concurrent_requests=max_concurrent_requests,
+    )
+    try:
+        run_all()
+    finally:
+        server.shutdown()
+
+    assert [row["value"] for row in received] == [1]
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 2])
+def test_http_write_raises_after_retries(max_concurrent_requests):
+    server, received = _start_failing_http_server(n_failures=None)
+    table = pw.debug.table_from_markdown(
+        """
+        value
+        1
+        """
+    )
+    pw.io.http.write(
+        table,
+        f"http://127.0.0.1:{server.server_address[1]}/",
+        n_retries=1,
+        retry_policy=pw.io.http.RetryPolicy(
+            first_delay_ms=10, backoff_factor=1, jitter_ms=0
+        ),
+        max_concurrent_requests=max_concurrent_requests,
+    )
+    try:
+        with pytest.raises(Exception, match="503"):
+            run_all()
+    finally:
+        server.shutdown()
+
+    assert received == []
+
+
+def test_http_write_batch_format_validation():
+    table = pw.debug.table_from_markdown(
+        """
+        value
+        1
+        """
+    )
+    with pytest.raises(ValueError, match="'json_array' batch format"):
+        pw.io.http.write(
+            table,
+            "http://127.0.0.1/",
+            format="custom",
+            request_payload_template="{table.value}",
+            max_batch_size=10,
+        )
+    with pytest.raises(ValueError, match="max_concurrent_requests"):
+        pw.io.http.write(table, "http://127.0.0.1/", max_concurrent_requests=0)
+
+
 def test_pyfilesystem_simple(tmp_path: pathlib.Path):
     zip_path = (
         pathlib.Path("/".join(__file__.split("/")[:-1])) / "data" / "pyfs-testdata.zip"
@@ -3093,6 +3417,82 @@ def test_deltalake_append(min_commit_frequency, tmp_path: pathlib.Path):
     assert pd_table_from_delta.shape[0] == 6
 
 
+def test_deltalake_partitioning(tmp_path: pathlib.Path):
+    data = """
+        k | v   | day
+        1 | foo | mon
+        2 | bar | mon
+        3 | baz | tue
+    """
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output"
+    write_csv(input_path, data)
+
+    class InputSchema(pw.Schema):
+        k: int = pw.column_definition(primary_key=True)
+        v: str
+        day: str
+
+    table = pw.io.csv.read(str(input_path), schema=InputSchema, mode="static")
+    pw.io.deltalake.write(table, str(output_path), partition_by=[table.day])
+    run_all()
+
+    delta_table = DeltaTable(output_path)
+    assert delta_table.metadata().partition_columns == ["day"]
+    assert (output_path / "day=mon").is_dir()
+    assert (output_path / "day=tue").is_dir()
+    assert sorted(delta_table.to_pandas()["k"]) == [1, 2, 3]
+
+
+def test_deltalake_partitioning_validation(tmp_path: pathlib.Path):
+    table = T(
+        """
+        k | v
+        1 | 1.5
+        """
+    )
+    other = T(
+        """
+        k
+        1
+        """
+    )
+    with pytest.raises(ValueError, match="must be of type str, int or bool"):
+        pw.io.deltalake.write(table, str(tmp_path / "a"), partition_by=[table.v])
+    with pytest.raises(ValueError, match="doesn't belong to the table"):
+        pw.io.deltalake.write(table, str(tmp_path / "b"), partition_by=[other.k])
+
+
+def test_deltalake_compaction(tmp_path: pathlib.Path):
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output"
+
+    class InputSchema(pw.Schema):
+        k: int = pw.column_definition(primary_key=True)
+        day: str
+
+    def iteration(data):
+        G.clear()
+        write_csv(input_path, data)
+        table = pw.io.csv.read(str(input_path), schema=InputSchema, mode="static")
+        pw.io.deltalake.write(
+            table,
+            str(output_path),
+            min_commit_frequency=None,
+            partition_by=[table.day],
+            compaction_interval_ms=60_000,
+        )
+        run_all()
+
+    iteration("k | day\n1 | mon\n2 | tue")
+    iteration("k | day\n3 | mon\n4 | tue")
+
+    # the files of both runs are compacted into a single file per partition
+    delta_table = DeltaTable(output_path)
+    assert len(delta_table.files()) == 2
+    assert sorted(delta_table.to_pandas()["k"]) == [1, 2, 3, 4]
+
+
 @needs_multiprocessing_fork
 @pytest.mark.parametrize("env_vars", [None, {"''": "\"''''\"\""}, {"KEY": "VALUE"}])
 def test_airbyte_local_run(env_vars, tmp_path_with_airbyte_config):
@@ -3321,6 +3721,99 @@ def test_streaming_from_deltalake(tmp_path):
     wait_result_with_checker(CsvLinesNumberChecker(output_path, 10), 30)
 
 
+def test_parquet_roundtrip(tmp_path: pathlib.Path):
+    data = """
+        k | v
+        1 | foo
+        2 | bar
+        3 | baz
+    """
+    input_path = tmp_path / "input.csv"
+    parquet_path = tmp_path / "parquet"
+    output_path = tmp_path / "output.csv"
+    write_csv(input_path, data)
+
+    class InputSchema(pw.Schema):
+        k: int = pw.column_definition(primary_key=True)
+        v: str
+
+    table = pw.io.csv.read(str(input_path), schema=InputSchema, mode="static")
+    pw.io.parquet.write(table, parquet_path)
+    run_all()
+
+    written_files = list(parquet_path.iterdir())
+    assert written_files
+    assert all(path.suffix == ".parquet" for path in written_files)
+
+    G.clear()
+    table = pw.io.parquet.read(parquet_path, schema=InputSchema, mode="static")
+    pw.io.csv.write(table, output_path)
+    run_all()
+
+    final = pd.read_csv(output_path, usecols=["k", "v"], index_col=["k"]).sort_index()
+    original = pd.read_csv(input_path, usecols=["k", "v"], index_col=["k"]).sort_index()
+    assert final.equals(original)
+
+
+def test_parquet_projection_and_filters(tmp_path: pathlib.Path):
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "output.csv"
+    df = pd.DataFrame(
+        {
+            "k": list(range(100)),
+            "v": [f"value_{i}" for i in range(100)],
+            "unused": [float(i) for i in range(100)],
+        }
+    )
+    # Small row groups, so that some of them are skipped by statistics
+    df.to_parquet(input_path, row_group_size=10)
+
+    class InputSchema(pw.Schema):
+        k: int
+        v: str
+
+    table = pw.io.parquet.read(
+        input_path,
+        schema=InputSchema,
+        mode="static",
+        filters=[("k", ">=", 35), ("k", "<", 42)],
+    )
+    pw.io.csv.write(table, output_path)
+    run_all()
+
+    result = pd.read_csv(output_path)
+    assert set(result["k"]) == set(range(35, 42))
+    assert "unused" not in result.columns
+
+
+def test_parquet_filters_validation(tmp_path: pathlib.Path):
+    class InputSchema(pw.Schema):
+        k: int
+
+    with pytest.raises(ValueError, match="not in the schema"):
+        pw.io.parquet.read(tmp_path, schema=InputSchema, filters=[("v", "==", 1)])
+    with pytest.raises(ValueError, match="Unknown filter operator"):
+        pw.io.parquet.read(tmp_path, schema=InputSchema, filters=[("k", "~", 1)])
+
+
+@pytest.mark.parametrize("compression", ["none", "snappy", "zstd"])
+def test_parquet_write_compression(compression, tmp_path: pathlib.Path):
+    output_path = tmp_path / "output"
+    table = T(
+        """
+        k | v
+        1 | foo
+        2 | bar
+        """
+    )
+    pw.io.parquet.write(table, output_path, compression=compression)
+    run_all()
+
+    result = pd.concat(pd.read_parquet(path) for path in output_path.iterdir())
+    assert set(result["k"]) == {1, 2}
+    assert set(result["diff"]) == {1}
+
+
 @needs_multiprocessing_fork
 @pytest.mark.parametrize("enforce_method", ["venv", "docker"])
 def test_airbyte_persistence(enforce_method, tmp_path_with_airbyte_config):
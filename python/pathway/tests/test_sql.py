@@ -507,6 +507,72 @@ def test_join_using():
     )
 
 
+def test_join_where_pushed_down():
+    tab1 = T(
+        """
+    a | b
+    x | 11
+    y | 12
+    z | 13
+    """
+    )
+    tab2 = T(
+        """
+    c | d
+    x | 13
+    y | 14
+    z | 15
+        """
+    )
+    assert_table_equality_wo_index(
+        pw.sql(
+            "SELECT tab1.b, tab2.d FROM tab1 JOIN tab2 ON tab1.a=tab2.c "
+            "WHERE tab1.b > 11 AND (tab2.d < 15 AND TRUE)",
+            tab1=tab1,
+            tab2=tab2,
+        ),
+        T(
+            """
+        b  | d
+        12 | 14
+            """
+        ),
+    )
+
+
+def test_join_using_where_pushed_down():
+    tab1 = T(
+        """
+    a | b
+    x | 11
+    y | 12
+    z | 13
+    """
+    )
+    tab2 = T(
+        """
+    a | d
+    x | 13
+    y | 14
+    z | 15
+        """
+    )
+    assert_table_equality_wo_index(
+        pw.sql(
+            "SELECT tab1.b, tab2.d FROM tab1 JOIN tab2 USING(a) "
+            "WHERE tab1.b > 11 AND tab2.d < 15",
+            tab1=tab1,
+            tab2=tab2,
+        ),
+        T(
+            """
+        b  | d
+        12 | 14
+            """
+        ),
+    )
+
+
 def test_union():
     tab1 = T(
         """
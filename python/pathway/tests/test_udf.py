@@ -12,6 +12,7 @@ import warnings
 from typing import Optional
 from unittest import mock
 
+import numpy as np
 import pytest
 
 import pathway as pw
@@ -20,6 +21,7 @@ from pathway.tests.utils import (
     T,
     assert_stream_equality,
     assert_table_equality,
+    assert_table_equality_wo_index,
     deprecated_call_here,
     run_all,
     warns_here,
@@ -611,6 +613,166 @@ def test_udf_cache(monkeypatch, tmp_path: pathlib.Path):
     assert internal_inc.call_count == 3
 
 
+@xfail_on_multiple_threads
+def test_udf_async_cache_single_flight(monkeypatch, tmp_path: pathlib.Path):
+    monkeypatch.delenv("PATHWAY_PERSISTENT_STORAGE", raising=False)
+    internal_inc = mock.Mock()
+
+    @pw.udf(deterministic=True, cache_strategy=pw.udfs.DiskCache())
+    async def inc(a: int) -> int:
+        await asyncio.sleep(0.1)
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a
+        1
+        2
+        2
+        3
+        1
+        """
+    )
+
+    result = input.select(ret=inc(pw.this.a))
+
+    persistence_config = pw.persistence.Config(
+        backend=pw.persistence.Backend.filesystem(tmp_path / "PStorage"),
+        persistence_mode=api.PersistenceMode.UDF_CACHING,
+    )
+    assert_table_equality(
+        result,
+        T(
+            """
+            ret
+            2
+            3
+            3
+            4
+            2
+            """,
+        ),
+        persistence_config=persistence_config,
+    )
+    # duplicates computed concurrently wait for the first call
+    internal_inc.assert_has_calls(
+        [mock.call(1), mock.call(2), mock.call(3)], any_order=True
+    )
+    assert internal_inc.call_count == 3
+
+
+@xfail_on_multiple_threads
+def test_udf_embedding_cache(tmp_path: pathlib.Path):
+    calls = mock.Mock()
+    cache = pw.udfs.EmbeddingCache(model="test", path=tmp_path / "embeddings")
+
+    def embedding(text: str) -> np.ndarray:
+        return np.array([text.count("a"), text.count("b")], dtype=np.float32)
+
+    @pw.udf(deterministic=True, cache_strategy=cache)
+    def embed(text: str) -> np.ndarray:
+        calls(text)
+        return embedding(text)
+
+    @pw.udf(vectorized=True, cache_strategy=cache)
+    def embed_batch(texts: np.ndarray) -> np.ndarray:
+        calls(*texts)
+        return np.stack([embedding(text) for text in texts])
+
+    @pw.udf
+    def describe(vector: np.ndarray) -> str:
+        return f"{vector[0]:.0f}:{vector[1]:.0f}"
+
+    class InputSchema(pw.Schema):
+        text: str
+
+    # texts differing only in whitespace share an entry
+    t = pw.debug.table_from_rows(InputSchema, [("a b",), (" a  b",), ("bb",)])
+    assert_table_equality_wo_index(
+        t.select(e=describe(embed(pw.this.text))),
+        T(
+            """
+            e
+            1:1
+            1:1
+            0:2
+            """
+        ),
+    )
+    assert calls.call_count == 2
+
+    t = pw.debug.table_from_rows(InputSchema, [("a b",), ("ab",)])
+    assert_table_equality_wo_index(
+        t.select(e=describe(embed_batch(pw.this.text))),
+        T(
+            """
+            e
+            1:1
+            1:1
+            """
+        ),
+    )
+    calls.assert_called_with("ab")
+    assert calls.call_count == 3
+
+
+def test_embedding_cache_async_hits_and_misses_are_float32(tmp_path: pathlib.Path):
+    calls = mock.Mock()
+    cache = pw.udfs.EmbeddingCache(model="test", path=tmp_path / "embeddings")
+
+    async def embed(text: str) -> np.ndarray:
+        calls(text)
+        return np.array([len(text), 1.0])
+
+    cached_embed = cache.wrap_async(embed)
+    miss = asyncio.run(cached_embed("abc"))
+    hit = asyncio.run(cached_embed("abc"))
+    assert calls.call_count == 1
+    assert type(miss) is type(hit) is np.ndarray
+    assert miss.dtype == hit.dtype == np.float32
+    np.testing.assert_array_equal(miss, hit)
+
+
+class _RecordingUdfMetrics:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    def on_call_started(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def on_call_finished(self, latency: float, failed: bool) -> None:
+        self.in_flight -= 1
+        self.calls += 1
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_udf_metrics_count_calls_holding_capacity(monkeypatch, enabled: bool):
+    monkeypatch.setattr("pathway.internals.udfs.metrics._enabled", enabled)
+    metrics = _RecordingUdfMetrics()
+
+    async def wait(x: int) -> int:
+        await asyncio.sleep(0.01)
+        return x
+
+    executor = pw.udfs.async_executor(capacity=2)
+    wrapped = executor._wrap(wait, metrics)  # type: ignore[arg-type]
+
+    async def call_all() -> list[int]:
+        return await asyncio.gather(*(wrapped(x) for x in range(10)))
+
+    assert asyncio.run(call_all()) == list(range(10))
+    if enabled:
+        assert metrics.calls == 10
+        assert metrics.max_in_flight == 2
+    else:
+        assert metrics.calls == 0
+    assert metrics.in_flight == 0
+
+
 def test_udf_cache_too_small_size_limit(monkeypatch, tmp_path: pathlib.Path):
     monkeypatch.delenv("PATHWAY_PERSISTENT_STORAGE", raising=False)
 
@@ -1172,3 +1334,364 @@ def test_append_only_results_stored_temporarily_column_not_append_only_storage_n
     )
 
     assert_stream_equality(result, expected)
+
+
+@xfail_on_multiple_threads
+def test_udf_vectorized():
+    internal_call = mock.Mock()
+
+    @pw.udf(vectorized=True, deterministic=True)
+    def weighted(a, b, *, weight) -> float:
+        internal_call()
+        assert isinstance(a, np.ndarray) and a.dtype == np.int64
+        assert isinstance(weight, np.ndarray) and weight.dtype == np.float64
+        return a * weight + b
+
+    input = T(
+        """
+        a | b | w
+        1 | 6 | 0.5
+        2 | 7 | 1.5
+        3 | 8 | 2.5
+        """
+    )
+
+    result = input.select(ret=weighted(pw.this.a, pw.this.b, weight=pw.this.w))
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            ret
+            6.5
+            10.0
+            15.5
+            """,
+        ),
+    )
+    internal_call.assert_called_once()
+
+
+def test_udf_vectorized_with_none():
+    @pw.udf(vectorized=True, deterministic=True)
+    def inc(a) -> Optional[int]:
+        assert isinstance(a, np.ma.MaskedArray)
+        return a + 1
+
+    @pw.udf(vectorized=True, deterministic=True, propagate_none=True)
+    def dec(a) -> int:
+        assert not isinstance(a, np.ma.MaskedArray)
+        return a - 1
+
+    input = T(
+        """
+        a
+        1
+        2
+
+        """
+    )
+
+    result = input.select(inc=inc(pw.this.a), dec=dec(pw.this.a))
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            inc  | dec
+            2    | 0
+            3    | 1
+            None | None
+            """,
+        ),
+    )
+
+
+def test_udf_vectorized_wrong_length():
+    @pw.udf(vectorized=True, deterministic=True)
+    def extend(a) -> int:
+        return np.append(a, 0)
+
+    input = T(
+        """
+        a
+        1
+        2
+        """
+    )
+
+    result = input.select(ret=pw.fill_error(extend(pw.this.a), -1))
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            ret
+            -1
+            -1
+            """,
+        ),
+        terminate_on_error=False,
+    )
+
+
+def test_udf_vectorized_async_not_allowed():
+    with pytest.raises(ValueError, match="have to be executed synchronously"):
+
+        @pw.udf(vectorized=True)
+        async def inc(a) -> int:
+            return a + 1
+
+
+def test_udf_array_arguments_are_read_only_views():
+    t = T(
+        """
+        a
+        1
+        2
+        """
+    ).select(a=pw.apply_with_type(lambda a: np.arange(a + 1.0), np.ndarray, pw.this.a))
+
+    @pw.udf
+    def identity(a: np.ndarray) -> np.ndarray:
+        return a
+
+    @pw.udf
+    def describe(a: np.ndarray) -> str:
+        return f"{a.flags.writeable}:{a.sum()}"
+
+    result = t.select(a=describe(identity(pw.this.a)))
+    expected = T(
+        """
+        a
+        False:1.0
+        False:3.0
+        """
+    )
+    assert_table_equality(result, expected)
+
+
+def test_udf_deterministic_computed_once_in_select():
+    internal_inc = mock.Mock()
+
+    @pw.udf(deterministic=True)
+    def inc(a: int) -> int:
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a
+        1
+        2
+        3
+        """
+    )
+
+    result = input.select(
+        b=inc(pw.this.a), c=inc(pw.this.a) * 2, d=inc(input.a) + pw.this.a
+    )
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            b | c | d
+            2 | 4 | 3
+            3 | 6 | 5
+            4 | 8 | 7
+            """
+        ),
+    )
+    assert internal_inc.call_count == 3
+
+
+def test_udf_deterministic_reused_by_next_select():
+    internal_inc = mock.Mock()
+
+    @pw.udf(deterministic=True)
+    def inc(a: int) -> int:
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a
+        1
+        2
+        3
+        """
+    )
+
+    result = input.with_columns(b=inc(pw.this.a)).with_columns(c=inc(pw.this.a))
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            a | b | c
+            1 | 2 | 2
+            2 | 3 | 3
+            3 | 4 | 4
+            """
+        ),
+    )
+    assert internal_inc.call_count == 3
+
+
+def test_udf_deterministic_guarded_by_if_else_not_hoisted():
+    internal_div = mock.Mock()
+
+    @pw.udf(deterministic=True)
+    def div(a: int, b: int) -> int:
+        internal_div(a, b)
+        return a // b
+
+    input = T(
+        """
+        a | b
+        4 | 2
+        3 | 0
+        6 | 3
+        """
+    )
+
+    result = input.select(
+        c=pw.if_else(pw.this.b != 0, div(pw.this.a, pw.this.b), 0),
+        d=pw.if_else(pw.this.b != 0, div(pw.this.a, pw.this.b) + 1, -1),
+    )
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            c | d
+            2 | 3
+            0 | -1
+            2 | 3
+            """
+        ),
+    )
+    # the rows excluded by the condition are never passed to the udf
+    assert internal_div.call_count == 4
+    assert all(call.args[1] != 0 for call in internal_div.call_args_list)
+
+
+def test_udf_deterministic_reused_by_sibling_select():
+    internal_inc = mock.Mock()
+
+    @pw.udf(deterministic=True)
+    def inc(a: int) -> int:
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a
+        1
+        2
+        3
+        """
+    )
+
+    first = input.select(b=inc(pw.this.a))
+    second = input.select(c=inc(pw.this.a))
+    result = first.with_columns(c=second.c)
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            b | c
+            2 | 2
+            3 | 3
+            4 | 4
+            """
+        ),
+    )
+    assert internal_inc.call_count == 3
+
+
+def test_udf_deterministic_reused_by_sibling_select_after_other_selects():
+    internal_inc = mock.Mock()
+
+    @pw.udf(deterministic=True)
+    def inc(a: int) -> int:
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a
+        1
+        2
+        3
+        """
+    )
+
+    first = input.select(b=inc(pw.this.a))
+    first_sum = first.reduce(s=pw.reducers.sum(pw.this.b))
+    # the column of the first select is not used by this one, but it is kept for
+    # the last select
+    other = input.select(c=pw.this.a * 2)
+    other_sum = other.reduce(s=pw.reducers.sum(pw.this.c))
+    last = input.select(d=inc(pw.this.a))
+    last_sum = last.reduce(s=pw.reducers.sum(pw.this.d))
+
+    assert_table_equality_wo_index(
+        (first_sum, other_sum, last_sum),
+        (
+            T(
+                """
+                s
+                9
+                """
+            ),
+            T(
+                """
+                s
+                12
+                """
+            ),
+            T(
+                """
+                s
+                9
+                """
+            ),
+        ),
+    )
+    assert internal_inc.call_count == 3
+
+
+def test_udf_non_deterministic_not_deduplicated():
+    internal_inc = mock.Mock()
+
+    @pw.udf
+    def inc(a: int) -> int:
+        internal_inc(a)
+        return a + 1
+
+    input = T(
+        """
+        a
+        1
+        2
+        3
+        """
+    )
+
+    result = input.select(b=inc(pw.this.a), c=inc(pw.this.a))
+
+    assert_table_equality(
+        result,
+        T(
+            """
+            b | c
+            2 | 2
+            3 | 3
+            4 | 4
+            """
+        ),
+    )
+    assert internal_inc.call_count == 6
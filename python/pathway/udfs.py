@@ -49,6 +49,7 @@ from pathway.internals.udfs import (
     CacheStrategy,
     DefaultCache,
     DiskCache,
+    EmbeddingCache,
     ExponentialBackoffRetryStrategy,
     FixedDelayRetryStrategy,
     InMemoryCache,
@@ -72,6 +73,7 @@ __all__ = [
     "CacheStrategy",
     "DefaultCache",
     "DiskCache",
+    "EmbeddingCache",
     "InMemoryCache",
     "AsyncRetryStrategy",
     "ExponentialBackoffRetryStrategy",
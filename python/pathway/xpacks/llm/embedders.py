@@ -3,6 +3,7 @@
 Pathway embedder UDFs.
 """
 import asyncio
+from typing import Any
 
 import numpy as np
 
@@ -160,7 +161,9 @@ class OpenAIEmbedder(BaseEmbedder):
         if model is not None:
             self.kwargs["model"] = model
 
-    async def __wrapped__(self, input, **kwargs) -> np.ndarray:
+    async def __wrapped__(
+        self, input, **kwargs
+    ) -> np.ndarray[Any, np.dtype[np.float32]]:
         """Embed the documents
 
         Args:
@@ -174,7 +177,7 @@ class OpenAIEmbedder(BaseEmbedder):
         api_key = kwargs.pop("api_key", None)
         client = openai.AsyncOpenAI(api_key=api_key)
         ret = await client.embeddings.create(input=[input or "."], **kwargs)
-        return np.array(ret.data[0].embedding)
+        return np.array(ret.data[0].embedding, dtype=np.float32)
 
 
 class LiteLLMEmbedder(BaseEmbedder):
@@ -252,7 +255,9 @@ class LiteLLMEmbedder(BaseEmbedder):
         if model is not None:
             self.kwargs["model"] = model
 
-    async def __wrapped__(self, input, **kwargs) -> np.ndarray:
+    async def __wrapped__(
+        self, input, **kwargs
+    ) -> np.ndarray[Any, np.dtype[np.float32]]:
         """Embed the documents
 
         Args:
@@ -264,7 +269,7 @@ class LiteLLMEmbedder(BaseEmbedder):
 
         kwargs = {**self.kwargs, **kwargs}
         ret = await litellm.aembedding(input=[input or "."], **kwargs)
-        return np.array(ret.data[0]["embedding"])
+        return np.array(ret.data[0]["embedding"], dtype=np.float32)
 
 
 class SentenceTransformerEmbedder(BaseEmbedder):
@@ -312,7 +317,9 @@ class SentenceTransformerEmbedder(BaseEmbedder):
         )
         self.kwargs = call_kwargs
 
-    def __wrapped__(self, input: str, **kwargs) -> np.ndarray:
+    def __wrapped__(
+        self, input: str, **kwargs
+    ) -> np.ndarray[Any, np.dtype[np.float32]]:
         """
         Embed the text
 
@@ -324,7 +331,7 @@ class SentenceTransformerEmbedder(BaseEmbedder):
               <https://www.sbert.net/docs/package_reference/SentenceTransformer.html#sentence_transformers.SentenceTransformer.encode>`_.
         """  # noqa: E501
         kwargs = {**self.kwargs, **kwargs}
-        return self.model.encode(input, **kwargs)
+        return np.asarray(self.model.encode(input, **kwargs), dtype=np.float32)
 
 
 class GeminiEmbedder(BaseEmbedder):
@@ -398,7 +405,9 @@ class GeminiEmbedder(BaseEmbedder):
         if api_key is not None:
             self.kwargs["api_key"] = api_key
 
-    def __wrapped__(self, input: str, **kwargs) -> np.ndarray:
+    def __wrapped__(
+        self, input: str, **kwargs
+    ) -> np.ndarray[Any, np.dtype[np.float32]]:
         import google.generativeai as genai
 
         kwargs = {**self.kwargs, **kwargs}
@@ -410,4 +419,4 @@ class GeminiEmbedder(BaseEmbedder):
 
         response = genai.embed_content(model, content=[input], **kwargs)
         embedding = response["embedding"][0]
-        return np.array(embedding)
+        return np.array(embedding, dtype=np.float32)
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import os
+import typing
 
 import pytest
 
 import pathway as pw
+from pathway.internals import dtype as dt
 from pathway.tests.utils import assert_table_equality
 from pathway.xpacks.llm import embedders
 
@@ -35,3 +37,17 @@ def test_oai_vs_llm():
     r2 = t.select(ret=embedder_oai(pw.this.txt, model=pw.this.model))
 
     assert_table_equality(r1, r2)
+
+
+@pytest.mark.parametrize(
+    "embedder_cls",
+    [
+        embedders.OpenAIEmbedder,
+        embedders.LiteLLMEmbedder,
+        embedders.SentenceTransformerEmbedder,
+        embedders.GeminiEmbedder,
+    ],
+)
+def test_embedders_return_float32_arrays(embedder_cls):
+    return_type = typing.get_type_hints(embedder_cls.__wrapped__)["return"]
+    assert dt.wrap(return_type) == dt.FLOAT32_ARRAY
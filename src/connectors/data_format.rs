@@ -601,7 +601,7 @@ fn ensure_all_fields_in_schema(
 }
 
 /// "magic field" containing the metadata
-const METADATA_FIELD_NAME: &str = "_metadata";
+pub const METADATA_FIELD_NAME: &str = "_metadata";
 
 impl DsvParser {
     pub fn new(
@@ -1135,6 +1135,13 @@ fn serialize_value_to_json(value: &Value) -> Result<JsonValue, FormatterError> {
             }
             Ok(JsonValue::Array(items))
         }
+        Value::Float32Array(a) => {
+            let mut items = Vec::with_capacity(a.len());
+            for item in a.iter() {
+                items.push(json!(item));
+            }
+            Ok(JsonValue::Array(items))
+        }
         Value::DateTimeNaive(dt) => Ok(json!(dt.to_string())),
         Value::DateTimeUtc(dt) => Ok(json!(dt.to_string())),
         Value::Duration(d) => Ok(json!(d.nanoseconds())),
@@ -1947,6 +1954,13 @@ fn serialize_value_to_bson(value: &Value) -> Result<BsonValue, FormatterError> {
             }
             Ok(BsonValue::Array(items))
         }
+        Value::Float32Array(a) => {
+            let mut items = Vec::with_capacity(a.len());
+            for item in a.iter() {
+                items.push(bson!(item));
+            }
+            Ok(BsonValue::Array(items))
+        }
         Value::Bytes(b) => Ok(BsonValue::Binary(BsonBinaryContents {
             subtype: BsonBinarySubtype::Generic,
             bytes: b.to_vec(),
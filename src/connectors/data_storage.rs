@@ -7,6 +7,7 @@ use s3::error::S3Error;
 use std::any::type_name;
 use std::borrow::Borrow;
 use std::borrow::Cow;
+use std::cmp::Ordering;
 use std::collections::HashMap;
 use std::collections::HashSet;
 use std::collections::VecDeque;
@@ -17,11 +18,12 @@ use std::io::BufRead;
 use std::io::BufWriter;
 use std::io::Write;
 use std::io::{Seek, SeekFrom};
-use std::mem::take;
-use std::path::Path;
-use std::str::{from_utf8, Utf8Error};
-use std::sync::Arc;
-use std::thread::sleep;
+use std::mem::{discriminant, take};
+use std::path::{Path, PathBuf};
+use std::str::{from_utf8, FromStr, Utf8Error};
+use std::sync::atomic::{self, AtomicBool};
+use std::sync::{Arc, Mutex};
+use std::thread::{sleep, JoinHandle};
 use std::time::{Duration, Instant};
 
 use arcstr::ArcStr;
@@ -31,10 +33,11 @@ use log::{error, info, warn};
 use postgres::types::ToSql;
 use tempfile::tempfile;
 use tokio::runtime::Runtime as TokioRuntime;
+use uuid::Uuid;
 
 use crate::async_runtime::create_async_tokio_runtime;
 use crate::connectors::data_format::{FormatterContext, FormatterError, COMMIT_LITERAL};
-use crate::connectors::data_tokenize::{BufReaderTokenizer, CsvTokenizer};
+use crate::connectors::data_tokenize::{BufReaderTokenizer, CsvTokenizer, ParquetTokenizer};
 use crate::connectors::metadata::{KafkaMetadata, SQLiteMetadata, SourceMetadata};
 use crate::connectors::offset::EMPTY_OFFSET;
 use crate::connectors::posix_like::PosixLikeReader;
@@ -56,12 +59,17 @@ use crate::python_api::extract_value;
 use crate::python_api::threads::PythonThreadState;
 use crate::python_api::PythonSubject;
 use crate::python_api::ValueField;
+use crate::timestamp::current_unix_timestamp_ms;
 
 use async_nats::client::FlushError as NatsFlushError;
 use async_nats::client::PublishError as NatsPublishError;
 use async_nats::Client as NatsClient;
 use async_nats::Subscriber as NatsSubscriber;
 use bincode::ErrorKind as BincodeError;
+use crossbeam_channel::{
+    Receiver as CrossbeamReceiver, RecvTimeoutError as CrossbeamRecvTimeoutError,
+    Sender as CrossbeamSender,
+};
 use deltalake::arrow::array::Array as ArrowArray;
 use deltalake::arrow::array::RecordBatch as DTRecordBatch;
 use deltalake::arrow::array::{
@@ -81,16 +89,21 @@ use deltalake::kernel::DataType as DeltaTableKernelType;
 use deltalake::kernel::PrimitiveType as DeltaTablePrimitiveType;
 use deltalake::kernel::StructField as DeltaTableStructField;
 use deltalake::operations::create::CreateBuilder as DeltaTableCreateBuilder;
+use deltalake::parquet::arrow::ArrowWriter as ParquetArrowWriter;
+use deltalake::parquet::basic::Compression as ParquetCompression;
 use deltalake::parquet::errors::ParquetError;
+use deltalake::parquet::file::metadata::RowGroupMetaData as ParquetRowGroupMetaData;
+use deltalake::parquet::file::properties::WriterProperties as ParquetWriterProperties;
 use deltalake::parquet::file::reader::FileReader as DeltaLakeParquetFileReader;
+use deltalake::parquet::file::statistics::Statistics as ParquetStatistics;
 use deltalake::parquet::record::reader::RowIter as ParquetRowIterator;
 use deltalake::parquet::record::Row as ParquetRow;
 use deltalake::protocol::SaveMode as DeltaTableSaveMode;
 use deltalake::table::PeekCommit as DeltaLakePeekCommit;
 use deltalake::writer::{DeltaWriter, RecordBatchWriter as DTRecordBatchWriter};
 use deltalake::{
-    open_table_with_storage_options as open_delta_table, DeltaConfigKey, DeltaTable,
-    DeltaTableError,
+    open_table_with_storage_options as open_delta_table, DeltaConfigKey, DeltaOps, DeltaTable,
+    DeltaTableError, PartitionFilter as DeltaPartitionFilter,
 };
 use elasticsearch::{BulkParts, Elasticsearch};
 use glob::PatternError as GlobPatternError;
@@ -579,6 +592,9 @@ pub enum WriteError {
     #[error(transparent)]
     Arrow(#[from] ArrowError),
 
+    #[error(transparent)]
+    Parquet(#[from] ParquetError),
+
     #[error(transparent)]
     NatsPublish(#[from] NatsPublishError),
 
@@ -597,6 +613,12 @@ pub enum WriteError {
     #[error("unsupported type: {0:?}")]
     UnsupportedType(Type),
 
+    #[error("partition column {0:?} is not present in the table")]
+    UnknownPartitionColumn(String),
+
+    #[error("writer thread has finished unexpectedly")]
+    WriterThreadFinished,
+
     #[error("query {query:?} failed: {error}")]
     PsqlQueryFailed {
         query: String,
@@ -689,66 +711,104 @@ impl Writer for FileWriter {
     }
 }
 
+/// The maximal number of messages drained from the local `librdkafka` queue within one
+/// `read` call.
+const KAFKA_MAX_MESSAGES_PER_READ: usize = 1024;
+
+/// The maximal time spent on draining the local `librdkafka` queue within one `read` call.
+const KAFKA_MAX_READ_DURATION: Duration = Duration::from_millis(10);
+
 pub struct KafkaReader {
     consumer: BaseConsumer<DefaultConsumerContext>,
     persistent_id: Option<PersistentId>,
     topic: ArcStr,
     positions_for_seek: HashMap<i32, KafkaOffset>,
-    deferred_read_result: Option<ReadResult>,
+    pending_read_results: VecDeque<ReadResult>,
+    metadata_per_message: bool,
+    current_partition: Option<i32>,
 }
 
 impl Reader for KafkaReader {
     fn read(&mut self) -> Result<ReadResult, ReadError> {
-        if let Some(deferred_read_result) = take(&mut self.deferred_read_result) {
-            return Ok(deferred_read_result);
+        if let Some(pending_read_result) = self.pending_read_results.pop_front() {
+            return Ok(pending_read_result);
         }
 
-        loop {
-            let kafka_message = self
-                .consumer
-                .poll(Timeout::Never)
-                .expect("poll should never timeout")?;
-            let message_key = kafka_message.key().map(<[u8]>::to_vec);
-            let message_payload = kafka_message.payload().map(<[u8]>::to_vec);
-
-            if let Some(lazy_seek_offset) = self.positions_for_seek.get(&kafka_message.partition())
-            {
+        // Block until the first message arrives, then take whatever is already
+        // fetched by librdkafka without waiting, up to the batch limits.
+        let mut batch_started_at: Option<Instant> = None;
+        while self.pending_read_results.len() < KAFKA_MAX_MESSAGES_PER_READ {
+            let timeout = match batch_started_at {
+                None => Timeout::Never,
+                Some(started_at) if started_at.elapsed() < KAFKA_MAX_READ_DURATION => {
+                    Timeout::After(Duration::ZERO)
+                }
+                Some(_) => break,
+            };
+            let Some(kafka_message) = self.consumer.poll(timeout) else {
+                if batch_started_at.is_none() {
+                    // `poll` may return without a message even if it doesn't time out,
+                    // e.g. after serving a callback, so keep waiting for the first one.
+                    continue;
+                }
+                break;
+            };
+            let kafka_message = kafka_message?;
+            let partition = kafka_message.partition();
+
+            if let Some(lazy_seek_offset) = self.positions_for_seek.get(&partition) {
                 info!(
                     "Performing Kafka topic seek for ({}, {}) to {:?}",
                     kafka_message.topic(),
-                    kafka_message.partition(),
+                    partition,
                     lazy_seek_offset
                 );
                 // If there is a need for seek, perform it and remove the seek requirement.
-                if let Err(e) = self.consumer.seek(
-                    kafka_message.topic(),
-                    kafka_message.partition(),
-                    *lazy_seek_offset,
-                    None,
-                ) {
+                if let Err(e) =
+                    self.consumer
+                        .seek(kafka_message.topic(), partition, *lazy_seek_offset, None)
+                {
                     error!(
                         "Failed to seek topic and partition ({}, {}) to offset {:?}: {e}",
                         kafka_message.topic(),
-                        kafka_message.partition(),
+                        partition,
                         lazy_seek_offset,
                     );
                 } else {
-                    self.positions_for_seek.remove(&kafka_message.partition());
+                    self.positions_for_seek.remove(&partition);
                 }
                 continue;
             }
 
+            // The metadata is only needed by the parser if it's included into the table,
+            // otherwise it's enough to report the change of the source partition.
+            if self.metadata_per_message || self.current_partition != Some(partition) {
+                self.current_partition = Some(partition);
+                let metadata = KafkaMetadata::from_rdkafka_message(&kafka_message);
+                self.pending_read_results
+                    .push_back(ReadResult::NewSource(metadata.into()));
+            }
+
             let offset = {
-                let offset_key = OffsetKey::Kafka(self.topic.clone(), kafka_message.partition());
+                let offset_key = OffsetKey::Kafka(self.topic.clone(), partition);
                 let offset_value = OffsetValue::KafkaOffset(kafka_message.offset());
                 (offset_key, offset_value)
             };
-            let message = ReaderContext::from_key_value(message_key, message_payload);
-            self.deferred_read_result = Some(ReadResult::Data(message, offset));
-
-            let metadata = KafkaMetadata::from_rdkafka_message(&kafka_message);
-            return Ok(ReadResult::NewSource(metadata.into()));
+            // The message is borrowed from the consumer's buffer, which is reused after the
+            // next poll, so the key and the payload are copied exactly once here.
+            let message = ReaderContext::from_key_value(
+                kafka_message.key().map(<[u8]>::to_vec),
+                kafka_message.payload().map(<[u8]>::to_vec),
+            );
+            self.pending_read_results
+                .push_back(ReadResult::Data(message, offset));
+            batch_started_at.get_or_insert_with(Instant::now);
         }
+
+        Ok(self
+            .pending_read_results
+            .pop_front()
+            .expect("the batch ends only after a message is read"))
     }
 
     fn seek(&mut self, frontier: &OffsetAntichain) -> Result<(), ReadError> {
@@ -808,13 +868,16 @@ impl KafkaReader {
         topic: String,
         persistent_id: Option<PersistentId>,
         positions_for_seek: HashMap<i32, KafkaOffset>,
+        metadata_per_message: bool,
     ) -> KafkaReader {
         KafkaReader {
             consumer,
             persistent_id,
             topic: topic.into(),
             positions_for_seek,
-            deferred_read_result: None,
+            pending_read_results: VecDeque::new(),
+            metadata_per_message,
+            current_partition: None,
         }
     }
 }
@@ -1176,8 +1239,9 @@ mod to_sql {
                     try_forward!(&[Value], &t[..]);
                     "tuple"
                 }
-                Self::IntArray(_) => "int array",     // TODO
-                Self::FloatArray(_) => "float array", // TODO
+                Self::IntArray(_) => "int array",         // TODO
+                Self::FloatArray(_) => "float array",     // TODO
+                Self::Float32Array(_) => "float32 array", // TODO
                 Self::DateTimeNaive(dt) => {
                     try_forward!(NaiveDateTime, dt.as_chrono_datetime());
                     "naive date/time"
@@ -1391,6 +1455,126 @@ impl Writer for ElasticSearchWriter {
     }
 }
 
+enum ShardedWriterEvent {
+    Write(FormatterContext),
+    Flush(bool),
+}
+
+/// Distributes the output among several writers, each running in its own thread
+/// and having its own connection to the sink. The entries are routed by their keys,
+/// so all updates of a key are written by the same writer in the order they come.
+pub struct ShardedWriter {
+    senders: Vec<CrossbeamSender<ShardedWriterEvent>>,
+    flush_results: CrossbeamReceiver<Result<(), WriteError>>,
+    threads: Vec<JoinHandle<()>>,
+    single_threaded: bool,
+    short_description: Cow<'static, str>,
+}
+
+impl ShardedWriter {
+    pub fn new(writers: Vec<Box<dyn Writer>>) -> Result<Self, WriteError> {
+        assert!(!writers.is_empty());
+        let single_threaded = writers[0].single_threaded();
+        let short_description = writers[0].short_description();
+
+        let (flush_results_sender, flush_results) = crossbeam_channel::unbounded();
+        let mut senders = Vec::with_capacity(writers.len());
+        let mut threads = Vec::with_capacity(writers.len());
+        for (index, mut writer) in writers.into_iter().enumerate() {
+            let (sender, receiver) = crossbeam_channel::unbounded();
+            let flush_results_sender = flush_results_sender.clone();
+            let thread = std::thread::Builder::new()
+                .name(format!(
+                    "pathway:sharded_writer-{short_description}-{index}"
+                ))
+                .spawn(move || {
+                    // A failed write is reported on the next flush, since it's
+                    // the moment when the caller waits for the outcome
+                    let mut write_error = None;
+                    for event in receiver {
+                        match event {
+                            ShardedWriterEvent::Write(data) => {
+                                if write_error.is_none() {
+                                    write_error = writer.write(data).err();
+                                }
+                            }
+                            ShardedWriterEvent::Flush(forced) => {
+                                let result = match write_error.take() {
+                                    Some(e) => Err(e),
+                                    None => writer.flush(forced),
+                                };
+                                if flush_results_sender.send(result).is_err() {
+                                    break;
+                                }
+                            }
+                        }
+                    }
+                })?;
+            senders.push(sender);
+            threads.push(thread);
+        }
+
+        Ok(Self {
+            senders,
+            flush_results,
+            threads,
+            single_threaded,
+            short_description,
+        })
+    }
+}
+
+impl Writer for ShardedWriter {
+    fn write(&mut self, data: FormatterContext) -> Result<(), WriteError> {
+        // The lower bits of the key determine the worker, so they are correlated
+        // for the entries of one worker. Use the higher ones to spread them evenly.
+        #[allow(clippy::cast_possible_truncation)]
+        let shard = (data.key.0 >> 64) as usize % self.senders.len();
+        self.senders[shard]
+            .send(ShardedWriterEvent::Write(data))
+            .map_err(|_| WriteError::WriterThreadFinished)
+    }
+
+    fn flush(&mut self, forced: bool) -> Result<(), WriteError> {
+        for sender in &self.senders {
+            sender
+                .send(ShardedWriterEvent::Flush(forced))
+                .map_err(|_| WriteError::WriterThreadFinished)?;
+        }
+        // The writers flush in parallel, wait until all of them are done
+        let mut result = Ok(());
+        for _ in 0..self.senders.len() {
+            let flush_result = self
+                .flush_results
+                .recv()
+                .map_err(|_| WriteError::WriterThreadFinished)?;
+            if result.is_ok() {
+                result = flush_result;
+            }
+        }
+        result
+    }
+
+    fn single_threaded(&self) -> bool {
+        self.single_threaded
+    }
+
+    fn short_description(&self) -> Cow<'static, str> {
+        self.short_description.clone()
+    }
+}
+
+impl Drop for ShardedWriter {
+    fn drop(&mut self) {
+        self.senders.clear();
+        for thread in self.threads.drain(..) {
+            if thread.join().is_err() {
+                error!("Sharded writer thread has panicked");
+            }
+        }
+    }
+}
+
 #[derive(Default, Debug)]
 pub struct NullWriter;
 
@@ -1618,13 +1802,171 @@ impl Reader for SqliteReader {
 
 const SPECIAL_OUTPUT_FIELDS: [(&str, Type); 2] = [("time", Type::Int), ("diff", Type::Int)];
 
+type DeltaPartitionValues = Vec<String>;
+
+/// Background compaction of a Delta table. The writer reports the partitions it
+/// writes to, and once a partition receives no writes for a full compaction
+/// interval, it is considered closed: its small files are rewritten into larger
+/// ones by the `OPTIMIZE` operation, which is committed as a `remove`+`add`
+/// transaction without data change. All partitions are considered closed
+/// when the writer is dropped.
+///
+/// The commits of the compaction and of the writer are serialized with
+/// `commit_lock`, and each side refreshes its table snapshot before committing
+/// after the other one has changed the table.
+struct DeltaTableCompaction {
+    partitions_last_written_at: Arc<Mutex<HashMap<DeltaPartitionValues, Instant>>>,
+    commit_lock: Arc<Mutex<()>>,
+    table_compacted: Arc<AtomicBool>,
+    stop_sender: Option<CrossbeamSender<()>>,
+    thread_handle: Option<JoinHandle<()>>,
+}
+
+impl DeltaTableCompaction {
+    fn start(
+        path: String,
+        storage_options: HashMap<String, String>,
+        partition_columns: Vec<String>,
+        target_file_size: Option<usize>,
+        interval: Duration,
+    ) -> Result<Self, WriteError> {
+        let partitions_last_written_at: Arc<Mutex<HashMap<DeltaPartitionValues, Instant>>> =
+            Arc::default();
+        let commit_lock: Arc<Mutex<()>> = Arc::default();
+        let table_compacted: Arc<AtomicBool> = Arc::default();
+        let (stop_sender, stop_receiver) = crossbeam_channel::bounded(0);
+        let partitions = partitions_last_written_at.clone();
+        let thread_commit_lock = commit_lock.clone();
+        let thread_table_compacted = table_compacted.clone();
+        let thread_handle = std::thread::Builder::new()
+            .name("pathway:deltalake-compaction".to_string())
+            .spawn(move || loop {
+                // When the writer is dropped, no more data will come,
+                // so all partitions become closed
+                let is_finished = match stop_receiver.recv_timeout(interval) {
+                    Err(CrossbeamRecvTimeoutError::Timeout) => false,
+                    Ok(()) | Err(CrossbeamRecvTimeoutError::Disconnected) => true,
+                };
+                let closed_partitions: Vec<DeltaPartitionValues> = {
+                    let mut partitions = partitions.lock().unwrap();
+                    let closed_partitions: Vec<_> = partitions
+                        .iter()
+                        .filter(|(_, last_written_at)| {
+                            is_finished || last_written_at.elapsed() >= interval
+                        })
+                        .map(|(partition_values, _)| partition_values.clone())
+                        .collect();
+                    for partition_values in &closed_partitions {
+                        partitions.remove(partition_values);
+                    }
+                    closed_partitions
+                };
+                if let Err(e) = Self::compact_partitions(
+                    &path,
+                    &storage_options,
+                    &partition_columns,
+                    &closed_partitions,
+                    target_file_size,
+                    &thread_commit_lock,
+                    &thread_table_compacted,
+                ) {
+                    error!("Failed to compact DeltaTable partitions: {e}");
+                }
+                if is_finished {
+                    break;
+                }
+            })?;
+        Ok(Self {
+            partitions_last_written_at,
+            commit_lock,
+            table_compacted,
+            stop_sender: Some(stop_sender),
+            thread_handle: Some(thread_handle),
+        })
+    }
+
+    /// Runs `commit` while the compaction can't commit. `commit` receives whether
+    /// the table has been compacted since the previous call, that is, whether
+    /// the writer's snapshot of the table is stale.
+    fn exclusive_commit<T>(&self, commit: impl FnOnce(bool) -> T) -> T {
+        let _commit_guard = self.commit_lock.lock().unwrap();
+        commit(self.table_compacted.swap(false, atomic::Ordering::AcqRel))
+    }
+
+    fn register_write(&self, partition_values: DeltaPartitionValues) {
+        self.partitions_last_written_at
+            .lock()
+            .unwrap()
+            .insert(partition_values, Instant::now());
+    }
+
+    fn compact_partitions(
+        path: &str,
+        storage_options: &HashMap<String, String>,
+        partition_columns: &[String],
+        closed_partitions: &[DeltaPartitionValues],
+        target_file_size: Option<usize>,
+        commit_lock: &Mutex<()>,
+        table_compacted: &AtomicBool,
+    ) -> Result<(), WriteError> {
+        if closed_partitions.is_empty() {
+            return Ok(());
+        }
+        create_async_tokio_runtime()?.block_on(async {
+            let mut table = open_delta_table(path, storage_options.clone()).await?;
+            for partition_values in closed_partitions {
+                // The writer may have committed since the last partition was compacted
+                let _commit_guard = commit_lock.lock().unwrap();
+                table.update().await?;
+                let filters: Vec<DeltaPartitionFilter> = partition_columns
+                    .iter()
+                    .zip(partition_values)
+                    .map(|(column, value)| {
+                        DeltaPartitionFilter::try_from((column.as_str(), "=", value.as_str()))
+                    })
+                    .try_collect()?;
+                let mut optimize = DeltaOps(table).optimize().with_filters(&filters);
+                if let Some(target_file_size) = target_file_size {
+                    optimize = optimize.with_target_size(target_file_size.try_into().unwrap());
+                }
+                let (optimized_table, metrics) = optimize.await?;
+                info!(
+                    "Compacted DeltaTable partition {partition_values:?}: {} files removed, {} files added",
+                    metrics.num_files_removed, metrics.num_files_added
+                );
+                table = optimized_table;
+                if metrics.num_files_removed > 0 {
+                    table_compacted.store(true, atomic::Ordering::Release);
+                }
+            }
+            Ok::<(), WriteError>(())
+        })
+    }
+}
+
+impl Drop for DeltaTableCompaction {
+    fn drop(&mut self) {
+        // Dropping the sender wakes the compaction thread up and stops it
+        self.stop_sender.take();
+        if let Some(thread_handle) = self.thread_handle.take() {
+            if thread_handle.join().is_err() {
+                error!("DeltaTable compaction thread has panicked");
+            }
+        }
+    }
+}
+
 pub struct DeltaTableWriter {
     table: DeltaTable,
     writer: DTRecordBatchWriter,
     schema: Arc<ArrowSchema>,
     buffered_columns: Vec<Vec<Value>>,
+    buffered_bytes: usize,
     min_commit_frequency: Option<Duration>,
+    target_file_size: Option<usize>,
     last_commit_at: Instant,
+    partition_column_indices: Vec<usize>,
+    compaction: Option<DeltaTableCompaction>,
 }
 
 impl DeltaTableWriter {
@@ -1633,10 +1975,37 @@ impl DeltaTableWriter {
         value_fields: &Vec<ValueField>,
         storage_options: HashMap<String, String>,
         min_commit_frequency: Option<Duration>,
+        partition_columns: Vec<String>,
+        target_file_size: Option<usize>,
+        compaction_interval: Option<Duration>,
     ) -> Result<Self, WriteError> {
         let schema = Arc::new(Self::construct_schema(value_fields)?);
-        let table = Self::open_table(path, value_fields, storage_options)?;
+        let mut partition_column_indices = Vec::with_capacity(partition_columns.len());
+        for column in &partition_columns {
+            let index = value_fields
+                .iter()
+                .position(|field| &field.name == column)
+                .ok_or_else(|| WriteError::UnknownPartitionColumn(column.clone()))?;
+            partition_column_indices.push(index);
+        }
+        let table = Self::open_table(
+            path,
+            value_fields,
+            &partition_columns,
+            storage_options.clone(),
+        )?;
         let writer = DTRecordBatchWriter::for_table(&table)?;
+        let compaction = compaction_interval
+            .map(|interval| {
+                DeltaTableCompaction::start(
+                    path.to_string(),
+                    storage_options,
+                    partition_columns,
+                    target_file_size,
+                    interval,
+                )
+            })
+            .transpose()?;
 
         let mut empty_buffered_columns = Vec::new();
         for _ in 0..schema.flattened_fields().len() {
@@ -1647,14 +2016,44 @@ impl DeltaTableWriter {
             writer,
             schema,
             buffered_columns: empty_buffered_columns,
+            buffered_bytes: 0,
             min_commit_frequency,
+            target_file_size,
 
             // before the first commit, the time should be
             // measured from the moment of the start
             last_commit_at: Instant::now(),
+            partition_column_indices,
+            compaction,
         })
     }
 
+    fn partition_value(value: &Value) -> Option<String> {
+        match value {
+            Value::String(s) => Some(s.to_string()),
+            Value::Int(i) => Some(i.to_string()),
+            Value::Bool(b) => Some(b.to_string()),
+            _ => None,
+        }
+    }
+
+    /// A rough estimation of the size of the value in the output file.
+    /// Used only to decide when the buffered data reaches the target file size.
+    fn estimated_value_size(value: &Value) -> usize {
+        match value {
+            Value::String(s) => s.len(),
+            Value::Bytes(b) => b.len(),
+            Value::Json(j) => j.to_string().len(),
+            Value::None => 1,
+            _ => 8,
+        }
+    }
+
+    fn is_target_file_size_reached(&self) -> bool {
+        self.target_file_size
+            .is_some_and(|target_file_size| self.buffered_bytes >= target_file_size)
+    }
+
     fn array_of_target_type<ElementType>(
         values: &Vec<Value>,
         mut to_simple_type: impl FnMut(&Value) -> Result<ElementType, WriteError>,
@@ -1738,14 +2137,21 @@ impl DeltaTableWriter {
     }
 
     fn prepare_delta_batch(&self) -> Result<DTRecordBatch, WriteError> {
+        Self::prepare_record_batch(&self.schema, &self.buffered_columns)
+    }
+
+    pub fn prepare_record_batch(
+        schema: &Arc<ArrowSchema>,
+        buffered_columns: &[Vec<Value>],
+    ) -> Result<DTRecordBatch, WriteError> {
         let mut data_columns = Vec::new();
-        for (index, column) in self.buffered_columns.iter().enumerate() {
+        for (index, column) in buffered_columns.iter().enumerate() {
             data_columns.push(Self::arrow_array_for_type(
-                self.schema.field(index).data_type(),
+                schema.field(index).data_type(),
                 column,
             )?);
         }
-        Ok(DTRecordBatch::try_new(self.schema.clone(), data_columns)?)
+        Ok(DTRecordBatch::try_new(schema.clone(), data_columns)?)
     }
 
     fn delta_table_primitive_type(type_: &Type) -> Result<DeltaTableKernelType, WriteError> {
@@ -1759,6 +2165,7 @@ impl DeltaTableWriter {
             Type::Int | Type::Duration => DeltaTablePrimitiveType::Long,
             Type::Optional(wrapped) => return Self::delta_table_primitive_type(wrapped),
             Type::Any
+            | Type::Float32
             | Type::Array(_, _)
             | Type::Tuple(_)
             | Type::List(_)
@@ -1782,6 +2189,7 @@ impl DeltaTableWriter {
             }
             Type::Optional(wrapped) => return Self::arrow_data_type(wrapped),
             Type::Any
+            | Type::Float32
             | Type::Array(_, _)
             | Type::Tuple(_)
             | Type::List(_)
@@ -1811,6 +2219,7 @@ impl DeltaTableWriter {
     pub fn open_table(
         path: &str,
         schema_fields: &Vec<ValueField>,
+        partition_columns: &[String],
         storage_options: HashMap<String, String>,
     ) -> Result<DeltaTable, WriteError> {
         let mut struct_fields = Vec::new();
@@ -1836,6 +2245,7 @@ impl DeltaTableWriter {
                     .with_location(path)
                     .with_save_mode(DeltaTableSaveMode::Append)
                     .with_columns(struct_fields)
+                    .with_partition_columns(partition_columns.to_vec())
                     .with_configuration_property(DeltaConfigKey::AppendOnly, Some("true"))
                     .with_storage_options(storage_options.clone());
 
@@ -1856,7 +2266,18 @@ impl DeltaTableWriter {
 
 impl Writer for DeltaTableWriter {
     fn write(&mut self, data: FormatterContext) -> Result<(), WriteError> {
+        if let Some(compaction) = &self.compaction {
+            let partition_values: Option<DeltaPartitionValues> = self
+                .partition_column_indices
+                .iter()
+                .map(|index| Self::partition_value(&data.values[*index]))
+                .collect();
+            if let Some(partition_values) = partition_values {
+                compaction.register_write(partition_values);
+            }
+        }
         for (index, value) in data.values.into_iter().enumerate() {
+            self.buffered_bytes += Self::estimated_value_size(&value);
             self.buffered_columns[index].push(value);
         }
         let time_column_idx = self.buffered_columns.len() - 2;
@@ -1871,17 +2292,33 @@ impl Writer for DeltaTableWriter {
             && (self
                 .min_commit_frequency
                 .map_or(true, |f| self.last_commit_at.elapsed() >= f)
-                || forced);
+                || forced
+                || self.is_target_file_size_reached());
         if commit_needed {
-            // Deadlocks if new_current_thread is used
-            create_async_tokio_runtime()?.block_on(async {
-                self.writer.write(self.prepare_delta_batch()?).await?;
-                self.writer.flush_and_commit(&mut self.table).await?;
-                for column in &mut self.buffered_columns {
-                    column.clear();
-                }
-                Ok::<(), WriteError>(())
-            })?;
+            let batch = self.prepare_delta_batch()?;
+            let table = &mut self.table;
+            let writer = &mut self.writer;
+            let buffered_columns = &mut self.buffered_columns;
+            let commit = |table_changed: bool| {
+                // Deadlocks if new_current_thread is used
+                create_async_tokio_runtime()?.block_on(async {
+                    if table_changed {
+                        table.update().await?;
+                    }
+                    writer.write(batch).await?;
+                    writer.flush_and_commit(table).await?;
+                    for column in buffered_columns {
+                        column.clear();
+                    }
+                    Ok::<(), WriteError>(())
+                })
+            };
+            match &self.compaction {
+                Some(compaction) => compaction.exclusive_commit(commit)?,
+                None => commit(false)?,
+            }
+            self.buffered_bytes = 0;
+            self.last_commit_at = Instant::now();
         }
         Ok(())
     }
@@ -2093,6 +2530,57 @@ impl DeltaTableReader {
     }
 }
 
+pub fn parquet_row_into_values_map(
+    parquet_row: &ParquetRow,
+    column_types: &HashMap<String, Type>,
+) -> ValuesMap {
+    let mut row_map = HashMap::new();
+    for (name, parquet_value) in parquet_row.get_column_iter() {
+        let Some(expected_type) = column_types.get(name) else {
+            // Column outside of the user-provided schema
+            continue;
+        };
+
+        let value = match (parquet_value, expected_type) {
+            (ParquetValue::Null, _) => Some(Value::None),
+            (ParquetValue::Bool(b), Type::Bool | Type::Any) => Some(Value::from(*b)),
+            (ParquetValue::Long(i), Type::Int | Type::Any) => Some(Value::from(*i)),
+            (ParquetValue::Long(i), Type::Duration) => Some(Value::from(
+                EngineDuration::new_with_unit(*i, "us").unwrap(),
+            )),
+            (ParquetValue::Double(f), Type::Float | Type::Any) => Some(Value::Float((*f).into())),
+            (ParquetValue::Str(s), Type::String | Type::Any) => Some(Value::String(s.into())),
+            (ParquetValue::Str(s), Type::Json) => serde_json::from_str::<serde_json::Value>(s)
+                .ok()
+                .map(Value::from),
+            (ParquetValue::TimestampMicros(us), Type::DateTimeNaive | Type::Any) => Some(
+                Value::from(DateTimeNaive::from_timestamp(*us, "us").unwrap()),
+            ),
+            (ParquetValue::TimestampMicros(us), Type::DateTimeUtc) => {
+                Some(Value::from(DateTimeUtc::from_timestamp(*us, "us").unwrap()))
+            }
+            (ParquetValue::Bytes(b), Type::Bytes | Type::Any) => {
+                Some(Value::Bytes(b.data().into()))
+            }
+            _ => None,
+        };
+        let value = if let Some(value) = value {
+            Ok(value)
+        } else {
+            let value_repr =
+                limit_length(format!("{parquet_value:?}"), STANDARD_OBJECT_LENGTH_LIMIT);
+            Err(Box::new(ConversionError {
+                value_repr,
+                field_name: name.clone(),
+                type_: expected_type.clone(),
+            }))
+        };
+        row_map.insert(name.clone(), value);
+    }
+
+    row_map.into()
+}
+
 impl Reader for DeltaTableReader {
     fn read(&mut self) -> Result<ReadResult, ReadError> {
         let parquet_row = match self.read_next_row_native(self.streaming_mode.is_polling_enabled())
@@ -2101,55 +2589,11 @@ impl Reader for DeltaTableReader {
             Err(ReadError::NoObjectsToRead) => return Ok(ReadResult::Finished),
             Err(other) => return Err(other),
         };
-        let mut row_map = HashMap::new();
-        for (name, parquet_value) in parquet_row.get_column_iter() {
-            let Some(expected_type) = self.column_types.get(name) else {
-                // Column outside of the user-provided schema
-                continue;
-            };
-
-            let value = match (parquet_value, expected_type) {
-                (ParquetValue::Null, _) => Some(Value::None),
-                (ParquetValue::Bool(b), Type::Bool | Type::Any) => Some(Value::from(*b)),
-                (ParquetValue::Long(i), Type::Int | Type::Any) => Some(Value::from(*i)),
-                (ParquetValue::Long(i), Type::Duration) => Some(Value::from(
-                    EngineDuration::new_with_unit(*i, "us").unwrap(),
-                )),
-                (ParquetValue::Double(f), Type::Float | Type::Any) => {
-                    Some(Value::Float((*f).into()))
-                }
-                (ParquetValue::Str(s), Type::String | Type::Any) => Some(Value::String(s.into())),
-                (ParquetValue::Str(s), Type::Json) => serde_json::from_str::<serde_json::Value>(s)
-                    .ok()
-                    .map(Value::from),
-                (ParquetValue::TimestampMicros(us), Type::DateTimeNaive | Type::Any) => Some(
-                    Value::from(DateTimeNaive::from_timestamp(*us, "us").unwrap()),
-                ),
-                (ParquetValue::TimestampMicros(us), Type::DateTimeUtc) => {
-                    Some(Value::from(DateTimeUtc::from_timestamp(*us, "us").unwrap()))
-                }
-                (ParquetValue::Bytes(b), Type::Bytes | Type::Any) => {
-                    Some(Value::Bytes(b.data().into()))
-                }
-                _ => None,
-            };
-            let value = if let Some(value) = value {
-                Ok(value)
-            } else {
-                let value_repr =
-                    limit_length(format!("{parquet_value:?}"), STANDARD_OBJECT_LENGTH_LIMIT);
-                Err(Box::new(ConversionError {
-                    value_repr,
-                    field_name: name.clone(),
-                    type_: expected_type.clone(),
-                }))
-            };
-            row_map.insert(name.clone(), value);
-        }
+        let row_map = parquet_row_into_values_map(&parquet_row, &self.column_types);
 
         self.rows_read_within_version += 1;
         Ok(ReadResult::Data(
-            ReaderContext::from_diff(self.current_event_type, None, row_map.into()),
+            ReaderContext::from_diff(self.current_event_type, None, row_map),
             (
                 OffsetKey::Empty,
                 OffsetValue::DeltaTablePosition {
@@ -2229,6 +2673,322 @@ impl Reader for DeltaTableReader {
     }
 }
 
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum ParquetFilterOperator {
+    Equal,
+    NotEqual,
+    Less,
+    LessOrEqual,
+    Greater,
+    GreaterOrEqual,
+}
+
+impl FromStr for ParquetFilterOperator {
+    type Err = String;
+
+    fn from_str(symbol: &str) -> Result<Self, Self::Err> {
+        match symbol {
+            "=" | "==" => Ok(Self::Equal),
+            "!=" => Ok(Self::NotEqual),
+            "<" => Ok(Self::Less),
+            "<=" => Ok(Self::LessOrEqual),
+            ">" => Ok(Self::Greater),
+            ">=" => Ok(Self::GreaterOrEqual),
+            _ => Err(format!("unknown parquet filter operator: {symbol}")),
+        }
+    }
+}
+
+impl ParquetFilterOperator {
+    fn accepts(self, ordering: Ordering) -> bool {
+        match self {
+            Self::Equal => ordering == Ordering::Equal,
+            Self::NotEqual => ordering != Ordering::Equal,
+            Self::Less => ordering == Ordering::Less,
+            Self::LessOrEqual => ordering != Ordering::Greater,
+            Self::Greater => ordering == Ordering::Greater,
+            Self::GreaterOrEqual => ordering != Ordering::Less,
+        }
+    }
+}
+
+/// A single `column <operator> value` condition used for the predicate pushdown
+/// in parquet reads. Several filters are combined with a logical AND.
+#[derive(Clone, Debug)]
+pub struct ParquetFilter {
+    column: String,
+    operator: ParquetFilterOperator,
+    value: Value,
+}
+
+impl ParquetFilter {
+    pub fn new(column: String, operator: ParquetFilterOperator, value: Value) -> Self {
+        Self {
+            column,
+            operator,
+            value,
+        }
+    }
+
+    pub fn column(&self) -> &str {
+        &self.column
+    }
+
+    #[allow(clippy::cast_precision_loss)]
+    fn compare(lhs: &Value, rhs: &Value) -> Option<Ordering> {
+        match (lhs, rhs) {
+            (Value::None, _) | (_, Value::None) => None,
+            (Value::Int(lhs), Value::Float(rhs)) => (*lhs as f64).partial_cmp(&rhs.into_inner()),
+            (Value::Float(lhs), Value::Int(rhs)) => lhs.into_inner().partial_cmp(&(*rhs as f64)),
+            (lhs, rhs) if discriminant(lhs) == discriminant(rhs) => Some(lhs.cmp(rhs)),
+            _ => None,
+        }
+    }
+
+    /// Checks the condition for a decoded row. Rows where the value is absent,
+    /// `None` or can't be compared with the literal are filtered out.
+    pub fn matches(&self, values: &ValuesMap) -> bool {
+        let Some(Ok(value)) = values.get(&self.column) else {
+            return false;
+        };
+        Self::compare(value, &self.value).is_some_and(|ordering| self.operator.accepts(ordering))
+    }
+
+    /// Checks whether a row group may contain the rows satisfying the condition,
+    /// judging by the min-max statistics stored in the file. If the statistics are
+    /// absent or have an unsupported type, the row group is never skipped.
+    pub fn may_match_row_group(&self, row_group: &ParquetRowGroupMetaData) -> bool {
+        let Some((min_value, max_value)) = self.row_group_bounds(row_group) else {
+            return true;
+        };
+        let (Some(min_ordering), Some(max_ordering)) = (
+            Self::compare(&min_value, &self.value),
+            Self::compare(&max_value, &self.value),
+        ) else {
+            return true;
+        };
+        match self.operator {
+            ParquetFilterOperator::Equal => {
+                min_ordering != Ordering::Greater && max_ordering != Ordering::Less
+            }
+            ParquetFilterOperator::NotEqual => {
+                min_ordering != Ordering::Equal || max_ordering != Ordering::Equal
+            }
+            ParquetFilterOperator::Less | ParquetFilterOperator::LessOrEqual => {
+                self.operator.accepts(min_ordering)
+            }
+            ParquetFilterOperator::Greater | ParquetFilterOperator::GreaterOrEqual => {
+                self.operator.accepts(max_ordering)
+            }
+        }
+    }
+
+    fn row_group_bounds(&self, row_group: &ParquetRowGroupMetaData) -> Option<(Value, Value)> {
+        let column_chunk = row_group
+            .columns()
+            .iter()
+            .find(|column| column.column_path().string() == self.column)?;
+        let statistics = column_chunk.statistics()?;
+        if !statistics.has_min_max_set() {
+            return None;
+        }
+        let bounds = match statistics {
+            ParquetStatistics::Boolean(s) => (Value::Bool(*s.min()), Value::Bool(*s.max())),
+            ParquetStatistics::Int32(s) => (
+                Value::Int(i64::from(*s.min())),
+                Value::Int(i64::from(*s.max())),
+            ),
+            ParquetStatistics::Int64(s) => (Value::Int(*s.min()), Value::Int(*s.max())),
+            ParquetStatistics::Float(s) => (
+                Value::from(f64::from(*s.min())),
+                Value::from(f64::from(*s.max())),
+            ),
+            ParquetStatistics::Double(s) => (Value::from(*s.min()), Value::from(*s.max())),
+            ParquetStatistics::ByteArray(s) => (
+                Value::from(s.min().as_utf8().ok()?),
+                Value::from(s.max().as_utf8().ok()?),
+            ),
+            _ => return None,
+        };
+        Some(bounds)
+    }
+}
+
+pub fn new_parquet_filesystem_reader(
+    path: &str,
+    column_types: HashMap<String, Type>,
+    filters: Vec<ParquetFilter>,
+    parallel_row_groups: usize,
+    streaming_mode: ConnectorMode,
+    persistent_id: Option<PersistentId>,
+) -> Result<PosixLikeReader, ReadError> {
+    let scanner = FilesystemScanner::new(path, PARQUET_OBJECT_PATTERN)?;
+    let tokenizer = ParquetTokenizer::new(column_types, filters, parallel_row_groups);
+    PosixLikeReader::new(
+        Box::new(scanner),
+        Box::new(tokenizer),
+        streaming_mode,
+        persistent_id,
+    )
+}
+
+pub fn new_s3_parquet_reader(
+    bucket: S3Bucket,
+    objects_prefix: impl Into<String>,
+    column_types: HashMap<String, Type>,
+    filters: Vec<ParquetFilter>,
+    parallel_row_groups: usize,
+    streaming_mode: ConnectorMode,
+    persistent_id: Option<PersistentId>,
+    downloader_threads_count: usize,
+) -> Result<PosixLikeReader, ReadError> {
+    let scanner = S3Scanner::new(bucket, objects_prefix, downloader_threads_count)?;
+    let tokenizer = ParquetTokenizer::new(column_types, filters, parallel_row_groups);
+    PosixLikeReader::new(
+        Box::new(scanner),
+        Box::new(tokenizer),
+        streaming_mode,
+        persistent_id,
+    )
+}
+
+const PARQUET_OBJECT_PATTERN: &str = "*.parquet";
+const PARQUET_IN_PROGRESS_EXTENSION: &str = "inprogress";
+
+/// Writes the stream of updates into a directory as a sequence of parquet files.
+/// A file is finalized and a new one is started when the current file exceeds
+/// the size limit or has been open for longer than the duration limit. Until
+/// finalized, the file has an `.inprogress` extension, so the readers don't
+/// pick up the files with an unwritten footer.
+pub struct ParquetWriter {
+    base_path: PathBuf,
+    schema: Arc<ArrowSchema>,
+    properties: ParquetWriterProperties,
+    buffered_columns: Vec<Vec<Value>>,
+    max_file_size: Option<usize>,
+    max_file_duration: Option<Duration>,
+
+    current_file: Option<(ParquetArrowWriter<File>, PathBuf)>,
+    current_file_opened_at: Instant,
+}
+
+impl ParquetWriter {
+    pub fn new(
+        path: &str,
+        value_fields: &Vec<ValueField>,
+        compression: ParquetCompression,
+        max_file_size: Option<usize>,
+        max_file_duration: Option<Duration>,
+    ) -> Result<Self, WriteError> {
+        let schema = Arc::new(DeltaTableWriter::construct_schema(value_fields)?);
+        std::fs::create_dir_all(path)?;
+        let properties = ParquetWriterProperties::builder()
+            .set_compression(compression)
+            .build();
+
+        let mut empty_buffered_columns = Vec::new();
+        for _ in 0..schema.flattened_fields().len() {
+            empty_buffered_columns.push(Vec::new());
+        }
+        Ok(Self {
+            base_path: path.into(),
+            schema,
+            properties,
+            buffered_columns: empty_buffered_columns,
+            max_file_size,
+            max_file_duration,
+            current_file: None,
+            current_file_opened_at: Instant::now(),
+        })
+    }
+
+    fn open_new_file(&mut self) -> Result<(), WriteError> {
+        let file_name = format!(
+            "part-{}-{}.parquet.{PARQUET_IN_PROGRESS_EXTENSION}",
+            current_unix_timestamp_ms(),
+            Uuid::new_v4()
+        );
+        let path = self.base_path.join(file_name);
+        let writer = ParquetArrowWriter::try_new(
+            File::create(&path)?,
+            self.schema.clone(),
+            Some(self.properties.clone()),
+        )?;
+        self.current_file = Some((writer, path));
+        self.current_file_opened_at = Instant::now();
+        Ok(())
+    }
+
+    fn close_current_file(&mut self) -> Result<(), WriteError> {
+        if let Some((writer, path)) = self.current_file.take() {
+            writer.close()?;
+            // Drops the `.inprogress` extension, leaving `.parquet`
+            std::fs::rename(&path, path.with_extension(""))?;
+        }
+        Ok(())
+    }
+
+    fn is_rollover_needed(&self) -> bool {
+        let Some((writer, _)) = &self.current_file else {
+            return false;
+        };
+        let is_size_exceeded = self
+            .max_file_size
+            .is_some_and(|max_size| writer.bytes_written() + writer.in_progress_size() >= max_size);
+        let is_duration_exceeded = self
+            .max_file_duration
+            .is_some_and(|max_duration| self.current_file_opened_at.elapsed() >= max_duration);
+        is_size_exceeded || is_duration_exceeded
+    }
+}
+
+impl Writer for ParquetWriter {
+    fn write(&mut self, data: FormatterContext) -> Result<(), WriteError> {
+        for (index, value) in data.values.into_iter().enumerate() {
+            self.buffered_columns[index].push(value);
+        }
+        let time_column_idx = self.buffered_columns.len() - 2;
+        let diff_column_idx = self.buffered_columns.len() - 1;
+        self.buffered_columns[time_column_idx].push(Value::Int(data.time.0.try_into().unwrap()));
+        self.buffered_columns[diff_column_idx].push(Value::Int(data.diff.try_into().unwrap()));
+        Ok(())
+    }
+
+    fn flush(&mut self, forced: bool) -> Result<(), WriteError> {
+        if !self.buffered_columns[0].is_empty() {
+            if self.current_file.is_none() {
+                self.open_new_file()?;
+            }
+            let batch =
+                DeltaTableWriter::prepare_record_batch(&self.schema, &self.buffered_columns)?;
+            let (writer, _) = self
+                .current_file
+                .as_mut()
+                .expect("the file must have been opened");
+            writer.write(&batch)?;
+            for column in &mut self.buffered_columns {
+                column.clear();
+            }
+        }
+        if forced || self.is_rollover_needed() {
+            self.close_current_file()?;
+        }
+        Ok(())
+    }
+
+    fn single_threaded(&self) -> bool {
+        false
+    }
+}
+
+impl Drop for ParquetWriter {
+    fn drop(&mut self) {
+        if let Err(e) = self.flush(true) {
+            error!("Failed to finalize the parquet file: {e}");
+        }
+    }
+}
+
 pub struct MongoWriter {
     collection: MongoCollection<BsonDocument>,
     buffer: Vec<BsonDocument>,
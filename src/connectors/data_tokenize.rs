@@ -1,14 +1,25 @@
 // Copyright © 2024 Pathway
 
+use std::collections::{HashMap, VecDeque};
 use std::io::BufReader;
 use std::io::Read;
 use std::mem::take;
+use std::sync::Arc;
 
+use bytes::Bytes;
 use csv::Reader as CsvReader;
 use csv::ReaderBuilder as CsvReaderBuilder;
+use deltalake::parquet::file::reader::{FileReader, SerializedFileReader};
+use deltalake::parquet::file::serialized_reader::ReadOptionsBuilder;
+use deltalake::parquet::record::reader::RowIter as ParquetRowIterator;
+use deltalake::parquet::schema::types::Type as ParquetSchemaType;
+use rayon::prelude::*;
 
-use crate::connectors::data_storage::ReadMethod;
+use crate::connectors::data_storage::{
+    parquet_row_into_values_map, ParquetFilter, ReadMethod, ValuesMap,
+};
 use crate::connectors::{DataEventType, ReadError, ReaderContext};
+use crate::engine::Type;
 
 type TokenizedEntry = (ReaderContext, u64); // The second value is a position of the record within the object read
 
@@ -129,3 +140,151 @@ impl Tokenize for BufReaderTokenizer {
         }
     }
 }
+
+/// Decodes parquet objects into rows. The object is split into row groups,
+/// the row groups are pruned with the min-max statistics from the footer, and
+/// then up to `parallel_row_groups` of them are decoded in parallel. Only the
+/// columns present in `column_types` are decoded.
+pub struct ParquetTokenizer {
+    column_types: Arc<HashMap<String, Type>>,
+    filters: Arc<[ParquetFilter]>,
+    parallel_row_groups: usize,
+
+    current_event_type: DataEventType,
+    contents: Option<Bytes>,
+    pending_row_groups: VecDeque<usize>,
+    decoded_rows: VecDeque<ValuesMap>,
+    rows_read: u64,
+}
+
+impl ParquetTokenizer {
+    pub fn new(
+        column_types: HashMap<String, Type>,
+        filters: Vec<ParquetFilter>,
+        parallel_row_groups: usize,
+    ) -> Self {
+        Self {
+            column_types: Arc::new(column_types),
+            filters: filters.into(),
+            parallel_row_groups: parallel_row_groups.max(1),
+            current_event_type: DataEventType::Insert,
+            contents: None,
+            pending_row_groups: VecDeque::new(),
+            decoded_rows: VecDeque::new(),
+            rows_read: 0,
+        }
+    }
+
+    fn projection(
+        reader: &SerializedFileReader<Bytes>,
+        column_types: &HashMap<String, Type>,
+    ) -> Result<Option<ParquetSchemaType>, ReadError> {
+        let root_schema = reader.metadata().file_metadata().schema();
+        let projected_fields: Vec<_> = root_schema
+            .get_fields()
+            .iter()
+            .filter(|field| column_types.contains_key(field.name()))
+            .cloned()
+            .collect();
+        if projected_fields.is_empty() {
+            return Ok(None);
+        }
+        let projection = ParquetSchemaType::group_type_builder(root_schema.name())
+            .with_fields(projected_fields)
+            .build()?;
+        Ok(Some(projection))
+    }
+
+    fn decode_row_group(
+        contents: Bytes,
+        row_group_index: usize,
+        column_types: &HashMap<String, Type>,
+        filters: &[ParquetFilter],
+    ) -> Result<Vec<ValuesMap>, ReadError> {
+        let options = ReadOptionsBuilder::new()
+            .with_predicate(Box::new(move |_, index| index == row_group_index))
+            .build();
+        let reader = SerializedFileReader::new_with_options(contents, options)?;
+        let projection = Self::projection(&reader, column_types)?;
+        let rows = ParquetRowIterator::from_file_into(Box::new(reader)).project(projection)?;
+
+        let mut result = Vec::new();
+        for row in rows {
+            let values = parquet_row_into_values_map(&row?, column_types);
+            if filters.iter().all(|filter| filter.matches(&values)) {
+                result.push(values);
+            }
+        }
+        Ok(result)
+    }
+
+    fn decode_next_row_groups(&mut self) -> Result<(), ReadError> {
+        let Some(contents) = &self.contents else {
+            return Ok(());
+        };
+        let batch_size = self.parallel_row_groups.min(self.pending_row_groups.len());
+        let row_groups: Vec<usize> = self.pending_row_groups.drain(..batch_size).collect();
+        let column_types = self.column_types.as_ref();
+        let filters = self.filters.as_ref();
+        let decoded: Vec<_> = row_groups
+            .into_par_iter()
+            .map(|row_group_index| {
+                Self::decode_row_group(contents.clone(), row_group_index, column_types, filters)
+            })
+            .collect();
+        for rows in decoded {
+            self.decoded_rows.extend(rows?);
+        }
+        Ok(())
+    }
+}
+
+impl Tokenize for ParquetTokenizer {
+    fn set_new_reader(
+        &mut self,
+        mut source: Box<dyn Read + Send + 'static>,
+        data_event_type: DataEventType,
+    ) -> Result<(), ReadError> {
+        let mut contents = Vec::new();
+        source.read_to_end(&mut contents)?;
+        let contents = Bytes::from(contents);
+
+        let reader = SerializedFileReader::new(contents.clone())?;
+        self.pending_row_groups = reader
+            .metadata()
+            .row_groups()
+            .iter()
+            .enumerate()
+            .filter(|(_, row_group)| {
+                self.filters
+                    .iter()
+                    .all(|filter| filter.may_match_row_group(row_group))
+            })
+            .map(|(index, _)| index)
+            .collect();
+        self.contents = Some(contents);
+        self.decoded_rows.clear();
+        self.current_event_type = data_event_type;
+        self.rows_read = 0;
+        Ok(())
+    }
+
+    fn next_entry(&mut self) -> Result<Option<(ReaderContext, u64)>, ReadError> {
+        while self.decoded_rows.is_empty() {
+            if self.pending_row_groups.is_empty() {
+                self.contents = None;
+                return Ok(None);
+            }
+            self.decode_next_row_groups()?;
+        }
+        let values = self
+            .decoded_rows
+            .pop_front()
+            .expect("decoded rows must be non-empty");
+        self.rows_read += 1;
+        Ok(Some((
+            ReaderContext::from_diff(self.current_event_type, None, values),
+            self.rows_read,
+        )))
+    }
+}
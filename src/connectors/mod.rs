@@ -4,6 +4,7 @@ use differential_dataflow::input::InputSession;
 use itertools::Itertools;
 use log::{error, info, warn};
 use std::cell::RefCell;
+use std::collections::VecDeque;
 use std::env;
 use std::ops::ControlFlow;
 use std::rc::Rc;
@@ -88,8 +89,103 @@ impl StartedConnectorState {
     }
 }
 
+/// Determines when a connector commits the entries it has read.
+#[derive(Debug, Clone, Copy)]
+pub enum CommitPolicy {
+    /// Commit once per the given duration.
+    Periodic(Duration),
+
+    /// Commit as soon as the dataflow has processed everything committed before.
+    /// While it's busy, keep extending the batch, so that the estimated p99 end-to-end
+    /// latency stays within `target_latency`, but never longer than `max_duration`.
+    Adaptive {
+        max_duration: Duration,
+        target_latency: Duration,
+    },
+}
+
+/// The number of the most recent batch processing durations used for estimating
+/// the p99 processing latency in the adaptive commit policy.
+const ADAPTIVE_COMMIT_LATENCY_SAMPLES: usize = 128;
+
+struct AdaptiveCommitState {
+    max_duration: Duration,
+    target_latency: Duration,
+    batch_started_at: Option<SystemTime>,
+    unfinished_batches: VecDeque<(Timestamp, SystemTime)>,
+    processing_durations: VecDeque<Duration>,
+    processing_duration_p99: Duration,
+}
+
+impl AdaptiveCommitState {
+    fn new(max_duration: Duration, target_latency: Duration) -> Self {
+        Self {
+            max_duration,
+            target_latency,
+            batch_started_at: None,
+            unfinished_batches: VecDeque::new(),
+            processing_durations: VecDeque::with_capacity(ADAPTIVE_COMMIT_LATENCY_SAMPLES),
+            processing_duration_p99: Duration::ZERO,
+        }
+    }
+
+    fn on_data_read(&mut self) {
+        if self.batch_started_at.is_none() {
+            self.batch_started_at = Some(SystemTime::now());
+        }
+    }
+
+    fn on_commit_skipped(&mut self) {
+        self.batch_started_at = None;
+    }
+
+    fn on_committed(&mut self, timestamp: Timestamp) {
+        self.batch_started_at = None;
+        self.unfinished_batches
+            .push_back((timestamp, SystemTime::now()));
+    }
+
+    fn update_finished_batches(&mut self, probe: &Handle<Timestamp>, now: SystemTime) {
+        let mut updated = false;
+        while let Some((timestamp, committed_at)) = self.unfinished_batches.front() {
+            if probe.less_than(timestamp) {
+                break;
+            }
+            if self.processing_durations.len() == ADAPTIVE_COMMIT_LATENCY_SAMPLES {
+                self.processing_durations.pop_front();
+            }
+            self.processing_durations
+                .push_back(now.duration_since(*committed_at).unwrap_or(Duration::ZERO));
+            self.unfinished_batches.pop_front();
+            updated = true;
+        }
+        if updated {
+            let mut durations: Vec<_> = self.processing_durations.iter().copied().collect();
+            durations.sort_unstable();
+            self.processing_duration_p99 = durations[(durations.len() - 1) * 99 / 100];
+        }
+    }
+
+    fn next_commit_at(&self) -> Option<SystemTime> {
+        let batch_started_at = self.batch_started_at?;
+        if self.unfinished_batches.is_empty() {
+            // The dataflow is idle, so there is no reason to wait
+            return Some(batch_started_at);
+        }
+        // If the target can't be met anyway, prefer bigger batches for throughput
+        let max_wait = self
+            .target_latency
+            .checked_sub(self.processing_duration_p99)
+            .map_or(self.max_duration, |max_wait| {
+                max_wait.min(self.max_duration)
+            });
+        Some(batch_started_at + max_wait)
+    }
+}
+
 pub struct Connector {
-    commit_duration: Option<Duration>,
+    commit_policy: Option<CommitPolicy>,
+    adaptive_commit_state: Option<AdaptiveCommitState>,
     current_timestamp: Timestamp,
     num_columns: usize,
     current_frontier: OffsetAntichain,
@@ -189,13 +285,21 @@ impl Connector {
         arrived data.
     */
     pub fn new(
-        commit_duration: Option<Duration>,
+        commit_policy: Option<CommitPolicy>,
         num_columns: usize,
         skip_all_errors: bool,
         error_logger: Rc<dyn LogError>,
     ) -> Self {
+        let adaptive_commit_state = match commit_policy {
+            Some(CommitPolicy::Adaptive {
+                max_duration,
+                target_latency,
+            }) => Some(AdaptiveCommitState::new(max_duration, target_latency)),
+            _ => None,
+        };
         Connector {
-            commit_duration,
+            commit_policy,
+            adaptive_commit_state,
             current_timestamp: Timestamp(0), // default is 0 now. If changing, make sure it is even (required for alt-neu).
             num_columns,
             current_frontier: OffsetAntichain::new(),
@@ -204,6 +308,13 @@ impl Connector {
         }
     }
 
+    fn next_commit_at(&self, next_periodic_commit_at: Option<SystemTime>) -> Option<SystemTime> {
+        match &self.adaptive_commit_state {
+            Some(adaptive_commit_state) => adaptive_commit_state.next_commit_at(),
+            None => next_periodic_commit_at,
+        }
+    }
+
     fn advance_time(&mut self, input_session: &mut dyn InputAdaptor<Timestamp>) -> Timestamp {
         let new_timestamp = Timestamp::new_from_current_time();
         let timestamp_updated = self.current_timestamp <= new_timestamp;
@@ -212,6 +323,9 @@ impl Connector {
         } else {
             warn!("The current timestamp is lower than the last one saved");
         }
+        if let Some(adaptive_commit_state) = &mut self.adaptive_commit_state {
+            adaptive_commit_state.on_committed(self.current_timestamp);
+        }
 
         input_session.advance_to(self.current_timestamp);
         input_session.flush();
@@ -486,7 +600,12 @@ impl Connector {
             })
             .expect("connector thread creation failed");
 
-        let mut next_commit_at = self.commit_duration.map(|x| SystemTime::now() + x);
+        let mut next_periodic_commit_at = match self.commit_policy {
+            Some(CommitPolicy::Periodic(commit_duration)) => {
+                Some(SystemTime::now() + commit_duration)
+            }
+            _ => None,
+        };
         let mut backfilling_finished = false;
 
         let connector_monitor = Rc::new(RefCell::new(ConnectorMonitor::new(reader_name)));
@@ -501,7 +620,11 @@ impl Connector {
                 return ControlFlow::Continue(Some(iteration_start));
             }
 
-            if let Some(next_commit_at_timestamp) = next_commit_at {
+            if let Some(adaptive_commit_state) = &mut self.adaptive_commit_state {
+                adaptive_commit_state.update_finished_batches(&probe, iteration_start);
+            }
+
+            if let Some(next_commit_at_timestamp) = self.next_commit_at(next_periodic_commit_at) {
                 if next_commit_at_timestamp <= iteration_start {
                     if backfilling_finished && commit_allowed {
                         /*
@@ -519,9 +642,13 @@ impl Connector {
                             &mut snapshot_writer,
                             &mut Some(&mut *connector_monitor.borrow_mut()),
                         );
+                    } else if let Some(adaptive_commit_state) = &mut self.adaptive_commit_state {
+                        adaptive_commit_state.on_commit_skipped();
                     }
 
-                    next_commit_at = Some(next_commit_at_timestamp + self.commit_duration.unwrap());
+                    if let Some(CommitPolicy::Periodic(commit_duration)) = self.commit_policy {
+                        next_periodic_commit_at = Some(next_commit_at_timestamp + commit_duration);
+                    }
                 }
             }
 
@@ -529,7 +656,7 @@ impl Connector {
             loop {
                 n_entries_in_batch += 1;
                 if n_entries_in_batch == 100_000 {
-                    return ControlFlow::Continue(next_commit_at);
+                    return ControlFlow::Continue(self.next_commit_at(next_periodic_commit_at));
                 }
                 match receiver.try_recv() {
                     Ok(Entry::Realtime(ReadResult::Finished)) => {
@@ -566,7 +693,9 @@ impl Connector {
                             &mut commit_allowed,
                         );
                     }
-                    Err(TryRecvError::Empty) => return ControlFlow::Continue(next_commit_at),
+                    Err(TryRecvError::Empty) => {
+                        return ControlFlow::Continue(self.next_commit_at(next_periodic_commit_at))
+                    }
                     Err(TryRecvError::Disconnected) => {
                         (*connector_monitor).borrow_mut().finish();
                         return ControlFlow::Break(());
@@ -619,6 +748,11 @@ impl Connector {
                     parser.on_new_source_started(&metadata);
                 }
                 ReadResult::Data(reader_context, offset) => {
+                    if *backfilling_finished && *commit_allowed {
+                        if let Some(adaptive_commit_state) = &mut self.adaptive_commit_state {
+                            adaptive_commit_state.on_data_read();
+                        }
+                    }
                     let mut parsed_entries = match parser.parse(&reader_context) {
                         Ok(entries) => entries,
                         Err(e) => {
@@ -1,7 +1,8 @@
 // Copyright © 2024 Pathway
 
 use std::collections::VecDeque;
-use std::time::{Duration, Instant};
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::time::{Duration, Instant, SystemTime};
 
 use log::{info, warn};
 use pyo3::pyclass;
@@ -17,6 +18,9 @@ pub struct ConnectorStats {
     pub num_messages_recently_committed: usize,
     #[pyo3(get, set)]
     pub finished: bool,
+    /// Wall-clock time of the last commit that carried data, in milliseconds since the epoch
+    #[pyo3(get, set)]
+    pub last_commit_at_ms: Option<u64>,
 }
 
 struct ConnectorLogger {
@@ -100,6 +104,7 @@ impl ConnectorMonitor {
                 num_messages_in_last_minute: 0,
                 num_messages_recently_committed: 0,
                 finished: false,
+                last_commit_at_ms: None,
             },
             last_minute_queue: VecDeque::new(),
             current_num_messages: 0,
@@ -132,6 +137,12 @@ impl ConnectorMonitor {
         self.last_minute_queue
             .push_back((self.current_num_messages, now));
         self.stats.num_messages_from_start += self.current_num_messages;
+        if self.current_num_messages > 0 {
+            self.stats.last_commit_at_ms = SystemTime::now()
+                .duration_since(SystemTime::UNIX_EPOCH)
+                .ok()
+                .and_then(|duration| u64::try_from(duration.as_millis()).ok());
+        }
         self.logger.on_commit(now, self.current_num_messages);
         self.current_num_messages = 0;
     }
@@ -145,6 +156,70 @@ impl ConnectorMonitor {
     }
 }
 
+#[derive(Debug, Clone, Copy)]
+#[pyclass]
+pub struct OutputQueueStats {
+    #[pyo3(get, set)]
+    pub queue_depth: usize,
+    #[pyo3(get, set)]
+    pub in_flight_batches: usize,
+    #[pyo3(get, set)]
+    pub last_flush_latency_ms: u64,
+    #[pyo3(get, set)]
+    pub max_flush_latency_ms: u64,
+    #[pyo3(get, set)]
+    pub num_flushes: u64,
+}
+
+/// The state of the pipeline between the workers and an output connector thread.
+/// It is updated by both sides and read by the metrics exporters, hence atomics.
+#[derive(Debug, Default)]
+pub struct OutputQueueMetrics {
+    queue_depth: AtomicUsize,
+    in_flight_batches: AtomicUsize,
+    last_flush_latency_ms: AtomicU64,
+    max_flush_latency_ms: AtomicU64,
+    num_flushes: AtomicU64,
+}
+
+impl OutputQueueMetrics {
+    pub fn on_enqueued(&self) {
+        self.queue_depth.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn on_dequeued(&self) {
+        self.queue_depth.fetch_sub(1, Ordering::Relaxed);
+    }
+
+    pub fn on_batch_written(&self) {
+        self.in_flight_batches.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn in_flight_batches(&self) -> usize {
+        self.in_flight_batches.load(Ordering::Relaxed)
+    }
+
+    pub fn on_flushed(&self, latency: Duration) {
+        let latency_ms = u64::try_from(latency.as_millis()).unwrap_or(u64::MAX);
+        self.in_flight_batches.store(0, Ordering::Relaxed);
+        self.last_flush_latency_ms
+            .store(latency_ms, Ordering::Relaxed);
+        self.max_flush_latency_ms
+            .fetch_max(latency_ms, Ordering::Relaxed);
+        self.num_flushes.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn get_stats(&self) -> OutputQueueStats {
+        OutputQueueStats {
+            queue_depth: self.queue_depth.load(Ordering::Relaxed),
+            in_flight_batches: self.in_flight_batches.load(Ordering::Relaxed),
+            last_flush_latency_ms: self.last_flush_latency_ms.load(Ordering::Relaxed),
+            max_flush_latency_ms: self.max_flush_latency_ms.load(Ordering::Relaxed),
+            num_flushes: self.num_flushes.load(Ordering::Relaxed),
+        }
+    }
+}
+
 // TODO: incorporate in monitor (?)
 pub struct OutputConnectorStats {
     name: String,
@@ -10,18 +10,27 @@ pub mod maybe_total;
 pub mod operators;
 pub mod persist;
 pub mod shard;
+mod skew;
+pub mod spill;
 mod variable;
 
 use crate::connectors::adaptors::{GenericValues, ValuesSessionAdaptor};
 use crate::connectors::data_format::{Formatter, Parser};
 use crate::connectors::data_storage::{ReaderBuilder, Writer};
-use crate::connectors::monitoring::{ConnectorMonitor, ConnectorStats, OutputConnectorStats};
-use crate::connectors::{read_persisted_state, Connector, PersistenceMode, SnapshotAccess};
+use crate::connectors::monitoring::{
+    ConnectorMonitor, ConnectorStats, OutputConnectorStats, OutputQueueMetrics, OutputQueueStats,
+};
+use crate::connectors::{
+    read_persisted_state, CommitPolicy, Connector, PersistenceMode, SnapshotAccess,
+};
 use crate::engine::dataflow::operators::external_index::UseExternalIndexAsOfNow;
 use crate::engine::dataflow::operators::gradual_broadcast::GradualBroadcast;
 use crate::engine::dataflow::operators::time_column::{
     Epsilon, TimeColumnForget, TimeColumnFreeze,
 };
+use crate::engine::memory::PurgeThreshold;
+use crate::engine::operator_metrics::{OperatorMetricsRegistry, WorkerOperatorMetrics};
+use crate::engine::profiler::Profile;
 use crate::engine::telemetry::Config as TelemetryConfig;
 use crate::engine::value::HashInto;
 use crate::persistence::config::PersistenceManagerOuterConfig;
@@ -40,16 +49,19 @@ use std::iter::once;
 use std::marker::PhantomData;
 use std::ops::{ControlFlow, Deref};
 use std::panic::{catch_unwind, resume_unwind, AssertUnwindSafe};
+use std::path::PathBuf;
 use std::rc::Rc;
 use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::{mpsc, Arc};
+use std::sync::Arc;
 use std::thread::{Builder, JoinHandle};
-use std::time::{Duration, SystemTime};
+use std::time::{Duration, Instant, SystemTime};
 use std::{env, slice};
 
 use arcstr;
 use arcstr::ArcStr;
-use crossbeam_channel::{bounded, never, select, Receiver, RecvError, Sender};
+use crossbeam_channel::{
+    bounded, never, select, unbounded, Receiver, RecvError, Sender, TryRecvError,
+};
 use derivative::Derivative;
 use differential_dataflow::collection::concatenate;
 use differential_dataflow::difference::Semigroup;
@@ -74,7 +86,7 @@ use persist::{
 use pyo3::PyObject;
 use serde::{Deserialize, Serialize};
 use timely::dataflow::operators::probe::Handle as ProbeHandle;
-use timely::dataflow::operators::{Filter, Inspect, Probe};
+use timely::dataflow::operators::{Broadcast, Filter, Inspect, Probe};
 use timely::dataflow::operators::{Map, ToStream as _};
 use timely::dataflow::scopes::Child;
 use timely::execute;
@@ -90,9 +102,11 @@ use self::operators::output::{ConsolidateForOutput, OutputBatch};
 use self::operators::prev_next::add_prev_next_pointers;
 use self::operators::stateful_reduce::StatefulReduce;
 use self::operators::time_column::{MaxTimestamp, TimeColumnBuffer};
-use self::operators::{ArrangeWithTypes, MapWithConsistentDeletions, MapWrapped};
+use self::operators::{ArrangeLocally, ArrangeWithTypes, MapWithConsistentDeletions, MapWrapped};
 use self::operators::{MaybeTotal, Reshard};
 use self::shard::Shard;
+use self::skew::HotKeys;
+use self::spill::SpillValSpine;
 use self::variable::SafeVariable;
 use super::error::{DataError, DataResult, DynError, DynResult, Trace};
 use super::expression::AnyExpression;
@@ -114,9 +128,9 @@ use super::report_error::{
 use super::telemetry::maybe_run_telemetry_thread;
 use super::{
     BatchWrapper, ColumnHandle, ColumnPath, ColumnProperties, ComplexColumn, Error, ErrorLogHandle,
-    Expression, ExpressionData, Graph, IterationLogic, IxKeyPolicy, JoinData, JoinType, Key,
-    LegacyTable, OperatorStats, ProberStats, Reducer, ReducerData, Result, ShardPolicy,
-    TableHandle, TableProperties, Timestamp, UniverseHandle, Value,
+    Expression, ExpressionData, Graph, IterationLogic, IxKeyPolicy, JoinData, JoinStrategy,
+    JoinType, Key, LegacyTable, OperatorStats, ProberStats, Reducer, ReducerData, Result,
+    ShardPolicy, TableHandle, TableProperties, Timestamp, UniverseHandle, Value,
 };
 use crate::external_integration::{
     make_accessor, make_option_accessor, ExternalIndex, IndexDerivedImpl,
@@ -135,6 +149,8 @@ const YOLO: &[&str] = &[
 
 const OUTPUT_RETRIES: usize = 5;
 const ERROR_LOG_FLUSH_PERIOD: Duration = Duration::from_secs(1);
+// minibatches of at least that many rows are evaluated column by column in expression_table
+const EXPRESSION_BATCH_EVALUATION_THRESHOLD: usize = 64;
 
 #[derive(Clone, Debug)]
 struct ErrorReporter {
@@ -159,6 +175,8 @@ type ArrangedBySelf<S, K, R = isize> =
     Arranged<S, TraceAgent<OrdKeySpine<K, <S as MaybeTotalScope>::MaybeTotalTimestamp, R>>>;
 type ArrangedByKey<S, K, V, R = isize> =
     Arranged<S, TraceAgent<OrdValSpine<K, V, <S as MaybeTotalScope>::MaybeTotalTimestamp, R>>>;
+type SpillableArrangedByKey<S, K, V, R = isize> =
+    Arranged<S, TraceAgent<SpillValSpine<K, V, <S as MaybeTotalScope>::MaybeTotalTimestamp, R>>>;
 
 type Var<S, D, R = isize> = SafeVariable<S, D, R>;
 
@@ -666,12 +684,16 @@ impl Prober {
     }
 
     #[allow(clippy::cast_possible_truncation)]
+    #[allow(clippy::too_many_arguments)]
     fn update(
         &mut self,
         input_probe: &ProbeHandle<Timestamp>,
         output_probe: &ProbeHandle<Timestamp>,
         intermediate_probes: &HashMap<usize, ProbeHandle<Timestamp>>,
         connector_monitors: &[Rc<RefCell<ConnectorMonitor>>],
+        output_queue_metrics: &[(String, Arc<OutputQueueMetrics>)],
+        operator_metrics: Option<&WorkerOperatorMetrics>,
+        memory_budget: Option<usize>,
     ) {
         let now = Lazy::new(SystemTime::now);
 
@@ -713,6 +735,11 @@ impl Prober {
             })
             .collect();
 
+        let output_queue_stats: Vec<(String, OutputQueueStats)> = output_queue_metrics
+            .iter()
+            .map(|(name, metrics)| (name.clone(), metrics.get_stats()))
+            .collect();
+
         if changed || self.run_callback_every_time {
             if self.intermediate_probes_required {
                 for (id, probe) in intermediate_probes {
@@ -726,6 +753,9 @@ impl Prober {
                 output_stats: Self::create_stats(output_probe, self.input_time),
                 operators_stats: self.stats.clone(),
                 connector_stats,
+                output_queue_stats,
+                operator_metrics: operator_metrics.map(|metrics| metrics.registry().clone()),
+                memory_budget,
             };
 
             (self.callback)(prober_stats);
@@ -764,6 +794,7 @@ struct DataflowGraphInner<S: MaybeTotalScope> {
     pollers: Vec<Poller>,
     connector_threads: Vec<JoinHandle<()>>,
     connector_monitors: Vec<Rc<RefCell<ConnectorMonitor>>>,
+    output_queue_metrics: Vec<(String, Arc<OutputQueueMetrics>)>,
     error_reporter: ErrorReporter,
     input_probe: ProbeHandle<S::Timestamp>,
     output_probe: ProbeHandle<S::Timestamp>,
@@ -777,6 +808,7 @@ struct DataflowGraphInner<S: MaybeTotalScope> {
     default_error_log: Option<ErrorLog>,
     current_error_log: Option<ErrorLog>,
     current_operator_properties: Option<OperatorProperties>,
+    operator_metrics: Option<WorkerOperatorMetrics>,
 }
 
 #[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
@@ -966,6 +998,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         config: Arc<Config>,
         terminate_on_error: bool,
         default_error_log: Option<ErrorLog>,
+        operator_metrics: Option<WorkerOperatorMetrics>,
     ) -> Result<Self> {
         Ok(Self {
             scope,
@@ -977,6 +1010,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             pollers: Vec::new(),
             connector_threads: Vec::new(),
             connector_monitors: Vec::new(),
+            output_queue_metrics: Vec::new(),
             error_reporter,
             input_probe: ProbeHandle::new(),
             output_probe: ProbeHandle::new(),
@@ -990,6 +1024,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             default_error_log,
             current_error_log: None,
             current_operator_properties: None,
+            operator_metrics,
         })
     }
 
@@ -1267,30 +1302,75 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
 
         let new_values = if append_only_or_deterministic {
             // If the whole stream stream is append_only or all expressions are deterministic
-            table.values_consolidated().map_wrapped_named(
+            let prefers_batch_evaluation = expressions
+                .iter()
+                .any(|expression_data| expression_data.expression.prefers_batch_evaluation());
+            table.values_consolidated().map_batch_wrapped_named(
                 "expression_table::evaluate_expression",
                 wrapper,
-                move |(key, values)| {
-                    let args: Vec<Value> = column_paths
-                        .iter()
-                        .map(|path| path.extract(&key, &values))
-                        .collect::<Result<_>>()
-                        .unwrap_with_reporter(&error_reporter);
+                move |batch| {
+                    let (keys, rows): (Vec<Key>, Vec<Vec<Value>>) = batch
+                        .into_iter()
+                        .map(|(key, values)| {
+                            let args: Vec<Value> = column_paths
+                                .iter()
+                                .map(|path| path.extract(&key, &values))
+                                .collect::<Result<_>>()
+                                .unwrap_with_reporter(&error_reporter);
+                            (key, args)
+                        })
+                        .unzip();
                     // if a better behavior for append only is needed (then only output has to be append only, not input):
                     // split this closure here into two - first part (extraction from paths) before consolidation
                     // and second part (evals) after consolidation
-                    let new_values = expressions.iter().map(|expression_data| {
-                        let result = expression_data
-                            .expression
-                            .eval(&args)
-                            .unwrap_or_log_with_trace(
-                                error_logger.as_ref(),
-                                expression_data.properties.trace(),
-                                Value::Error,
-                            );
-                        result
-                    });
-                    (key, Value::Tuple(new_values.collect()))
+                    if rows.len() < EXPRESSION_BATCH_EVALUATION_THRESHOLD
+                        && !prefers_batch_evaluation
+                    {
+                        return keys
+                            .into_iter()
+                            .zip(rows)
+                            .map(|(key, args)| {
+                                let new_values = expressions.iter().map(|expression_data| {
+                                    expression_data
+                                        .expression
+                                        .eval(&args)
+                                        .unwrap_or_log_with_trace(
+                                            error_logger.as_ref(),
+                                            expression_data.properties.trace(),
+                                            Value::Error,
+                                        )
+                                });
+                                (key, Value::Tuple(new_values.collect()))
+                            })
+                            .collect();
+                    }
+                    let rows: Vec<&[Value]> = rows.iter().map(Vec::as_slice).collect();
+                    let mut new_columns: Vec<_> = expressions
+                        .iter()
+                        .map(|expression_data| {
+                            expression_data
+                                .expression
+                                .eval_batch(&rows)
+                                .into_iter()
+                                .map(|result| {
+                                    result.unwrap_or_log_with_trace(
+                                        error_logger.as_ref(),
+                                        expression_data.properties.trace(),
+                                        Value::Error,
+                                    )
+                                })
+                                .collect::<Vec<_>>()
+                                .into_iter()
+                        })
+                        .collect();
+                    keys.into_iter()
+                        .map(|key| {
+                            let new_values = new_columns
+                                .iter_mut()
+                                .map(|column| column.next().expect("column too short"));
+                            (key, Value::Tuple(new_values.collect()))
+                        })
+                        .collect()
                 },
             )
         } else {
@@ -1886,6 +1966,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             let wrapped = match value {
                 Value::IntArray(array) => Ok(flatten_ndarray(&array)),
                 Value::FloatArray(array) => Ok(flatten_ndarray(&array)),
+                Value::Float32Array(array) => Ok(flatten_ndarray(&array)),
                 Value::Tuple(array) => Ok((*array).to_vec()),
                 Value::String(s) => Ok((*s)
                     .chars()
@@ -2284,7 +2365,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         let filter_acc =
             make_option_accessor(query_stream.filter_column, self.error_reporter.clone());
 
-        let extended_external_index = Box::new(IndexDerivedImpl::new(
+        let mut extended_external_index = IndexDerivedImpl::new(
             external_index,
             self.create_error_logger()?,
             data_acc,
@@ -2292,11 +2373,18 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             query_acc,
             limit_acc,
             filter_acc,
-        ));
+        );
+        if let (Some(operator_metrics), Some(operator_properties)) =
+            (&self.operator_metrics, &self.current_operator_properties)
+        {
+            extended_external_index = extended_external_index.with_size_reporter(
+                operator_metrics.external_index_size_reporter(operator_properties.id),
+            );
+        }
 
         let new_values = index
             .values()
-            .use_external_index_as_of_now(queries.values(), extended_external_index);
+            .use_external_index_as_of_now(queries.values(), Box::new(extended_external_index));
 
         Ok(self
             .tables
@@ -2310,6 +2398,8 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
         right_data: JoinData,
         shard_policy: ShardPolicy,
         join_type: JoinType,
+        strategy: JoinStrategy,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         fn extract_join_key(
@@ -2375,7 +2465,6 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
                 });
         let join_left = left_with_join_key
             .flat_map(|(join_key, left_key_values)| Some((join_key?, left_key_values)));
-        let join_left_arranged: ArrangedByKey<S, Key, (Key, Value)> = join_left.arrange();
         let right_with_join_key =
             right_table
                 .values()
@@ -2392,12 +2481,70 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
                 });
         let join_right = right_with_join_key
             .flat_map(|(join_key, right_key_values)| Some((join_key?, right_key_values)));
-        let join_right_arranged: ArrangedByKey<S, Key, (Key, Value)> = join_right.arrange();
 
-        let join_left_right = join_left_arranged
-            .join_core(&join_right_arranged, |join_key, left_key, right_key| {
+        let hot_keys = HotKeys::new(
+            skewed_keys
+                .iter()
+                .map(|values| shard_policy.generate_key(values)),
+            self.scope.peers(),
+        );
+        let join_left_right = if strategy != JoinStrategy::Shuffle {
+            // the broadcast side is replicated to all workers and joined there with the
+            // rows of the other side, which stay on the workers that hold them
+            let (join_left, join_right) = match strategy {
+                JoinStrategy::BroadcastLeft => {
+                    (join_left.inner.broadcast().as_collection(), join_right)
+                }
+                _ => (join_left, join_right.inner.broadcast().as_collection()),
+            };
+            let join_left_arranged: SpillableArrangedByKey<S, Key, (Key, Value)> =
+                join_left.arrange_locally_named("Arrange: join::broadcast_left");
+            let join_right_arranged: SpillableArrangedByKey<S, Key, (Key, Value)> =
+                join_right.arrange_locally_named("Arrange: join::broadcast_right");
+            join_left_arranged.join_core(&join_right_arranged, |join_key, left_key, right_key| {
                 once((*join_key, left_key.clone(), right_key.clone()))
-            });
+            })
+        } else if let Some(hot_keys) = hot_keys.map(Rc::new) {
+            // rows of the left side with a hot join key are spread over the workers
+            // and the matching rows of the right side are replicated to all of them
+            let join_left_arranged: SpillableArrangedByKey<S, Key, (Key, (Key, Value))> = join_left
+                .map_named("join::salt_left", {
+                    let hot_keys = hot_keys.clone();
+                    move |(join_key, (left_key, left_values))| {
+                        (
+                            hot_keys.salted(join_key, &left_key),
+                            (join_key, (left_key, left_values)),
+                        )
+                    }
+                })
+                .arrange();
+            let join_right_arranged: SpillableArrangedByKey<S, Key, (Key, (Key, Value))> =
+                join_right
+                    .flat_map(move |(join_key, right_key_values)| {
+                        hot_keys
+                            .all_salted(join_key)
+                            .into_iter()
+                            .map(move |salted_key| {
+                                (salted_key, (join_key, right_key_values.clone()))
+                            })
+                    })
+                    .arrange();
+            join_left_arranged.join_core(
+                &join_right_arranged,
+                |_salted_key, (left_join_key, left_key), (right_join_key, right_key)| {
+                    (left_join_key == right_join_key)
+                        .then(|| (*left_join_key, left_key.clone(), right_key.clone()))
+                },
+            )
+        } else {
+            let join_left_arranged: SpillableArrangedByKey<S, Key, (Key, Value)> =
+                join_left.arrange();
+            let join_right_arranged: SpillableArrangedByKey<S, Key, (Key, Value)> =
+                join_right.arrange();
+            join_left_arranged.join_core(&join_right_arranged, |join_key, left_key, right_key| {
+                once((*join_key, left_key.clone(), right_key.clone()))
+            })
+        };
 
         let join_left_right_to_result_fn = match join_type {
             JoinType::LeftKeysFull | JoinType::LeftKeysSubset => {
@@ -2602,9 +2749,12 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
             .tables
             .get(table_handle)
             .ok_or(Error::InvalidTableHandle)?;
-        table
-            .values()
-            .probe_with(self.probes.entry(operator_id).or_default());
+        let values = table.values();
+        if let Some(operator_metrics) = &self.operator_metrics {
+            let count_retractions = operator_metrics.retractions_counter(operator_id);
+            values.inspect(move |(_data, _time, diff)| count_retractions(*diff));
+        }
+        values.probe_with(self.probes.entry(operator_id).or_default());
         Ok(())
     }
 
@@ -2633,6 +2783,13 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S> {
     }
 
     fn set_operator_properties(&mut self, operator_properties: OperatorProperties) -> Result<()> {
+        if let Some(operator_metrics) = &self.operator_metrics {
+            operator_metrics.start_operator(
+                &mut self.scope,
+                operator_properties.id,
+                &operator_properties.trace,
+            );
+        }
         self.current_operator_properties = Some(operator_properties);
         Ok(())
     }
@@ -2753,6 +2910,7 @@ trait DataflowReducer<S: MaybeTotalScope> {
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        hot_keys: Option<&Rc<HotKeys>>,
         error_logger: Rc<dyn LogError>,
         trace: Trace,
         graph: &mut DataflowGraphInner<S>,
@@ -2767,6 +2925,7 @@ where
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        hot_keys: Option<&Rc<HotKeys>>,
         error_logger: Rc<dyn LogError>,
         _trace: Trace,
         graph: &mut DataflowGraphInner<S>,
@@ -2774,6 +2933,7 @@ where
         let initialized = values.map_named("DataFlowReducer::reduce::init", {
             let self_ = self.clone();
             let error_logger = error_logger.clone();
+            let hot_keys = hot_keys.cloned();
             move |(source_key, result_key, values)| {
                 let state = if values.contains(&Value::Error) {
                     None
@@ -2782,29 +2942,46 @@ where
                         .init(&source_key, &values)
                         .ok_with_logger(error_logger.as_ref())
                 };
+                let result_key = match &hot_keys {
+                    Some(hot_keys) => hot_keys.salted(result_key, &source_key),
+                    None => result_key,
+                };
                 (result_key, state)
             }
         });
-        Ok(graph
-            .maybe_persist(initialized, "DataFlowReducer::reduce")?
-            .reduce({
-                let self_ = self.clone();
-                move |_key, input, output| {
-                    let result = if input.iter().any(|&(state, _)| state.is_none()) {
-                        None // None means that the state for a given key contains Value::Error
-                    } else {
-                        self_
-                            .combine(input.iter().map(|&(state, cnt)| {
-                                (
-                                    state.as_ref().unwrap(),
-                                    usize::try_from(cnt).unwrap().try_into().unwrap(),
-                                )
-                            }))
-                            .ok_with_logger(error_logger.as_ref())
-                    };
-                    output.push((result, 1));
-                }
-            })
+        let combine = {
+            let self_ = self.clone();
+            move |_key: &Key,
+                  input: &[(&Option<R::State>, isize)],
+                  output: &mut Vec<(Option<R::State>, isize)>| {
+                let result = if input.iter().any(|&(state, _)| state.is_none()) {
+                    None // None means that the state for a given key contains Value::Error
+                } else {
+                    self_
+                        .combine(input.iter().map(|&(state, cnt)| {
+                            (
+                                state.as_ref().unwrap(),
+                                usize::try_from(cnt).unwrap().try_into().unwrap(),
+                            )
+                        }))
+                        .ok_with_logger(error_logger.as_ref())
+                };
+                output.push((result, 1));
+            }
+        };
+        let initialized = graph.maybe_persist(initialized, "DataFlowReducer::reduce")?;
+        let initialized = match hot_keys {
+            Some(hot_keys) => hot_keys.combine_partials(
+                &initialized,
+                "DataFlowReducer::reduce::partial",
+                combine.clone(),
+            ),
+            None => initialized,
+        };
+        let arranged: SpillableArrangedByKey<S, Key, Option<R::State>> =
+            initialized.arrange_named("Arrange: DataFlowReducer::reduce");
+        Ok(arranged
+            .reduce_named("DataFlowReducer::reduce", combine)
             .map_named("DataFlowReducer::reduce", move |(key, state)| {
                 let result = if let Some(state) = state {
                     self.finish(state)
@@ -2821,6 +2998,7 @@ impl<S: MaybeTotalScope> DataflowReducer<S> for IntSumReducer {
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        hot_keys: Option<&Rc<HotKeys>>,
         error_logger: Rc<dyn LogError>,
         _trace: Trace,
         graph: &mut DataflowGraphInner<S>,
@@ -2828,6 +3006,7 @@ impl<S: MaybeTotalScope> DataflowReducer<S> for IntSumReducer {
         let initialized = values
             .map_named("IntSumReducer::reduce::init", {
                 let self_ = self.clone();
+                let hot_keys = hot_keys.cloned();
                 move |(source_key, result_key, values)| {
                     let state = if values.contains(&Value::Error) {
                         self_.init_error()
@@ -2836,12 +3015,20 @@ impl<S: MaybeTotalScope> DataflowReducer<S> for IntSumReducer {
                             .init(&source_key, &values[0])
                             .unwrap_or_else_log(error_logger.as_ref(), || self_.init_error())
                     };
+                    let result_key = match &hot_keys {
+                        Some(hot_keys) => hot_keys.salted(result_key, &source_key),
+                        None => result_key,
+                    };
                     (result_key, state)
                 }
             })
             .explode(|(key, state)| once((key, state)));
-        Ok(graph
-            .maybe_persist(initialized, "IntSumReducer::reduce")?
+        let initialized = graph.maybe_persist(initialized, "IntSumReducer::reduce")?;
+        let initialized = match hot_keys {
+            Some(hot_keys) => hot_keys.combine_counted_partials(&initialized),
+            None => initialized,
+        };
+        Ok(initialized
             .count()
             .map_named("IntSumReducer::reduce", move |(key, state)| {
                 (key, self.finish(state))
@@ -2854,16 +3041,24 @@ impl<S: MaybeTotalScope> DataflowReducer<S> for CountReducer {
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        hot_keys: Option<&Rc<HotKeys>>,
         _error_logger: Rc<dyn LogError>,
         _trace: Trace,
         graph: &mut DataflowGraphInner<S>,
     ) -> Result<Values<S>> {
-        let initialized = values.map_named(
-            "CountReducer::reduce::init",
-            |(_source_key, result_key, _values)| (result_key),
-        );
-        Ok(graph
-            .maybe_persist(initialized, "CountReducer::reduce")?
+        let initialized = values.map_named("CountReducer::reduce::init", {
+            let hot_keys = hot_keys.cloned();
+            move |(source_key, result_key, _values)| match &hot_keys {
+                Some(hot_keys) => hot_keys.salted(result_key, &source_key),
+                None => result_key,
+            }
+        });
+        let initialized = graph.maybe_persist(initialized, "CountReducer::reduce")?;
+        let initialized = match hot_keys {
+            Some(hot_keys) => hot_keys.combine_counted_partials(&initialized),
+            None => initialized,
+        };
+        Ok(initialized
             .count()
             .map_named("CountReducer::reduce", |(key, count)| {
                 (key, Value::from(count as i64))
@@ -2879,6 +3074,7 @@ where
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        _hot_keys: Option<&Rc<HotKeys>>,
         error_logger: Rc<dyn LogError>,
         trace: Trace,
         _graph: &mut DataflowGraphInner<S>,
@@ -2913,6 +3109,7 @@ where
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        _hot_keys: Option<&Rc<HotKeys>>,
         _error_logger: Rc<dyn LogError>,
         _trace: Trace,
         _graph: &mut DataflowGraphInner<S>,
@@ -2945,6 +3142,7 @@ where
     fn reduce(
         self: Rc<Self>,
         values: &Collection<S, (Key, Key, Vec<Value>)>,
+        _hot_keys: Option<&Rc<HotKeys>>,
         _error_logger: Rc<dyn LogError>,
         _trace: Trace,
         _graph: &mut DataflowGraphInner<S>,
@@ -3025,6 +3223,7 @@ impl<S: MaybeTotalScope> DataflowGraphInner<S>
 where
     <S::MaybeTotalTimestamp as MaybeTotalTimestamp>::IsTotal: CreateDataflowReducer<S>,
 {
+    #[allow(clippy::too_many_arguments)]
     fn group_by_table(
         &mut self,
         table_handle: TableHandle,
@@ -3032,6 +3231,7 @@ where
         shard_policy: ShardPolicy,
         reducers: Vec<ReducerData>,
         set_id: bool,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         if set_id {
@@ -3042,6 +3242,18 @@ where
             .get(table_handle)
             .ok_or(Error::InvalidTableHandle)?;
 
+        let skewed_keys: Vec<Key> = skewed_keys
+            .iter()
+            .map(|values| {
+                if set_id {
+                    values[0].as_pointer()
+                } else {
+                    Ok(shard_policy.generate_key(values))
+                }
+            })
+            .try_collect()?;
+        let hot_keys = HotKeys::new(skewed_keys, self.scope.peers()).map(Rc::new);
+
         let error_reporter_1 = self.error_reporter.clone();
         let reducer_impls: Vec<_> = reducers
             .iter()
@@ -3095,6 +3307,7 @@ where
                 });
                 reducer_impl.clone().reduce(
                     &with_extracted_value,
+                    hot_keys.as_ref(),
                     self.create_error_logger()?.into(),
                     data.trace,
                     self,
@@ -3324,7 +3537,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
         &mut self,
         mut reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
-        commit_duration: Option<Duration>,
+        commit_policy: Option<CommitPolicy>,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -3374,7 +3587,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                 .map_or(SnapshotAccess::Full, |config| config.snapshot_access);
 
             let connector = Connector::new(
-                commit_duration,
+                commit_policy,
                 parser.column_count(),
                 self.terminate_on_error,
                 self.create_error_logger()?.into(),
@@ -3551,10 +3764,17 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
             stats.on_batch_entry_written();
         }
         stats.on_batch_finished();
+        Ok(())
+    }
 
-        // This line can be removed. In this case, flush will happen on the next time advancement.
-        data_sink.flush(false).map_err(DynError::from)?;
-
+    fn flush_output(
+        data_sink: &mut Box<dyn Writer>,
+        queue_metrics: &OutputQueueMetrics,
+        forced: bool,
+    ) -> Result<(), DynError> {
+        let flush_started_at = Instant::now();
+        data_sink.flush(forced).map_err(DynError::from)?;
+        queue_metrics.on_flushed(flush_started_at.elapsed());
         Ok(())
     }
 
@@ -3599,8 +3819,15 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
             .get_worker_persistent_storage()
             .map(|storage| storage.lock().unwrap().register_sink());
 
+        let queue_metrics = Arc::new(OutputQueueMetrics::default());
         let sender = {
-            let (sender, receiver) = mpsc::channel();
+            // With a bounded queue, the workers block when the connector falls behind,
+            // instead of buffering the whole output in memory
+            let (sender, receiver) = match self.config.output_queue_size() {
+                Some(queue_size) => bounded(queue_size),
+                None => unbounded(),
+            };
+            let max_in_flight_batches = self.config.output_max_in_flight_batches();
 
             let thread_name = format!(
                 "pathway:output_table-{}-{}",
@@ -3616,37 +3843,85 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
             // connector_threads vector contains both, input and output connector threads
             // connector_monitors vector contains monitors only for input connectors
             let output_connector_id = self.connector_threads.len() - self.connector_monitors.len();
-            let mut stats = OutputConnectorStats::new(data_sink.name(output_connector_id));
+            let connector_name = data_sink.name(output_connector_id);
+            self.output_queue_metrics
+                .push((connector_name.clone(), queue_metrics.clone()));
+            let mut stats = OutputConnectorStats::new(connector_name);
+            let queue_metrics = queue_metrics.clone();
 
             let output_joiner_handle = Builder::new()
                 .name(thread_name)
                 .spawn_with_reporter(
                     self.error_reporter.clone().with_extra(receiver),
-                    move |error_reporter_with_receiver| loop {
-                        let receiver = error_reporter_with_receiver.get();
-                        match receiver.recv() {
-                            Ok(OutputEvent::Batch(batch)) => {
-                                Self::output_batch(
-                                    &mut stats,
-                                    batch,
-                                    &mut data_sink,
-                                    &mut data_formatter,
-                                    worker_persistent_storage.as_ref(),
-                                )?;
+                    move |error_reporter_with_receiver| {
+                        // The latest time, which is closed but can't be committed until
+                        // the batches written before it are flushed
+                        let mut pending_commit = None;
+                        loop {
+                            let receiver = error_reporter_with_receiver.get();
+                            let event = match receiver.try_recv() {
+                                Ok(event) => Ok(event),
+                                Err(TryRecvError::Empty) => {
+                                    // The queue is drained, so there is no point in
+                                    // delaying the flush of the in-flight batches
+                                    if queue_metrics.in_flight_batches() > 0 {
+                                        Self::flush_output(&mut data_sink, &queue_metrics, false)?;
+                                    }
+                                    if let Some(t) = pending_commit.take() {
+                                        Self::commit_output_time(
+                                            &mut stats,
+                                            Some(t),
+                                            sink_id,
+                                            worker_persistent_storage.as_ref(),
+                                        );
+                                    }
+                                    receiver.recv()
+                                }
+                                Err(TryRecvError::Disconnected) => Err(RecvError),
+                            };
+                            if event.is_ok() {
+                                queue_metrics.on_dequeued();
                             }
-                            Ok(OutputEvent::Commit(t)) => {
-                                Self::commit_output_time(
-                                    &mut stats,
-                                    t,
-                                    sink_id,
-                                    worker_persistent_storage.as_ref(),
-                                );
-                                data_sink.flush(t.is_none()).map_err(DynError::from)?;
-                                if t.is_none() {
-                                    break Ok(());
+                            match event {
+                                Ok(OutputEvent::Batch(batch)) => {
+                                    Self::output_batch(
+                                        &mut stats,
+                                        batch,
+                                        &mut data_sink,
+                                        &mut data_formatter,
+                                        worker_persistent_storage.as_ref(),
+                                    )?;
+                                    queue_metrics.on_batch_written();
+                                    if queue_metrics.in_flight_batches() >= max_in_flight_batches {
+                                        Self::flush_output(&mut data_sink, &queue_metrics, false)?;
+                                    }
+                                }
+                                Ok(OutputEvent::Commit(Some(t)))
+                                    if queue_metrics.in_flight_batches() > 0 =>
+                                {
+                                    pending_commit = Some(t);
+                                }
+                                Ok(OutputEvent::Commit(t)) => {
+                                    // The time is committed only after the connector
+                                    // acknowledges the flush of everything before it
+                                    Self::flush_output(
+                                        &mut data_sink,
+                                        &queue_metrics,
+                                        t.is_none(),
+                                    )?;
+                                    pending_commit = None;
+                                    Self::commit_output_time(
+                                        &mut stats,
+                                        t,
+                                        sink_id,
+                                        worker_persistent_storage.as_ref(),
+                                    );
+                                    if t.is_none() {
+                                        break Ok(());
+                                    }
                                 }
+                                Err(RecvError) => break Ok(()),
                             }
-                            Err(mpsc::RecvError) => break Ok(()),
                         }
                     },
                 )
@@ -3661,6 +3936,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                     Ok((_time, batches)) => {
                         assert!(connector_does_output || batches.is_empty());
                         for batch in batches {
+                            queue_metrics.on_enqueued();
                             sender
                                 .send(OutputEvent::Batch(batch.clone()))
                                 .expect("sending output batch should not fail");
@@ -3668,6 +3944,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                     }
                     Err(frontier) => {
                         assert!(frontier.len() <= 1);
+                        queue_metrics.on_enqueued();
                         sender
                             .send(OutputEvent::Commit(frontier.first().copied()))
                             .expect("sending output commit should not fail");
@@ -3707,6 +3984,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
         let SubscribeCallbacks {
             wrapper,
             mut on_data,
+            mut on_batch,
             mut on_time_end,
             mut on_end,
         } = callbacks;
@@ -3733,6 +4011,14 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                                 on_data(*key, values, batch.time, *diff)?;
                             }
                         }
+                        if let Some(on_batch) = on_batch.as_mut() {
+                            let rows: Vec<_> = batch
+                                .data
+                                .iter()
+                                .map(|((key, values), diff)| (*key, values.as_value_slice(), *diff))
+                                .collect();
+                            on_batch(batch.time, &rows)?;
+                        }
                         if let Some(on_time_end) = on_time_end.as_mut() {
                             on_time_end(batch.time)?;
                         }
@@ -3795,6 +4081,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> DataflowGraphInner<S>
                 self.config.clone(),
                 self.terminate_on_error,
                 self.current_error_log.clone(),
+                self.operator_metrics.clone(),
             )?;
             let mut subgraph_ref = subgraph.0.borrow_mut();
             let mut state = BeforeIterate::new(self, &mut subgraph_ref, step);
@@ -4321,6 +4608,7 @@ impl<S: MaybeTotalScope> InnerDataflowGraph<S> {
         config: Arc<Config>,
         terminate_on_error: bool,
         default_error_log: Option<ErrorLog>,
+        operator_metrics: Option<WorkerOperatorMetrics>,
     ) -> Result<Self> {
         Ok(Self(RefCell::new(DataflowGraphInner::new(
             scope,
@@ -4330,6 +4618,7 @@ impl<S: MaybeTotalScope> InnerDataflowGraph<S> {
             config,
             terminate_on_error,
             default_error_log,
+            operator_metrics,
         )?)))
     }
 }
@@ -4700,6 +4989,7 @@ where
         shard_policy: ShardPolicy,
         reducers: Vec<ReducerData>,
         set_id: bool,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().group_by_table(
@@ -4708,6 +4998,7 @@ where
             shard_policy,
             reducers,
             set_id,
+            skewed_keys,
             table_properties,
         )
     }
@@ -4781,6 +5072,8 @@ where
         right_data: JoinData,
         shard_policy: ShardPolicy,
         join_type: JoinType,
+        strategy: JoinStrategy,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().join_tables(
@@ -4788,6 +5081,8 @@ where
             right_data,
             shard_policy,
             join_type,
+            strategy,
+            skewed_keys,
             table_properties,
         )
     }
@@ -4824,7 +5119,7 @@ where
         &self,
         _reader: Box<dyn ReaderBuilder>,
         _parser: Box<dyn Parser>,
-        _commit_duration: Option<Duration>,
+        _commit_policy: Option<CommitPolicy>,
         _parallel_readers: usize,
         _table_properties: Arc<TableProperties>,
         _external_persistent_id: Option<&ExternalPersistentId>,
@@ -4908,6 +5203,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> OuterDataflowGraph<S>
         persistence_config: Option<PersistenceManagerOuterConfig>,
         config: Arc<Config>,
         terminate_on_error: bool,
+        operator_metrics: Option<WorkerOperatorMetrics>,
     ) -> Result<Self> {
         let worker_idx = scope.index();
         let total_workers = scope.peers();
@@ -4926,6 +5222,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> OuterDataflowGraph<S>
             config,
             terminate_on_error,
             None,
+            operator_metrics,
         )?)))
     }
 }
@@ -5320,6 +5617,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         shard_policy: ShardPolicy,
         reducers: Vec<ReducerData>,
         set_id: bool,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().group_by_table(
@@ -5328,6 +5626,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
             shard_policy,
             reducers,
             set_id,
+            skewed_keys,
             table_properties,
         )
     }
@@ -5408,6 +5707,8 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         right_data: JoinData,
         shard_policy: ShardPolicy,
         join_type: JoinType,
+        strategy: JoinStrategy,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         self.0.borrow_mut().join_tables(
@@ -5415,6 +5716,8 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
             right_data,
             shard_policy,
             join_type,
+            strategy,
+            skewed_keys,
             table_properties,
         )
     }
@@ -5453,7 +5756,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         &self,
         reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
-        commit_duration: Option<Duration>,
+        commit_policy: Option<CommitPolicy>,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -5461,7 +5764,7 @@ impl<S: MaybeTotalScope<MaybeTotalTimestamp = Timestamp>> Graph for OuterDataflo
         self.0.borrow_mut().connector_table(
             reader,
             parser,
-            commit_duration,
+            commit_policy,
             parallel_readers,
             table_properties,
             external_persistent_id,
@@ -5553,6 +5856,7 @@ pub fn run_with_new_dataflow_graph<R, R2>(
     #[allow(unused)] license: &License,
     telemetry_config: TelemetryConfig,
     terminate_on_error: bool,
+    profile: Option<PathBuf>,
 ) -> Result<Vec<R2>>
 where
     R: 'static,
@@ -5571,6 +5875,17 @@ where
     let (error_reporter, error_receiver) = ErrorReporter::create();
     let failed = Arc::new(AtomicBool::new(false));
     let failed_2 = failed.clone();
+    let process_id = config.process_id();
+    let processes = config.processes();
+    let profile = profile
+        .map(|path| Profile::new(&path, process_id, processes))
+        .transpose()?;
+    let operator_metrics_registry = (with_http_server || profile.is_some())
+        .then(|| Arc::new(OperatorMetricsRegistry::new(profile)));
+    let operator_metrics_registry_2 = operator_metrics_registry.clone();
+    let purge_threshold = config
+        .memory_budget()
+        .map(|budget| Arc::new(PurgeThreshold::new(budget)));
 
     let guards = execute(config.to_timely_config(), move |worker| {
         catch_unwind(AssertUnwindSafe(|| {
@@ -5582,6 +5897,10 @@ where
                     panic!("Could not connect to differential log address: {addr:?}");
                 }
             }
+            let operator_metrics = operator_metrics_registry
+                .clone()
+                .map(|registry| WorkerOperatorMetrics::register(&*worker, registry));
+            let _spill_guard = config.spill_config().map(spill::enable);
 
             let (
                 res,
@@ -5589,6 +5908,8 @@ where
                 mut pollers,
                 connector_threads,
                 connector_monitors,
+                output_queue_metrics,
+                operator_metrics,
                 input_probe,
                 output_probe,
                 intermediate_probes,
@@ -5604,6 +5925,7 @@ where
                     persistence_config.clone(),
                     config.clone(),
                     terminate_on_error,
+                    operator_metrics,
                 )
                 .unwrap_with_reporter(&error_reporter);
                 let telemetry_runner = maybe_run_telemetry_thread(&graph, telemetry_config.clone());
@@ -5619,6 +5941,8 @@ where
                     graph.pollers,
                     graph.connector_threads,
                     graph.connector_monitors,
+                    graph.output_queue_metrics,
+                    graph.operator_metrics,
                     graph.input_probe,
                     graph.output_probe,
                     graph.probes,
@@ -5640,9 +5964,21 @@ where
                         &output_probe,
                         &intermediate_probes,
                         &connector_monitors,
+                        &output_queue_metrics,
+                        operator_metrics.as_ref(),
+                        config.memory_budget(),
                     );
                 }
 
+                if operator_metrics.is_some() {
+                    // deliver the buffered logging events, so that the metrics stay fresh
+                    worker.log_register().flush();
+                }
+
+                if let Some(purge_threshold) = &purge_threshold {
+                    purge_threshold.purge_if_exceeded();
+                }
+
                 let mut next_step_duration = None;
 
                 let iteration_start = SystemTime::now();
@@ -5696,9 +6032,17 @@ where
                     &output_probe,
                     &intermediate_probes,
                     &connector_monitors,
+                    &output_queue_metrics,
+                    operator_metrics.as_ref(),
+                    config.memory_budget(),
                 );
             }
 
+            if let Some(operator_metrics) = &operator_metrics {
+                worker.log_register().flush();
+                operator_metrics.finish();
+            }
+
             drop(http_server_runner);
             drop(progress_reporter_runner);
             drop(telemetry_runner);
@@ -5750,5 +6094,12 @@ where
         .into_iter()
         .map(|res| res.map_err(Error::WorkerPanic))
         .collect::<Result<Vec<_>>>()?;
+    if let Some(profile) = operator_metrics_registry_2
+        .as_ref()
+        .and_then(|registry| registry.profile())
+    {
+        let path = profile.finish()?;
+        info!("Profile written to {}", path.display());
+    }
     Ok(res)
 }
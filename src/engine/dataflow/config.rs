@@ -1,6 +1,10 @@
 // Copyright © 2024 Pathway
 
+use std::path::PathBuf;
+
+use crate::engine::dataflow::spill::SpillConfig;
 use crate::env::{parse_env_var, parse_env_var_required, Error as EnvError};
+use differential_dataflow::Config as DifferentialConfig;
 use log::warn;
 use timely::{CommunicationConfig, Config as TimelyConfig, WorkerConfig};
 
@@ -10,6 +14,16 @@ const MAX_WORKERS: usize = if cfg!(feature = "unlimited-workers") {
     8
 };
 
+/// The number of updates an arrangement merges per activation while idle, when a memory budget
+/// is set and the effort isn't configured explicitly.
+const DEFAULT_IDLE_MERGE_EFFORT: isize = 1000;
+
+/// The number of updates from which merged batches of spillable arrangements are written to disk.
+const DEFAULT_SPILL_THRESHOLD: usize = 1_000_000;
+
+/// The number of updates of spilled batches each worker keeps in memory.
+const DEFAULT_SPILL_CACHE_SIZE: usize = 4_000_000;
+
 #[derive(Debug, thiserror::Error)]
 #[non_exhaustive]
 pub enum Error {
@@ -22,6 +36,15 @@ pub enum Error {
     #[error("invalid process ID {0}")]
     InvalidId(usize),
 
+    #[error("the number of in-flight output batches must be positive")]
+    NeedsInFlightBatches,
+
+    #[error("the idle merge effort must be positive")]
+    NeedsMergeEffort,
+
+    #[error("the spill threshold must be positive")]
+    NeedsSpillThreshold,
+
     #[error(transparent)]
     EnvError(#[from] EnvError),
 }
@@ -38,6 +61,13 @@ pub struct Config {
     threads: usize,
     processes: Processes,
     process_id: usize,
+    output_queue_size: Option<usize>,
+    output_max_in_flight_batches: usize,
+    memory_budget: Option<usize>,
+    idle_merge_effort: Option<isize>,
+    spill_dir: Option<PathBuf>,
+    spill_threshold: usize,
+    spill_cache_size: usize,
 }
 
 impl Config {
@@ -60,7 +90,67 @@ impl Config {
         self.process_id
     }
 
+    /// The maximum number of batches waiting for an output connector thread.
+    /// When it is reached, the worker blocks until the connector catches up.
+    /// If not set, the queue is unbounded.
+    pub fn output_queue_size(&self) -> Option<usize> {
+        self.output_queue_size
+    }
+
+    /// The number of batches an output connector may write before it
+    /// has to flush them.
+    pub fn output_max_in_flight_batches(&self) -> usize {
+        self.output_max_in_flight_batches
+    }
+
+    /// The number of bytes the process should keep its allocated memory under.
+    pub fn memory_budget(&self) -> Option<usize> {
+        self.memory_budget
+    }
+
+    /// Overrides the memory budget set in the environment.
+    pub fn set_memory_budget(&mut self, memory_budget: Option<usize>) {
+        if memory_budget.is_some() {
+            self.memory_budget = memory_budget;
+        }
+    }
+
+    /// The number of updates an arrangement merges per activation while no new data arrives.
+    /// If not set, arrangements only merge when they receive data.
+    pub fn idle_merge_effort(&self) -> Option<isize> {
+        self.idle_merge_effort
+            .or(self.memory_budget.map(|_budget| DEFAULT_IDLE_MERGE_EFFORT))
+    }
+
+    /// Where and when the arrangements that support it write their batches to disk.
+    /// If not set, all arrangements are kept in memory.
+    pub fn spill_config(&self) -> Option<SpillConfig> {
+        self.spill_dir.as_ref().map(|dir| SpillConfig {
+            dir: dir.clone(),
+            threshold: self.spill_threshold,
+            cache_size: self.spill_cache_size,
+        })
+    }
+
+    /// Overrides the spill directory set in the environment.
+    pub fn set_spill_dir(&mut self, spill_dir: Option<PathBuf>) {
+        if spill_dir.is_some() {
+            self.spill_dir = spill_dir;
+        }
+    }
+
     pub fn to_timely_config(&self) -> TimelyConfig {
+        let mut config = self.to_timely_config_without_differential();
+        if let Some(effort) = self.idle_merge_effort() {
+            differential_dataflow::configure(
+                &mut config.worker,
+                &DifferentialConfig::default().idle_merge_effort(Some(effort)),
+            );
+        }
+        config
+    }
+
+    fn to_timely_config_without_differential(&self) -> TimelyConfig {
         match &self.processes {
             Processes::Single => {
                 if self.threads > 1 {
@@ -118,11 +208,37 @@ impl Config {
         } else {
             (0, Processes::Single)
         };
+        let output_queue_size = parse_env_var("PATHWAY_OUTPUT_QUEUE_SIZE")?;
+        let output_max_in_flight_batches =
+            parse_env_var("PATHWAY_OUTPUT_MAX_IN_FLIGHT_BATCHES")?.unwrap_or(1);
+        if output_max_in_flight_batches == 0 {
+            return Err(Error::NeedsInFlightBatches);
+        }
+        let memory_budget = parse_env_var("PATHWAY_MEMORY_BUDGET")?;
+        let idle_merge_effort = parse_env_var("PATHWAY_IDLE_MERGE_EFFORT")?;
+        if idle_merge_effort.is_some_and(|effort: isize| effort <= 0) {
+            return Err(Error::NeedsMergeEffort);
+        }
+        let spill_dir = parse_env_var("PATHWAY_SPILL_DIR")?;
+        let spill_threshold =
+            parse_env_var("PATHWAY_SPILL_THRESHOLD")?.unwrap_or(DEFAULT_SPILL_THRESHOLD);
+        if spill_threshold == 0 {
+            return Err(Error::NeedsSpillThreshold);
+        }
+        let spill_cache_size =
+            parse_env_var("PATHWAY_SPILL_CACHE_SIZE")?.unwrap_or(DEFAULT_SPILL_CACHE_SIZE);
         Ok(Self {
             workers,
             threads,
             processes,
             process_id,
+            output_queue_size,
+            output_max_in_flight_batches,
+            memory_budget,
+            idle_merge_effort,
+            spill_dir,
+            spill_threshold,
+            spill_cache_size,
         })
     }
 }
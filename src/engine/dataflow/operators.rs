@@ -135,6 +135,47 @@ where
     }
 }
 
+pub trait ArrangeLocally<S, K, V, R>
+where
+    S: MaybeTotalScope,
+    K: ExchangeData,
+    V: ExchangeData,
+    R: Semigroup + ExchangeData,
+{
+    /// Arranges the rows on the workers that hold them, without exchanging them by key.
+    fn arrange_locally_named<Tr>(&self, name: &str) -> Arranged<S, TraceAgent<Tr>>
+    where
+        Tr: Trace + TraceReader<Key = K, Val = V, Time = S::Timestamp, R = R> + 'static,
+        Tr::Batch: Batch;
+}
+
+impl<T, S, K, V, R> ArrangeLocally<S, K, V, R> for T
+where
+    T: differential_dataflow::operators::arrange::arrangement::Arrange<S, K, V, R>,
+    S: MaybeTotalScope,
+    K: ExchangeData,
+    V: ExchangeData,
+    R: Semigroup + ExchangeData,
+{
+    #[track_caller]
+    fn arrange_locally_named<Tr>(&self, name: &str) -> Arranged<S, TraceAgent<Tr>>
+    where
+        Tr: Trace + TraceReader<Key = K, Val = V, Time = S::Timestamp, R = R> + 'static,
+        Tr::Batch: Batch,
+    {
+        let caller = Location::caller();
+        let name = format!(
+            "{name} [{key}, {value}] at {caller}",
+            key = type_name::<K>(),
+            value = type_name::<V>()
+        );
+        #[allow(clippy::disallowed_methods)]
+        differential_dataflow::operators::arrange::arrangement::Arrange::arrange_core(
+            self, Pipeline, &name,
+        )
+    }
+}
+
 pub trait MaybeTotal<S, K, R>
 where
     S: MaybeTotalScope,
@@ -215,6 +256,15 @@ where
         logic: impl FnMut(D) -> D2 + 'static,
     ) -> Collection<S, D2, R>;
 
+    /// Like [`MapWrapped::map_wrapped_named`], but `logic` receives whole minibatches.
+    /// It has to return exactly one output entry for each input entry, in the same order.
+    fn map_batch_wrapped_named<D2: Data>(
+        &self,
+        name: &str,
+        wrapper: BatchWrapper,
+        logic: impl FnMut(Vec<D>) -> Vec<D2> + 'static,
+    ) -> Collection<S, D2, R>;
+
     fn map_named_async<F: Future>(
         &self,
         name: &str,
@@ -265,6 +315,41 @@ where
             .as_collection()
     }
 
+    #[track_caller]
+    fn map_batch_wrapped_named<D2: Data>(
+        &self,
+        name: &str,
+        wrapper: BatchWrapper,
+        mut logic: impl FnMut(Vec<D>) -> Vec<D2> + 'static,
+    ) -> Collection<S, D2, R> {
+        let caller = Location::caller();
+        let name = format!("{name} at {caller}");
+        let mut vector = Vec::new();
+        self.inner
+            .unary(Pipeline, &name, move |_, _| {
+                move |input, output| {
+                    wrapper.run(|| {
+                        while let Some((time, data)) = input.next() {
+                            data.swap(&mut vector);
+                            let (batch, times_and_diffs): (Vec<_>, Vec<_>) = vector
+                                .drain(..)
+                                .map(|(data, time, diff)| (data, (time, diff)))
+                                .unzip();
+                            let results = logic(batch);
+                            assert_eq!(results.len(), times_and_diffs.len());
+                            output.session(&time).give_iterator(
+                                results
+                                    .into_iter()
+                                    .zip(times_and_diffs)
+                                    .map(|(data, (time, diff))| (data, time, diff)),
+                            );
+                        }
+                    });
+                }
+            })
+            .as_collection()
+    }
+
     #[track_caller]
     fn map_named_async<F: Future>(
         &self,
@@ -0,0 +1,143 @@
+// Copyright © 2024 Pathway
+
+//! Splitting of hot keys across workers.
+//!
+//! Arrangements are exchanged between workers by the shard of the key, so all rows of a key
+//! that holds a large part of the data end up on a single worker. The keys marked as hot are
+//! salted: each of their rows is assigned one of the salted keys, whose shards are consecutive
+//! and thus fall on different workers. The salt of a row is derived from its id, so an insertion
+//! and its retraction get the same salted key.
+
+use std::collections::{HashMap, HashSet};
+use std::iter::once;
+use std::rc::Rc;
+
+use differential_dataflow::difference::{Multiply, Semigroup};
+use differential_dataflow::operators::reduce::Reduce;
+use differential_dataflow::{Collection, ExchangeData};
+
+use super::maybe_total::MaybeTotalScope;
+use super::operators::{ArrangeWithTypes, MapWrapped, MaybeTotal};
+use super::ArrangedByKey;
+use crate::engine::value::SHARD_MASK;
+use crate::engine::{Key, KeyImpl, Value};
+
+#[derive(Debug)]
+pub struct HotKeys {
+    fanout: usize,
+    hot: HashSet<Key>,
+    unsalted: HashMap<Key, Key>,
+}
+
+impl HotKeys {
+    /// Splits every key in `keys` into `workers` salted keys. Returns `None` if there is nothing
+    /// to split.
+    pub fn new(keys: impl IntoIterator<Item = Key>, workers: usize) -> Option<Self> {
+        let hot: HashSet<Key> = keys.into_iter().collect();
+        if hot.is_empty() || workers < 2 {
+            return None;
+        }
+        let unsalted = hot
+            .iter()
+            .flat_map(|key| (0..workers).map(move |salt| (salted_key(*key, salt), *key)))
+            .collect();
+        Some(Self {
+            fanout: workers,
+            hot,
+            unsalted,
+        })
+    }
+
+    /// Returns the salted key of a row if `key` is hot and `key` otherwise.
+    pub fn salted(&self, key: Key, row_key: &Key) -> Key {
+        if self.hot.contains(&key) {
+            #[allow(clippy::cast_possible_truncation)]
+            let salt = (row_key.0 % self.fanout as KeyImpl) as usize;
+            salted_key(key, salt)
+        } else {
+            key
+        }
+    }
+
+    /// Returns all salted keys of `key` if it is hot and `key` otherwise.
+    pub fn all_salted(&self, key: Key) -> Vec<Key> {
+        if self.hot.contains(&key) {
+            (0..self.fanout).map(|salt| salted_key(key, salt)).collect()
+        } else {
+            vec![key]
+        }
+    }
+
+    pub fn is_salted(&self, key: &Key) -> bool {
+        self.unsalted.contains_key(key)
+    }
+
+    pub fn unsalted(&self, key: Key) -> Key {
+        self.unsalted.get(&key).copied().unwrap_or(key)
+    }
+
+    /// Aggregates the rows of the salted keys with `logic` and maps the partial results back
+    /// to the original keys. The rows of the other keys are passed through unchanged, so the
+    /// result can be aggregated again with the same logic.
+    pub fn combine_partials<S, V, L>(
+        self: &Rc<Self>,
+        collection: &Collection<S, (Key, V)>,
+        name: &str,
+        logic: L,
+    ) -> Collection<S, (Key, V)>
+    where
+        S: MaybeTotalScope,
+        V: ExchangeData,
+        L: FnMut(&Key, &[(&V, isize)], &mut Vec<(V, isize)>) + 'static,
+    {
+        let salted: ArrangedByKey<S, Key, V> = collection
+            .filter({
+                let hot_keys = self.clone();
+                move |(key, _value)| hot_keys.is_salted(key)
+            })
+            .arrange_named(&format!("Arrange: {name}"));
+        let partials = salted.reduce_named(name, logic).map_named(name, {
+            let hot_keys = self.clone();
+            move |(key, value)| (hot_keys.unsalted(key), value)
+        });
+        let hot_keys = self.clone();
+        collection
+            .filter(move |(key, _value)| !hot_keys.is_salted(key))
+            .concat(&partials)
+    }
+
+    /// Counterpart of [`Self::combine_partials`] for the reductions done in the differences
+    /// of the collection with `count`.
+    pub fn combine_counted_partials<S, R>(
+        self: &Rc<Self>,
+        collection: &Collection<S, Key, R>,
+    ) -> Collection<S, Key, R>
+    where
+        S: MaybeTotalScope,
+        R: ExchangeData + Semigroup + Multiply<isize, Output = R>,
+    {
+        let partials = collection
+            .filter({
+                let hot_keys = self.clone();
+                move |key| hot_keys.is_salted(key)
+            })
+            .count()
+            .explode({
+                let hot_keys = self.clone();
+                move |(key, partial)| once((hot_keys.unsalted(key), partial))
+            });
+        let hot_keys = self.clone();
+        collection
+            .filter(move |key| !hot_keys.is_salted(key))
+            .concat(&partials)
+    }
+}
+
+/// The shards of the salted keys of a key follow its own shard, so consecutive salts are
+/// placed on consecutive workers.
+#[allow(clippy::cast_possible_wrap)]
+fn salted_key(key: Key, salt: usize) -> Key {
+    let salted = Key::for_values(&[Value::Pointer(key), Value::Int(salt as i64)]);
+    let shard = key.0.wrapping_add(salt as KeyImpl) & SHARD_MASK;
+    Key((salted.0 & !SHARD_MASK) | shard)
+}
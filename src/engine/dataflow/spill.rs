@@ -0,0 +1,1036 @@
+// Copyright © 2024 Pathway
+
+//! Arrangements whose large batches are kept on disk.
+//!
+//! A [`SpillBatch`] wraps a batch of a differential spine. When spilling is enabled on the
+//! worker, the merges of batches holding together at least `threshold` updates write their
+//! result to an unlinked file in the spill directory as they go, instead of building it in
+//! memory. The merged batches are read from the spilled ones block by block, so a merge holds
+//! at most one block of each of its sources.
+//!
+//! A spilled batch is split into blocks of whole keys, each compressed with lz4 on its own, and
+//! the first key of every block is kept in memory. The file is mapped into memory and a cursor
+//! decodes only the blocks it reaches, so seeking a key decodes the block holding it. Decoded
+//! blocks are kept in a per-worker cache holding up to `cache_size` updates.
+//!
+//! Readers of a spilled batch keep the blocks they have read resident for as long as they hold
+//! their copy of the batch, which is what the references returned by the cursors are tied to.
+//! The copies kept by the spine itself never read blocks.
+
+#![allow(clippy::module_name_repetitions)]
+
+use std::any::Any;
+use std::cell::RefCell;
+use std::cmp::Ordering;
+use std::collections::VecDeque;
+use std::fs::File;
+use std::io::{BufWriter, IntoInnerError, Write};
+use std::path::{Path, PathBuf};
+use std::rc::Rc;
+
+use differential_dataflow::consolidation::consolidate;
+use differential_dataflow::difference::Semigroup;
+use differential_dataflow::lattice::Lattice;
+use differential_dataflow::trace::implementations::ord::OrdValBatch;
+use differential_dataflow::trace::implementations::spine_fueled::Spine;
+use differential_dataflow::trace::{
+    Batch, BatchReader, Batcher, Builder, Cursor, Description, Merger,
+};
+use log::{info, warn};
+use lz4_flex::frame::{FrameDecoder, FrameEncoder};
+use memmap2::Mmap;
+use once_cell::unsync::OnceCell;
+use serde::de::DeserializeOwned;
+use serde::Serialize;
+use timely::communication::message::RefOrMut;
+use timely::progress::frontier::AntichainRef;
+use timely::progress::Antichain;
+
+use crate::engine::error::DynResult;
+
+pub type SpillValSpine<K, V, T, R> = Spine<SpillBatch<OrdValBatch<K, V, T, R>>>;
+
+/// The number of updates after which a block of a spilled batch is closed at the next key.
+const BLOCK_UPDATES: usize = 4096;
+
+#[derive(Debug, Clone)]
+pub struct SpillConfig {
+    /// Directory in which the spilled batches are placed.
+    pub dir: PathBuf,
+    /// The number of updates from which the result of a merge is spilled.
+    pub threshold: usize,
+    /// The number of updates of spilled batches a worker keeps in memory.
+    pub cache_size: usize,
+}
+
+thread_local! {
+    static SPILL_STORE: RefCell<Option<SpillStore>> = const { RefCell::new(None) };
+}
+
+struct SpillStore {
+    config: SpillConfig,
+    cache: BlockCache,
+    next_id: u64,
+    spilled_updates: usize,
+    read_updates: usize,
+}
+
+/// Enables spilling on the current worker until the returned guard is dropped.
+#[must_use]
+pub fn enable(config: SpillConfig) -> SpillGuard {
+    SPILL_STORE.with_borrow_mut(|store| {
+        *store = Some(SpillStore {
+            cache: BlockCache::new(config.cache_size),
+            config,
+            next_id: 0,
+            spilled_updates: 0,
+            read_updates: 0,
+        });
+    });
+    SpillGuard
+}
+
+pub struct SpillGuard;
+
+impl Drop for SpillGuard {
+    fn drop(&mut self) {
+        let store = SPILL_STORE.with_borrow_mut(Option::take);
+        if let Some(store) = &store {
+            if store.spilled_updates > 0 {
+                info!(
+                    "Spilled {} updates to {} and read back {} updates",
+                    store.spilled_updates,
+                    store.config.dir.display(),
+                    store.read_updates
+                );
+            }
+        }
+        drop(store);
+    }
+}
+
+/// Least recently used blocks of spilled batches, decoded.
+struct BlockCache {
+    capacity: usize,
+    size: usize,
+    entries: VecDeque<((u64, usize), usize, Rc<dyn Any>)>,
+}
+
+impl BlockCache {
+    fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            size: 0,
+            entries: VecDeque::new(),
+        }
+    }
+
+    fn get(&mut self, id: (u64, usize)) -> Option<Rc<dyn Any>> {
+        let position = self
+            .entries
+            .iter()
+            .position(|(entry_id, _, _)| *entry_id == id)?;
+        let entry = self.entries.remove(position)?;
+        let block = entry.2.clone();
+        self.entries.push_back(entry);
+        Some(block)
+    }
+
+    fn insert(&mut self, id: (u64, usize), len: usize, block: Rc<dyn Any>) {
+        self.entries.push_back((id, len, block));
+        self.size += len;
+        while self.size > self.capacity {
+            let Some((_, len, _)) = self.entries.pop_front() else {
+                break;
+            };
+            self.size -= len;
+        }
+    }
+
+    fn remove_batch(&mut self, batch_id: u64) -> Vec<Rc<dyn Any>> {
+        let mut removed = Vec::new();
+        self.entries.retain(|((entry_batch_id, _), len, block)| {
+            if *entry_batch_id == batch_id {
+                self.size -= len;
+                removed.push(block.clone());
+                false
+            } else {
+                true
+            }
+        });
+        removed
+    }
+}
+
+/// Updates of consecutive keys of a spilled batch, decoded.
+struct Block<B: BatchReader> {
+    keys: Vec<B::Key>,
+    /// The values of `keys[i]` are `vals[key_offs[i]..key_offs[i + 1]]`.
+    key_offs: Vec<usize>,
+    vals: Vec<B::Val>,
+    /// The updates of `vals[i]` are `updates[val_offs[i]..val_offs[i + 1]]`.
+    val_offs: Vec<usize>,
+    updates: Vec<(B::Time, B::R)>,
+}
+
+impl<B> Block<B>
+where
+    B: BatchReader,
+    B::Key: Eq,
+    B::Val: Eq,
+{
+    fn with_capacity(updates: usize) -> Self {
+        Self {
+            keys: Vec::new(),
+            key_offs: Vec::new(),
+            vals: Vec::new(),
+            val_offs: Vec::new(),
+            updates: Vec::with_capacity(updates),
+        }
+    }
+
+    fn push(&mut self, key: B::Key, val: B::Val, time: B::Time, diff: B::R) {
+        let new_key = self.keys.last() != Some(&key);
+        if new_key {
+            self.keys.push(key);
+            self.key_offs.push(self.vals.len());
+        }
+        if new_key || self.vals.last() != Some(&val) {
+            self.vals.push(val);
+            self.val_offs.push(self.updates.len());
+        }
+        self.updates.push((time, diff));
+    }
+
+    fn seal(mut self) -> Self {
+        self.key_offs.push(self.vals.len());
+        self.val_offs.push(self.updates.len());
+        self
+    }
+
+    fn times(&self, val: usize) -> &[(B::Time, B::R)] {
+        &self.updates[self.val_offs[val]..self.val_offs[val + 1]]
+    }
+}
+
+/// Position of a cursor in a spilled batch. The `val` index is counted from the start of the
+/// block, like the `key` index.
+#[derive(Debug, Clone, Copy, Default)]
+pub struct BlockPosition {
+    block: usize,
+    key: usize,
+    val: usize,
+}
+
+impl BlockPosition {
+    /// Moves to the next value, stepping to the next key or block at their ends. Returns true
+    /// if the position left `block`.
+    fn step<B: BatchReader>(&mut self, block: &Block<B>) -> bool {
+        self.val += 1;
+        if self.val < block.key_offs[self.key + 1] {
+            return false;
+        }
+        self.step_key(block)
+    }
+
+    /// Moves to the next key, returning true if the position left `block`.
+    fn step_key<B: BatchReader>(&mut self, block: &Block<B>) -> bool {
+        self.key += 1;
+        if self.key < block.keys.len() {
+            self.val = block.key_offs[self.key];
+            return false;
+        }
+        self.block += 1;
+        self.key = 0;
+        self.val = 0;
+        true
+    }
+}
+
+struct BlockMeta<K> {
+    first_key: K,
+    offset: usize,
+    len: usize,
+    updates: usize,
+}
+
+/// A batch written to disk.
+struct SpilledBatch<B: BatchReader> {
+    id: u64,
+    len: usize,
+    desc: Description<B::Time>,
+    blocks: Vec<BlockMeta<B::Key>>,
+    data: Mmap,
+}
+
+impl<B> SpilledBatch<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn read_block(&self, index: usize) -> DynResult<Block<B>> {
+        let meta = &self.blocks[index];
+        let mut reader = FrameDecoder::new(&self.data[meta.offset..meta.offset + meta.len]);
+        let mut block = Block::with_capacity(meta.updates);
+        for _ in 0..meta.updates {
+            let (key, val, time, diff): (B::Key, B::Val, B::Time, B::R) =
+                bincode::deserialize_from(&mut reader)?;
+            block.push(key, val, time, diff);
+        }
+        SPILL_STORE.with_borrow_mut(|store| {
+            if let Some(store) = store {
+                store.read_updates += meta.updates;
+            }
+        });
+        Ok(block.seal())
+    }
+
+    fn read_block_or_panic(&self, index: usize) -> Block<B> {
+        self.read_block(index)
+            .unwrap_or_else(|error| panic!("failed to read a spilled batch: {error}"))
+    }
+
+    fn load_block(&self, index: usize) -> Rc<Block<B>> {
+        let cached =
+            SPILL_STORE.with_borrow_mut(|store| store.as_mut()?.cache.get((self.id, index)));
+        if let Some(block) = cached.and_then(|block| block.downcast::<Block<B>>().ok()) {
+            return block;
+        }
+        let block = Rc::new(self.read_block_or_panic(index));
+        SPILL_STORE.with_borrow_mut(|store| {
+            if let Some(store) = store {
+                let updates = self.blocks[index].updates;
+                store.cache.insert((self.id, index), updates, block.clone());
+            }
+        });
+        block
+    }
+
+    /// Returns the index of the only block that may hold `key` among the blocks from `start`.
+    fn find_block(&self, start: usize, key: &B::Key) -> usize {
+        let following = self.blocks[start..].partition_point(|meta| meta.first_key <= *key);
+        start + following.saturating_sub(1)
+    }
+}
+
+impl<B: BatchReader> Drop for SpilledBatch<B> {
+    fn drop(&mut self) {
+        let evicted = SPILL_STORE
+            .try_with(|store| {
+                let mut store = store.try_borrow_mut().ok()?;
+                Some(store.as_mut()?.cache.remove_batch(self.id))
+            })
+            .ok()
+            .flatten();
+        drop(evicted);
+    }
+}
+
+/// Writes the updates of a batch, in order, to a new spilled batch.
+struct SpillWriter<B: BatchReader> {
+    id: u64,
+    writer: BufWriter<File>,
+    offset: usize,
+    len: usize,
+    blocks: Vec<BlockMeta<B::Key>>,
+    block: Vec<u8>,
+    block_updates: usize,
+    block_first_key: Option<B::Key>,
+    last_key: Option<B::Key>,
+}
+
+impl<B> SpillWriter<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn new(id: u64, dir: &Path) -> DynResult<Self> {
+        // the file is unlinked at once, its space is freed when the mapping is dropped
+        let file = tempfile::tempfile_in(dir)?;
+        Ok(Self {
+            id,
+            writer: BufWriter::new(file),
+            offset: 0,
+            len: 0,
+            blocks: Vec::new(),
+            block: Vec::new(),
+            block_updates: 0,
+            block_first_key: None,
+            last_key: None,
+        })
+    }
+
+    fn push(&mut self, key: &B::Key, val: &B::Val, time: &B::Time, diff: &B::R) -> DynResult<()> {
+        if self.last_key.as_ref() != Some(key) {
+            // blocks hold whole keys, so that a key is found in a single block
+            if self.block_updates >= BLOCK_UPDATES {
+                self.write_block()?;
+            }
+            if self.block_first_key.is_none() {
+                self.block_first_key = Some(key.clone());
+            }
+            self.last_key = Some(key.clone());
+        }
+        bincode::serialize_into(&mut self.block, &(key, val, time, diff))?;
+        self.block_updates += 1;
+        self.len += 1;
+        Ok(())
+    }
+
+    fn write_block(&mut self) -> DynResult<()> {
+        let Some(first_key) = self.block_first_key.take() else {
+            return Ok(());
+        };
+        let mut encoder = FrameEncoder::new(Vec::new());
+        encoder.write_all(&self.block)?;
+        let compressed = encoder.finish()?;
+        self.writer.write_all(&compressed)?;
+        self.blocks.push(BlockMeta {
+            first_key,
+            offset: self.offset,
+            len: compressed.len(),
+            updates: self.block_updates,
+        });
+        self.offset += compressed.len();
+        self.block.clear();
+        self.block_updates = 0;
+        Ok(())
+    }
+
+    /// Returns the spilled batch, or `None` if no updates were written.
+    fn finish(mut self, desc: Description<B::Time>) -> DynResult<Option<SpilledBatch<B>>> {
+        if self.len == 0 {
+            return Ok(None);
+        }
+        self.write_block()?;
+        let file = self
+            .writer
+            .into_inner()
+            .map_err(IntoInnerError::into_error)?;
+        // SAFETY: the file is private to this process and it is not written to anymore
+        let data = unsafe { Mmap::map(&file)? };
+        SPILL_STORE.with_borrow_mut(|store| {
+            if let Some(store) = store {
+                store.spilled_updates += self.len;
+            }
+        });
+        Ok(Some(SpilledBatch {
+            id: self.id,
+            len: self.len,
+            desc,
+            blocks: self.blocks,
+            data,
+        }))
+    }
+}
+
+enum Contents<B: BatchReader> {
+    Resident(Rc<B>),
+    Spilled(Rc<SpilledBatch<B>>),
+}
+
+/// A batch that is either held in memory or spilled to disk.
+pub struct SpillBatch<B: BatchReader> {
+    contents: Contents<B>,
+    /// Blocks of a spilled batch read through this copy, kept until it is dropped.
+    blocks: OnceCell<Box<[OnceCell<Rc<Block<B>>>]>>,
+}
+
+impl<B: BatchReader> Clone for SpillBatch<B> {
+    fn clone(&self) -> Self {
+        let contents = match &self.contents {
+            Contents::Resident(batch) => Contents::Resident(batch.clone()),
+            Contents::Spilled(batch) => Contents::Spilled(batch.clone()),
+        };
+        Self {
+            contents,
+            blocks: self.blocks.clone(),
+        }
+    }
+}
+
+impl<B> SpillBatch<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn resident(batch: B) -> Self {
+        Self {
+            contents: Contents::Resident(Rc::new(batch)),
+            blocks: OnceCell::new(),
+        }
+    }
+
+    fn spilled(batch: SpilledBatch<B>) -> Self {
+        Self {
+            contents: Contents::Spilled(Rc::new(batch)),
+            blocks: OnceCell::new(),
+        }
+    }
+
+    fn as_resident(&self) -> Option<&B> {
+        match &self.contents {
+            Contents::Resident(batch) => Some(&**batch),
+            Contents::Spilled(_) => None,
+        }
+    }
+
+    fn resident_contents(&self) -> &B {
+        self.as_resident()
+            .expect("a cursor of a resident batch should be used with a copy of that batch")
+    }
+
+    fn spilled_contents(&self) -> &SpilledBatch<B> {
+        match &self.contents {
+            Contents::Spilled(batch) => &**batch,
+            Contents::Resident(_) => {
+                panic!("a cursor of a spilled batch should be used with a copy of that batch")
+            }
+        }
+    }
+
+    /// Returns a block of the spilled batch, keeping it in memory for as long as this copy
+    /// lives.
+    fn block(&self, index: usize) -> &Block<B> {
+        let spilled = self.spilled_contents();
+        let blocks = self
+            .blocks
+            .get_or_init(|| spilled.blocks.iter().map(|_| OnceCell::new()).collect());
+        blocks[index].get_or_init(|| spilled.load_block(index))
+    }
+}
+
+impl<B> BatchReader for SpillBatch<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    type Key = B::Key;
+    type Val = B::Val;
+    type Time = B::Time;
+    type R = B::R;
+
+    type Cursor = SpillCursor<B>;
+
+    fn cursor(&self) -> Self::Cursor {
+        match &self.contents {
+            Contents::Resident(batch) => SpillCursor::Resident(batch.cursor()),
+            Contents::Spilled(_) => SpillCursor::Spilled(BlockPosition::default()),
+        }
+    }
+
+    fn len(&self) -> usize {
+        match &self.contents {
+            Contents::Resident(batch) => B::len(batch),
+            Contents::Spilled(spilled) => spilled.len,
+        }
+    }
+
+    fn description(&self) -> &Description<Self::Time> {
+        match &self.contents {
+            Contents::Resident(batch) => B::description(batch),
+            Contents::Spilled(spilled) => &spilled.desc,
+        }
+    }
+}
+
+/// Cursor of a [`SpillBatch`]. It can be used with any copy of the batch it was created from.
+pub enum SpillCursor<B: BatchReader> {
+    Resident(B::Cursor),
+    Spilled(BlockPosition),
+}
+
+impl<B> Cursor for SpillCursor<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    type Key = B::Key;
+    type Val = B::Val;
+    type Time = B::Time;
+    type R = B::R;
+
+    type Storage = SpillBatch<B>;
+
+    fn key_valid(&self, storage: &Self::Storage) -> bool {
+        match self {
+            Self::Resident(cursor) => cursor.key_valid(storage.resident_contents()),
+            Self::Spilled(position) => position.block < storage.spilled_contents().blocks.len(),
+        }
+    }
+
+    fn val_valid(&self, storage: &Self::Storage) -> bool {
+        match self {
+            Self::Resident(cursor) => cursor.val_valid(storage.resident_contents()),
+            Self::Spilled(position) => {
+                self.key_valid(storage)
+                    && position.val < storage.block(position.block).key_offs[position.key + 1]
+            }
+        }
+    }
+
+    fn key<'a>(&self, storage: &'a Self::Storage) -> &'a Self::Key {
+        match self {
+            Self::Resident(cursor) => cursor.key(storage.resident_contents()),
+            Self::Spilled(position) => &storage.block(position.block).keys[position.key],
+        }
+    }
+
+    fn val<'a>(&self, storage: &'a Self::Storage) -> &'a Self::Val {
+        match self {
+            Self::Resident(cursor) => cursor.val(storage.resident_contents()),
+            Self::Spilled(position) => &storage.block(position.block).vals[position.val],
+        }
+    }
+
+    fn map_times<L: FnMut(&Self::Time, &Self::R)>(
+        &mut self,
+        storage: &Self::Storage,
+        mut logic: L,
+    ) {
+        match self {
+            Self::Resident(cursor) => cursor.map_times(storage.resident_contents(), logic),
+            Self::Spilled(position) => {
+                for (time, diff) in storage.block(position.block).times(position.val) {
+                    logic(time, diff);
+                }
+            }
+        }
+    }
+
+    fn step_key(&mut self, storage: &Self::Storage) {
+        if !self.key_valid(storage) {
+            return;
+        }
+        match self {
+            Self::Resident(cursor) => cursor.step_key(storage.resident_contents()),
+            Self::Spilled(position) => {
+                position.step_key(storage.block(position.block));
+            }
+        }
+    }
+
+    fn seek_key(&mut self, storage: &Self::Storage, key: &Self::Key) {
+        if !self.key_valid(storage) {
+            return;
+        }
+        match self {
+            Self::Resident(cursor) => cursor.seek_key(storage.resident_contents(), key),
+            Self::Spilled(position) => {
+                // only the block that may hold the key is decoded
+                let block_index = storage.spilled_contents().find_block(position.block, key);
+                if block_index > position.block {
+                    *position = BlockPosition {
+                        block: block_index,
+                        ..BlockPosition::default()
+                    };
+                }
+                let block = storage.block(position.block);
+                position.key += block.keys[position.key..].partition_point(|other| other < key);
+                if position.key < block.keys.len() {
+                    position.val = block.key_offs[position.key];
+                } else {
+                    // the next block starts with a greater key
+                    *position = BlockPosition {
+                        block: position.block + 1,
+                        ..BlockPosition::default()
+                    };
+                }
+            }
+        }
+    }
+
+    fn step_val(&mut self, storage: &Self::Storage) {
+        if !self.val_valid(storage) {
+            return;
+        }
+        match self {
+            Self::Resident(cursor) => cursor.step_val(storage.resident_contents()),
+            Self::Spilled(position) => position.val += 1,
+        }
+    }
+
+    fn seek_val(&mut self, storage: &Self::Storage, val: &Self::Val) {
+        if !self.val_valid(storage) {
+            return;
+        }
+        match self {
+            Self::Resident(cursor) => cursor.seek_val(storage.resident_contents(), val),
+            Self::Spilled(position) => {
+                let block = storage.block(position.block);
+                let vals = &block.vals[position.val..block.key_offs[position.key + 1]];
+                position.val += vals.partition_point(|other| other < val);
+            }
+        }
+    }
+
+    fn rewind_keys(&mut self, storage: &Self::Storage) {
+        match self {
+            Self::Resident(cursor) => cursor.rewind_keys(storage.resident_contents()),
+            Self::Spilled(position) => *position = BlockPosition::default(),
+        }
+    }
+
+    fn rewind_vals(&mut self, storage: &Self::Storage) {
+        if !self.key_valid(storage) {
+            return;
+        }
+        match self {
+            Self::Resident(cursor) => cursor.rewind_vals(storage.resident_contents()),
+            Self::Spilled(position) => {
+                position.val = storage.block(position.block).key_offs[position.key];
+            }
+        }
+    }
+}
+
+impl<B> Batch for SpillBatch<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    type Batcher = SpillBatcher<B>;
+    type Builder = SpillBuilder<B>;
+    type Merger = SpillMerger<B>;
+}
+
+pub struct SpillBatcher<B: Batch> {
+    batcher: B::Batcher,
+}
+
+impl<B> Batcher<SpillBatch<B>> for SpillBatcher<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn new() -> Self {
+        Self {
+            batcher: <B::Batcher as Batcher<B>>::new(),
+        }
+    }
+
+    fn push_batch(&mut self, batch: RefOrMut<Vec<((B::Key, B::Val), B::Time, B::R)>>) {
+        self.batcher.push_batch(batch);
+    }
+
+    fn seal(&mut self, upper: Antichain<B::Time>) -> SpillBatch<B> {
+        SpillBatch::resident(self.batcher.seal(upper))
+    }
+
+    fn frontier(&mut self) -> AntichainRef<B::Time> {
+        self.batcher.frontier()
+    }
+}
+
+pub struct SpillBuilder<B: Batch> {
+    builder: B::Builder,
+}
+
+impl<B> Builder<SpillBatch<B>> for SpillBuilder<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn new() -> Self {
+        Self {
+            builder: <B::Builder as Builder<B>>::new(),
+        }
+    }
+
+    fn with_capacity(cap: usize) -> Self {
+        Self {
+            builder: <B::Builder as Builder<B>>::with_capacity(cap),
+        }
+    }
+
+    fn push(&mut self, element: (B::Key, B::Val, B::Time, B::R)) {
+        self.builder.push(element);
+    }
+
+    fn done(
+        self,
+        lower: Antichain<B::Time>,
+        upper: Antichain<B::Time>,
+        since: Antichain<B::Time>,
+    ) -> SpillBatch<B> {
+        SpillBatch::resident(self.builder.done(lower, upper, since))
+    }
+}
+
+/// One of the batches of a streamed merge, read in order.
+enum MergeSource<B: BatchReader> {
+    Resident {
+        batch: Rc<B>,
+        cursor: B::Cursor,
+    },
+    Spilled {
+        batch: Rc<SpilledBatch<B>>,
+        block: Option<Block<B>>,
+        position: BlockPosition,
+    },
+}
+
+impl<B> MergeSource<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn new(source: &SpillBatch<B>) -> Self {
+        match &source.contents {
+            Contents::Resident(batch) => Self::Resident {
+                cursor: batch.cursor(),
+                batch: batch.clone(),
+            },
+            Contents::Spilled(batch) => Self::Spilled {
+                batch: batch.clone(),
+                block: None,
+                position: BlockPosition::default(),
+            },
+        }
+    }
+
+    /// Returns the key and the value of the next updates, if any are left.
+    fn peek(&mut self) -> Option<(&B::Key, &B::Val)> {
+        match self {
+            Self::Resident { batch, cursor } => {
+                let batch: &B = batch;
+                if cursor.key_valid(batch) {
+                    Some((cursor.key(batch), cursor.val(batch)))
+                } else {
+                    None
+                }
+            }
+            Self::Spilled {
+                batch,
+                block,
+                position,
+            } => {
+                if block.is_none() && position.block < batch.blocks.len() {
+                    // read past the cache, merges would evict the blocks of the readers
+                    *block = Some(batch.read_block_or_panic(position.block));
+                }
+                let block = block.as_ref()?;
+                Some((&block.keys[position.key], &block.vals[position.val]))
+            }
+        }
+    }
+
+    /// Appends the updates of the current value to `times` and moves to the next value.
+    fn take_times(&mut self, times: &mut Vec<(B::Time, B::R)>) {
+        match self {
+            Self::Resident { batch, cursor } => {
+                let batch: &B = batch;
+                cursor.map_times(batch, |time, diff| times.push((time.clone(), diff.clone())));
+                cursor.step_val(batch);
+                if !cursor.val_valid(batch) {
+                    cursor.step_key(batch);
+                }
+            }
+            Self::Spilled {
+                block, position, ..
+            } => {
+                let Some(current) = block.as_ref() else {
+                    return;
+                };
+                times.extend_from_slice(current.times(position.val));
+                if position.step(current) {
+                    *block = None;
+                }
+            }
+        }
+    }
+}
+
+enum MergeOutput<B: Batch> {
+    Spilled(SpillWriter<B>),
+    Resident(B::Builder),
+}
+
+/// Merges two batches update by update, holding at most one block of each of them in memory.
+pub struct StreamedMerge<B: Batch> {
+    sources: (MergeSource<B>, MergeSource<B>),
+    description: Description<B::Time>,
+    should_compact: bool,
+    output: MergeOutput<B>,
+    times: Vec<(B::Time, B::R)>,
+}
+
+impl<B> StreamedMerge<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn work(&mut self, fuel: &mut isize) {
+        while *fuel > 0 {
+            let (key, val, order) = {
+                let first = self.sources.0.peek();
+                let second = self.sources.1.peek();
+                let (order, (key, val)) = match (first, second) {
+                    (None, None) => return,
+                    (Some(first), None) => (Ordering::Less, first),
+                    (None, Some(second)) => (Ordering::Greater, second),
+                    (Some(first), Some(second)) => match first.cmp(&second) {
+                        Ordering::Greater => (Ordering::Greater, second),
+                        order => (order, first),
+                    },
+                };
+                (key.clone(), val.clone(), order)
+            };
+            self.times.clear();
+            if order != Ordering::Greater {
+                self.sources.0.take_times(&mut self.times);
+            }
+            if order != Ordering::Less {
+                self.sources.1.take_times(&mut self.times);
+            }
+            if self.should_compact {
+                for (time, _diff) in &mut self.times {
+                    time.advance_by(self.description.since().borrow());
+                }
+            }
+            consolidate(&mut self.times);
+            for (time, diff) in &self.times {
+                match &mut self.output {
+                    MergeOutput::Spilled(writer) => writer
+                        .push(&key, &val, time, diff)
+                        .unwrap_or_else(|error| panic!("failed to write a spilled batch: {error}")),
+                    MergeOutput::Resident(builder) => {
+                        builder.push((key.clone(), val.clone(), time.clone(), diff.clone()));
+                    }
+                }
+            }
+            *fuel -= isize::try_from(self.times.len().max(1)).unwrap_or(isize::MAX);
+        }
+    }
+
+    fn done(self) -> SpillBatch<B> {
+        let lower = self.description.lower().clone();
+        let upper = self.description.upper().clone();
+        let since = self.description.since().clone();
+        match self.output {
+            MergeOutput::Spilled(writer) => match writer.finish(self.description) {
+                Ok(Some(spilled)) => SpillBatch::spilled(spilled),
+                Ok(None) => SpillBatch::resident(
+                    <B::Builder as Builder<B>>::new().done(lower, upper, since),
+                ),
+                Err(error) => panic!("failed to write a spilled batch: {error}"),
+            },
+            MergeOutput::Resident(builder) => {
+                SpillBatch::resident(builder.done(lower, upper, since))
+            }
+        }
+    }
+}
+
+/// Merges two batches. Batches that are large together are merged by streaming their
+/// updates to disk, the others in memory by the merger of the inner batches.
+pub enum SpillMerger<B: Batch> {
+    Resident(B::Merger),
+    Streamed(StreamedMerge<B>),
+}
+
+impl<B> Merger<SpillBatch<B>> for SpillMerger<B>
+where
+    B: Batch + 'static,
+    B::Key: Ord + Clone + Serialize + DeserializeOwned,
+    B::Val: Ord + Clone + Serialize + DeserializeOwned,
+    B::Time: Lattice + Ord + Clone + Serialize + DeserializeOwned,
+    B::R: Semigroup + Serialize + DeserializeOwned,
+{
+    fn new(
+        source1: &SpillBatch<B>,
+        source2: &SpillBatch<B>,
+        compaction_frontier: Option<AntichainRef<B::Time>>,
+    ) -> Self {
+        let len = source1.len() + source2.len();
+        let writer = SPILL_STORE.with_borrow_mut(|store| {
+            let store = store.as_mut()?;
+            if len < store.config.threshold {
+                return None;
+            }
+            let id = store.next_id;
+            store.next_id += 1;
+            SpillWriter::new(id, &store.config.dir)
+                .map_err(|error| {
+                    warn!(
+                        "Failed to spill a batch to {}: {error}",
+                        store.config.dir.display()
+                    );
+                })
+                .ok()
+        });
+        if let (None, Some(batch1), Some(batch2)) =
+            (&writer, source1.as_resident(), source2.as_resident())
+        {
+            return Self::Resident(B::begin_merge(batch1, batch2, compaction_frontier));
+        }
+
+        let mut since = source1
+            .description()
+            .since()
+            .join(source2.description().since());
+        if let Some(compaction_frontier) = compaction_frontier {
+            since = since.join(&compaction_frontier.to_owned());
+        }
+        let description = Description::new(source1.lower().clone(), source2.upper().clone(), since);
+        let output = match writer {
+            Some(writer) => MergeOutput::Spilled(writer),
+            None => MergeOutput::Resident(<B::Builder as Builder<B>>::with_capacity(len)),
+        };
+        Self::Streamed(StreamedMerge {
+            sources: (MergeSource::new(source1), MergeSource::new(source2)),
+            description,
+            should_compact: compaction_frontier.is_some(),
+            output,
+            times: Vec::new(),
+        })
+    }
+
+    fn work(&mut self, source1: &SpillBatch<B>, source2: &SpillBatch<B>, fuel: &mut isize) {
+        match self {
+            Self::Resident(merger) => merger.work(
+                source1.resident_contents(),
+                source2.resident_contents(),
+                fuel,
+            ),
+            Self::Streamed(merge) => merge.work(fuel),
+        }
+    }
+
+    fn done(self) -> SpillBatch<B> {
+        match self {
+            Self::Resident(merger) => SpillBatch::resident(merger.done()),
+            Self::Streamed(merge) => merge.done(),
+        }
+    }
+}
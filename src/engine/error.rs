@@ -67,6 +67,9 @@ pub enum Error {
     #[error("wrong join type")]
     BadJoinType,
 
+    #[error("only one side of a join can be broadcast")]
+    BadJoinStrategy,
+
     #[error("wrong ix key policy")]
     BadIxKeyPolicy,
 
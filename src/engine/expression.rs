@@ -22,6 +22,10 @@ use super::{Key, Type, Value};
 use crate::engine::ShardPolicy;
 use crate::mat_mul::mat_mul;
 
+/// Function applied to whole columns at once. It gets one column per argument, holding
+/// the arguments of all rows, and has to return one value per row.
+pub type VectorizedFn = Box<dyn Fn(&[Vec<Value>]) -> DynResult<Vec<Value>> + Send + Sync>;
+
 #[derive(Debug)]
 pub enum Expressions {
     Explicit(SmallVec<[Arc<Expression>; 2]>),
@@ -105,6 +109,7 @@ pub enum AnyExpression {
         #[derivative(Debug = "ignore")] Box<dyn Fn(&[Value]) -> DynResult<Value> + Send + Sync>,
         Expressions,
     ),
+    VectorizedApply(#[derivative(Debug = "ignore")] VectorizedFn, Expressions),
     IfElse(Arc<Expression>, Arc<Expression>, Arc<Expression>),
     OptionalPointerFrom(Expressions),
     OptionalPointerWithInstanceFrom(Expressions, Arc<Expression>),
@@ -374,6 +379,7 @@ fn get_array_element(
     match value {
         Value::IntArray(array) => get_ndarray_element(&array, index),
         Value::FloatArray(array) => get_ndarray_element(&array, index),
+        Value::Float32Array(array) => get_ndarray_element(&array, index),
         Value::Tuple(tuple) => get_tuple_element(&tuple, index),
         _ => Err(DynError::from(DataError::ValueError(format!(
             "Can't get element at index {index} out of {value:?}"
@@ -461,8 +467,13 @@ fn compare_tuples(lhs: &Arc<[Value]>, rhs: &Arc<[Value]>) -> DynResult<Ordering>
             (val_l, val_r) => {
                 let type_l = val_l.kind();
                 let type_r = val_r.kind();
-                let is_incomparable_type =
-                    [Kind::Json, Kind::IntArray, Kind::FloatArray].contains(&type_l);
+                let is_incomparable_type = [
+                    Kind::Json,
+                    Kind::IntArray,
+                    Kind::FloatArray,
+                    Kind::Float32Array,
+                ]
+                .contains(&type_l);
                 if type_l != type_r || is_incomparable_type {
                     let msg = format!(
                         "comparison not supported between instances of '{type_l:?}' and '{type_r:?}'",
@@ -495,6 +506,9 @@ impl AnyExpression {
                 .into_result()?,
             Self::Const(v) => v.clone(),
             Self::Apply(f, args) => f(&args.eval(values)?)?,
+            Self::VectorizedApply(f, args) => eval_vectorized_apply(f, args, &[values])
+                .pop()
+                .expect("one result per row")?,
             Self::OptionalApply(f, args) => {
                 let args = args.eval(values)?;
                 if args.iter().any(|a| matches!(a, Value::None)) {
@@ -645,6 +659,9 @@ impl AnyExpression {
                 let rhs_val = rhs.eval(values)?;
                 match (lhs_val, rhs_val) {
                     (Value::FloatArray(lhs), Value::FloatArray(rhs)) => mat_mul_wrapper(&lhs, &rhs),
+                    (Value::Float32Array(lhs), Value::Float32Array(rhs)) => {
+                        mat_mul_wrapper(&lhs, &rhs)
+                    }
                     (Value::IntArray(lhs), Value::IntArray(rhs)) => mat_mul_wrapper(&lhs, &rhs),
                     (lhs_val, rhs_val) => {
                         let lhs_type = lhs_val.kind();
@@ -1278,6 +1295,561 @@ impl Expression {
     }
 }
 
+/// Values of a single subexpression computed for a whole minibatch by
+/// [`Expression::eval_batch`].
+///
+/// `errors` works as an error bitmap: it is left empty as long as no row failed, so that
+/// the common path operates on plain vectors only. Rows with an error hold a placeholder
+/// value.
+struct BatchColumn<T> {
+    values: Vec<T>,
+    errors: Vec<Option<DynError>>,
+}
+
+impl<T: Default> BatchColumn<T> {
+    fn splat(value: T, len: usize) -> Self
+    where
+        T: Clone,
+    {
+        Self {
+            values: vec![value; len],
+            errors: Vec::new(),
+        }
+    }
+
+    fn from_results(len: usize, results: impl Iterator<Item = DynResult<T>>) -> Self {
+        let mut values = Vec::with_capacity(len);
+        let mut errors = Vec::new();
+        for (i, result) in results.enumerate() {
+            match result {
+                Ok(value) => values.push(value),
+                Err(error) => {
+                    if errors.is_empty() {
+                        errors.resize_with(len, || None);
+                    }
+                    errors[i] = Some(error);
+                    values.push(T::default());
+                }
+            }
+        }
+        Self { values, errors }
+    }
+
+    fn from_rows(rows: &[&[Value]], eval: impl Fn(&[Value]) -> DynResult<T>) -> Self {
+        Self::from_results(rows.len(), rows.iter().map(|values| eval(values)))
+    }
+
+    fn argument(rows: &[&[Value]], index: usize, convert: impl Fn(&Value) -> DynResult<T>) -> Self {
+        Self::from_rows(rows, |values| match values.get(index) {
+            None => Err(DataError::IndexOutOfBounds.into()),
+            Some(Value::Error) => Err(DataError::ErrorInValue.into()),
+            Some(value) => convert(value),
+        })
+    }
+
+    fn is_ok(&self, i: usize) -> bool {
+        self.errors.is_empty() || self.errors[i].is_none()
+    }
+
+    fn map<U>(self, op: impl Fn(&T) -> U) -> BatchColumn<U> {
+        BatchColumn {
+            values: self.values.iter().map(op).collect(),
+            errors: self.errors,
+        }
+    }
+
+    fn into_results(self) -> Vec<DynResult<Value>>
+    where
+        T: Into<Value>,
+    {
+        let mut errors = self.errors.into_iter();
+        self.values
+            .into_iter()
+            .map(|value| match errors.next().flatten() {
+                Some(error) => Err(error),
+                None => Ok(value.into()),
+            })
+            .collect()
+    }
+}
+
+fn merge_errors(
+    first: Vec<Option<DynError>>,
+    second: Vec<Option<DynError>>,
+) -> Vec<Option<DynError>> {
+    if first.is_empty() {
+        second
+    } else if second.is_empty() {
+        first
+    } else {
+        first
+            .into_iter()
+            .zip(second)
+            .map(|(first, second)| first.or(second))
+            .collect()
+    }
+}
+
+trait BatchEval: Default + Sized {
+    fn eval_batch(expression: &Expression, rows: &[&[Value]]) -> BatchColumn<Self>;
+}
+
+impl BatchEval for bool {
+    fn eval_batch(expression: &Expression, rows: &[&[Value]]) -> BatchColumn<Self> {
+        expression.eval_batch_as_bool(rows)
+    }
+}
+
+impl BatchEval for i64 {
+    fn eval_batch(expression: &Expression, rows: &[&[Value]]) -> BatchColumn<Self> {
+        expression.eval_batch_as_int(rows)
+    }
+}
+
+impl BatchEval for f64 {
+    fn eval_batch(expression: &Expression, rows: &[&[Value]]) -> BatchColumn<Self> {
+        expression.eval_batch_as_float(rows)
+    }
+}
+
+impl BatchEval for ArcStr {
+    fn eval_batch(expression: &Expression, rows: &[&[Value]]) -> BatchColumn<Self> {
+        expression.eval_batch_as_string(rows)
+    }
+}
+
+/// Evaluates `expression` only for the rows for which `first` succeeded and `proceed`
+/// holds. The row path stops at the first failing (or short-circuiting) operand, so
+/// skipped rows must not be evaluated here either, as they may call user functions.
+fn eval_batch_where<F, S: BatchEval>(
+    rows: &[&[Value]],
+    first: &BatchColumn<F>,
+    proceed: impl Fn(&F) -> bool,
+    expression: &Expression,
+) -> BatchColumn<S> {
+    if first.errors.is_empty() && first.values.iter().all(&proceed) {
+        return S::eval_batch(expression, rows);
+    }
+    let selected: Vec<usize> = (0..rows.len())
+        .filter(|i| first.is_ok(*i) && proceed(&first.values[*i]))
+        .collect();
+    let selected_rows: Vec<&[Value]> = selected.iter().map(|i| rows[*i]).collect();
+    let partial = S::eval_batch(expression, &selected_rows);
+
+    let mut values: Vec<S> = Vec::with_capacity(rows.len());
+    values.resize_with(rows.len(), S::default);
+    for (i, value) in selected.iter().zip(partial.values) {
+        values[*i] = value;
+    }
+    let mut errors = Vec::new();
+    if !partial.errors.is_empty() {
+        errors.resize_with(rows.len(), || None);
+        for (i, error) in selected.iter().zip(partial.errors) {
+            errors[*i] = error;
+        }
+    }
+    BatchColumn { values, errors }
+}
+
+/// Applies an infallible binary operator column by column.
+fn eval_batch_zip<L: BatchEval, R: BatchEval, T>(
+    rows: &[&[Value]],
+    lhs: &Expression,
+    rhs: &Expression,
+    op: impl Fn(&L, &R) -> T,
+) -> BatchColumn<T> {
+    let lhs = L::eval_batch(lhs, rows);
+    let rhs: BatchColumn<R> = eval_batch_where(rows, &lhs, |_| true, rhs);
+    BatchColumn {
+        values: lhs
+            .values
+            .iter()
+            .zip(&rhs.values)
+            .map(|(lhs, rhs)| op(lhs, rhs))
+            .collect(),
+        errors: merge_errors(lhs.errors, rhs.errors),
+    }
+}
+
+/// Applies a fallible binary operator. `second` is evaluated only for the rows for which
+/// `first` succeeded and `proceed` holds; for the remaining successful rows `op` receives
+/// a placeholder as its second argument.
+fn eval_batch_zip_checked<F: BatchEval, S: BatchEval, T: Default>(
+    rows: &[&[Value]],
+    first: &Expression,
+    proceed: impl Fn(&F) -> bool,
+    second: &Expression,
+    op: impl Fn(&F, &S) -> DynResult<T>,
+) -> BatchColumn<T> {
+    let first = F::eval_batch(first, rows);
+    let second: BatchColumn<S> = eval_batch_where(rows, &first, proceed, second);
+    let mut errors = merge_errors(first.errors, second.errors).into_iter();
+    let results = first
+        .values
+        .iter()
+        .zip(&second.values)
+        .map(|(first, second)| match errors.next().flatten() {
+            Some(error) => Err(error),
+            None => op(first, second),
+        });
+    BatchColumn::from_results(rows.len(), results)
+}
+
+impl BoolExpression {
+    fn eval_batch(&self, rows: &[&[Value]]) -> BatchColumn<bool> {
+        match self {
+            Self::Const(c) => BatchColumn::splat(*c, rows.len()),
+            Self::Not(e) => e.eval_batch_as_bool(rows).map(|value| !value),
+            Self::And(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                lhs,
+                |lhs: &bool| *lhs,
+                rhs,
+                |lhs: &bool, rhs: &bool| Ok(*lhs && *rhs),
+            ),
+            Self::Or(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                lhs,
+                |lhs: &bool| !lhs,
+                rhs,
+                |lhs: &bool, rhs: &bool| Ok(*lhs || *rhs),
+            ),
+            Self::Xor(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &bool, rhs: &bool| lhs ^ rhs)
+            }
+            Self::BoolEq(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &bool, rhs: &bool| lhs == rhs)
+            }
+            Self::BoolNe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &bool, rhs: &bool| lhs != rhs)
+            }
+            Self::IntEq(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs == rhs)
+            }
+            Self::IntNe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs != rhs)
+            }
+            Self::IntLt(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs < rhs)
+            }
+            Self::IntLe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs <= rhs)
+            }
+            Self::IntGt(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs > rhs)
+            }
+            Self::IntGe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs >= rhs)
+            }
+            #[allow(clippy::float_cmp)]
+            Self::FloatEq(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs == rhs)
+            }
+            #[allow(clippy::float_cmp)]
+            Self::FloatNe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs != rhs)
+            }
+            Self::FloatLt(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs < rhs)
+            }
+            Self::FloatLe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs <= rhs)
+            }
+            Self::FloatGt(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs > rhs)
+            }
+            Self::FloatGe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs >= rhs)
+            }
+            Self::StringEq(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &ArcStr, rhs: &ArcStr| **lhs == **rhs)
+            }
+            Self::StringNe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &ArcStr, rhs: &ArcStr| **lhs != **rhs)
+            }
+            Self::StringLt(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &ArcStr, rhs: &ArcStr| **lhs < **rhs)
+            }
+            Self::StringLe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &ArcStr, rhs: &ArcStr| **lhs <= **rhs)
+            }
+            Self::StringGt(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &ArcStr, rhs: &ArcStr| **lhs > **rhs)
+            }
+            Self::StringGe(lhs, rhs) => {
+                eval_batch_zip(rows, lhs, rhs, |lhs: &ArcStr, rhs: &ArcStr| **lhs >= **rhs)
+            }
+            _ => BatchColumn::from_rows(rows, |values| self.eval(values)),
+        }
+    }
+}
+
+impl IntExpression {
+    fn eval_batch(&self, rows: &[&[Value]]) -> BatchColumn<i64> {
+        match self {
+            Self::Const(c) => BatchColumn::splat(*c, rows.len()),
+            Self::Neg(e) => e.eval_batch_as_int(rows).map(|value| -value),
+            Self::Abs(e) => e.eval_batch_as_int(rows).map(|value| value.abs()),
+            Self::Add(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs + rhs),
+            Self::Sub(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs - rhs),
+            Self::Mul(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs * rhs),
+            Self::And(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs & rhs),
+            Self::Or(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs | rhs),
+            Self::Xor(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &i64, rhs: &i64| lhs ^ rhs),
+            // the divisor is evaluated first, as in the row path
+            Self::FloorDiv(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                rhs,
+                |rhs: &i64| *rhs != 0,
+                lhs,
+                |rhs: &i64, lhs: &i64| {
+                    if *rhs == 0 {
+                        Err(DynError::from(DataError::DivisionByZero))
+                    } else {
+                        Ok(Integer::div_floor(lhs, rhs))
+                    }
+                },
+            ),
+            Self::Mod(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                rhs,
+                |rhs: &i64| *rhs != 0,
+                lhs,
+                |rhs: &i64, lhs: &i64| {
+                    if *rhs == 0 {
+                        Err(DynError::from(DataError::DivisionByZero))
+                    } else {
+                        Ok(Integer::mod_floor(lhs, rhs))
+                    }
+                },
+            ),
+            #[allow(clippy::cast_possible_truncation)]
+            Self::CastFromFloat(e) => e.eval_batch_as_float(rows).map(|value| *value as i64),
+            Self::CastFromBool(e) => e.eval_batch_as_bool(rows).map(|value| i64::from(*value)),
+            _ => BatchColumn::from_rows(rows, |values| self.eval(values)),
+        }
+    }
+}
+
+impl FloatExpression {
+    fn eval_batch(&self, rows: &[&[Value]]) -> BatchColumn<f64> {
+        match self {
+            Self::Const(c) => BatchColumn::splat(*c, rows.len()),
+            Self::Neg(e) => e.eval_batch_as_float(rows).map(|value| -value),
+            Self::Abs(e) => e.eval_batch_as_float(rows).map(|value| value.abs()),
+            Self::Add(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs + rhs),
+            Self::Sub(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs - rhs),
+            Self::Mul(lhs, rhs) => eval_batch_zip(rows, lhs, rhs, |lhs: &f64, rhs: &f64| lhs * rhs),
+            // the divisor is evaluated first, as in the row path
+            Self::FloorDiv(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                rhs,
+                |rhs: &f64| *rhs != 0.0f64,
+                lhs,
+                |rhs: &f64, lhs: &f64| {
+                    if *rhs == 0.0f64 {
+                        Err(DynError::from(DataError::DivisionByZero))
+                    } else {
+                        Ok((lhs / rhs).floor())
+                    }
+                },
+            ),
+            Self::TrueDiv(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                rhs,
+                |rhs: &f64| *rhs != 0.0f64,
+                lhs,
+                |rhs: &f64, lhs: &f64| {
+                    if *rhs == 0.0f64 {
+                        Err(DynError::from(DataError::DivisionByZero))
+                    } else {
+                        Ok(lhs / rhs)
+                    }
+                },
+            ),
+            #[allow(clippy::cast_precision_loss)]
+            Self::IntTrueDiv(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                rhs,
+                |rhs: &i64| *rhs != 0,
+                lhs,
+                |rhs: &i64, lhs: &i64| {
+                    if *rhs == 0 {
+                        Err(DynError::from(DataError::DivisionByZero))
+                    } else {
+                        Ok(*lhs as f64 / *rhs as f64)
+                    }
+                },
+            ),
+            Self::Mod(lhs, rhs) => eval_batch_zip_checked(
+                rows,
+                lhs,
+                |_: &f64| true,
+                rhs,
+                |lhs: &f64, rhs: &f64| {
+                    if *rhs == 0.0f64 {
+                        return Err(DynError::from(DataError::DivisionByZero));
+                    }
+                    let mut modulo = lhs % rhs;
+                    if modulo == 0.0f64 {
+                        modulo = modulo.copysign(*rhs);
+                    } else if (*rhs < 0.0f64) != (modulo < 0.0f64) {
+                        modulo += rhs;
+                    }
+                    Ok(modulo)
+                },
+            ),
+            Self::CastFromBool(e) => e
+                .eval_batch_as_bool(rows)
+                .map(|value| if *value { 1.0 } else { 0.0 }),
+            #[allow(clippy::cast_precision_loss)]
+            Self::CastFromInt(e) => e.eval_batch_as_int(rows).map(|value| *value as f64),
+            _ => BatchColumn::from_rows(rows, |values| self.eval(values)),
+        }
+    }
+}
+
+/// Calls `f` once for all rows of `rows` for which the arguments could be evaluated.
+fn eval_vectorized_apply(
+    f: &VectorizedFn,
+    args: &Expressions,
+    rows: &[&[Value]],
+) -> Vec<DynResult<Value>> {
+    let mut results = Vec::with_capacity(rows.len());
+    let mut selected = Vec::with_capacity(rows.len());
+    let mut columns: Vec<Vec<Value>> = Vec::new();
+    for (i, values) in rows.iter().enumerate() {
+        match args.eval(values) {
+            Ok(args) => {
+                columns.resize_with(args.len(), || Vec::with_capacity(rows.len()));
+                for (column, arg) in columns.iter_mut().zip(args.iter()) {
+                    column.push(arg.clone());
+                }
+                selected.push(i);
+                results.push(Ok(Value::None));
+            }
+            Err(error) => results.push(Err(error)),
+        }
+    }
+    if selected.is_empty() {
+        return results;
+    }
+    match f(&columns) {
+        Ok(values) if values.len() == selected.len() => {
+            for (i, value) in selected.into_iter().zip(values) {
+                results[i] = Ok(value);
+            }
+        }
+        Ok(values) => {
+            let message = format!(
+                "vectorized function returned {} values for {} rows",
+                values.len(),
+                selected.len()
+            );
+            for i in selected {
+                results[i] = Err(DataError::ValueError(message.clone()).into());
+            }
+        }
+        Err(error) => {
+            let message = error.to_string();
+            let mut error = Some(error);
+            for i in selected {
+                results[i] = Err(error.take().unwrap_or_else(|| message.clone().into()));
+            }
+        }
+    }
+    results
+}
+
+impl Expression {
+    /// Evaluates the expression for all rows of a minibatch at once.
+    ///
+    /// Boolean, integer and float subexpressions are computed column by column on unboxed
+    /// vectors, string operands are materialized once per column. Everything else, in
+    /// particular `Apply` and expressions producing Python objects, is evaluated with
+    /// [`Expression::eval`] row by row. Results, including errors, are the same as the
+    /// ones of calling [`Expression::eval`] on each row. Vectorized functions are called
+    /// once for the whole minibatch.
+    pub fn eval_batch(&self, rows: &[&[Value]]) -> Vec<DynResult<Value>> {
+        match self {
+            Self::Bool(expr) => expr.eval_batch(rows).into_results(),
+            Self::Int(expr) => expr.eval_batch(rows).into_results(),
+            Self::Float(expr) => expr.eval_batch(rows).into_results(),
+            Self::Any(AnyExpression::VectorizedApply(f, args)) => {
+                eval_vectorized_apply(f, args, rows)
+            }
+            _ => rows.iter().map(|values| self.eval(values)).collect(),
+        }
+    }
+
+    /// Whether evaluating the expression with [`Expression::eval_batch`] pays off
+    /// even for small minibatches.
+    pub fn prefers_batch_evaluation(&self) -> bool {
+        matches!(self, Self::Any(AnyExpression::VectorizedApply(..)))
+    }
+
+    fn eval_batch_vectorized<T: Default>(
+        &self,
+        rows: &[&[Value]],
+        convert: impl Fn(Value) -> DynResult<T>,
+    ) -> BatchColumn<T> {
+        let results = self.eval_batch(rows);
+        BatchColumn::from_results(
+            rows.len(),
+            results.into_iter().map(|result| convert(result?)),
+        )
+    }
+
+    fn eval_batch_as_bool(&self, rows: &[&[Value]]) -> BatchColumn<bool> {
+        match self {
+            Self::Bool(expr) => expr.eval_batch(rows),
+            Self::Any(AnyExpression::Argument(i)) => {
+                BatchColumn::argument(rows, *i, Value::as_bool)
+            }
+            Self::Any(AnyExpression::VectorizedApply(..)) => {
+                self.eval_batch_vectorized(rows, |value| value.as_bool())
+            }
+            _ => BatchColumn::from_rows(rows, |values| self.eval_as_bool(values)),
+        }
+    }
+
+    fn eval_batch_as_int(&self, rows: &[&[Value]]) -> BatchColumn<i64> {
+        match self {
+            Self::Int(expr) => expr.eval_batch(rows),
+            Self::Any(AnyExpression::Argument(i)) => BatchColumn::argument(rows, *i, Value::as_int),
+            Self::Any(AnyExpression::VectorizedApply(..)) => {
+                self.eval_batch_vectorized(rows, |value| value.as_int())
+            }
+            _ => BatchColumn::from_rows(rows, |values| self.eval_as_int(values)),
+        }
+    }
+
+    fn eval_batch_as_float(&self, rows: &[&[Value]]) -> BatchColumn<f64> {
+        match self {
+            Self::Float(expr) => expr.eval_batch(rows),
+            Self::Any(AnyExpression::Argument(i)) => {
+                BatchColumn::argument(rows, *i, Value::as_float)
+            }
+            Self::Any(AnyExpression::VectorizedApply(..)) => {
+                self.eval_batch_vectorized(rows, |value| value.as_float())
+            }
+            _ => BatchColumn::from_rows(rows, |values| self.eval_as_float(values)),
+        }
+    }
+
+    fn eval_batch_as_string(&self, rows: &[&[Value]]) -> BatchColumn<ArcStr> {
+        match self {
+            Self::Any(AnyExpression::Argument(i)) => {
+                BatchColumn::argument(rows, *i, |value| value.as_string().cloned())
+            }
+            Self::Any(AnyExpression::VectorizedApply(..)) => {
+                self.eval_batch_vectorized(rows, |value| Ok(value.as_string()?.clone()))
+            }
+            _ => BatchColumn::from_rows(rows, |values| self.eval_as_string(values)),
+        }
+    }
+}
+
 impl From<BoolExpression> for Expression {
     fn from(expr: BoolExpression) -> Self {
         Self::Bool(expr)
@@ -5,7 +5,7 @@ use std::cell::Cell;
 use std::collections::HashMap;
 use std::ops::ControlFlow;
 use std::sync::Arc;
-use std::time::{Duration, SystemTime};
+use std::time::SystemTime;
 
 use futures::future::BoxFuture;
 use id_arena::ArenaBehavior;
@@ -18,13 +18,15 @@ use scopeguard::defer;
 
 use crate::connectors::data_format::{Formatter, Parser};
 use crate::connectors::data_storage::{ReaderBuilder, Writer};
-use crate::connectors::monitoring::ConnectorStats;
+use crate::connectors::monitoring::{ConnectorStats, OutputQueueStats};
+use crate::connectors::CommitPolicy;
 use crate::external_integration::ExternalIndex;
 use crate::persistence::ExternalPersistentId;
 use crate::python_api::extract_value;
 
 use super::error::{DynResult, Trace};
 use super::external_index_wrappers::{ExternalIndexData, ExternalIndexQuery};
+use super::operator_metrics::OperatorMetricsRegistry;
 use super::reduce::StatefulCombineFn;
 use super::{
     Error, Expression, Key, Reducer, Result, ShardPolicy, Timestamp, TotalFrontier, Type, Value,
@@ -428,6 +430,7 @@ impl TableProperties {
 pub struct OperatorProperties {
     pub id: usize,
     pub depends_on_error_log: bool,
+    pub trace: Trace,
 }
 
 pub type IterationLogic<'a> = Box<
@@ -479,6 +482,24 @@ impl JoinType {
     }
 }
 
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub enum JoinStrategy {
+    Shuffle,
+    BroadcastLeft,
+    BroadcastRight,
+}
+
+impl JoinStrategy {
+    pub fn from_broadcast_left_right(left: bool, right: bool) -> Result<Self> {
+        match (left, right) {
+            (false, false) => Ok(Self::Shuffle),
+            (true, false) => Ok(Self::BroadcastLeft),
+            (false, true) => Ok(Self::BroadcastRight),
+            (true, true) => Err(Error::BadJoinStrategy),
+        }
+    }
+}
+
 #[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
 pub enum IxKeyPolicy {
     FailMissing,
@@ -539,15 +560,21 @@ pub struct ProberStats {
     pub operators_stats: HashMap<usize, OperatorStats>,
     #[pyo3(get, set)]
     pub connector_stats: Vec<(String, ConnectorStats)>,
+    #[pyo3(get, set)]
+    pub output_queue_stats: Vec<(String, OutputQueueStats)>,
+    pub operator_metrics: Option<Arc<OperatorMetricsRegistry>>,
+    pub memory_budget: Option<usize>,
 }
 
 pub type OnDataFn = Box<dyn FnMut(Key, &[Value], Timestamp, isize) -> DynResult<()>>;
+pub type OnBatchFn = Box<dyn FnMut(Timestamp, &[(Key, &[Value], isize)]) -> DynResult<()>>;
 pub type OnTimeEndFn = Box<dyn FnMut(Timestamp) -> DynResult<()>>;
 pub type OnEndFn = Box<dyn FnMut() -> DynResult<()>>;
 
 pub struct SubscribeCallbacks {
     pub wrapper: BatchWrapper,
     pub on_data: Option<OnDataFn>,
+    pub on_batch: Option<OnBatchFn>,
     pub on_time_end: Option<OnTimeEndFn>,
     pub on_end: Option<OnEndFn>,
 }
@@ -562,6 +589,7 @@ impl SubscribeCallbacksBuilder {
             inner: SubscribeCallbacks {
                 wrapper: BatchWrapper::None,
                 on_data: None,
+                on_batch: None,
                 on_time_end: None,
                 on_end: None,
             },
@@ -585,6 +613,12 @@ impl SubscribeCallbacksBuilder {
         self
     }
 
+    #[must_use]
+    pub fn on_batch(mut self, on_batch: OnBatchFn) -> Self {
+        self.inner.on_batch = Some(on_batch);
+        self
+    }
+
     #[must_use]
     pub fn on_time_end(mut self, on_time_end: OnTimeEndFn) -> Self {
         self.inner.on_time_end = Some(on_time_end);
@@ -861,6 +895,7 @@ pub trait Graph {
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
+    #[allow(clippy::too_many_arguments)]
     fn group_by_table(
         &self,
         table_handle: TableHandle,
@@ -868,6 +903,7 @@ pub trait Graph {
         shard_policy: ShardPolicy,
         reducers: Vec<ReducerData>,
         set_id: bool,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
@@ -914,6 +950,8 @@ pub trait Graph {
         right_data: JoinData,
         shard_policy: ShardPolicy,
         join_type: JoinType,
+        strategy: JoinStrategy,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle>;
 
@@ -941,7 +979,7 @@ pub trait Graph {
         &self,
         reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
-        commit_duration: Option<Duration>,
+        commit_policy: Option<CommitPolicy>,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -1426,6 +1464,7 @@ impl Graph for ScopedGraph {
         shard_policy: ShardPolicy,
         reducers: Vec<ReducerData>,
         set_id: bool,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         self.try_with(|g| {
@@ -1435,6 +1474,7 @@ impl Graph for ScopedGraph {
                 shard_policy,
                 reducers,
                 set_id,
+                skewed_keys,
                 table_properties,
             )
         })
@@ -1507,6 +1547,8 @@ impl Graph for ScopedGraph {
         right_data: JoinData,
         shard_policy: ShardPolicy,
         join_type: JoinType,
+        strategy: JoinStrategy,
+        skewed_keys: Vec<Vec<Value>>,
         table_properties: Arc<TableProperties>,
     ) -> Result<TableHandle> {
         self.try_with(|g| {
@@ -1515,6 +1557,8 @@ impl Graph for ScopedGraph {
                 right_data,
                 shard_policy,
                 join_type,
+                strategy,
+                skewed_keys,
                 table_properties,
             )
         })
@@ -1552,7 +1596,7 @@ impl Graph for ScopedGraph {
         &self,
         reader: Box<dyn ReaderBuilder>,
         parser: Box<dyn Parser>,
-        commit_duration: Option<Duration>,
+        commit_policy: Option<CommitPolicy>,
         parallel_readers: usize,
         table_properties: Arc<TableProperties>,
         external_persistent_id: Option<&ExternalPersistentId>,
@@ -1561,7 +1605,7 @@ impl Graph for ScopedGraph {
             g.connector_table(
                 reader,
                 parser,
-                commit_duration,
+                commit_policy,
                 parallel_readers,
                 table_properties,
                 external_persistent_id,
@@ -1,6 +1,7 @@
 // Copyright © 2024 Pathway
 
 use std::env;
+use std::sync::atomic::AtomicU64;
 use std::sync::Arc;
 use std::thread::{Builder, JoinHandle};
 use std::time::SystemTime;
@@ -10,10 +11,15 @@ use hyper::service::{make_service_fn, service_fn};
 use hyper::{header, Body, Method, Response, Server, StatusCode};
 use log::{error, info};
 use prometheus_client::encoding::text::encode;
+use prometheus_client::metrics::counter::Counter;
+use prometheus_client::metrics::family::Family;
 use prometheus_client::metrics::gauge::Gauge;
 use prometheus_client::registry::Registry;
 use tokio::sync::oneshot::Sender;
 
+use super::memory::allocator_stats;
+use super::operator_metrics::OperatorMetricsRegistry;
+use super::udf_metrics::udf_stats;
 use super::Error;
 use super::Graph;
 use super::ProberStats;
@@ -65,11 +71,301 @@ fn metrics_from_stats(stats: &Arc<ArcSwapOption<ProberStats>>) -> String {
             output_latency_ms,
         );
 
+        let output_queue_depth = Family::<Vec<(String, String)>, Gauge>::default();
+        let output_in_flight_batches = Family::<Vec<(String, String)>, Gauge>::default();
+        let output_flush_latency_ms = Family::<Vec<(String, String)>, Gauge>::default();
+        let output_max_flush_latency_ms = Family::<Vec<(String, String)>, Gauge>::default();
+        for (name, queue_stats) in &stats_owned.output_queue_stats {
+            let labels = vec![("connector".to_string(), name.clone())];
+            output_queue_depth
+                .get_or_create(&labels)
+                .set(i64::try_from(queue_stats.queue_depth).unwrap_or(i64::MAX));
+            output_in_flight_batches
+                .get_or_create(&labels)
+                .set(i64::try_from(queue_stats.in_flight_batches).unwrap_or(i64::MAX));
+            output_flush_latency_ms
+                .get_or_create(&labels)
+                .set(i64::try_from(queue_stats.last_flush_latency_ms).unwrap_or(i64::MAX));
+            output_max_flush_latency_ms
+                .get_or_create(&labels)
+                .set(i64::try_from(queue_stats.max_flush_latency_ms).unwrap_or(i64::MAX));
+        }
+        registry.register(
+            "output_queue_depth",
+            "The number of events waiting for an output connector",
+            output_queue_depth,
+        );
+        registry.register(
+            "output_in_flight_batches",
+            "The number of batches written by an output connector but not flushed yet",
+            output_in_flight_batches,
+        );
+        registry.register(
+            "output_flush_latency_ms",
+            "The duration of the last flush of an output connector in milliseconds",
+            output_flush_latency_ms,
+        );
+        registry.register(
+            "output_max_flush_latency_ms",
+            "The longest flush of an output connector in milliseconds",
+            output_max_flush_latency_ms,
+        );
+
+        register_connector_metrics(&mut registry, &stats_owned);
+        if let Some(operator_metrics) = &stats_owned.operator_metrics {
+            register_operator_metrics(&mut registry, operator_metrics);
+        }
+        register_memory_metrics(&mut registry, stats_owned.memory_budget);
+        register_udf_metrics(&mut registry);
+
         encode(&mut metrics_text, &registry).unwrap();
     }
     metrics_text
 }
 
+fn register_memory_metrics(registry: &mut Registry, memory_budget: Option<usize>) {
+    if let Some(stats) = allocator_stats() {
+        let allocated_bytes: Gauge = Gauge::default();
+        allocated_bytes.set(i64::try_from(stats.allocated).unwrap_or(i64::MAX));
+        registry.register(
+            "memory_allocated_bytes",
+            "The memory allocated by the process in bytes",
+            allocated_bytes,
+        );
+        let resident_bytes: Gauge = Gauge::default();
+        resident_bytes.set(i64::try_from(stats.resident).unwrap_or(i64::MAX));
+        registry.register(
+            "memory_resident_bytes",
+            "The physically resident memory mapped by the allocator in bytes",
+            resident_bytes,
+        );
+    }
+    if let Some(memory_budget) = memory_budget {
+        let budget_bytes: Gauge = Gauge::default();
+        budget_bytes.set(i64::try_from(memory_budget).unwrap_or(i64::MAX));
+        registry.register(
+            "memory_budget_bytes",
+            "The memory budget of the process in bytes",
+            budget_bytes,
+        );
+    }
+}
+
+fn register_connector_metrics(registry: &mut Registry, stats: &ProberStats) {
+    let messages = Family::<Vec<(String, String)>, Counter>::default();
+    let messages_in_last_minute = Family::<Vec<(String, String)>, Gauge>::default();
+    let lag_ms = Family::<Vec<(String, String)>, Gauge>::default();
+    for (name, connector_stats) in &stats.connector_stats {
+        let labels = vec![("connector".to_string(), name.clone())];
+        messages
+            .get_or_create(&labels)
+            .inc_by(u64::try_from(connector_stats.num_messages_from_start).unwrap_or(u64::MAX));
+        messages_in_last_minute
+            .get_or_create(&labels)
+            .set(i64::try_from(connector_stats.num_messages_in_last_minute).unwrap_or(i64::MAX));
+        let lag = match (
+            connector_stats.finished,
+            connector_stats.last_commit_at_ms,
+            stats.output_stats.time,
+        ) {
+            (false, Some(committed_at), Some(output_time)) => {
+                i64::try_from(committed_at.saturating_sub(output_time.0)).unwrap_or(i64::MAX)
+            }
+            _ => -1,
+        };
+        lag_ms.get_or_create(&labels).set(lag);
+    }
+    registry.register(
+        "connector_messages",
+        "The number of messages read by an input connector",
+        messages,
+    );
+    registry.register(
+        "connector_messages_in_last_minute",
+        "The number of messages read by an input connector in the last minute",
+        messages_in_last_minute,
+    );
+    registry.register(
+        "connector_lag_ms",
+        "How far the output lags behind the last data committed by an input connector in milliseconds (-1 when finished or idle)",
+        lag_ms,
+    );
+}
+
+fn register_operator_metrics(registry: &mut Registry, operator_metrics: &OperatorMetricsRegistry) {
+    let rows_in = Family::<Vec<(String, String)>, Counter>::default();
+    let rows_out = Family::<Vec<(String, String)>, Counter>::default();
+    let retractions = Family::<Vec<(String, String)>, Counter>::default();
+    let busy_seconds = Family::<Vec<(String, String)>, Counter<f64, AtomicU64>>::default();
+    let arrangement_batches = Family::<Vec<(String, String)>, Gauge>::default();
+    let arrangement_records = Family::<Vec<(String, String)>, Gauge>::default();
+    let arrangement_size_bytes = Family::<Vec<(String, String)>, Gauge>::default();
+    let external_index_size_bytes = Family::<Vec<(String, String)>, Gauge>::default();
+    for (id, metrics) in operator_metrics.snapshot() {
+        let labels = vec![
+            ("operator".to_string(), id.to_string()),
+            ("trace".to_string(), metrics.trace.unwrap_or_default()),
+        ];
+        rows_in.get_or_create(&labels).inc_by(metrics.rows_in);
+        rows_out.get_or_create(&labels).inc_by(metrics.rows_out);
+        retractions
+            .get_or_create(&labels)
+            .inc_by(metrics.retractions);
+        busy_seconds
+            .get_or_create(&labels)
+            .inc_by(metrics.busy_time.as_secs_f64());
+        arrangement_batches
+            .get_or_create(&labels)
+            .set(i64::try_from(metrics.arrangement_batches).unwrap_or(i64::MAX));
+        arrangement_records
+            .get_or_create(&labels)
+            .set(i64::try_from(metrics.arrangement_records).unwrap_or(i64::MAX));
+        arrangement_size_bytes
+            .get_or_create(&labels)
+            .set(i64::try_from(metrics.arrangement_size_bytes).unwrap_or(i64::MAX));
+        if metrics.external_index_size_bytes > 0 {
+            external_index_size_bytes
+                .get_or_create(&labels)
+                .set(i64::try_from(metrics.external_index_size_bytes).unwrap_or(i64::MAX));
+        }
+    }
+    registry.register(
+        "operator_rows_in",
+        "The number of updates received by an operator",
+        rows_in,
+    );
+    registry.register(
+        "operator_rows_out",
+        "The number of updates produced by an operator",
+        rows_out,
+    );
+    registry.register(
+        "operator_retractions",
+        "The number of retractions among the updates produced by an operator",
+        retractions,
+    );
+    registry.register(
+        "operator_busy_seconds",
+        "The time spent executing an operator in seconds",
+        busy_seconds,
+    );
+    registry.register(
+        "operator_arrangement_batches",
+        "The number of batches in the arrangements maintained by an operator",
+        arrangement_batches,
+    );
+    registry.register(
+        "operator_arrangement_records",
+        "The number of records in the arrangements maintained by an operator",
+        arrangement_records,
+    );
+    registry.register(
+        "operator_arrangement_size_bytes",
+        "The estimated size of the arrangements maintained by an operator, excluding heap-allocated values",
+        arrangement_size_bytes,
+    );
+    registry.register(
+        "operator_external_index_size_bytes",
+        "The memory used by the external index of an operator in bytes",
+        external_index_size_bytes,
+    );
+}
+
+fn register_udf_metrics(registry: &mut Registry) {
+    let calls = Family::<Vec<(String, String)>, Counter>::default();
+    let failures = Family::<Vec<(String, String)>, Counter>::default();
+    let retries = Family::<Vec<(String, String)>, Counter>::default();
+    let timeouts = Family::<Vec<(String, String)>, Counter>::default();
+    let cache_hits = Family::<Vec<(String, String)>, Counter>::default();
+    let cache_misses = Family::<Vec<(String, String)>, Counter>::default();
+    let latency_seconds_sum = Family::<Vec<(String, String)>, Counter<f64, AtomicU64>>::default();
+    let latency_seconds = Family::<Vec<(String, String)>, Gauge<f64, AtomicU64>>::default();
+    let in_flight = Family::<Vec<(String, String)>, Gauge>::default();
+    let capacity = Family::<Vec<(String, String)>, Gauge>::default();
+    let cache_hit_ratio = Family::<Vec<(String, String)>, Gauge<f64, AtomicU64>>::default();
+    for stats in udf_stats() {
+        let labels = vec![("udf".to_string(), stats.name.clone())];
+        calls.get_or_create(&labels).inc_by(stats.calls);
+        failures.get_or_create(&labels).inc_by(stats.failures);
+        retries.get_or_create(&labels).inc_by(stats.retries);
+        timeouts.get_or_create(&labels).inc_by(stats.timeouts);
+        cache_hits.get_or_create(&labels).inc_by(stats.cache_hits);
+        cache_misses
+            .get_or_create(&labels)
+            .inc_by(stats.cache_misses);
+        latency_seconds_sum
+            .get_or_create(&labels)
+            .inc_by(stats.latency_sum.as_secs_f64());
+        for quantile in ["0.5", "0.95", "0.99"] {
+            if let Some(latency) = stats.latency_quantile(quantile.parse().unwrap()) {
+                let mut labels = labels.clone();
+                labels.push(("quantile".to_string(), quantile.to_string()));
+                latency_seconds.get_or_create(&labels).set(latency);
+            }
+        }
+        in_flight.get_or_create(&labels).set(stats.in_flight);
+        if let Some(udf_capacity) = stats.capacity {
+            capacity
+                .get_or_create(&labels)
+                .set(i64::try_from(udf_capacity).unwrap_or(i64::MAX));
+        }
+        if let Some(ratio) = stats.cache_hit_ratio() {
+            cache_hit_ratio.get_or_create(&labels).set(ratio);
+        }
+    }
+    registry.register("udf_calls", "The number of finished calls of a UDF", calls);
+    registry.register(
+        "udf_failures",
+        "The number of calls of a UDF that raised an exception",
+        failures,
+    );
+    registry.register(
+        "udf_retries",
+        "The number of retried calls of a UDF",
+        retries,
+    );
+    registry.register(
+        "udf_timeouts",
+        "The number of calls of a UDF that timed out",
+        timeouts,
+    );
+    registry.register(
+        "udf_cache_hits",
+        "The number of calls of a UDF answered from the cache",
+        cache_hits,
+    );
+    registry.register(
+        "udf_cache_misses",
+        "The number of calls of a UDF not found in the cache",
+        cache_misses,
+    );
+    registry.register(
+        "udf_latency_seconds_sum",
+        "The total time spent in calls of a UDF in seconds",
+        latency_seconds_sum,
+    );
+    registry.register(
+        "udf_latency_seconds",
+        "The estimated quantiles of the latency of a UDF in seconds",
+        latency_seconds,
+    );
+    registry.register(
+        "udf_in_flight",
+        "The number of calls of a UDF currently in progress",
+        in_flight,
+    );
+    registry.register(
+        "udf_capacity",
+        "The maximum number of concurrent calls of an asynchronous UDF",
+        capacity,
+    );
+    registry.register(
+        "udf_cache_hit_ratio",
+        "The fraction of calls of a UDF answered from the cache",
+        cache_hit_ratio,
+    );
+}
+
 /// Starts a lightweight http server allowing monitoring.
 /// Available at: http://localhost:PORT/status
 /// where PORT is `PATHWAY_MONITORING_HTTP_PORT + process_id`
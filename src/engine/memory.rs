@@ -0,0 +1,169 @@
+// Copyright © 2024 Pathway
+
+//! Memory accounting of the process and returning freed memory above the memory budget.
+//!
+//! The statistics come from jemalloc, so they are not available with the `standard-allocator`
+//! feature.
+
+use std::sync::Mutex;
+use std::time::{Duration, Instant};
+
+use log::{info, warn};
+
+const PURGE_CHECK_INTERVAL: Duration = Duration::from_millis(100);
+
+// purging walks all arenas, so it is skipped until the freed pages retained by the allocator
+// reach this part of the threshold, or this many bytes
+const MIN_PURGED_FRACTION: usize = 16;
+const MIN_PURGED_BYTES: usize = 16 << 20;
+
+#[derive(Debug, Clone, Copy)]
+pub struct AllocatorStats {
+    /// Bytes allocated by the application.
+    pub allocated: usize,
+    /// Bytes in physically resident pages mapped by the allocator, including unused ones.
+    pub resident: usize,
+}
+
+#[cfg(not(feature = "standard-allocator"))]
+mod allocator {
+    use std::ffi::CStr;
+    use std::mem::size_of;
+    use std::ptr;
+
+    use jemalloc_sys::mallctl;
+
+    use super::AllocatorStats;
+
+    // MALLCTL_ARENAS_ALL
+    const PURGE_ALL_ARENAS: &CStr = c"arena.4096.purge";
+
+    fn read_usize(name: &CStr) -> Option<usize> {
+        let mut value: usize = 0;
+        let mut len = size_of::<usize>();
+        // SAFETY: the statistics read here are of type size_t
+        let ret = unsafe {
+            mallctl(
+                name.as_ptr(),
+                ptr::addr_of_mut!(value).cast(),
+                &mut len,
+                ptr::null_mut(),
+                0,
+            )
+        };
+        (ret == 0).then_some(value)
+    }
+
+    pub fn stats() -> Option<AllocatorStats> {
+        // jemalloc caches the statistics, advancing the epoch refreshes them
+        let mut epoch: u64 = 1;
+        let mut len = size_of::<u64>();
+        // SAFETY: epoch is of type uint64_t
+        unsafe {
+            mallctl(
+                c"epoch".as_ptr(),
+                ptr::addr_of_mut!(epoch).cast(),
+                &mut len,
+                ptr::addr_of_mut!(epoch).cast(),
+                len,
+            );
+        }
+        Some(AllocatorStats {
+            allocated: read_usize(c"stats.allocated")?,
+            resident: read_usize(c"stats.resident")?,
+        })
+    }
+
+    pub fn purge() {
+        // SAFETY: purging takes no arguments
+        unsafe {
+            mallctl(
+                PURGE_ALL_ARENAS.as_ptr(),
+                ptr::null_mut(),
+                ptr::null_mut(),
+                ptr::null_mut(),
+                0,
+            );
+        }
+    }
+}
+
+#[cfg(feature = "standard-allocator")]
+mod allocator {
+    use super::AllocatorStats;
+
+    pub fn stats() -> Option<AllocatorStats> {
+        None
+    }
+
+    pub fn purge() {}
+}
+
+pub fn allocator_stats() -> Option<AllocatorStats> {
+    allocator::stats()
+}
+
+/// Returns the memory freed in the process to the operating system once the allocated memory
+/// exceeds a threshold, the memory budget.
+///
+/// The threshold does not limit the memory of the process: the engine does not compact its
+/// state any harder above it, apart from the merges done while idle, which are configured
+/// when the workers are created. What it changes is that the pages freed by the merges are
+/// returned right away instead of after the decay time of the allocator.
+#[derive(Debug)]
+pub struct PurgeThreshold {
+    threshold: usize,
+    state: Mutex<PurgeState>,
+}
+
+#[derive(Debug)]
+struct PurgeState {
+    checked_at: Instant,
+    exceeded: bool,
+}
+
+impl PurgeThreshold {
+    pub fn new(threshold: usize) -> Self {
+        Self {
+            threshold,
+            state: Mutex::new(PurgeState {
+                checked_at: Instant::now(),
+                exceeded: false,
+            }),
+        }
+    }
+
+    /// Purges the freed pages if the allocated memory is above the threshold and enough of
+    /// them are retained by the allocator to be worth it. It is cheap to call from all
+    /// workers, as the check is done by one of them at a time and not more often than
+    /// every `PURGE_CHECK_INTERVAL`.
+    pub fn purge_if_exceeded(&self) {
+        let Ok(mut state) = self.state.try_lock() else {
+            return;
+        };
+        if state.checked_at.elapsed() < PURGE_CHECK_INTERVAL {
+            return;
+        }
+        state.checked_at = Instant::now();
+        let Some(stats) = allocator_stats() else {
+            return;
+        };
+        let exceeded = stats.allocated > self.threshold;
+        let retained = stats.resident.saturating_sub(stats.allocated);
+        if exceeded && retained >= (self.threshold / MIN_PURGED_FRACTION).max(MIN_PURGED_BYTES) {
+            allocator::purge();
+        }
+        if exceeded && !state.exceeded {
+            warn!(
+                "Allocated memory ({} bytes) exceeds the memory budget ({} bytes)",
+                stats.allocated, self.threshold
+            );
+        } else if !exceeded && state.exceeded {
+            info!(
+                "Allocated memory ({} bytes) is back within the memory budget ({} bytes)",
+                stats.allocated, self.threshold
+            );
+        }
+        state.exceeded = exceeded;
+    }
+}
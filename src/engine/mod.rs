@@ -19,12 +19,16 @@ pub mod graph;
 pub use graph::{
     BatchWrapper, ColumnHandle, ColumnPath, ColumnProperties, ComplexColumn, Computer,
     ConcatHandle, Context, DataRow, ErrorLogHandle, ExportedTable, ExportedTableCallback,
-    ExpressionData, Graph, IterationLogic, IxKeyPolicy, IxerHandle, JoinData, JoinType,
-    LegacyTable, OperatorStats, ProberStats, ReducerData, ScopedGraph, TableHandle,
+    ExpressionData, Graph, IterationLogic, IxKeyPolicy, IxerHandle, JoinData, JoinStrategy,
+    JoinType, LegacyTable, OperatorStats, ProberStats, ReducerData, ScopedGraph, TableHandle,
     TableProperties, UniverseHandle,
 };
 
 pub mod http_server;
+pub mod memory;
+pub mod operator_metrics;
+pub mod profiler;
+pub mod udf_metrics;
 pub use http_server::maybe_run_http_server_thread;
 
 pub mod dataflow;
@@ -0,0 +1,485 @@
+// Copyright © 2024 Pathway
+
+//! Per-operator metrics collected from timely and differential logging.
+//!
+//! Every Pathway operator is lowered to a contiguous range of timely operators. The graph
+//! marks where each range starts (see [`WorkerOperatorMetrics::start_operator`]) and the
+//! loggers registered here attribute timely events (schedules and messages) and differential
+//! events (arrangement batches, merges and drops) to the Pathway operator owning the timely
+//! operator that emitted them. The counters are shared by all workers of a process.
+//! When profiling, the individual activations are recorded as well (see [`super::profiler`]).
+
+use std::cell::RefCell;
+use std::collections::{BTreeMap, HashMap, HashSet};
+use std::mem::{size_of, take};
+use std::rc::Rc;
+use std::sync::atomic::{AtomicI64, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant};
+
+use differential_dataflow::logging::DifferentialEvent;
+use timely::communication::Allocate;
+use timely::logging::{StartStop, TimelyEvent};
+use timely::worker::{AsWorker, Worker};
+
+use super::error::Trace;
+use super::profiler::{Profile, ProfileSpan};
+use super::{Key, Timestamp, Value};
+
+/// Approximate size of a single record kept in an arrangement.
+/// Heap allocations owned by the values are not included.
+const ARRANGED_RECORD_SIZE: usize = size_of::<((Key, Value), Timestamp, isize)>();
+
+/// How often the activations recorded on a worker are handed over to the profile.
+const PROFILE_FLUSH_INTERVAL: Duration = Duration::from_secs(1);
+
+/// The number of activations a worker buffers before handing them over to the profile,
+/// regardless of [`PROFILE_FLUSH_INTERVAL`].
+const MAX_BUFFERED_ACTIVATIONS: usize = 1 << 16;
+
+#[derive(Debug, Default)]
+struct OperatorCounters {
+    id: usize,
+    trace: OnceLock<Trace>,
+    rows_in: AtomicU64,
+    rows_out: AtomicU64,
+    retractions: AtomicU64,
+    busy_time_ns: AtomicU64,
+    arrangement_batches: AtomicI64,
+    arrangement_records: AtomicI64,
+    external_index_size_bytes: AtomicI64,
+}
+
+#[derive(Debug, Clone)]
+pub struct OperatorMetrics {
+    pub trace: Option<String>,
+    pub rows_in: u64,
+    pub rows_out: u64,
+    pub retractions: u64,
+    pub busy_time: Duration,
+    pub arrangement_batches: u64,
+    pub arrangement_records: u64,
+    pub arrangement_size_bytes: u64,
+    pub external_index_size_bytes: u64,
+}
+
+impl OperatorCounters {
+    fn new(id: usize) -> Self {
+        Self {
+            id,
+            ..Default::default()
+        }
+    }
+
+    fn location(&self) -> Option<String> {
+        match self.trace.get()? {
+            Trace::Frame {
+                file_name,
+                line_number,
+                ..
+            } => Some(format!("{file_name}:{line_number}")),
+            Trace::Empty => None,
+        }
+    }
+
+    fn call_site(&self) -> Option<String> {
+        match self.trace.get()? {
+            Trace::Frame { function, .. } => Some(format!("{function} ({})", self.location()?)),
+            Trace::Empty => None,
+        }
+    }
+}
+
+impl From<&OperatorCounters> for OperatorMetrics {
+    fn from(counters: &OperatorCounters) -> Self {
+        let arrangement_records =
+            u64::try_from(counters.arrangement_records.load(Ordering::Relaxed)).unwrap_or(0);
+        Self {
+            trace: counters.location(),
+            rows_in: counters.rows_in.load(Ordering::Relaxed),
+            rows_out: counters.rows_out.load(Ordering::Relaxed),
+            retractions: counters.retractions.load(Ordering::Relaxed),
+            busy_time: Duration::from_nanos(counters.busy_time_ns.load(Ordering::Relaxed)),
+            arrangement_batches: u64::try_from(
+                counters.arrangement_batches.load(Ordering::Relaxed),
+            )
+            .unwrap_or(0),
+            arrangement_records,
+            arrangement_size_bytes: arrangement_records.saturating_mul(ARRANGED_RECORD_SIZE as u64),
+            external_index_size_bytes: u64::try_from(
+                counters.external_index_size_bytes.load(Ordering::Relaxed),
+            )
+            .unwrap_or(0),
+        }
+    }
+}
+
+/// Process-wide store of the per-operator counters, read by the monitoring http server.
+#[derive(Debug, Default)]
+pub struct OperatorMetricsRegistry {
+    operators: Mutex<BTreeMap<usize, Arc<OperatorCounters>>>,
+    profile: Option<Profile>,
+}
+
+impl OperatorMetricsRegistry {
+    pub fn new(profile: Option<Profile>) -> Self {
+        Self {
+            operators: Mutex::default(),
+            profile,
+        }
+    }
+
+    pub fn profile(&self) -> Option<&Profile> {
+        self.profile.as_ref()
+    }
+
+    fn operator(&self, id: usize) -> Arc<OperatorCounters> {
+        self.operators
+            .lock()
+            .unwrap()
+            .entry(id)
+            .or_insert_with(|| Arc::new(OperatorCounters::new(id)))
+            .clone()
+    }
+
+    pub fn snapshot(&self) -> Vec<(usize, OperatorMetrics)> {
+        self.operators
+            .lock()
+            .unwrap()
+            .iter()
+            .map(|(id, counters)| (*id, counters.as_ref().into()))
+            .collect()
+    }
+}
+
+struct Activation {
+    timely_id: usize,
+    start: Duration,
+    duration: Duration,
+}
+
+struct Channel {
+    source: Vec<usize>,
+    target: Vec<usize>,
+    resolved: Option<(Option<Arc<OperatorCounters>>, Option<Arc<OperatorCounters>>)>,
+}
+
+#[derive(Default)]
+struct WorkerState {
+    // first timely identifier allocated for a Pathway operator -> its counters
+    operators: BTreeMap<usize, Arc<OperatorCounters>>,
+    operator_ids: HashMap<Vec<usize>, usize>,
+    operator_addresses: HashMap<usize, Vec<usize>>,
+    operator_names: HashMap<usize, String>,
+    scope_addresses: HashSet<Vec<usize>>,
+    channels: HashMap<usize, Channel>,
+    scheduled_at: HashMap<usize, Duration>,
+    // present only when profiling
+    activations: Option<Vec<Activation>>,
+    activations_flushed_at: Duration,
+}
+
+impl WorkerState {
+    fn owner(&self, timely_id: usize) -> Option<&Arc<OperatorCounters>> {
+        self.operators
+            .range(..=timely_id)
+            .next_back()
+            .map(|(_start, counters)| counters)
+    }
+
+    fn owner_of_address(&self, address: &[usize]) -> Option<Option<Arc<OperatorCounters>>> {
+        self.operator_ids
+            .get(address)
+            .map(|timely_id| self.owner(*timely_id).cloned())
+    }
+
+    fn should_flush_activations(&self, now: Duration) -> bool {
+        self.activations.as_ref().is_some_and(|activations| {
+            activations.len() >= MAX_BUFFERED_ACTIVATIONS
+                || (!activations.is_empty()
+                    && now.saturating_sub(self.activations_flushed_at) >= PROFILE_FLUSH_INTERVAL)
+        })
+    }
+
+    /// Takes the activations recorded so far as profile spans.
+    fn take_spans(
+        &mut self,
+        now: Duration,
+        worker_index: usize,
+        worker_started_at: Instant,
+        profile: &Profile,
+    ) -> Vec<ProfileSpan> {
+        self.activations_flushed_at = now;
+        let Some(activations) = self.activations.as_mut().map(take) else {
+            return Vec::new();
+        };
+        activations
+            .into_iter()
+            .map(|activation| {
+                let owner = self.owner(activation.timely_id);
+                ProfileSpan {
+                    worker: worker_index,
+                    operator: owner.map(|owner| owner.id),
+                    call_site: owner.and_then(|owner| owner.call_site()),
+                    name: self
+                        .operator_names
+                        .get(&activation.timely_id)
+                        .cloned()
+                        .unwrap_or_default(),
+                    start: (worker_started_at + activation.start)
+                        .saturating_duration_since(profile.started_at()),
+                    duration: activation.duration,
+                }
+            })
+            .collect()
+    }
+
+    fn on_timely_event(&mut self, time: Duration, event: TimelyEvent) {
+        match event {
+            TimelyEvent::Operates(operates) => {
+                if let Some((_index, scope_address)) = operates.addr.split_last() {
+                    self.scope_addresses.insert(scope_address.to_vec());
+                }
+                self.operator_ids.insert(operates.addr.clone(), operates.id);
+                self.operator_addresses.insert(operates.id, operates.addr);
+                self.operator_names.insert(operates.id, operates.name);
+            }
+            TimelyEvent::Channels(channel) => {
+                // index 0 stands for the boundary of the enclosing scope
+                let endpoint = |index: usize| {
+                    let mut address = channel.scope_addr.clone();
+                    if index != 0 {
+                        address.push(index);
+                    }
+                    address
+                };
+                self.channels.insert(
+                    channel.id,
+                    Channel {
+                        source: endpoint(channel.source.0),
+                        target: endpoint(channel.target.0),
+                        resolved: None,
+                    },
+                );
+            }
+            TimelyEvent::Messages(message) => {
+                let Some(channel) = self.channels.get(&message.channel) else {
+                    return;
+                };
+                let resolved = if let Some(resolved) = &channel.resolved {
+                    resolved.clone()
+                } else {
+                    let (Some(source), Some(target)) = (
+                        self.owner_of_address(&channel.source),
+                        self.owner_of_address(&channel.target),
+                    ) else {
+                        return;
+                    };
+                    let resolved = (source, target);
+                    self.channels.get_mut(&message.channel).unwrap().resolved =
+                        Some(resolved.clone());
+                    resolved
+                };
+                let length = message.length as u64;
+                match resolved {
+                    (Some(source), Some(target)) if Arc::ptr_eq(&source, &target) => {}
+                    (source, target) => {
+                        if message.is_send {
+                            if let Some(source) = source {
+                                source.rows_out.fetch_add(length, Ordering::Relaxed);
+                            }
+                        } else if let Some(target) = target {
+                            target.rows_in.fetch_add(length, Ordering::Relaxed);
+                        }
+                    }
+                }
+            }
+            TimelyEvent::Schedule(schedule) => match schedule.start_stop {
+                StartStop::Start => {
+                    self.scheduled_at.insert(schedule.id, time);
+                }
+                StartStop::Stop => {
+                    let Some(started_at) = self.scheduled_at.remove(&schedule.id) else {
+                        return;
+                    };
+                    // time spent in nested scopes is already counted for their operators
+                    if self
+                        .operator_addresses
+                        .get(&schedule.id)
+                        .is_some_and(|address| self.scope_addresses.contains(address))
+                    {
+                        return;
+                    }
+                    let busy = time.saturating_sub(started_at);
+                    if let Some(owner) = self.owner(schedule.id) {
+                        owner.busy_time_ns.fetch_add(
+                            u64::try_from(busy.as_nanos()).unwrap_or(u64::MAX),
+                            Ordering::Relaxed,
+                        );
+                    }
+                    if let Some(activations) = &mut self.activations {
+                        activations.push(Activation {
+                            timely_id: schedule.id,
+                            start: started_at,
+                            duration: busy,
+                        });
+                    }
+                }
+            },
+            _ => {}
+        }
+    }
+
+    #[allow(clippy::cast_possible_wrap)]
+    fn on_differential_event(&self, event: &DifferentialEvent) {
+        let (operator, batches, records) = match event {
+            DifferentialEvent::Batch(batch) => (batch.operator, 1, batch.length as i64),
+            DifferentialEvent::Merge(merge) => {
+                let Some(complete) = merge.complete else {
+                    return;
+                };
+                (
+                    merge.operator,
+                    -1,
+                    complete as i64 - (merge.length1 + merge.length2) as i64,
+                )
+            }
+            DifferentialEvent::Drop(drop) => (drop.operator, -1, -(drop.length as i64)),
+            _ => return,
+        };
+        if let Some(owner) = self.owner(operator) {
+            owner
+                .arrangement_batches
+                .fetch_add(batches, Ordering::Relaxed);
+            owner
+                .arrangement_records
+                .fetch_add(records, Ordering::Relaxed);
+        }
+    }
+}
+
+/// The part of the metrics living on a single worker: the mapping from timely operators
+/// to Pathway operators that the logging callbacks use.
+#[derive(Clone)]
+pub struct WorkerOperatorMetrics {
+    registry: Arc<OperatorMetricsRegistry>,
+    state: Rc<RefCell<WorkerState>>,
+    worker_index: usize,
+    worker_started_at: Instant,
+}
+
+impl WorkerOperatorMetrics {
+    /// Registers the loggers on the worker. It has to be called before the dataflow is built,
+    /// as operators and channels are only reported at creation.
+    pub fn register<A: Allocate>(
+        worker: &Worker<A>,
+        registry: Arc<OperatorMetricsRegistry>,
+    ) -> Self {
+        let state = Rc::new(RefCell::new(WorkerState {
+            activations: registry.profile.is_some().then(Vec::new),
+            ..Default::default()
+        }));
+        let mut log_register = worker.log_register();
+        // loggers requested through TIMELY_WORKER_LOG_ADDR or DIFFERENTIAL_LOG_ADDR take precedence
+        if log_register.get::<TimelyEvent>("timely").is_none() {
+            let timely_state = state.clone();
+            let timely_registry = registry.clone();
+            let worker_index = worker.index();
+            let worker_started_at = worker.timer();
+            log_register.insert::<TimelyEvent, _>("timely", move |now, data| {
+                let mut state = timely_state.borrow_mut();
+                for (time, _worker, event) in data.drain(..) {
+                    state.on_timely_event(time, event);
+                }
+                // the activations are handed over while running, so that they don't pile up
+                if let Some(profile) = timely_registry.profile() {
+                    if state.should_flush_activations(*now) {
+                        profile.extend(state.take_spans(
+                            *now,
+                            worker_index,
+                            worker_started_at,
+                            profile,
+                        ));
+                    }
+                }
+            });
+        }
+        if log_register
+            .get::<DifferentialEvent>("differential/arrange")
+            .is_none()
+        {
+            let differential_state = state.clone();
+            log_register.insert::<DifferentialEvent, _>(
+                "differential/arrange",
+                move |_time, data| {
+                    let state = differential_state.borrow();
+                    for (_time, _worker, event) in data.iter() {
+                        state.on_differential_event(event);
+                    }
+                },
+            );
+        }
+        Self {
+            registry,
+            state,
+            worker_index: worker.index(),
+            worker_started_at: worker.timer(),
+        }
+    }
+
+    /// Marks the start of a Pathway operator. All timely operators created from now on,
+    /// until the next call, belong to it.
+    pub fn start_operator(&self, worker: &mut impl AsWorker, id: usize, trace: &Trace) {
+        let counters = self.registry.operator(id);
+        counters.trace.get_or_init(|| trace.clone());
+        // Identifiers are allocated sequentially, so taking one marks the boundary.
+        let boundary = worker.new_identifier();
+        self.state.borrow_mut().operators.insert(boundary, counters);
+    }
+
+    /// Returns a callback counting the retractions among the updates leaving an operator.
+    pub fn retractions_counter(&self, id: usize) -> impl Fn(isize) + 'static {
+        let counters = self.registry.operator(id);
+        move |diff| {
+            if diff < 0 {
+                counters
+                    .retractions
+                    .fetch_add(diff.unsigned_abs() as u64, Ordering::Relaxed);
+            }
+        }
+    }
+
+    /// Returns a callback reporting the memory used by the external index of an operator
+    /// on this worker. The sizes reported by all workers are summed.
+    pub fn external_index_size_reporter(&self, id: usize) -> impl FnMut(usize) + 'static {
+        let counters = self.registry.operator(id);
+        let mut reported = 0;
+        move |size| {
+            let size = i64::try_from(size).unwrap_or(i64::MAX);
+            counters
+                .external_index_size_bytes
+                .fetch_add(size - reported, Ordering::Relaxed);
+            reported = size;
+        }
+    }
+
+    pub fn registry(&self) -> &Arc<OperatorMetricsRegistry> {
+        &self.registry
+    }
+
+    /// Hands the remaining activations recorded on this worker over to the profile.
+    /// The logging has to be flushed before.
+    pub fn finish(&self) {
+        let Some(profile) = self.registry.profile() else {
+            return;
+        };
+        let now = self.worker_started_at.elapsed();
+        let spans = self.state.borrow_mut().take_spans(
+            now,
+            self.worker_index,
+            self.worker_started_at,
+            profile,
+        );
+        profile.extend(spans);
+    }
+}
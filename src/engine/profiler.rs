@@ -0,0 +1,180 @@
+// Copyright © 2024 Pathway
+
+//! Operator-level profiling of a run.
+//!
+//! The activations of timely operators, recorded by the loggers in
+//! [`super::operator_metrics`], are attributed to Pathway operators and the lines of user code
+//! that created them. They are written as a Chrome trace, which can be opened in Perfetto or
+//! `chrome://tracing`, and as collapsed stacks for flamegraph tools.
+//!
+//! The workers hand their activations over periodically, and they are appended to the trace
+//! right away, so the memory used by profiling doesn't grow with the length of the run.
+//! The trace uses the JSON array format, in which the closing bracket is optional, so the trace
+//! of a run that hasn't finished can be opened as well.
+
+use std::collections::{HashMap, HashSet};
+use std::fs::File;
+use std::io::{BufWriter, Write};
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::time::{Duration, Instant};
+
+use log::error;
+use serde_json::json;
+
+use super::error::DynResult;
+
+#[derive(Debug)]
+pub struct ProfileSpan {
+    pub worker: usize,
+    pub operator: Option<usize>,
+    pub call_site: Option<String>,
+    pub name: String,
+    pub start: Duration,
+    pub duration: Duration,
+}
+
+#[derive(Debug)]
+pub struct Profile {
+    trace_path: PathBuf,
+    started_at: Instant,
+    writer: Mutex<ProfileWriter>,
+}
+
+#[derive(Debug)]
+struct ProfileWriter {
+    trace: BufWriter<File>,
+    process_id: usize,
+    has_events: bool,
+    is_finished: bool,
+    workers: HashSet<usize>,
+    stacks: HashMap<String, Duration>,
+}
+
+impl Profile {
+    /// Creates the trace file at `path`. In a multi-process run, the process id is added
+    /// to its name.
+    pub fn new(path: &Path, process_id: usize, processes: usize) -> DynResult<Self> {
+        let trace_path = if processes > 1 {
+            with_process_id(path, process_id)
+        } else {
+            path.to_path_buf()
+        };
+        let mut trace = BufWriter::new(File::create(&trace_path)?);
+        trace.write_all(b"[")?;
+        Ok(Self {
+            trace_path,
+            started_at: Instant::now(),
+            writer: Mutex::new(ProfileWriter {
+                trace,
+                process_id,
+                has_events: false,
+                is_finished: false,
+                workers: HashSet::new(),
+                stacks: HashMap::new(),
+            }),
+        })
+    }
+
+    pub fn started_at(&self) -> Instant {
+        self.started_at
+    }
+
+    /// Appends the spans to the trace and adds them to the collapsed stacks.
+    pub fn extend(&self, spans: impl IntoIterator<Item = ProfileSpan>) {
+        if let Err(e) = self.writer.lock().unwrap().write_spans(spans) {
+            error!("Failed to write the profile: {e}");
+        }
+    }
+
+    /// Finishes the Chrome trace and writes the collapsed stacks next to it,
+    /// with the `.folded` extension. Returns the path of the trace.
+    pub fn finish(&self) -> DynResult<PathBuf> {
+        let mut writer = self.writer.lock().unwrap();
+        writer.is_finished = true;
+        writer.trace.write_all(b"]")?;
+        writer.trace.flush()?;
+        write_collapsed_stacks(&self.trace_path.with_extension("folded"), &writer.stacks)?;
+        Ok(self.trace_path.clone())
+    }
+}
+
+impl ProfileWriter {
+    fn write_event(&mut self, event: &serde_json::Value) -> DynResult<()> {
+        if self.has_events {
+            self.trace.write_all(b",\n")?;
+        }
+        serde_json::to_writer(&mut self.trace, event)?;
+        self.has_events = true;
+        Ok(())
+    }
+
+    fn write_spans(&mut self, spans: impl IntoIterator<Item = ProfileSpan>) -> DynResult<()> {
+        if self.is_finished {
+            return Ok(());
+        }
+        for span in spans {
+            if self.workers.insert(span.worker) {
+                let metadata = json!({
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.process_id,
+                    "tid": span.worker,
+                    "args": {"name": format!("worker {}", span.worker)},
+                });
+                self.write_event(&metadata)?;
+            }
+            let category = span
+                .operator
+                .map_or_else(|| "timely".to_string(), |id| format!("operator {id}"));
+            let event = json!({
+                "name": span.name,
+                "cat": category,
+                "ph": "X",
+                "ts": micros(span.start),
+                "dur": micros(span.duration),
+                "pid": self.process_id,
+                "tid": span.worker,
+                "args": {"operator": span.operator, "call_site": span.call_site},
+            });
+            self.write_event(&event)?;
+            // frames can't contain the separator of the format
+            let frames = [
+                span.call_site.as_deref().unwrap_or("pathway"),
+                &category,
+                &span.name,
+            ]
+            .map(|frame| frame.replace(';', ",").replace('\n', " "));
+            *self.stacks.entry(frames.join(";")).or_default() += span.duration;
+        }
+        self.trace.flush()?;
+        Ok(())
+    }
+}
+
+fn with_process_id(path: &Path, process_id: usize) -> PathBuf {
+    let stem = path.file_stem().unwrap_or_default().to_string_lossy();
+    match path.extension() {
+        Some(extension) => path.with_file_name(format!(
+            "{stem}.{process_id}.{}",
+            extension.to_string_lossy()
+        )),
+        None => path.with_file_name(format!("{stem}.{process_id}")),
+    }
+}
+
+#[allow(clippy::cast_precision_loss)]
+fn micros(duration: Duration) -> f64 {
+    duration.as_nanos() as f64 / 1000.0
+}
+
+fn write_collapsed_stacks(path: &Path, stacks: &HashMap<String, Duration>) -> DynResult<()> {
+    let mut stacks: Vec<_> = stacks.iter().collect();
+    stacks.sort();
+    let mut writer = BufWriter::new(File::create(path)?);
+    for (stack, duration) in stacks {
+        writeln!(writer, "{stack} {}", duration.as_micros())?;
+    }
+    writer.flush()?;
+    Ok(())
+}
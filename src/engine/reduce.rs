@@ -217,6 +217,7 @@ pub struct ArraySumReducer;
 enum ArraySumState<'a> {
     IntArray(CowArray<'a, i64, IxDyn>),
     FloatArray(CowArray<'a, f64, IxDyn>),
+    Float32Array(CowArray<'a, f32, IxDyn>),
 }
 
 impl<'a> ArraySumState<'a> {
@@ -242,6 +243,16 @@ impl<'a> ArraySumState<'a> {
                     )))
                 }
             }
+            #[allow(clippy::cast_precision_loss)]
+            Value::Float32Array(array) => {
+                if cnt.get() == 1 {
+                    Ok(Self::Float32Array(CowArray::from(&**array)))
+                } else {
+                    Ok(Self::Float32Array(CowArray::from(
+                        &**array * cnt.get() as f32,
+                    )))
+                }
+            }
             value => Err(DataError::TypeMismatch {
                 expected: "Array",
                 value: value.clone(),
@@ -262,6 +273,9 @@ fn add_array_sum_states<'a>(
         (ArraySumState::FloatArray(lhs), ArraySumState::FloatArray(rhs)) => Ok(
             ArraySumState::FloatArray(CowArray::from(lhs.into_owned() + &rhs)),
         ),
+        (ArraySumState::Float32Array(lhs), ArraySumState::Float32Array(rhs)) => Ok(
+            ArraySumState::Float32Array(CowArray::from(lhs.into_owned() + &rhs)),
+        ),
         _ => Err(DataError::MixingTypesInNpSum.into()),
     }
 }
@@ -271,6 +285,7 @@ impl<'a> From<ArraySumState<'a>> for Value {
         match state {
             ArraySumState::IntArray(a) => Self::from(a.into_owned()),
             ArraySumState::FloatArray(a) => Self::from(a.into_owned()),
+            ArraySumState::Float32Array(a) => Self::from(a.into_owned()),
         }
     }
 }
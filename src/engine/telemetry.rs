@@ -4,6 +4,8 @@ use std::{
     time::{Duration, SystemTime},
 };
 
+use super::memory::allocator_stats;
+use super::udf_metrics::udf_stats;
 use super::{error::DynError, license::License, Graph, ProberStats, Result};
 use crate::env::parse_env_var;
 use arc_swap::ArcSwapOption;
@@ -39,10 +41,19 @@ const PERIODIC_READER_INTERVAL: Duration = Duration::from_secs(60);
 const OPENTELEMETRY_EXPORT_TIMEOUT: Duration = Duration::from_secs(3);
 
 const PROCESS_MEMORY_USAGE: &str = "process.memory.usage";
+const PROCESS_MEMORY_ALLOCATED: &str = "process.memory.allocated";
 const PROCESS_CPU_USER_TIME: &str = "process.cpu.utime";
 const PROCESS_CPU_SYSTEM_TIME: &str = "process.cpu.stime";
 const INPUT_LATENCY: &str = "latency.input";
 const OUTPUT_LATENCY: &str = "latency.output";
+const UDF_CALLS: &str = "udf.calls";
+const UDF_FAILURES: &str = "udf.failures";
+const UDF_RETRIES: &str = "udf.retries";
+const UDF_TIMEOUTS: &str = "udf.timeouts";
+const UDF_IN_FLIGHT: &str = "udf.in_flight";
+const UDF_CAPACITY: &str = "udf.capacity";
+const UDF_LATENCY: &str = "udf.latency";
+const UDF_CACHE_HIT_RATIO: &str = "udf.cache.hit_ratio";
 
 const ROOT_TRACE_ID: &str = "root.trace.id";
 const RUN_ID: &str = "run.id";
@@ -305,6 +316,7 @@ fn start_telemetry_thread(
                     let _telemetry_guard = telemetry.init();
                     register_stats_metrics(&stats);
                     register_sys_metrics();
+                    register_udf_metrics();
                     start_sender.send(tx).await.expect("should not fail");
                     rx.recv().await;
                 });
@@ -357,6 +369,11 @@ fn register_sys_metrics() {
         .with_unit("byte")
         .init();
 
+    let memory_allocated_gauge = meter
+        .u64_observable_gauge(PROCESS_MEMORY_ALLOCATED)
+        .with_unit("byte")
+        .init();
+
     let cpu_user_time_gauge = meter
         .i64_observable_gauge(PROCESS_CPU_USER_TIME)
         .with_unit("s")
@@ -371,6 +388,7 @@ fn register_sys_metrics() {
         .register_callback(
             &[
                 memory_usage_gauge.as_any(),
+                memory_allocated_gauge.as_any(),
                 cpu_user_time_gauge.as_any(),
                 cpu_system_time_gauge.as_any(),
             ],
@@ -382,6 +400,9 @@ fn register_sys_metrics() {
                 if let Some(process) = sys.process(pid) {
                     observer.observe_u64(&memory_usage_gauge, process.memory(), &[]);
                 }
+                if let Some(stats) = allocator_stats() {
+                    observer.observe_u64(&memory_allocated_gauge, stats.allocated as u64, &[]);
+                }
                 observer.observe_i64(&cpu_user_time_gauge, usage.user_time().num_seconds(), &[]);
                 observer.observe_i64(
                     &cpu_system_time_gauge,
@@ -393,6 +414,65 @@ fn register_sys_metrics() {
         .expect("Initializing meter callback should not fail");
 }
 
+fn register_udf_metrics() {
+    let meter = global::meter("pathway-udfs");
+
+    let calls_gauge = meter.u64_observable_gauge(UDF_CALLS).init();
+    let failures_gauge = meter.u64_observable_gauge(UDF_FAILURES).init();
+    let retries_gauge = meter.u64_observable_gauge(UDF_RETRIES).init();
+    let timeouts_gauge = meter.u64_observable_gauge(UDF_TIMEOUTS).init();
+    let in_flight_gauge = meter.i64_observable_gauge(UDF_IN_FLIGHT).init();
+    let capacity_gauge = meter.u64_observable_gauge(UDF_CAPACITY).init();
+    let latency_gauge = meter
+        .f64_observable_gauge(UDF_LATENCY)
+        .with_unit("s")
+        .init();
+    let cache_hit_ratio_gauge = meter.f64_observable_gauge(UDF_CACHE_HIT_RATIO).init();
+
+    meter
+        .register_callback(
+            &[
+                calls_gauge.as_any(),
+                failures_gauge.as_any(),
+                retries_gauge.as_any(),
+                timeouts_gauge.as_any(),
+                in_flight_gauge.as_any(),
+                capacity_gauge.as_any(),
+                latency_gauge.as_any(),
+                cache_hit_ratio_gauge.as_any(),
+            ],
+            move |observer| {
+                for stats in udf_stats() {
+                    let attributes = [KeyValue::new("udf", stats.name.clone())];
+                    observer.observe_u64(&calls_gauge, stats.calls, &attributes);
+                    observer.observe_u64(&failures_gauge, stats.failures, &attributes);
+                    observer.observe_u64(&retries_gauge, stats.retries, &attributes);
+                    observer.observe_u64(&timeouts_gauge, stats.timeouts, &attributes);
+                    observer.observe_i64(&in_flight_gauge, stats.in_flight, &attributes);
+                    if let Some(capacity) = stats.capacity {
+                        observer.observe_u64(&capacity_gauge, capacity, &attributes);
+                    }
+                    for quantile in [0.5, 0.95, 0.99] {
+                        if let Some(latency) = stats.latency_quantile(quantile) {
+                            observer.observe_f64(
+                                &latency_gauge,
+                                latency,
+                                &[
+                                    KeyValue::new("udf", stats.name.clone()),
+                                    KeyValue::new("quantile", quantile),
+                                ],
+                            );
+                        }
+                    }
+                    if let Some(ratio) = stats.cache_hit_ratio() {
+                        observer.observe_f64(&cache_hit_ratio_gauge, ratio, &attributes);
+                    }
+                }
+            },
+        )
+        .expect("Initializing meter callback should not fail");
+}
+
 impl Drop for Runner {
     fn drop(&mut self) {
         self.close_sender.blocking_send(()).unwrap();
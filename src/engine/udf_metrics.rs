@@ -0,0 +1,190 @@
+// Copyright © 2024 Pathway
+
+//! Runtime statistics of UDFs.
+//!
+//! The counters are updated from Python by the wrappers of the UDFs and read by the monitoring
+//! http server and the telemetry meter. They live as long as the UDFs they describe.
+
+use std::collections::BTreeMap;
+use std::sync::atomic::{AtomicI64, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, Weak};
+use std::time::Duration;
+
+use once_cell::sync::Lazy;
+
+/// Upper bounds of the latency buckets, in seconds. The last bucket is unbounded.
+const LATENCY_BUCKETS: [f64; 16] = [
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+];
+
+static UDF_METRICS: Lazy<Mutex<Vec<Weak<UdfCounters>>>> = Lazy::new(Mutex::default);
+
+#[derive(Debug, Default)]
+pub struct UdfCounters {
+    name: String,
+    capacity: Option<u64>,
+    calls: AtomicU64,
+    failures: AtomicU64,
+    in_flight: AtomicI64,
+    retries: AtomicU64,
+    timeouts: AtomicU64,
+    cache_hits: AtomicU64,
+    cache_misses: AtomicU64,
+    latency_sum_ns: AtomicU64,
+    latency_buckets: [AtomicU64; LATENCY_BUCKETS.len() + 1],
+}
+
+impl UdfCounters {
+    pub fn register(name: String, capacity: Option<u64>) -> Arc<Self> {
+        let counters = Arc::new(Self {
+            name,
+            capacity,
+            ..Default::default()
+        });
+        let mut udfs = UDF_METRICS.lock().unwrap();
+        udfs.retain(|counters| counters.strong_count() > 0);
+        udfs.push(Arc::downgrade(&counters));
+        counters
+    }
+
+    pub fn on_call_started(&self) {
+        self.in_flight.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn on_call_finished(&self, latency: Duration, failed: bool) {
+        self.in_flight.fetch_sub(1, Ordering::Relaxed);
+        self.calls.fetch_add(1, Ordering::Relaxed);
+        if failed {
+            self.failures.fetch_add(1, Ordering::Relaxed);
+        }
+        self.latency_sum_ns.fetch_add(
+            u64::try_from(latency.as_nanos()).unwrap_or(u64::MAX),
+            Ordering::Relaxed,
+        );
+        let seconds = latency.as_secs_f64();
+        let bucket = LATENCY_BUCKETS.partition_point(|upper_bound| *upper_bound < seconds);
+        self.latency_buckets[bucket].fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn on_retry(&self) {
+        self.retries.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn on_timeout(&self) {
+        self.timeouts.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub fn on_cache_lookup(&self, hit: bool) {
+        if hit {
+            self.cache_hits.fetch_add(1, Ordering::Relaxed);
+        } else {
+            self.cache_misses.fetch_add(1, Ordering::Relaxed);
+        }
+    }
+}
+
+#[derive(Debug, Clone)]
+pub struct UdfStats {
+    pub name: String,
+    pub capacity: Option<u64>,
+    pub calls: u64,
+    pub failures: u64,
+    pub in_flight: i64,
+    pub retries: u64,
+    pub timeouts: u64,
+    pub cache_hits: u64,
+    pub cache_misses: u64,
+    pub latency_sum: Duration,
+    latency_buckets: [u64; LATENCY_BUCKETS.len() + 1],
+}
+
+impl UdfStats {
+    fn new(name: String) -> Self {
+        Self {
+            name,
+            capacity: None,
+            calls: 0,
+            failures: 0,
+            in_flight: 0,
+            retries: 0,
+            timeouts: 0,
+            cache_hits: 0,
+            cache_misses: 0,
+            latency_sum: Duration::ZERO,
+            latency_buckets: [0; LATENCY_BUCKETS.len() + 1],
+        }
+    }
+
+    fn add(&mut self, counters: &UdfCounters) {
+        self.capacity = match (self.capacity, counters.capacity) {
+            (Some(left), Some(right)) => Some(left + right),
+            (left, right) => left.or(right),
+        };
+        self.calls += counters.calls.load(Ordering::Relaxed);
+        self.failures += counters.failures.load(Ordering::Relaxed);
+        self.in_flight += counters.in_flight.load(Ordering::Relaxed);
+        self.retries += counters.retries.load(Ordering::Relaxed);
+        self.timeouts += counters.timeouts.load(Ordering::Relaxed);
+        self.cache_hits += counters.cache_hits.load(Ordering::Relaxed);
+        self.cache_misses += counters.cache_misses.load(Ordering::Relaxed);
+        self.latency_sum += Duration::from_nanos(counters.latency_sum_ns.load(Ordering::Relaxed));
+        for (total, bucket) in self
+            .latency_buckets
+            .iter_mut()
+            .zip(&counters.latency_buckets)
+        {
+            *total += bucket.load(Ordering::Relaxed);
+        }
+    }
+
+    /// Estimates a quantile of the latency in seconds, interpolating within the bucket.
+    #[allow(clippy::cast_precision_loss)]
+    pub fn latency_quantile(&self, quantile: f64) -> Option<f64> {
+        let total: u64 = self.latency_buckets.iter().sum();
+        if total == 0 {
+            return None;
+        }
+        let rank = quantile * total as f64;
+        let mut seen = 0;
+        for (index, count) in self.latency_buckets.iter().enumerate() {
+            if *count > 0 && (seen + count) as f64 >= rank {
+                let lower = if index == 0 {
+                    0.0
+                } else {
+                    LATENCY_BUCKETS[index - 1]
+                };
+                let Some(upper) = LATENCY_BUCKETS.get(index) else {
+                    return Some(lower);
+                };
+                let fraction = (rank - seen as f64) / *count as f64;
+                return Some(lower + (upper - lower) * fraction.clamp(0.0, 1.0));
+            }
+            seen += count;
+        }
+        LATENCY_BUCKETS.last().copied()
+    }
+
+    #[allow(clippy::cast_precision_loss)]
+    pub fn cache_hit_ratio(&self) -> Option<f64> {
+        let lookups = self.cache_hits + self.cache_misses;
+        (lookups > 0).then(|| self.cache_hits as f64 / lookups as f64)
+    }
+}
+
+/// Returns the statistics of the live UDFs. The UDFs sharing a name are reported together.
+pub fn udf_stats() -> Vec<UdfStats> {
+    let live: Vec<Arc<UdfCounters>> = UDF_METRICS
+        .lock()
+        .unwrap()
+        .iter()
+        .filter_map(Weak::upgrade)
+        .collect();
+    let mut stats: BTreeMap<&str, UdfStats> = BTreeMap::new();
+    for counters in &live {
+        stats
+            .entry(&counters.name)
+            .or_insert_with(|| UdfStats::new(counters.name.clone()))
+            .add(counters);
+    }
+    stats.into_values().collect()
+}
@@ -225,6 +225,7 @@ pub enum Value {
     Json(Handle<JsonValue>),
     Error,
     PyObjectWrapper(Handle<PyObjectWrapper>),
+    Float32Array(Handle<ArrayD<f32>>),
 }
 
 const _: () = assert!(align_of::<Value>() <= 16);
@@ -356,6 +357,7 @@ impl Display for Value {
             Self::Tuple(vals) => write!(fmt, "({})", vals.iter().format(", ")),
             Self::IntArray(array) => write!(fmt, "{array}"),
             Self::FloatArray(array) => write!(fmt, "{array}"),
+            Self::Float32Array(array) => write!(fmt, "{array}"),
             Self::DateTimeNaive(date_time) => write!(fmt, "{date_time}"),
             Self::DateTimeUtc(date_time) => write!(fmt, "{date_time}"),
             Self::Duration(duration) => write!(fmt, "{duration}"),
@@ -384,6 +386,12 @@ impl From<f64> for Value {
     }
 }
 
+impl From<f32> for Value {
+    fn from(f: f32) -> Self {
+        Self::Float(f64::from(f).into())
+    }
+}
+
 impl From<OrderedFloat<f64>> for Value {
     fn from(f: OrderedFloat<f64>) -> Self {
         Self::Float(f)
@@ -438,6 +446,12 @@ impl From<ArrayD<f64>> for Value {
     }
 }
 
+impl From<ArrayD<f32>> for Value {
+    fn from(a: ArrayD<f32>) -> Self {
+        Self::Float32Array(Handle::new(a))
+    }
+}
+
 impl<T> From<Option<T>> for Value
 where
     T: Into<Value>,
@@ -501,6 +515,7 @@ pub enum Kind {
     Json,
     Error,
     PyObjectWrapper,
+    Float32Array,
 }
 
 #[derive(Debug, Clone, PartialEq, Eq)]
@@ -509,6 +524,7 @@ pub enum Type {
     Bool,
     Int,
     Float,
+    Float32,
     Pointer,
     String,
     Bytes,
@@ -542,6 +558,7 @@ impl Display for Type {
             Type::Bool => write!(f, "bool"),
             Type::Int => write!(f, "int"),
             Type::Float => write!(f, "float"),
+            Type::Float32 => write!(f, "float32"),
             Type::Pointer => write!(f, "Pointer"),
             Type::String => write!(f, "str"),
             Type::Bytes => write!(f, "bytes"),
@@ -578,6 +595,7 @@ impl Value {
             Self::Tuple(_) => Kind::Tuple,
             Self::IntArray(_) => Kind::IntArray,
             Self::FloatArray(_) => Kind::FloatArray,
+            Self::Float32Array(_) => Kind::Float32Array,
             Self::DateTimeNaive(_) => Kind::DateTimeNaive,
             Self::DateTimeUtc(_) => Kind::DateTimeUtc,
             Self::Duration(_) => Kind::Duration,
@@ -612,6 +630,20 @@ impl HashInto for f64 {
     }
 }
 
+impl HashInto for f32 {
+    fn hash_into(&self, hasher: &mut Hasher) {
+        #[allow(clippy::float_cmp)]
+        let raw = if self.is_nan() {
+            !0
+        } else if self == &0.0 {
+            0 // -0.0 and 0.0 should hash to the same value
+        } else {
+            self.to_bits()
+        };
+        raw.hash_into(hasher);
+    }
+}
+
 impl HashInto for OrderedFloat<f64> {
     fn hash_into(&self, hasher: &mut Hasher) {
         self.0.hash_into(hasher);
@@ -722,6 +754,7 @@ impl HashInto for Value {
             Self::Tuple(vals) => vals.hash_into(hasher),
             Self::IntArray(handle) => handle.hash_into(hasher),
             Self::FloatArray(handle) => handle.hash_into(hasher),
+            Self::Float32Array(handle) => handle.hash_into(hasher),
             Self::DateTimeNaive(date_time) => date_time.hash_into(hasher),
             Self::DateTimeUtc(date_time) => date_time.hash_into(hasher),
             Self::Duration(duration) => duration.hash_into(hasher),
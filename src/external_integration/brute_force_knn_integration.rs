@@ -7,6 +7,7 @@ use crate::engine::error::DynResult;
 use crate::engine::{Error, Key};
 use ordered_float::{self, OrderedFloat};
 use std::cmp::max;
+use std::mem::size_of;
 
 use super::{
     DerivedFilteredSearchIndex, ExternalIndex, ExternalIndexFactory, KeyScoreMatch,
@@ -234,6 +235,10 @@ impl NonFilteringExternalIndex<Vec<f64>, Vec<f64>> for BruteForceKNNIndex {
         }
         ret
     }
+
+    fn memory_usage(&self) -> Option<usize> {
+        Some(self.index_array.len() * size_of::<f64>())
+    }
 }
 
 pub struct BruteForceKNNIndexFactory {
@@ -41,6 +41,11 @@ pub trait ExternalIndex {
     fn add(&mut self, add_data: Vec<AddDataEntry>) -> Vec<(Key, DynResult<()>)>;
     fn remove(&mut self, keys: Vec<Key>) -> Vec<(Key, DynResult<()>)>;
     fn search(&self, query_data: &[QueryEntry]) -> Vec<(Key, DynResult<Value>)>;
+
+    /// Approximate number of bytes of memory used by the index, if known.
+    fn memory_usage(&self) -> Option<usize> {
+        None
+    }
 }
 
 pub trait ExternalIndexFactory: Send + Sync {
@@ -55,6 +60,7 @@ pub struct IndexDerivedImpl {
     query_accessor: Accessor,
     query_limit_accessor: OptionAccessor,
     query_filter_accessor: OptionAccessor,
+    size_reporter: Option<Box<dyn FnMut(usize)>>,
 }
 
 impl IndexDerivedImpl {
@@ -75,8 +81,16 @@ impl IndexDerivedImpl {
             query_accessor,
             query_limit_accessor,
             query_filter_accessor,
+            size_reporter: None,
         }
     }
+
+    /// Sets a callback receiving the memory used by the index after each batch of updates.
+    #[must_use]
+    pub fn with_size_reporter(mut self, size_reporter: impl FnMut(usize) + 'static) -> Self {
+        self.size_reporter = Some(Box::new(size_reporter));
+        self
+    }
 }
 
 pub trait CanBeRetraction {
@@ -137,6 +151,12 @@ impl<R: Abelian + CanBeRetraction> IndexTrait<Key, Value, R, Key, Value, Value>
         for (_key, res) in self.inner.add(to_insert) {
             res.unwrap_or_log(self.error_logger.as_ref(), ());
         }
+
+        if let Some(size_reporter) = &mut self.size_reporter {
+            if let Some(size) = self.inner.memory_usage() {
+                size_reporter(size);
+            }
+        }
     }
 
     fn search(&self, queries: Vec<(Key, Value, R)>) -> Vec<(Key, Value, R)> {
@@ -338,6 +358,27 @@ impl Unpack<Vec<f64>> for Value {
             Value::Tuple(values) => Ok(values.iter().map(Value::as_float).try_collect()?),
             Value::IntArray(values) => Ok(values.iter().map(|i| *i as f64).collect()),
             Value::FloatArray(values) => Ok(values.iter().copied().collect()),
+            Value::Float32Array(values) => Ok(values.iter().map(|f| f64::from(*f)).collect()),
+            value => Err(Box::new(DataError::TypeMismatch {
+                expected: "vector of floats",
+                value,
+            })),
+        }
+    }
+}
+
+// to vector of single precision floats, used by indexes that store f32 natively
+impl Unpack<Vec<f32>> for Value {
+    #[allow(clippy::cast_precision_loss, clippy::cast_possible_truncation)]
+    fn unpack(self) -> DynResult<Vec<f32>> {
+        match self {
+            Value::Tuple(values) => Ok(values
+                .iter()
+                .map(|v| v.as_float().map(|f| f as f32))
+                .try_collect()?),
+            Value::IntArray(values) => Ok(values.iter().map(|i| *i as f32).collect()),
+            Value::FloatArray(values) => Ok(values.iter().map(|f| *f as f32).collect()),
+            Value::Float32Array(values) => Ok(values.iter().copied().collect()),
             value => Err(Box::new(DataError::TypeMismatch {
                 expected: "vector of floats",
                 value,
@@ -368,6 +409,10 @@ pub trait NonFilteringExternalIndex<DataType, QueryType> {
         &self,
         queries: &[(Key, QueryType, usize)],
     ) -> Vec<(Key, DynResult<Vec<KeyScoreMatch>>)>;
+
+    fn memory_usage(&self) -> Option<usize> {
+        None
+    }
 }
 
 pub struct DerivedFilteredSearchIndex<DataType, QueryType> {
@@ -525,6 +570,11 @@ where
         self.inner.remove(keys)
     }
 
+    fn memory_usage(&self) -> Option<usize> {
+        // the filter data isn't included
+        self.inner.memory_usage()
+    }
+
     fn search(&self, query_data: &[QueryEntry]) -> Vec<(Key, DynResult<Value>)> {
         let (queries_without_errors, queries_with_errors): (Vec<_>, Vec<_>) = query_data
             .iter()
@@ -1,5 +1,7 @@
 // Copyright © 2024 Pathway
 
+use std::time::{Duration, Instant};
+
 use crate::engine::error::DynResult;
 use crate::engine::{Error, Key};
 use log::warn;
@@ -13,6 +15,9 @@ use super::{
     KeyToU64IdMapper, NonFilteringExternalIndex,
 };
 
+// measuring the size of the index walks all its segments, so it is done only this often
+const MEMORY_USAGE_REFRESH_INTERVAL: Duration = Duration::from_secs(10);
+
 pub struct TantivyIndex {
     // non configurable parameters
     reader: IndexReader,
@@ -21,6 +26,9 @@ pub struct TantivyIndex {
     data_field: Field,
     query_parser: QueryParser,
     key_to_id_mapper: KeyToU64IdMapper,
+    in_memory_index: bool,
+    memory_usage: Option<usize>,
+    memory_usage_measured_at: Option<Instant>,
 }
 impl TantivyIndex {
     pub fn new(ram_budget: usize, in_memory_index: bool) -> DynResult<TantivyIndex> {
@@ -53,6 +61,9 @@ impl TantivyIndex {
             data_field,
             query_parser,
             key_to_id_mapper: KeyToU64IdMapper::new(),
+            in_memory_index,
+            memory_usage: None,
+            memory_usage_measured_at: None,
         })
     }
 
@@ -97,6 +108,28 @@ impl TantivyIndex {
         Ok(())
     }
 
+    fn commit(&mut self) {
+        self.writer.commit().unwrap(); //TODO fix when clear how to report batch errors
+                                       // an index in a directory is kept on disk
+        if !self.in_memory_index {
+            return;
+        }
+        if self
+            .memory_usage_measured_at
+            .is_some_and(|measured_at| measured_at.elapsed() < MEMORY_USAGE_REFRESH_INTERVAL)
+        {
+            return;
+        }
+        self.memory_usage_measured_at = Some(Instant::now());
+        self.memory_usage = self.measure_memory_usage();
+    }
+
+    fn measure_memory_usage(&self) -> Option<usize> {
+        self.reader.reload().ok()?;
+        let space_usage = self.reader.searcher().space_usage().ok()?;
+        usize::try_from(space_usage.total().get_bytes()).ok()
+    }
+
     fn remove_one(&mut self, key: Key) -> DynResult<()> {
         let key_id = self.key_to_id_mapper.remove_key(key)?;
         let proxy_id_term = Term::from_field_u64(self.id_field, key_id);
@@ -114,7 +147,7 @@ impl NonFilteringExternalIndex<String, String> for TantivyIndex {
             .map(|(key, data)| (key, self.add_one(key, data)))
             .collect();
 
-        self.writer.commit().unwrap(); //TODO fix when clear how to report batch errors
+        self.commit();
         ret
     }
 
@@ -123,7 +156,7 @@ impl NonFilteringExternalIndex<String, String> for TantivyIndex {
             .into_iter()
             .map(|key| (key, self.remove_one(key)))
             .collect();
-        self.writer.commit().unwrap(); //TODO fix when clear how to report batch errors
+        self.commit();
         ret
     }
 
@@ -139,6 +172,10 @@ impl NonFilteringExternalIndex<String, String> for TantivyIndex {
             .map(|(key, data, limit)| (*key, self.search_one(data, *limit, &searcher)))
             .collect()
     }
+
+    fn memory_usage(&self) -> Option<usize> {
+        self.memory_usage
+    }
 }
 
 // index factory structure
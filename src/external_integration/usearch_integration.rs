@@ -50,7 +50,7 @@ impl USearchKNNIndex {
         })
     }
 
-    fn search_one(&self, data: &[f64], limit: usize) -> DynResult<Vec<KeyScoreMatch>> {
+    fn search_one(&self, data: &[f32], limit: usize) -> DynResult<Vec<KeyScoreMatch>> {
         let matches = self.index.search(data, limit)?;
         Ok(matches
             .keys
@@ -69,7 +69,7 @@ impl USearchKNNIndex {
             .collect())
     }
 
-    fn add_one(&mut self, key: Key, data: &[f64]) -> DynResult<()> {
+    fn add_one(&mut self, key: Key, data: &[f32]) -> DynResult<()> {
         let key_id = self.key_to_id_mapper.get_next_free_u64_id(key);
         self.index.add(key_id, data)?;
         Ok(())
@@ -82,8 +82,8 @@ impl USearchKNNIndex {
     }
 }
 
-impl NonFilteringExternalIndex<Vec<f64>, Vec<f64>> for USearchKNNIndex {
-    fn add(&mut self, add_data: Vec<(Key, Vec<f64>)>) -> Vec<(Key, DynResult<()>)> {
+impl NonFilteringExternalIndex<Vec<f32>, Vec<f32>> for USearchKNNIndex {
+    fn add(&mut self, add_data: Vec<(Key, Vec<f32>)>) -> Vec<(Key, DynResult<()>)> {
         if self.index.size() + add_data.len() > self.index.capacity() {
             assert!(self
                 .index
@@ -108,13 +108,17 @@ impl NonFilteringExternalIndex<Vec<f64>, Vec<f64>> for USearchKNNIndex {
 
     fn search(
         &self,
-        queries: &[(Key, Vec<f64>, usize)],
+        queries: &[(Key, Vec<f32>, usize)],
     ) -> Vec<(Key, DynResult<Vec<KeyScoreMatch>>)> {
         queries
             .iter()
             .map(|(key, data, limit)| (*key, self.search_one(data, *limit)))
             .collect()
     }
+
+    fn memory_usage(&self) -> Option<usize> {
+        Some(self.index.memory_usage())
+    }
 }
 
 // index factory structure
@@ -18,6 +18,7 @@ use async_nats::connect as nats_connect;
 use async_nats::Client as NatsClient;
 use async_nats::Subscriber as NatsSubscriber;
 use csv::ReaderBuilder as CsvReaderBuilder;
+use deltalake::parquet::basic::Compression as ParquetCompression;
 use elasticsearch::{
     auth::Credentials as ESCredentials,
     http::{
@@ -30,7 +31,10 @@ use itertools::Itertools;
 use log::{info, warn};
 use mongodb::sync::Client as MongoClient;
 use ndarray;
-use numpy::{PyArray, PyReadonlyArrayDyn};
+use numpy::{
+    Element, PyArray, PyArray1, PyReadonlyArray1, PyReadonlyArrayDyn, PyUntypedArray,
+    PyUntypedArrayMethods,
+};
 use once_cell::sync::Lazy;
 use postgres::{Client, NoTls};
 use pyo3::exceptions::{
@@ -60,6 +64,7 @@ use std::fs::File;
 use std::io::{BufWriter, Read};
 use std::mem::take;
 use std::os::unix::prelude::*;
+use std::path::PathBuf;
 use std::sync::{Arc, Mutex};
 use std::thread;
 use std::time;
@@ -73,30 +78,32 @@ use crate::connectors::data_format::{
     BsonFormatter, DebeziumDBType, DebeziumMessageParser, DsvSettings, Formatter,
     IdentityFormatter, IdentityParser, InnerSchemaField, JsonLinesFormatter, JsonLinesParser,
     KeyGenerationPolicy, NullFormatter, Parser, PsqlSnapshotFormatter, PsqlUpdatesFormatter,
-    SingleColumnFormatter, TransparentParser,
+    SingleColumnFormatter, TransparentParser, METADATA_FIELD_NAME,
 };
 use crate::connectors::data_storage::{
-    new_csv_filesystem_reader, new_filesystem_reader, new_s3_csv_reader, new_s3_generic_reader,
-    ConnectorMode, DeltaTableReader, DeltaTableWriter, ElasticSearchWriter, FileWriter,
-    KafkaReader, KafkaWriter, MongoWriter, NatsReader, NatsWriter, NullWriter, ObjectDownloader,
-    PsqlWriter, PythonConnectorEventType, PythonReaderBuilder, ReadError, ReadMethod,
-    ReaderBuilder, SqliteReader, Writer,
+    new_csv_filesystem_reader, new_filesystem_reader, new_parquet_filesystem_reader,
+    new_s3_csv_reader, new_s3_generic_reader, new_s3_parquet_reader, ConnectorMode,
+    DeltaTableReader, DeltaTableWriter, ElasticSearchWriter, FileWriter, KafkaReader, KafkaWriter,
+    MongoWriter, NatsReader, NatsWriter, NullWriter, ObjectDownloader, ParquetFilter,
+    ParquetWriter, PsqlWriter, PythonConnectorEventType, PythonReaderBuilder, ReadError,
+    ReadMethod, ReaderBuilder, ShardedWriter, SqliteReader, Writer,
 };
 use crate::connectors::scanner::S3Scanner;
-use crate::connectors::{PersistenceMode, SessionType, SnapshotAccess};
+use crate::connectors::{CommitPolicy, PersistenceMode, SessionType, SnapshotAccess};
 use crate::engine::dataflow::Config;
 use crate::engine::error::{DataError, DynError, DynResult, Trace as EngineTrace};
 use crate::engine::graph::ScopedContext;
 use crate::engine::progress_reporter::MonitoringLevel;
 use crate::engine::reduce::StatefulCombineFn;
 use crate::engine::time::DateTime;
+use crate::engine::udf_metrics::UdfCounters;
 use crate::engine::Config as EngineTelemetryConfig;
 use crate::engine::Timestamp;
 use crate::engine::{
     run_with_new_dataflow_graph, BatchWrapper, ColumnHandle, ColumnPath,
     ColumnProperties as EngineColumnProperties, DataRow, DateTimeNaive, DateTimeUtc, Duration,
-    ExpressionData, IxKeyPolicy, JoinData, JoinType, Key, KeyImpl, PointerExpression, Reducer,
-    ReducerData, ScopedGraph, TableHandle, TableProperties as EngineTableProperties, Type,
+    ExpressionData, IxKeyPolicy, JoinData, JoinStrategy, JoinType, Key, KeyImpl, PointerExpression,
+    Reducer, ReducerData, ScopedGraph, TableHandle, TableProperties as EngineTableProperties, Type,
     UniverseHandle, Value,
 };
 use crate::engine::{AnyExpression, Context as EngineContext};
@@ -296,6 +303,66 @@ fn extract_datetime(ob: &Bound<PyAny>, type_: &Type) -> Option<Value> {
     }
 }
 
+/// Owns the engine value a read-only NumPy view returned to Python is backed by.
+#[pyclass(module = "pathway.engine", frozen)]
+struct ArrayOwner(Value);
+
+fn array_to_py<T: Element>(py: Python<'_>, array: &ndarray::ArrayD<T>, owner: &Value) -> PyObject {
+    let container =
+        Bound::new(py, ArrayOwner(owner.clone())).expect("creating an array owner should not fail");
+    // SAFETY: the container keeps the handle with the data alive for as long as the view
+    // exists, and the engine never mutates arrays behind a handle.
+    let view = unsafe { PyArray::borrow_from_array_bound(array, container.into_any()) };
+    view.getattr(intern!(py, "flags"))
+        .and_then(|flags| flags.setattr(intern!(py, "writeable"), false))
+        .expect("setting the array read-only should not fail");
+    view.unbind().into_any()
+}
+
+fn is_view_of<T>(array: &ndarray::ArrayD<T>, view: &Bound<PyUntypedArray>) -> bool {
+    let element_size = isize::try_from(std::mem::size_of::<T>()).unwrap();
+    // SAFETY: only the data pointer of a live array object is read
+    let data = unsafe { (*view.as_array_ptr()).data };
+    data.cast::<T>().cast_const() == array.as_ptr()
+        && view.shape() == array.shape()
+        && view
+            .strides()
+            .iter()
+            .zip_eq(array.strides())
+            .all(|(view_stride, stride)| *view_stride == stride * element_size)
+}
+
+/// Returns the engine value if `ob` is a view created by [`array_to_py`] spanning the
+/// whole array, so that arrays passed back from Python are not copied again.
+fn extract_engine_array(ob: &Bound<PyAny>, dim: Option<usize>, wrapped: &Type) -> Option<Value> {
+    let view = ob.downcast::<PyUntypedArray>().ok()?;
+    let base = view.getattr(intern!(ob.py(), "base")).ok()?;
+    let owner = base.downcast::<ArrayOwner>().ok()?;
+    let value = &owner.get().0;
+    let (is_view, ndim) = match (value, wrapped) {
+        (Value::IntArray(array), Type::Int | Type::Any) => (is_view_of(array, view), array.ndim()),
+        (Value::FloatArray(array), Type::Float | Type::Any) => {
+            (is_view_of(array, view), array.ndim())
+        }
+        (Value::Float32Array(array), Type::Float32 | Type::Any) => {
+            (is_view_of(array, view), array.ndim())
+        }
+        _ => return None,
+    };
+    (is_view && dim.map_or(true, |dim| dim == ndim)).then(|| value.clone())
+}
+
+fn extract_owned_array(ob: &Bound<PyAny>, dim: Option<usize>, wrapped: &Type) -> Option<Value> {
+    match wrapped {
+        Type::Int => extract_int_array(ob, dim).map(Value::from),
+        Type::Float => extract_float_array(ob, dim).map(Value::from),
+        Type::Float32 => extract_float32_array(ob, dim).map(Value::from),
+        _ => extract_int_array(ob, dim)
+            .map(Value::from)
+            .or_else(|| extract_float_array(ob, dim).map(Value::from)),
+    }
+}
+
 fn extract_int_array(ob: &Bound<PyAny>, dim: Option<usize>) -> Option<ndarray::ArrayD<i64>> {
     let array = if let Ok(array) = ob.extract::<PyReadonlyArrayDyn<i64>>() {
         Some(array.as_array().to_owned())
@@ -321,6 +388,16 @@ fn extract_float_array(ob: &Bound<PyAny>, dim: Option<usize>) -> Option<ndarray:
     array_with_proper_dimensions(array, dim)
 }
 
+#[allow(clippy::cast_possible_truncation)]
+fn extract_float32_array(ob: &Bound<PyAny>, dim: Option<usize>) -> Option<ndarray::ArrayD<f32>> {
+    let array = if let Ok(array) = ob.extract::<PyReadonlyArrayDyn<f32>>() {
+        array.as_array().to_owned()
+    } else {
+        extract_float_array(ob, dim).map(|array| array.mapv(|v| v as f32))?
+    };
+    array_with_proper_dimensions(array, dim)
+}
+
 fn py_type_error(ob: &Bound<PyAny>, type_: &Type) -> PyErr {
     PyTypeError::new_err(format!(
         "cannot create an object of type {type_:?} from value {ob}"
@@ -342,7 +419,7 @@ pub fn extract_value(ob: &Bound<PyAny>, type_: &Type) -> PyResult<Value> {
             .ok()
             .map(|b| Value::from(b.is_true())),
         Type::Int => ob.extract::<i64>().ok().map(Value::from),
-        Type::Float => ob.extract::<f64>().ok().map(Value::from),
+        Type::Float | Type::Float32 => ob.extract::<f64>().ok().map(Value::from),
         Type::Pointer => ob.extract::<Key>().ok().map(Value::from),
         Type::String => ob
             .downcast::<PyString>()
@@ -366,11 +443,10 @@ pub fn extract_value(ob: &Bound<PyAny>, type_: &Type) -> PyResult<Value> {
             }
         }
         Type::Array(dim, wrapped) => match wrapped.borrow() {
-            Type::Int => Ok(extract_int_array(ob, *dim).map(Value::from)),
-            Type::Float => Ok(extract_float_array(ob, *dim).map(Value::from)),
-            Type::Any => Ok(extract_int_array(ob, *dim)
-                .map(Value::from)
-                .or_else(|| extract_float_array(ob, *dim).map(Value::from))),
+            wrapped @ (Type::Int | Type::Float | Type::Float32 | Type::Any) => {
+                Ok(extract_engine_array(ob, *dim, wrapped)
+                    .or_else(|| extract_owned_array(ob, *dim, wrapped)))
+            }
             wrapped => Err(PyValueError::new_err(format!(
                 "{wrapped:?} is invalid type for Array"
             ))),
@@ -447,6 +523,8 @@ impl<'py> FromPyObject<'py> for Value {
         } else if let Ok(b) = ob.extract::<&PyBool>() {
             // Fallback checks from now on
             Ok(Value::Bool(b.is_true()))
+        } else if let Some(value) = extract_engine_array(ob, None, &Type::Any) {
+            Ok(value)
         } else if let Ok(array) = ob.extract::<PyReadonlyArrayDyn<i64>>() {
             // single-element arrays convert to scalars, so we need to check for arrays first
             Ok(Value::from(array.as_array().to_owned()))
@@ -521,8 +599,9 @@ impl ToPyObject for Value {
             Self::String(s) => s.into_py(py),
             Self::Bytes(b) => PyBytes::new_bound(py, b).unbind().into_any(),
             Self::Tuple(t) => PyTuple::new_bound(py, t.iter()).unbind().into_any(),
-            Self::IntArray(a) => PyArray::from_array_bound(py, a).unbind().into_any(),
-            Self::FloatArray(a) => PyArray::from_array_bound(py, a).unbind().into_any(),
+            Self::IntArray(a) => array_to_py(py, a, self),
+            Self::FloatArray(a) => array_to_py(py, a, self),
+            Self::Float32Array(a) => array_to_py(py, a, self),
             Self::DateTimeNaive(dt) => dt.into_py(py),
             Self::DateTimeUtc(dt) => dt.into_py(py),
             Self::Duration(d) => d.into_py(py),
@@ -1161,6 +1240,27 @@ impl PyExpression {
         Self::new(Arc::new(Expression::Any(expression)), true)
     }
 
+    #[staticmethod]
+    #[pyo3(signature = (function, *args, dtype, propagate_none=false))]
+    fn vectorized_apply(
+        function: Py<PyAny>,
+        args: Vec<PyRef<PyExpression>>,
+        dtype: Type,
+        propagate_none: bool,
+    ) -> Self {
+        let args = args
+            .into_iter()
+            .map(|expr| expr.inner.clone())
+            .collect_vec();
+        let func = Box::new(move |columns: &[Vec<Value>]| {
+            Python::with_gil(|py| {
+                call_vectorized_function(py, &function, columns, &dtype, propagate_none)
+            })
+        });
+        let expression = AnyExpression::VectorizedApply(func, args.into());
+        Self::new(Arc::new(Expression::Any(expression)), true)
+    }
+
     #[staticmethod]
     fn unary_expression(
         expr: &PyExpression,
@@ -1633,6 +1733,8 @@ impl PathwayType {
     #[classattr]
     pub const FLOAT: Type = Type::Float;
     #[classattr]
+    pub const FLOAT32: Type = Type::Float32;
+    #[classattr]
     pub const POINTER: Type = Type::Pointer;
     #[classattr]
     pub const STRING: Type = Type::String;
@@ -2380,6 +2482,7 @@ impl Scope {
             &data_format.borrow(),
             connector_index,
             self_.borrow().worker_index(),
+            self_.borrow().worker_count(),
         )?;
 
         let parser_impl = data_format.borrow().construct_parser(py)?;
@@ -2389,9 +2492,7 @@ impl Scope {
         let table_handle = self_.borrow().graph.connector_table(
             reader_impl,
             parser_impl,
-            properties
-                .commit_duration_ms
-                .map(time::Duration::from_millis),
+            properties.commit_policy(),
             parallel_readers,
             Arc::new(EngineTableProperties::flat(column_properties)),
             persistent_id.as_ref(),
@@ -2912,7 +3013,8 @@ impl Scope {
         LegacyTable::new(universe.clone(), columns)
     }
 
-    #[pyo3(signature = (table, grouping_columns_paths, last_column_is_instance, reducers, set_id, table_properties))]
+    #[pyo3(signature = (table, grouping_columns_paths, last_column_is_instance, reducers, set_id, table_properties, *, skewed_keys = Vec::new()))]
+    #[allow(clippy::too_many_arguments)]
     pub fn group_by_table(
         self_: &Bound<Self>,
         table: PyRef<Table>,
@@ -2921,6 +3023,7 @@ impl Scope {
         #[pyo3(from_py_with = "from_py_iterable")] reducers: Vec<ReducerData>,
         set_id: bool,
         table_properties: TableProperties,
+        skewed_keys: Vec<Vec<Value>>,
     ) -> PyResult<Py<Table>> {
         let table_handle = self_.borrow().graph.group_by_table(
             table.handle,
@@ -2928,6 +3031,7 @@ impl Scope {
             ShardPolicy::from_last_column_is_instance(last_column_is_instance),
             reducers,
             set_id,
+            skewed_keys,
             table_properties.0,
         )?;
         Table::new(self_, table_handle)
@@ -2974,7 +3078,7 @@ impl Scope {
         Table::new(self_, result_table_handle)
     }
 
-    #[pyo3(signature = (left_table, right_table, left_column_paths, right_column_paths, *, last_column_is_instance, table_properties, assign_id = false, left_ear = false, right_ear = false))]
+    #[pyo3(signature = (left_table, right_table, left_column_paths, right_column_paths, *, last_column_is_instance, table_properties, assign_id = false, left_ear = false, right_ear = false, broadcast_left = false, broadcast_right = false, skewed_keys = Vec::new()))]
     #[allow(clippy::too_many_arguments)]
     #[allow(clippy::fn_params_excessive_bools)]
     pub fn join_tables(
@@ -2988,13 +3092,19 @@ impl Scope {
         assign_id: bool,
         left_ear: bool,
         right_ear: bool,
+        broadcast_left: bool,
+        broadcast_right: bool,
+        skewed_keys: Vec<Vec<Value>>,
     ) -> PyResult<Py<Table>> {
         let join_type = JoinType::from_assign_left_right(assign_id, left_ear, right_ear)?;
+        let strategy = JoinStrategy::from_broadcast_left_right(broadcast_left, broadcast_right)?;
         let table_handle = self_.borrow().graph.join_tables(
             JoinData::new(left_table.handle, left_column_paths),
             JoinData::new(right_table.handle, right_column_paths),
             ShardPolicy::from_last_column_is_instance(last_column_is_instance),
             join_type,
+            strategy,
+            skewed_keys,
             table_properties.0,
         )?;
         Table::new(self_, table_handle)
@@ -3104,24 +3214,49 @@ impl Scope {
     }
 
     #[allow(clippy::too_many_arguments)]
+    #[pyo3(signature = (
+        table,
+        column_paths,
+        skip_persisted_batch,
+        skip_errors,
+        on_change,
+        on_time_end,
+        on_end,
+        on_batch = None,
+        on_batch_column_types = Vec::new(),
+    ))]
     pub fn subscribe_table(
         self_: &Bound<Self>,
         table: PyRef<Table>,
         #[pyo3(from_py_with = "from_py_iterable")] column_paths: Vec<ColumnPath>,
         skip_persisted_batch: bool,
         skip_errors: bool,
-        on_change: Py<PyAny>,
+        on_change: Option<Py<PyAny>>,
         on_time_end: Py<PyAny>,
         on_end: Py<PyAny>,
+        on_batch: Option<Py<PyAny>>,
+        on_batch_column_types: Vec<Type>,
     ) -> PyResult<()> {
-        let callbacks = SubscribeCallbacksBuilder::new()
-            .wrapper(BatchWrapper::WithGil)
-            .on_data(Box::new(move |key, values, time, diff| {
+        let mut callbacks = SubscribeCallbacksBuilder::new().wrapper(BatchWrapper::WithGil);
+        if let Some(on_change) = on_change {
+            callbacks = callbacks.on_data(Box::new(move |key, values, time, diff| {
                 Python::with_gil(|py| {
                     on_change.call1(py, (key, PyTuple::new_bound(py, values), time, diff))?;
                     Ok(())
                 })
-            }))
+            }));
+        }
+        if let Some(on_batch) = on_batch {
+            callbacks = callbacks.on_batch(Box::new(move |time, rows| {
+                Python::with_gil(|py| {
+                    let (keys, columns, diffs) =
+                        batch_to_numpy_columns(py, rows, &on_batch_column_types);
+                    on_batch.call1(py, (keys, columns, time, diffs))?;
+                    Ok(())
+                })
+            }));
+        }
+        let callbacks = callbacks
             .on_time_end(Box::new(move |new_time| {
                 Python::with_gil(|py| {
                     on_time_end.call1(py, (new_time,))?;
@@ -3145,10 +3280,12 @@ impl Scope {
         Ok(())
     }
 
+    #[pyo3(signature = (operator_id, depends_on_error_log, trace=None))]
     pub fn set_operator_properties(
         self_: &Bound<Self>,
         operator_id: usize,
         depends_on_error_log: bool,
+        trace: Option<EngineTrace>,
     ) -> PyResult<()> {
         Ok(self_
             .borrow()
@@ -3156,6 +3293,7 @@ impl Scope {
             .set_operator_properties(OperatorProperties {
                 id: operator_id,
                 depends_on_error_log,
+                trace: trace.unwrap_or(EngineTrace::Empty),
             })?)
     }
 
@@ -3228,6 +3366,199 @@ impl Scope {
     }
 }
 
+/// Converts a batch of rows into NumPy arrays: the keys, one array per column
+/// and the diffs. The dtype of a column is given by its type in the schema, so that
+/// it is the same in every batch: `int`, `float` and `bool` columns get a native
+/// dtype, other columns are arrays of Python objects. A native column falls back
+/// to Python objects only if it contains an error value.
+fn batch_to_numpy_columns(
+    py: Python<'_>,
+    rows: &[(Key, &[Value], isize)],
+    column_types: &[Type],
+) -> (PyObject, Vec<PyObject>, PyObject) {
+    fn native_column<T: numpy::Element>(
+        py: Python<'_>,
+        column: impl Iterator<Item = DynResult<T>>,
+    ) -> Option<PyObject> {
+        let values: Vec<T> = column.collect::<DynResult<_>>().ok()?;
+        Some(PyArray1::from_vec_bound(py, values).into_any().unbind())
+    }
+
+    let keys: Vec<PyObject> = rows.iter().map(|(key, _, _)| key.to_object(py)).collect();
+    let diffs: Vec<i64> = rows
+        .iter()
+        .map(|(_, _, diff)| (*diff).try_into().unwrap())
+        .collect();
+    let columns = column_types
+        .iter()
+        .enumerate()
+        .map(|(index, type_)| {
+            let column = rows.iter().map(|(_, values, _)| &values[index]);
+            let native = match type_ {
+                Type::Int => native_column(py, column.clone().map(Value::as_int)),
+                Type::Float => native_column(py, column.clone().map(Value::as_float)),
+                Type::Bool => native_column(py, column.clone().map(Value::as_bool)),
+                _ => None,
+            };
+            native.unwrap_or_else(|| {
+                let values: Vec<PyObject> = column.map(|value| value.to_object(py)).collect();
+                PyArray1::from_vec_bound(py, values).into_any().unbind()
+            })
+        })
+        .collect();
+    (
+        PyArray1::from_vec_bound(py, keys).into_any().unbind(),
+        columns,
+        PyArray1::from_vec_bound(py, diffs).into_any().unbind(),
+    )
+}
+
+/// Converts a column of values into a NumPy array and a mask of `None` entries
+/// (`None` if there are no such entries). Columns of ints, floats or bools,
+/// possibly with `None`s, get a native dtype, with `None`s replaced by a filler.
+fn column_to_numpy(py: Python<'_>, column: &[Value]) -> (PyObject, Option<PyObject>) {
+    let mask = column
+        .iter()
+        .any(|value| matches!(value, Value::None))
+        .then(|| {
+            let mask: Vec<bool> = column
+                .iter()
+                .map(|value| matches!(value, Value::None))
+                .collect();
+            PyArray1::from_vec_bound(py, mask).into_any().unbind()
+        });
+    let mut present = column
+        .iter()
+        .filter(|value| !matches!(value, Value::None))
+        .peekable();
+    let data = if present.peek().is_none() {
+        let values: Vec<PyObject> = column.iter().map(|value| value.to_object(py)).collect();
+        PyArray1::from_vec_bound(py, values).into_any().unbind()
+    } else if present.clone().all(|value| matches!(value, Value::Int(_))) {
+        let values: Vec<i64> = column
+            .iter()
+            .map(|value| value.as_int().unwrap_or_default())
+            .collect();
+        PyArray1::from_vec_bound(py, values).into_any().unbind()
+    } else if present
+        .clone()
+        .all(|value| matches!(value, Value::Float(_)))
+    {
+        let values: Vec<f64> = column
+            .iter()
+            .map(|value| value.as_float().unwrap_or(f64::NAN))
+            .collect();
+        PyArray1::from_vec_bound(py, values).into_any().unbind()
+    } else if present.all(|value| matches!(value, Value::Bool(_))) {
+        let values: Vec<bool> = column
+            .iter()
+            .map(|value| value.as_bool().unwrap_or_default())
+            .collect();
+        PyArray1::from_vec_bound(py, values).into_any().unbind()
+    } else {
+        let values: Vec<PyObject> = column.iter().map(|value| value.to_object(py)).collect();
+        PyArray1::from_vec_bound(py, values).into_any().unbind()
+    };
+    (data, mask)
+}
+
+/// Converts an array returned by a vectorized function into values of type `type_`.
+/// Arrays with a native dtype matching the type are read without creating Python
+/// objects for the individual entries.
+fn numpy_to_values(data: &Bound<PyAny>, type_: &Type) -> PyResult<Vec<Value>> {
+    match type_.unoptionalize() {
+        Type::Float => {
+            if let Ok(array) = data.extract::<PyReadonlyArray1<f64>>() {
+                return Ok(array.as_array().iter().map(|v| Value::from(*v)).collect());
+            }
+        }
+        Type::Int => {
+            if let Ok(array) = data.extract::<PyReadonlyArray1<i64>>() {
+                return Ok(array.as_array().iter().map(|v| Value::from(*v)).collect());
+            }
+        }
+        Type::Bool => {
+            if let Ok(array) = data.extract::<PyReadonlyArray1<bool>>() {
+                return Ok(array.as_array().iter().map(|v| Value::from(*v)).collect());
+            }
+        }
+        _ => {}
+    }
+    let items = if data.getattr("ndim")?.extract::<usize>()? == 1 {
+        // numpy scalars are converted to the builtin Python types
+        data.call_method0("tolist")?
+    } else {
+        data.clone()
+    };
+    items
+        .iter()?
+        .map(|item| extract_value(&item?, type_))
+        .collect()
+}
+
+fn call_vectorized_function(
+    py: Python<'_>,
+    function: &Py<PyAny>,
+    columns: &[Vec<Value>],
+    type_: &Type,
+    propagate_none: bool,
+) -> DynResult<Vec<Value>> {
+    if propagate_none {
+        let n_rows = columns.first().map_or(0, Vec::len);
+        let keep: Vec<bool> = (0..n_rows)
+            .map(|i| {
+                !columns
+                    .iter()
+                    .any(|column| matches!(column[i], Value::None))
+            })
+            .collect();
+        if keep.contains(&false) {
+            let filtered: Vec<Vec<Value>> = columns
+                .iter()
+                .map(|column| {
+                    column
+                        .iter()
+                        .zip(&keep)
+                        .filter_map(|(value, keep)| keep.then(|| value.clone()))
+                        .collect()
+                })
+                .collect();
+            let results = if keep.contains(&true) {
+                call_vectorized_function(py, function, &filtered, type_, false)?
+            } else {
+                Vec::new()
+            };
+            if results.len() != filtered[0].len() {
+                // reported by the caller as a mismatch between the number of rows and results
+                return Ok(results);
+            }
+            let mut results = results.into_iter();
+            return Ok(keep
+                .into_iter()
+                .map(|keep| {
+                    if keep {
+                        results.next().expect("one result per row")
+                    } else {
+                        Value::None
+                    }
+                })
+                .collect());
+        }
+    }
+    let args = PyTuple::new_bound(py, columns.iter().map(|column| column_to_numpy(py, column)));
+    let result = function.call1(py, args)?;
+    let (data, mask): (Bound<PyAny>, Option<PyReadonlyArray1<bool>>) = result.bind(py).extract()?;
+    let mut values = numpy_to_values(&data, type_)?;
+    if let Some(mask) = mask {
+        for (value, masked) in values.iter_mut().zip(mask.as_array()) {
+            if *masked {
+                *value = Value::None;
+            }
+        }
+    }
+    Ok(values)
+}
+
 type CapturedTableData = Arc<Mutex<Vec<DataRow>>>;
 
 fn capture_table_data(
@@ -3278,6 +3609,9 @@ pub fn make_captured_table(table_data: Vec<CapturedTableData>) -> PyResult<Vec<D
     trace_parent = None,
     run_id = None,
     terminate_on_error = true,
+    profile = None,
+    memory_budget = None,
+    spill_dir = None,
 ))]
 pub fn run_with_new_graph(
     py: Python,
@@ -3293,14 +3627,19 @@ pub fn run_with_new_graph(
     trace_parent: Option<String>,
     run_id: Option<String>,
     terminate_on_error: bool,
+    profile: Option<PathBuf>,
+    memory_budget: Option<usize>,
+    spill_dir: Option<PathBuf>,
 ) -> PyResult<Vec<Vec<DataRow>>> {
     LOGGING_RESET_HANDLE.reset();
     defer! {
         log::logger().flush();
     }
-    let config = Config::from_env().map_err(|msg| {
+    let mut config = Config::from_env().map_err(|msg| {
         PyErr::from_type_bound(ENGINE_ERROR_TYPE.bind(py).clone(), msg.to_string())
     })?;
+    config.set_memory_budget(memory_budget);
+    config.set_spill_dir(spill_dir);
     let persistence_config = {
         if let Some(persistence_config) = persistence_config {
             Some(persistence_config.prepare(py)?)
@@ -3342,6 +3681,7 @@ pub fn run_with_new_graph(
                 &license,
                 telemetry_config,
                 terminate_on_error,
+                profile,
             )
         })
     })??;
@@ -3696,6 +4036,12 @@ pub struct DataStorage {
     downloader_threads_count: Option<usize>,
     database: Option<String>,
     start_from_timestamp_ms: Option<i64>,
+    parquet_settings: Option<Py<ParquetSettings>>,
+    partition_columns: Vec<String>,
+    target_file_size: Option<usize>,
+    compaction_interval_ms: Option<u64>,
+    parallel_writers: Option<usize>,
+    static_partition_assignment: bool,
 }
 
 #[pyclass(module = "pathway.engine", frozen, name = "PersistenceMode")]
@@ -3861,6 +4207,39 @@ impl From<EngineTelemetryConfig> for TelemetryConfig {
     }
 }
 
+#[pyclass(module = "pathway.engine", frozen)]
+pub struct UdfMetrics(Arc<UdfCounters>);
+
+#[pymethods]
+impl UdfMetrics {
+    #[new]
+    #[pyo3(signature = (name, capacity=None))]
+    fn new(name: String, capacity: Option<u64>) -> Self {
+        Self(UdfCounters::register(name, capacity))
+    }
+
+    fn on_call_started(&self) {
+        self.0.on_call_started();
+    }
+
+    fn on_call_finished(&self, latency: f64, failed: bool) {
+        self.0
+            .on_call_finished(time::Duration::from_secs_f64(latency.max(0.0)), failed);
+    }
+
+    fn on_retry(&self) {
+        self.0.on_retry();
+    }
+
+    fn on_timeout(&self) {
+        self.0.on_timeout();
+    }
+
+    fn on_cache_lookup(&self, hit: bool) {
+        self.0.on_cache_lookup(hit);
+    }
+}
+
 impl<'py> FromPyObject<'py> for SnapshotEvent {
     fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
         Ok(ob.extract::<PyRef<PySnapshotEvent>>()?.0.clone())
@@ -4010,6 +4389,12 @@ impl DataStorage {
         downloader_threads_count = None,
         database = None,
         start_from_timestamp_ms = None,
+        parquet_settings = None,
+        partition_columns = Vec::new(),
+        target_file_size = None,
+        compaction_interval_ms = None,
+        parallel_writers = None,
+        static_partition_assignment = false,
     ))]
     #[allow(clippy::too_many_arguments)]
     fn new(
@@ -4037,6 +4422,12 @@ impl DataStorage {
         downloader_threads_count: Option<usize>,
         database: Option<String>,
         start_from_timestamp_ms: Option<i64>,
+        parquet_settings: Option<Py<ParquetSettings>>,
+        partition_columns: Vec<String>,
+        target_file_size: Option<usize>,
+        compaction_interval_ms: Option<u64>,
+        parallel_writers: Option<usize>,
+        static_partition_assignment: bool,
     ) -> Self {
         DataStorage {
             storage_type,
@@ -4063,6 +4454,12 @@ impl DataStorage {
             downloader_threads_count,
             database,
             start_from_timestamp_ms,
+            parquet_settings,
+            partition_columns,
+            target_file_size,
+            compaction_interval_ms,
+            parallel_writers,
+            static_partition_assignment,
         }
     }
 }
@@ -4171,6 +4568,69 @@ impl CsvParserSettings {
     }
 }
 
+#[derive(Clone)]
+#[pyclass(module = "pathway.engine", frozen)]
+pub struct ParquetSettings {
+    pub filters: Vec<ParquetFilter>,
+    pub parallel_row_groups: Option<usize>,
+    pub compression: ParquetCompression,
+    pub max_file_size: Option<usize>,
+    pub max_file_duration_ms: Option<u64>,
+}
+
+#[pymethods]
+impl ParquetSettings {
+    #[new]
+    #[pyo3(signature = (
+        filters = Vec::new(),
+        parallel_row_groups = None,
+        compression = "snappy",
+        max_file_size = None,
+        max_file_duration_ms = None,
+    ))]
+    pub fn new(
+        filters: Vec<ParquetFilter>,
+        parallel_row_groups: Option<usize>,
+        compression: &str,
+        max_file_size: Option<usize>,
+        max_file_duration_ms: Option<u64>,
+    ) -> PyResult<ParquetSettings> {
+        let compression = match compression {
+            "none" => ParquetCompression::UNCOMPRESSED,
+            "snappy" => ParquetCompression::SNAPPY,
+            "gzip" => ParquetCompression::GZIP(Default::default()),
+            "lz4" => ParquetCompression::LZ4_RAW,
+            "zstd" => ParquetCompression::ZSTD(Default::default()),
+            "brotli" => ParquetCompression::BROTLI(Default::default()),
+            _ => {
+                return Err(PyValueError::new_err(format!(
+                    "Unknown parquet compression: {compression}"
+                )))
+            }
+        };
+        if parallel_row_groups == Some(0) {
+            return Err(PyValueError::new_err(
+                "parallel_row_groups, if specified, should be positive",
+            ));
+        }
+        Ok(ParquetSettings {
+            filters,
+            parallel_row_groups,
+            compression,
+            max_file_size,
+            max_file_duration_ms,
+        })
+    }
+}
+
+impl<'py> FromPyObject<'py> for ParquetFilter {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (column, operator, value): (String, String, Value) = ob.extract()?;
+        let operator = operator.parse().map_err(PyValueError::new_err)?;
+        Ok(ParquetFilter::new(column, operator, value))
+    }
+}
+
 impl CsvParserSettings {
     fn build_csv_reader_builder(&self) -> CsvReaderBuilder {
         let mut builder = CsvReaderBuilder::new();
@@ -4431,7 +4891,13 @@ impl DataStorage {
         }
     }
 
-    fn construct_kafka_reader(&self) -> PyResult<(Box<dyn ReaderBuilder>, usize)> {
+    fn construct_kafka_reader(
+        &self,
+        py: pyo3::Python,
+        data_format: &DataFormat,
+        worker_index: usize,
+        worker_count: usize,
+    ) -> PyResult<(Box<dyn ReaderBuilder>, usize)> {
         let client_config = self.kafka_client_config()?;
 
         let consumer: BaseConsumer = client_config
@@ -4439,9 +4905,26 @@ impl DataStorage {
             .map_err(|e| PyValueError::new_err(format!("Creating Kafka consumer failed: {e}")))?;
 
         let topic = self.kafka_or_nats_topic()?;
-        consumer
-            .subscribe(&[topic])
-            .map_err(|e| PyIOError::new_err(format!("Subscription to Kafka topic failed: {e}")))?;
+        let mut parallel_readers = self.parallel_readers.unwrap_or(256);
+        if self.static_partition_assignment {
+            // Partitions are distributed between the readers in a round-robin manner
+            // and no consumer group rebalancing takes place.
+            parallel_readers = parallel_readers.min(worker_count);
+            let total_partitions = Self::total_partitions_for_topic(&consumer, topic)?;
+            let mut assignment = TopicPartitionList::new();
+            if worker_index < parallel_readers {
+                for partition_idx in (worker_index..total_partitions).step_by(parallel_readers) {
+                    assignment.add_partition(topic, partition_idx.try_into().unwrap());
+                }
+            }
+            consumer.assign(&assignment).map_err(|e| {
+                PyIOError::new_err(format!("Assignment of Kafka partitions failed: {e}"))
+            })?;
+        } else {
+            consumer.subscribe(&[topic]).map_err(|e| {
+                PyIOError::new_err(format!("Subscription to Kafka topic failed: {e}"))
+            })?;
+        }
 
         let mut seek_positions = HashMap::new();
         if let Some(start_from_timestamp_ms) = self.start_from_timestamp_ms {
@@ -4516,8 +4999,9 @@ impl DataStorage {
             topic.to_string(),
             self.internal_persistent_id(),
             seek_positions,
+            data_format.has_metadata_field(py),
         );
-        Ok((Box::new(reader), self.parallel_readers.unwrap_or(256)))
+        Ok((Box::new(reader), parallel_readers))
     }
 
     fn construct_python_reader(
@@ -4598,6 +5082,53 @@ impl DataStorage {
         Ok((Box::new(reader), 1))
     }
 
+    fn parquet_settings<'py>(&'py self, py: pyo3::Python<'py>) -> PyResult<PyRef<ParquetSettings>> {
+        Ok(self
+            .parquet_settings
+            .as_ref()
+            .ok_or_else(|| {
+                PyValueError::new_err("For parquet storage, parquet_settings must be specified")
+            })?
+            .borrow(py))
+    }
+
+    fn construct_parquet_reader(
+        &self,
+        py: pyo3::Python,
+        data_format: &DataFormat,
+    ) -> PyResult<(Box<dyn ReaderBuilder>, usize)> {
+        let settings = self.parquet_settings(py)?;
+        let column_types = data_format.value_fields_type_map(py);
+        let filters = settings.filters.clone();
+        let parallel_row_groups = settings
+            .parallel_row_groups
+            .unwrap_or_else(rayon::current_num_threads);
+        let reader = if self.aws_s3_settings.is_some() {
+            let (_, deduced_path) = S3Scanner::deduce_bucket_and_path(self.path()?);
+            new_s3_parquet_reader(
+                self.s3_bucket(py)?,
+                deduced_path,
+                column_types,
+                filters,
+                parallel_row_groups,
+                self.mode,
+                self.internal_persistent_id(),
+                self.downloader_threads_count()?,
+            )
+        } else {
+            new_parquet_filesystem_reader(
+                self.path()?,
+                column_types,
+                filters,
+                parallel_row_groups,
+                self.mode,
+                self.internal_persistent_id(),
+            )
+        }
+        .map_err(|e| PyIOError::new_err(format!("Failed to initialize parquet reader: {e}")))?;
+        Ok((Box::new(reader), 1))
+    }
+
     fn construct_nats_reader(
         &self,
         connector_index: usize,
@@ -4634,16 +5165,18 @@ impl DataStorage {
         data_format: &DataFormat,
         connector_index: usize,
         worker_index: usize,
+        worker_count: usize,
     ) -> PyResult<(Box<dyn ReaderBuilder>, usize)> {
         match self.storage_type.as_ref() {
             "fs" => self.construct_fs_reader(),
             "s3" => self.construct_s3_reader(py),
             "s3_csv" => self.construct_s3_csv_reader(py),
             "csv" => self.construct_csv_reader(py),
-            "kafka" => self.construct_kafka_reader(),
+            "kafka" => self.construct_kafka_reader(py, data_format, worker_index, worker_count),
             "python" => self.construct_python_reader(py, data_format),
             "sqlite" => self.construct_sqlite_reader(py, data_format),
             "deltalake" => self.construct_deltalake_reader(py, data_format),
+            "parquet" => self.construct_parquet_reader(py, data_format),
             "nats" => self.construct_nats_reader(connector_index, worker_index),
             other => Err(PyValueError::new_err(format!(
                 "Unknown data source {other:?}"
@@ -4732,29 +5265,60 @@ impl DataStorage {
 
     fn construct_postgres_writer(&self) -> PyResult<Box<dyn Writer>> {
         let connection_string = self.connection_string()?;
-        let storage = match Client::connect(connection_string, NoTls) {
-            Ok(client) => PsqlWriter::new(
-                client,
-                self.max_batch_size,
-                self.snapshot_maintenance_on_output,
-            ),
-            Err(e) => {
-                return Err(PyIOError::new_err(format!(
-                    "Failed to establish PostgreSQL connection: {e:?}"
-                )))
-            }
+        let construct_writer = || -> PyResult<Box<dyn Writer>> {
+            let storage = match Client::connect(connection_string, NoTls) {
+                Ok(client) => PsqlWriter::new(
+                    client,
+                    self.max_batch_size,
+                    self.snapshot_maintenance_on_output,
+                ),
+                Err(e) => {
+                    return Err(PyIOError::new_err(format!(
+                        "Failed to establish PostgreSQL connection: {e:?}"
+                    )))
+                }
+            };
+            Ok(Box::new(storage))
         };
-        Ok(Box::new(storage))
+        if self.snapshot_maintenance_on_output && self.parallel_writers.is_some() {
+            return Err(PyValueError::new_err(
+                "parallel_writers is not supported for the snapshot mode of PostgreSQL output",
+            ));
+        }
+        self.construct_parallel_writers(construct_writer)
     }
 
     fn construct_elasticsearch_writer(&self, py: pyo3::Python) -> PyResult<Box<dyn Writer>> {
         let elasticsearch_client_params = self.elasticsearch_client_params(py)?;
-        let client = elasticsearch_client_params.client(py)?;
         let index_name = elasticsearch_client_params.index_name.clone();
         let max_batch_size = self.max_batch_size;
 
-        let writer = ElasticSearchWriter::new(client, index_name, max_batch_size);
-        Ok(Box::new(writer))
+        self.construct_parallel_writers(|| {
+            let client = elasticsearch_client_params.client(py)?;
+            let writer = ElasticSearchWriter::new(client, index_name.clone(), max_batch_size);
+            Ok(Box::new(writer))
+        })
+    }
+
+    fn construct_parallel_writers(
+        &self,
+        construct_writer: impl Fn() -> PyResult<Box<dyn Writer>>,
+    ) -> PyResult<Box<dyn Writer>> {
+        match self.parallel_writers {
+            None | Some(1) => construct_writer(),
+            Some(0) => Err(PyValueError::new_err(
+                "parallel_writers must be a positive integer",
+            )),
+            Some(parallel_writers) => {
+                let writers: Vec<_> = (0..parallel_writers)
+                    .map(|_| construct_writer())
+                    .try_collect()?;
+                let writer = ShardedWriter::new(writers).map_err(|e| {
+                    PyIOError::new_err(format!("Unable to start parallel writers: {e}"))
+                })?;
+                Ok(Box::new(writer))
+            }
+        }
     }
 
     fn construct_deltalake_writer(
@@ -4772,6 +5336,9 @@ impl DataStorage {
             &value_fields,
             self.delta_storage_options(py)?,
             self.min_commit_frequency.map(time::Duration::from_millis),
+            self.partition_columns.clone(),
+            self.target_file_size,
+            self.compaction_interval_ms.map(time::Duration::from_millis),
         )
         .map_err(|e| {
             PyIOError::new_err(format!("Unable to start DeltaTable output connector: {e}"))
@@ -4779,6 +5346,32 @@ impl DataStorage {
         Ok(Box::new(writer))
     }
 
+    fn construct_parquet_writer(
+        &self,
+        py: pyo3::Python,
+        data_format: &DataFormat,
+    ) -> PyResult<Box<dyn Writer>> {
+        let path = self.path()?;
+        let settings = self.parquet_settings(py)?;
+        let mut value_fields = Vec::new();
+        for field in &data_format.value_fields {
+            value_fields.push(field.borrow(py).clone());
+        }
+        let writer = ParquetWriter::new(
+            path,
+            &value_fields,
+            settings.compression,
+            settings.max_file_size,
+            settings
+                .max_file_duration_ms
+                .map(time::Duration::from_millis),
+        )
+        .map_err(|e| {
+            PyIOError::new_err(format!("Unable to start parquet output connector: {e}"))
+        })?;
+        Ok(Box::new(writer))
+    }
+
     fn construct_nats_writer(&self) -> PyResult<Box<dyn Writer>> {
         let uri = self.path()?;
         let topic: String = self.kafka_or_nats_topic()?.to_string();
@@ -4814,6 +5407,7 @@ impl DataStorage {
             "postgres" => self.construct_postgres_writer(),
             "elasticsearch" => self.construct_elasticsearch_writer(py),
             "deltalake" => self.construct_deltalake_writer(py, data_format),
+            "parquet" => self.construct_parquet_writer(py, data_format),
             "mongodb" => self.construct_mongodb_writer(),
             "null" => Ok(Box::new(NullWriter::new())),
             "nats" => self.construct_nats_writer(),
@@ -4835,6 +5429,12 @@ impl DataFormat {
         result
     }
 
+    fn has_metadata_field(&self, py: pyo3::Python) -> bool {
+        self.value_fields
+            .iter()
+            .any(|field| field.borrow(py).name == METADATA_FIELD_NAME)
+    }
+
     fn value_field_names(&self, py: pyo3::Python) -> Vec<String> {
         // TODO: schema support is to be added here
         let mut value_field_names = Vec::new();
@@ -5063,6 +5663,8 @@ impl TableProperties {
 pub struct ConnectorProperties {
     #[pyo3(get)]
     commit_duration_ms: Option<u64>,
+    #[pyo3(get)]
+    commit_target_latency_ms: Option<u64>,
     #[allow(unused)]
     #[pyo3(get)]
     unsafe_trusted_ids: bool,
@@ -5076,15 +5678,18 @@ impl ConnectorProperties {
     #[pyo3(signature = (
         commit_duration_ms = None,
         unsafe_trusted_ids = false,
-        column_properties = vec![]
+        column_properties = vec![],
+        commit_target_latency_ms = None,
     ))]
     fn new(
         commit_duration_ms: Option<u64>,
         unsafe_trusted_ids: bool,
         #[pyo3(from_py_with = "from_py_iterable")] column_properties: Vec<ColumnProperties>,
+        commit_target_latency_ms: Option<u64>,
     ) -> Self {
         Self {
             commit_duration_ms,
+            commit_target_latency_ms,
             unsafe_trusted_ids,
             column_properties,
         }
@@ -5092,6 +5697,20 @@ impl ConnectorProperties {
 }
 
 impl ConnectorProperties {
+    fn commit_policy(&self) -> Option<CommitPolicy> {
+        let commit_duration = self.commit_duration_ms.map(time::Duration::from_millis);
+        match self
+            .commit_target_latency_ms
+            .map(time::Duration::from_millis)
+        {
+            Some(target_latency) => Some(CommitPolicy::Adaptive {
+                max_duration: commit_duration.unwrap_or(target_latency),
+                target_latency,
+            }),
+            None => commit_duration.map(CommitPolicy::Periodic),
+        }
+    }
+
     fn column_properties(&self) -> Vec<Arc<EngineColumnProperties>> {
         self.column_properties.iter().map(|p| p.0.clone()).collect()
     }
@@ -5399,6 +6018,7 @@ fn engine(_py: Python<'_>, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<ElasticSearchParams>()?;
     m.add_class::<ElasticSearchAuth>()?;
     m.add_class::<CsvParserSettings>()?;
+    m.add_class::<ParquetSettings>()?;
     m.add_class::<ValueField>()?;
     m.add_class::<DataStorage>()?;
     m.add_class::<DataFormat>()?;
@@ -5408,6 +6028,7 @@ fn engine(_py: Python<'_>, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<PySnapshotAccess>()?;
     m.add_class::<PySnapshotEvent>()?;
     m.add_class::<TelemetryConfig>()?;
+    m.add_class::<UdfMetrics>()?;
 
     m.add_class::<ConnectorProperties>()?;
     m.add_class::<ColumnProperties>()?;